@@ -12,11 +12,26 @@ def main():
     group.add_argument('-l', '--list', dest='list', action='store_true', help='list available streams')
     group.add_argument('-s', '--sessions', dest='sessions', nargs='+', action='store', metavar=('s1', 's2'), help='session to examine')
     parser.add_argument('filename', action='store', help='filename of the store file')
+    parser.add_argument('-a', '--archive', dest='archive', action='store', default=None, help='directory of the rolled journal segments (default: <filename>.archive)')
     parser.add_argument('-d', '--direction', dest='direction', choices=['in', 'out', 'both'], action='store', default="both", help='filename of the store file')
+    # these use the journal's indexes for the messages since the last roll, archived segments are decoded and
+    # checked message by message (see Journaler.queryMsgs)
+    parser.add_argument('--clordid', dest='clOrdID', action='store', help='only messages with this ClOrdID(11)')
+    parser.add_argument('--orderid', dest='orderID', action='store', help='only messages with this OrderID(37)')
+    parser.add_argument('--msgtype', dest='msgType', action='store', help='only messages of this MsgType(35)')
+    parser.add_argument('--from', dest='sentFrom', action='store', metavar='YYYYMMDD-HH:MM:SS', help='only messages with a SendingTime(52) from this time')
+    parser.add_argument('--to', dest='sentTo', action='store', metavar='YYYYMMDD-HH:MM:SS', help='only messages with a SendingTime(52) up to this time')
+    parser.add_argument('--reindex', dest='reindex', action='store_true', help='index the messages journalled before the store had indexes')
+    parser.add_argument('--tag', dest='tags', action='append', default=[], metavar='TAG=VALUE', help='only messages with this value for an indexed tag')
+    parser.add_argument('--active-only', dest='activeOnly', action='store_true', help='only search the messages since the last roll with the filters above, which only uses the indexes and skips decoding the archived segments')
 
     args = parser.parse_args()
 
-    journal = Journaler(args.filename)
+    # looking doesn't change the store, only indexing it needs to write to it
+    journal = Journaler(args.filename, archiveDirectory=args.archive, readOnly=not args.reindex)
+
+    if args.reindex is True:
+        logging.info("Indexed %s messages" % (journal.indexMsgs(), ))
 
     if args.list is True:
         # list all sessions
@@ -30,7 +45,19 @@ def main():
     else:
         # list all messages in that stream
         direction = None if args.direction == 'both' else MessageDirection.INBOUND if args.direction == "in" else MessageDirection.OUTBOUND
-        for (seqNo, msg, msgDirection, session) in journal.getAllMsgs(args.sessions, direction):
+        keys = {int(tag): value for tag, value in (tag.split('=', 1) for tag in args.tags)}
+        for tag, value in ((11, args.clOrdID), (37, args.orderID), (35, args.msgType)):
+            if value is not None:
+                keys[tag] = value
+        ranges = {}
+        if args.sentFrom is not None or args.sentTo is not None:
+            ranges[52] = (args.sentFrom, args.sentTo)
+
+        if keys or ranges:
+            msgs = journal.queryMsgs(keys, ranges, args.sessions, direction, archived=not args.activeOnly)
+        else:
+            msgs = journal.iterAllMsgs(args.sessions, direction)
+        for (seqNo, msg, msgDirection, session) in msgs:
             d = "---->" if msgDirection == MessageDirection.OUTBOUND.value else "<----"
             print("{:>3} {:^5} [{:>5}] {}".format(session, d, seqNo, msg))
 
@@ -1,17 +1,21 @@
-from fixorchestra.orchestration import *
+from pyfix.dictionary import load_dictionary
 
 __author__ = 'tom'
 
 beginstring = 'FIX.4.4'
 
 import enum
+import os
 
 class StrEnum(str, enum.Enum):
     def __str__(self):
         return str(self.value)
 
 
-orchestration = Orchestration('fix_repository_4_4.xml')
+# the repository is at the top of the source tree, so importing this doesn't depend on the working directory; failing
+# that, it is looked for where we are run from
+_repository = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'fix_repository_4_4.xml')
+dictionary = load_dictionary(_repository if os.path.exists(_repository) else 'fix_repository_4_4.xml')
 
-fixtags = enum.IntEnum('Tags', {tag.name : tag_number for tag_number, tag in orchestration.fields_by_tag.items()})
-msgtype = StrEnum('MsgType', {message.name : message.msg_type for message in orchestration.messages.values()})
+fixtags = enum.IntEnum('Tags', {name : tag_number for tag_number, name in dictionary.field_names.items()})
+msgtype = StrEnum('MsgType', {message.name : message.msg_type for message in dictionary.messages.values()})
@@ -0,0 +1,12368 @@
+# Generated by pyfix.generator from fix_repository_4_4.xml (msg types 0 1 2 3 4 5 A D F G 8 9 J AE), do not edit.
+from datetime import date, datetime
+from decimal import Decimal
+from pyfix.message import parseBoolean, parseUTCTimestamp, parseDate
+from pyfix.message import formatBoolean, formatUTCTimestamp, formatDate
+from pyfix.typed import TypedGroup, TypedMessage
+
+
+
+class PtysSubGrp(TypedGroup):
+    __slots__ = (
+        'PartySubID',
+        'PartySubIDType',
+    )
+
+    PartySubID: str
+    PartySubIDType: int
+
+    fieldSpecs = {
+        523: ('PartySubID', None, None),
+        803: ('PartySubIDType', int, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.PartySubID = None
+        self.PartySubIDType = None
+
+    def encodeFields(self, buffer):
+        value = self.PartySubID
+        if value is not None:
+            buffer += b'523='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PartySubIDType
+        if value is not None:
+            buffer += b'803='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class Parties(TypedGroup):
+    __slots__ = (
+        'PartyID',
+        'PartyIDSource',
+        'PartyRole',
+        'NoPartySubIDs',
+    )
+
+    PartyID: str
+    PartyIDSource: str
+    PartyRole: int
+    NoPartySubIDs: list
+
+    fieldSpecs = {
+        448: ('PartyID', None, None),
+        447: ('PartyIDSource', None, None),
+        452: ('PartyRole', int, None),
+        802: ('NoPartySubIDs', None, PtysSubGrp),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.PartyID = None
+        self.PartyIDSource = None
+        self.PartyRole = None
+        self.NoPartySubIDs = None
+
+    def encodeFields(self, buffer):
+        value = self.PartyID
+        if value is not None:
+            buffer += b'448='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PartyIDSource
+        if value is not None:
+            buffer += b'447='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PartyRole
+        if value is not None:
+            buffer += b'452='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoPartySubIDs
+        if value is not None:
+            buffer += b'802=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class ContraGrp(TypedGroup):
+    __slots__ = (
+        'ContraBroker',
+        'ContraTrader',
+        'ContraTradeQty',
+        'ContraTradeTime',
+        'ContraLegRefID',
+    )
+
+    ContraBroker: str
+    ContraTrader: str
+    ContraTradeQty: Decimal
+    ContraTradeTime: datetime
+    ContraLegRefID: str
+
+    fieldSpecs = {
+        375: ('ContraBroker', None, None),
+        337: ('ContraTrader', None, None),
+        437: ('ContraTradeQty', Decimal, None),
+        438: ('ContraTradeTime', parseUTCTimestamp, None),
+        655: ('ContraLegRefID', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.ContraBroker = None
+        self.ContraTrader = None
+        self.ContraTradeQty = None
+        self.ContraTradeTime = None
+        self.ContraLegRefID = None
+
+    def encodeFields(self, buffer):
+        value = self.ContraBroker
+        if value is not None:
+            buffer += b'375='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContraTrader
+        if value is not None:
+            buffer += b'337='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContraTradeQty
+        if value is not None:
+            buffer += b'437='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContraTradeTime
+        if value is not None:
+            buffer += b'438='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContraLegRefID
+        if value is not None:
+            buffer += b'655='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class SecAltIDGrp(TypedGroup):
+    __slots__ = (
+        'SecurityAltID',
+        'SecurityAltIDSource',
+    )
+
+    SecurityAltID: str
+    SecurityAltIDSource: str
+
+    fieldSpecs = {
+        455: ('SecurityAltID', None, None),
+        456: ('SecurityAltIDSource', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.SecurityAltID = None
+        self.SecurityAltIDSource = None
+
+    def encodeFields(self, buffer):
+        value = self.SecurityAltID
+        if value is not None:
+            buffer += b'455='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityAltIDSource
+        if value is not None:
+            buffer += b'456='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class EvntGrp(TypedGroup):
+    __slots__ = (
+        'EventType',
+        'EventDate',
+        'EventPx',
+        'EventText',
+    )
+
+    EventType: int
+    EventDate: date
+    EventPx: Decimal
+    EventText: str
+
+    fieldSpecs = {
+        865: ('EventType', int, None),
+        866: ('EventDate', parseDate, None),
+        867: ('EventPx', Decimal, None),
+        868: ('EventText', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.EventType = None
+        self.EventDate = None
+        self.EventPx = None
+        self.EventText = None
+
+    def encodeFields(self, buffer):
+        value = self.EventType
+        if value is not None:
+            buffer += b'865='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EventDate
+        if value is not None:
+            buffer += b'866='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EventPx
+        if value is not None:
+            buffer += b'867='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EventText
+        if value is not None:
+            buffer += b'868='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class UndSecAltIDGrp(TypedGroup):
+    __slots__ = (
+        'UnderlyingSecurityAltID',
+        'UnderlyingSecurityAltIDSource',
+    )
+
+    UnderlyingSecurityAltID: str
+    UnderlyingSecurityAltIDSource: str
+
+    fieldSpecs = {
+        458: ('UnderlyingSecurityAltID', None, None),
+        459: ('UnderlyingSecurityAltIDSource', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.UnderlyingSecurityAltID = None
+        self.UnderlyingSecurityAltIDSource = None
+
+    def encodeFields(self, buffer):
+        value = self.UnderlyingSecurityAltID
+        if value is not None:
+            buffer += b'458='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingSecurityAltIDSource
+        if value is not None:
+            buffer += b'459='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class UnderlyingStipulations(TypedGroup):
+    __slots__ = (
+        'UnderlyingStipType',
+        'UnderlyingStipValue',
+    )
+
+    UnderlyingStipType: str
+    UnderlyingStipValue: str
+
+    fieldSpecs = {
+        888: ('UnderlyingStipType', None, None),
+        889: ('UnderlyingStipValue', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.UnderlyingStipType = None
+        self.UnderlyingStipValue = None
+
+    def encodeFields(self, buffer):
+        value = self.UnderlyingStipType
+        if value is not None:
+            buffer += b'888='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingStipValue
+        if value is not None:
+            buffer += b'889='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class UndInstrmtGrp(TypedGroup):
+    __slots__ = (
+        'UnderlyingSymbol',
+        'UnderlyingSymbolSfx',
+        'UnderlyingSecurityID',
+        'UnderlyingSecurityIDSource',
+        'NoUnderlyingSecurityAltID',
+        'UnderlyingProduct',
+        'UnderlyingCFICode',
+        'UnderlyingSecurityType',
+        'UnderlyingSecuritySubType',
+        'UnderlyingMaturityMonthYear',
+        'UnderlyingMaturityDate',
+        'UnderlyingPutOrCall',
+        'UnderlyingCouponPaymentDate',
+        'UnderlyingIssueDate',
+        'UnderlyingRepoCollateralSecurityType',
+        'UnderlyingRepurchaseTerm',
+        'UnderlyingRepurchaseRate',
+        'UnderlyingFactor',
+        'UnderlyingCreditRating',
+        'UnderlyingInstrRegistry',
+        'UnderlyingCountryOfIssue',
+        'UnderlyingStateOrProvinceOfIssue',
+        'UnderlyingLocaleOfIssue',
+        'UnderlyingRedemptionDate',
+        'UnderlyingStrikePrice',
+        'UnderlyingStrikeCurrency',
+        'UnderlyingOptAttribute',
+        'UnderlyingContractMultiplier',
+        'UnderlyingCouponRate',
+        'UnderlyingSecurityExchange',
+        'UnderlyingIssuer',
+        'EncodedUnderlyingIssuerLen',
+        'EncodedUnderlyingIssuer',
+        'UnderlyingSecurityDesc',
+        'EncodedUnderlyingSecurityDescLen',
+        'EncodedUnderlyingSecurityDesc',
+        'UnderlyingCPProgram',
+        'UnderlyingCPRegType',
+        'UnderlyingCurrency',
+        'UnderlyingQty',
+        'UnderlyingPx',
+        'UnderlyingDirtyPrice',
+        'UnderlyingEndPrice',
+        'UnderlyingStartValue',
+        'UnderlyingCurrentValue',
+        'UnderlyingEndValue',
+        'NoUnderlyingStips',
+    )
+
+    UnderlyingSymbol: str
+    UnderlyingSymbolSfx: str
+    UnderlyingSecurityID: str
+    UnderlyingSecurityIDSource: str
+    NoUnderlyingSecurityAltID: list
+    UnderlyingProduct: int
+    UnderlyingCFICode: str
+    UnderlyingSecurityType: str
+    UnderlyingSecuritySubType: str
+    UnderlyingMaturityMonthYear: str
+    UnderlyingMaturityDate: date
+    UnderlyingPutOrCall: int
+    UnderlyingCouponPaymentDate: date
+    UnderlyingIssueDate: date
+    UnderlyingRepoCollateralSecurityType: str
+    UnderlyingRepurchaseTerm: int
+    UnderlyingRepurchaseRate: Decimal
+    UnderlyingFactor: Decimal
+    UnderlyingCreditRating: str
+    UnderlyingInstrRegistry: str
+    UnderlyingCountryOfIssue: str
+    UnderlyingStateOrProvinceOfIssue: str
+    UnderlyingLocaleOfIssue: str
+    UnderlyingRedemptionDate: date
+    UnderlyingStrikePrice: Decimal
+    UnderlyingStrikeCurrency: str
+    UnderlyingOptAttribute: str
+    UnderlyingContractMultiplier: Decimal
+    UnderlyingCouponRate: Decimal
+    UnderlyingSecurityExchange: str
+    UnderlyingIssuer: str
+    EncodedUnderlyingIssuerLen: int
+    EncodedUnderlyingIssuer: str
+    UnderlyingSecurityDesc: str
+    EncodedUnderlyingSecurityDescLen: int
+    EncodedUnderlyingSecurityDesc: str
+    UnderlyingCPProgram: str
+    UnderlyingCPRegType: str
+    UnderlyingCurrency: str
+    UnderlyingQty: Decimal
+    UnderlyingPx: Decimal
+    UnderlyingDirtyPrice: Decimal
+    UnderlyingEndPrice: Decimal
+    UnderlyingStartValue: Decimal
+    UnderlyingCurrentValue: Decimal
+    UnderlyingEndValue: Decimal
+    NoUnderlyingStips: list
+
+    fieldSpecs = {
+        311: ('UnderlyingSymbol', None, None),
+        312: ('UnderlyingSymbolSfx', None, None),
+        309: ('UnderlyingSecurityID', None, None),
+        305: ('UnderlyingSecurityIDSource', None, None),
+        457: ('NoUnderlyingSecurityAltID', None, UndSecAltIDGrp),
+        462: ('UnderlyingProduct', int, None),
+        463: ('UnderlyingCFICode', None, None),
+        310: ('UnderlyingSecurityType', None, None),
+        763: ('UnderlyingSecuritySubType', None, None),
+        313: ('UnderlyingMaturityMonthYear', None, None),
+        542: ('UnderlyingMaturityDate', parseDate, None),
+        315: ('UnderlyingPutOrCall', int, None),
+        241: ('UnderlyingCouponPaymentDate', parseDate, None),
+        242: ('UnderlyingIssueDate', parseDate, None),
+        243: ('UnderlyingRepoCollateralSecurityType', None, None),
+        244: ('UnderlyingRepurchaseTerm', int, None),
+        245: ('UnderlyingRepurchaseRate', Decimal, None),
+        246: ('UnderlyingFactor', Decimal, None),
+        256: ('UnderlyingCreditRating', None, None),
+        595: ('UnderlyingInstrRegistry', None, None),
+        592: ('UnderlyingCountryOfIssue', None, None),
+        593: ('UnderlyingStateOrProvinceOfIssue', None, None),
+        594: ('UnderlyingLocaleOfIssue', None, None),
+        247: ('UnderlyingRedemptionDate', parseDate, None),
+        316: ('UnderlyingStrikePrice', Decimal, None),
+        941: ('UnderlyingStrikeCurrency', None, None),
+        317: ('UnderlyingOptAttribute', None, None),
+        436: ('UnderlyingContractMultiplier', Decimal, None),
+        435: ('UnderlyingCouponRate', Decimal, None),
+        308: ('UnderlyingSecurityExchange', None, None),
+        306: ('UnderlyingIssuer', None, None),
+        362: ('EncodedUnderlyingIssuerLen', int, None),
+        363: ('EncodedUnderlyingIssuer', None, None),
+        307: ('UnderlyingSecurityDesc', None, None),
+        364: ('EncodedUnderlyingSecurityDescLen', int, None),
+        365: ('EncodedUnderlyingSecurityDesc', None, None),
+        877: ('UnderlyingCPProgram', None, None),
+        878: ('UnderlyingCPRegType', None, None),
+        318: ('UnderlyingCurrency', None, None),
+        879: ('UnderlyingQty', Decimal, None),
+        810: ('UnderlyingPx', Decimal, None),
+        882: ('UnderlyingDirtyPrice', Decimal, None),
+        883: ('UnderlyingEndPrice', Decimal, None),
+        884: ('UnderlyingStartValue', Decimal, None),
+        885: ('UnderlyingCurrentValue', Decimal, None),
+        886: ('UnderlyingEndValue', Decimal, None),
+        887: ('NoUnderlyingStips', None, UnderlyingStipulations),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.UnderlyingSymbol = None
+        self.UnderlyingSymbolSfx = None
+        self.UnderlyingSecurityID = None
+        self.UnderlyingSecurityIDSource = None
+        self.NoUnderlyingSecurityAltID = None
+        self.UnderlyingProduct = None
+        self.UnderlyingCFICode = None
+        self.UnderlyingSecurityType = None
+        self.UnderlyingSecuritySubType = None
+        self.UnderlyingMaturityMonthYear = None
+        self.UnderlyingMaturityDate = None
+        self.UnderlyingPutOrCall = None
+        self.UnderlyingCouponPaymentDate = None
+        self.UnderlyingIssueDate = None
+        self.UnderlyingRepoCollateralSecurityType = None
+        self.UnderlyingRepurchaseTerm = None
+        self.UnderlyingRepurchaseRate = None
+        self.UnderlyingFactor = None
+        self.UnderlyingCreditRating = None
+        self.UnderlyingInstrRegistry = None
+        self.UnderlyingCountryOfIssue = None
+        self.UnderlyingStateOrProvinceOfIssue = None
+        self.UnderlyingLocaleOfIssue = None
+        self.UnderlyingRedemptionDate = None
+        self.UnderlyingStrikePrice = None
+        self.UnderlyingStrikeCurrency = None
+        self.UnderlyingOptAttribute = None
+        self.UnderlyingContractMultiplier = None
+        self.UnderlyingCouponRate = None
+        self.UnderlyingSecurityExchange = None
+        self.UnderlyingIssuer = None
+        self.EncodedUnderlyingIssuerLen = None
+        self.EncodedUnderlyingIssuer = None
+        self.UnderlyingSecurityDesc = None
+        self.EncodedUnderlyingSecurityDescLen = None
+        self.EncodedUnderlyingSecurityDesc = None
+        self.UnderlyingCPProgram = None
+        self.UnderlyingCPRegType = None
+        self.UnderlyingCurrency = None
+        self.UnderlyingQty = None
+        self.UnderlyingPx = None
+        self.UnderlyingDirtyPrice = None
+        self.UnderlyingEndPrice = None
+        self.UnderlyingStartValue = None
+        self.UnderlyingCurrentValue = None
+        self.UnderlyingEndValue = None
+        self.NoUnderlyingStips = None
+
+    def encodeFields(self, buffer):
+        value = self.UnderlyingSymbol
+        if value is not None:
+            buffer += b'311='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingSymbolSfx
+        if value is not None:
+            buffer += b'312='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingSecurityID
+        if value is not None:
+            buffer += b'309='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingSecurityIDSource
+        if value is not None:
+            buffer += b'305='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoUnderlyingSecurityAltID
+        if value is not None:
+            buffer += b'457=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.UnderlyingProduct
+        if value is not None:
+            buffer += b'462='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCFICode
+        if value is not None:
+            buffer += b'463='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingSecurityType
+        if value is not None:
+            buffer += b'310='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingSecuritySubType
+        if value is not None:
+            buffer += b'763='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingMaturityMonthYear
+        if value is not None:
+            buffer += b'313='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingMaturityDate
+        if value is not None:
+            buffer += b'542='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingPutOrCall
+        if value is not None:
+            buffer += b'315='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCouponPaymentDate
+        if value is not None:
+            buffer += b'241='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingIssueDate
+        if value is not None:
+            buffer += b'242='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingRepoCollateralSecurityType
+        if value is not None:
+            buffer += b'243='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingRepurchaseTerm
+        if value is not None:
+            buffer += b'244='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingRepurchaseRate
+        if value is not None:
+            buffer += b'245='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingFactor
+        if value is not None:
+            buffer += b'246='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCreditRating
+        if value is not None:
+            buffer += b'256='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingInstrRegistry
+        if value is not None:
+            buffer += b'595='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCountryOfIssue
+        if value is not None:
+            buffer += b'592='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingStateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'593='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingLocaleOfIssue
+        if value is not None:
+            buffer += b'594='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingRedemptionDate
+        if value is not None:
+            buffer += b'247='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingStrikePrice
+        if value is not None:
+            buffer += b'316='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingStrikeCurrency
+        if value is not None:
+            buffer += b'941='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingOptAttribute
+        if value is not None:
+            buffer += b'317='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingContractMultiplier
+        if value is not None:
+            buffer += b'436='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCouponRate
+        if value is not None:
+            buffer += b'435='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingSecurityExchange
+        if value is not None:
+            buffer += b'308='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingIssuer
+        if value is not None:
+            buffer += b'306='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedUnderlyingIssuerLen
+        if value is not None:
+            buffer += b'362='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedUnderlyingIssuer
+        if value is not None:
+            buffer += b'363='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingSecurityDesc
+        if value is not None:
+            buffer += b'307='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedUnderlyingSecurityDescLen
+        if value is not None:
+            buffer += b'364='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedUnderlyingSecurityDesc
+        if value is not None:
+            buffer += b'365='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCPProgram
+        if value is not None:
+            buffer += b'877='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCPRegType
+        if value is not None:
+            buffer += b'878='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCurrency
+        if value is not None:
+            buffer += b'318='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingQty
+        if value is not None:
+            buffer += b'879='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingPx
+        if value is not None:
+            buffer += b'810='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingDirtyPrice
+        if value is not None:
+            buffer += b'882='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingEndPrice
+        if value is not None:
+            buffer += b'883='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingStartValue
+        if value is not None:
+            buffer += b'884='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingCurrentValue
+        if value is not None:
+            buffer += b'885='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingEndValue
+        if value is not None:
+            buffer += b'886='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoUnderlyingStips
+        if value is not None:
+            buffer += b'887=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class Stipulations(TypedGroup):
+    __slots__ = (
+        'StipulationType',
+        'StipulationValue',
+    )
+
+    StipulationType: str
+    StipulationValue: str
+
+    fieldSpecs = {
+        233: ('StipulationType', None, None),
+        234: ('StipulationValue', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.StipulationType = None
+        self.StipulationValue = None
+
+    def encodeFields(self, buffer):
+        value = self.StipulationType
+        if value is not None:
+            buffer += b'233='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StipulationValue
+        if value is not None:
+            buffer += b'234='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class ContAmtGrp(TypedGroup):
+    __slots__ = (
+        'ContAmtType',
+        'ContAmtValue',
+        'ContAmtCurr',
+    )
+
+    ContAmtType: int
+    ContAmtValue: Decimal
+    ContAmtCurr: str
+
+    fieldSpecs = {
+        519: ('ContAmtType', int, None),
+        520: ('ContAmtValue', Decimal, None),
+        521: ('ContAmtCurr', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.ContAmtType = None
+        self.ContAmtValue = None
+        self.ContAmtCurr = None
+
+    def encodeFields(self, buffer):
+        value = self.ContAmtType
+        if value is not None:
+            buffer += b'519='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContAmtValue
+        if value is not None:
+            buffer += b'520='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContAmtCurr
+        if value is not None:
+            buffer += b'521='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class LegSecAltIDGrp(TypedGroup):
+    __slots__ = (
+        'LegSecurityAltID',
+        'LegSecurityAltIDSource',
+    )
+
+    LegSecurityAltID: str
+    LegSecurityAltIDSource: str
+
+    fieldSpecs = {
+        605: ('LegSecurityAltID', None, None),
+        606: ('LegSecurityAltIDSource', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.LegSecurityAltID = None
+        self.LegSecurityAltIDSource = None
+
+    def encodeFields(self, buffer):
+        value = self.LegSecurityAltID
+        if value is not None:
+            buffer += b'605='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityAltIDSource
+        if value is not None:
+            buffer += b'606='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class LegStipulations(TypedGroup):
+    __slots__ = (
+        'LegStipulationType',
+        'LegStipulationValue',
+    )
+
+    LegStipulationType: str
+    LegStipulationValue: str
+
+    fieldSpecs = {
+        688: ('LegStipulationType', None, None),
+        689: ('LegStipulationValue', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.LegStipulationType = None
+        self.LegStipulationValue = None
+
+    def encodeFields(self, buffer):
+        value = self.LegStipulationType
+        if value is not None:
+            buffer += b'688='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStipulationValue
+        if value is not None:
+            buffer += b'689='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class NstdPtysSubGrp(TypedGroup):
+    __slots__ = (
+        'NestedPartySubID',
+        'NestedPartySubIDType',
+    )
+
+    NestedPartySubID: str
+    NestedPartySubIDType: int
+
+    fieldSpecs = {
+        545: ('NestedPartySubID', None, None),
+        805: ('NestedPartySubIDType', int, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.NestedPartySubID = None
+        self.NestedPartySubIDType = None
+
+    def encodeFields(self, buffer):
+        value = self.NestedPartySubID
+        if value is not None:
+            buffer += b'545='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NestedPartySubIDType
+        if value is not None:
+            buffer += b'805='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class NestedParties(TypedGroup):
+    __slots__ = (
+        'NestedPartyID',
+        'NestedPartyIDSource',
+        'NestedPartyRole',
+        'NoNestedPartySubIDs',
+    )
+
+    NestedPartyID: str
+    NestedPartyIDSource: str
+    NestedPartyRole: int
+    NoNestedPartySubIDs: list
+
+    fieldSpecs = {
+        524: ('NestedPartyID', None, None),
+        525: ('NestedPartyIDSource', None, None),
+        538: ('NestedPartyRole', int, None),
+        804: ('NoNestedPartySubIDs', None, NstdPtysSubGrp),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.NestedPartyID = None
+        self.NestedPartyIDSource = None
+        self.NestedPartyRole = None
+        self.NoNestedPartySubIDs = None
+
+    def encodeFields(self, buffer):
+        value = self.NestedPartyID
+        if value is not None:
+            buffer += b'524='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NestedPartyIDSource
+        if value is not None:
+            buffer += b'525='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NestedPartyRole
+        if value is not None:
+            buffer += b'538='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoNestedPartySubIDs
+        if value is not None:
+            buffer += b'804=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class InstrmtLegExecGrp(TypedGroup):
+    __slots__ = (
+        'LegSymbol',
+        'LegSymbolSfx',
+        'LegSecurityID',
+        'LegSecurityIDSource',
+        'NoLegSecurityAltID',
+        'LegProduct',
+        'LegCFICode',
+        'LegSecurityType',
+        'LegSecuritySubType',
+        'LegMaturityMonthYear',
+        'LegMaturityDate',
+        'LegCouponPaymentDate',
+        'LegIssueDate',
+        'LegRepoCollateralSecurityType',
+        'LegRepurchaseTerm',
+        'LegRepurchaseRate',
+        'LegFactor',
+        'LegCreditRating',
+        'LegInstrRegistry',
+        'LegCountryOfIssue',
+        'LegStateOrProvinceOfIssue',
+        'LegLocaleOfIssue',
+        'LegRedemptionDate',
+        'LegStrikePrice',
+        'LegStrikeCurrency',
+        'LegOptAttribute',
+        'LegContractMultiplier',
+        'LegCouponRate',
+        'LegSecurityExchange',
+        'LegIssuer',
+        'EncodedLegIssuerLen',
+        'EncodedLegIssuer',
+        'LegSecurityDesc',
+        'EncodedLegSecurityDescLen',
+        'EncodedLegSecurityDesc',
+        'LegRatioQty',
+        'LegSide',
+        'LegCurrency',
+        'LegPool',
+        'LegDatedDate',
+        'LegContractSettlMonth',
+        'LegInterestAccrualDate',
+        'LegQty',
+        'LegSwapType',
+        'NoLegStipulations',
+        'LegPositionEffect',
+        'LegCoveredOrUncovered',
+        'NoNestedPartyIDs',
+        'LegRefID',
+        'LegPrice',
+        'LegSettlType',
+        'LegSettlDate',
+        'LegLastPx',
+    )
+
+    LegSymbol: str
+    LegSymbolSfx: str
+    LegSecurityID: str
+    LegSecurityIDSource: str
+    NoLegSecurityAltID: list
+    LegProduct: int
+    LegCFICode: str
+    LegSecurityType: str
+    LegSecuritySubType: str
+    LegMaturityMonthYear: str
+    LegMaturityDate: date
+    LegCouponPaymentDate: date
+    LegIssueDate: date
+    LegRepoCollateralSecurityType: str
+    LegRepurchaseTerm: int
+    LegRepurchaseRate: Decimal
+    LegFactor: Decimal
+    LegCreditRating: str
+    LegInstrRegistry: str
+    LegCountryOfIssue: str
+    LegStateOrProvinceOfIssue: str
+    LegLocaleOfIssue: str
+    LegRedemptionDate: date
+    LegStrikePrice: Decimal
+    LegStrikeCurrency: str
+    LegOptAttribute: str
+    LegContractMultiplier: Decimal
+    LegCouponRate: Decimal
+    LegSecurityExchange: str
+    LegIssuer: str
+    EncodedLegIssuerLen: int
+    EncodedLegIssuer: str
+    LegSecurityDesc: str
+    EncodedLegSecurityDescLen: int
+    EncodedLegSecurityDesc: str
+    LegRatioQty: Decimal
+    LegSide: str
+    LegCurrency: str
+    LegPool: str
+    LegDatedDate: date
+    LegContractSettlMonth: str
+    LegInterestAccrualDate: date
+    LegQty: Decimal
+    LegSwapType: int
+    NoLegStipulations: list
+    LegPositionEffect: str
+    LegCoveredOrUncovered: int
+    NoNestedPartyIDs: list
+    LegRefID: str
+    LegPrice: Decimal
+    LegSettlType: str
+    LegSettlDate: date
+    LegLastPx: Decimal
+
+    fieldSpecs = {
+        600: ('LegSymbol', None, None),
+        601: ('LegSymbolSfx', None, None),
+        602: ('LegSecurityID', None, None),
+        603: ('LegSecurityIDSource', None, None),
+        604: ('NoLegSecurityAltID', None, LegSecAltIDGrp),
+        607: ('LegProduct', int, None),
+        608: ('LegCFICode', None, None),
+        609: ('LegSecurityType', None, None),
+        764: ('LegSecuritySubType', None, None),
+        610: ('LegMaturityMonthYear', None, None),
+        611: ('LegMaturityDate', parseDate, None),
+        248: ('LegCouponPaymentDate', parseDate, None),
+        249: ('LegIssueDate', parseDate, None),
+        250: ('LegRepoCollateralSecurityType', None, None),
+        251: ('LegRepurchaseTerm', int, None),
+        252: ('LegRepurchaseRate', Decimal, None),
+        253: ('LegFactor', Decimal, None),
+        257: ('LegCreditRating', None, None),
+        599: ('LegInstrRegistry', None, None),
+        596: ('LegCountryOfIssue', None, None),
+        597: ('LegStateOrProvinceOfIssue', None, None),
+        598: ('LegLocaleOfIssue', None, None),
+        254: ('LegRedemptionDate', parseDate, None),
+        612: ('LegStrikePrice', Decimal, None),
+        942: ('LegStrikeCurrency', None, None),
+        613: ('LegOptAttribute', None, None),
+        614: ('LegContractMultiplier', Decimal, None),
+        615: ('LegCouponRate', Decimal, None),
+        616: ('LegSecurityExchange', None, None),
+        617: ('LegIssuer', None, None),
+        618: ('EncodedLegIssuerLen', int, None),
+        619: ('EncodedLegIssuer', None, None),
+        620: ('LegSecurityDesc', None, None),
+        621: ('EncodedLegSecurityDescLen', int, None),
+        622: ('EncodedLegSecurityDesc', None, None),
+        623: ('LegRatioQty', Decimal, None),
+        624: ('LegSide', None, None),
+        556: ('LegCurrency', None, None),
+        740: ('LegPool', None, None),
+        739: ('LegDatedDate', parseDate, None),
+        955: ('LegContractSettlMonth', None, None),
+        956: ('LegInterestAccrualDate', parseDate, None),
+        687: ('LegQty', Decimal, None),
+        690: ('LegSwapType', int, None),
+        683: ('NoLegStipulations', None, LegStipulations),
+        564: ('LegPositionEffect', None, None),
+        565: ('LegCoveredOrUncovered', int, None),
+        539: ('NoNestedPartyIDs', None, NestedParties),
+        654: ('LegRefID', None, None),
+        566: ('LegPrice', Decimal, None),
+        587: ('LegSettlType', None, None),
+        588: ('LegSettlDate', parseDate, None),
+        637: ('LegLastPx', Decimal, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.LegSymbol = None
+        self.LegSymbolSfx = None
+        self.LegSecurityID = None
+        self.LegSecurityIDSource = None
+        self.NoLegSecurityAltID = None
+        self.LegProduct = None
+        self.LegCFICode = None
+        self.LegSecurityType = None
+        self.LegSecuritySubType = None
+        self.LegMaturityMonthYear = None
+        self.LegMaturityDate = None
+        self.LegCouponPaymentDate = None
+        self.LegIssueDate = None
+        self.LegRepoCollateralSecurityType = None
+        self.LegRepurchaseTerm = None
+        self.LegRepurchaseRate = None
+        self.LegFactor = None
+        self.LegCreditRating = None
+        self.LegInstrRegistry = None
+        self.LegCountryOfIssue = None
+        self.LegStateOrProvinceOfIssue = None
+        self.LegLocaleOfIssue = None
+        self.LegRedemptionDate = None
+        self.LegStrikePrice = None
+        self.LegStrikeCurrency = None
+        self.LegOptAttribute = None
+        self.LegContractMultiplier = None
+        self.LegCouponRate = None
+        self.LegSecurityExchange = None
+        self.LegIssuer = None
+        self.EncodedLegIssuerLen = None
+        self.EncodedLegIssuer = None
+        self.LegSecurityDesc = None
+        self.EncodedLegSecurityDescLen = None
+        self.EncodedLegSecurityDesc = None
+        self.LegRatioQty = None
+        self.LegSide = None
+        self.LegCurrency = None
+        self.LegPool = None
+        self.LegDatedDate = None
+        self.LegContractSettlMonth = None
+        self.LegInterestAccrualDate = None
+        self.LegQty = None
+        self.LegSwapType = None
+        self.NoLegStipulations = None
+        self.LegPositionEffect = None
+        self.LegCoveredOrUncovered = None
+        self.NoNestedPartyIDs = None
+        self.LegRefID = None
+        self.LegPrice = None
+        self.LegSettlType = None
+        self.LegSettlDate = None
+        self.LegLastPx = None
+
+    def encodeFields(self, buffer):
+        value = self.LegSymbol
+        if value is not None:
+            buffer += b'600='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSymbolSfx
+        if value is not None:
+            buffer += b'601='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityID
+        if value is not None:
+            buffer += b'602='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityIDSource
+        if value is not None:
+            buffer += b'603='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoLegSecurityAltID
+        if value is not None:
+            buffer += b'604=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.LegProduct
+        if value is not None:
+            buffer += b'607='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCFICode
+        if value is not None:
+            buffer += b'608='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityType
+        if value is not None:
+            buffer += b'609='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecuritySubType
+        if value is not None:
+            buffer += b'764='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegMaturityMonthYear
+        if value is not None:
+            buffer += b'610='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegMaturityDate
+        if value is not None:
+            buffer += b'611='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCouponPaymentDate
+        if value is not None:
+            buffer += b'248='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegIssueDate
+        if value is not None:
+            buffer += b'249='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepoCollateralSecurityType
+        if value is not None:
+            buffer += b'250='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepurchaseTerm
+        if value is not None:
+            buffer += b'251='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepurchaseRate
+        if value is not None:
+            buffer += b'252='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegFactor
+        if value is not None:
+            buffer += b'253='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCreditRating
+        if value is not None:
+            buffer += b'257='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegInstrRegistry
+        if value is not None:
+            buffer += b'599='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCountryOfIssue
+        if value is not None:
+            buffer += b'596='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'597='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegLocaleOfIssue
+        if value is not None:
+            buffer += b'598='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRedemptionDate
+        if value is not None:
+            buffer += b'254='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStrikePrice
+        if value is not None:
+            buffer += b'612='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStrikeCurrency
+        if value is not None:
+            buffer += b'942='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegOptAttribute
+        if value is not None:
+            buffer += b'613='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegContractMultiplier
+        if value is not None:
+            buffer += b'614='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCouponRate
+        if value is not None:
+            buffer += b'615='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityExchange
+        if value is not None:
+            buffer += b'616='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegIssuer
+        if value is not None:
+            buffer += b'617='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegIssuerLen
+        if value is not None:
+            buffer += b'618='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegIssuer
+        if value is not None:
+            buffer += b'619='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityDesc
+        if value is not None:
+            buffer += b'620='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegSecurityDescLen
+        if value is not None:
+            buffer += b'621='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegSecurityDesc
+        if value is not None:
+            buffer += b'622='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRatioQty
+        if value is not None:
+            buffer += b'623='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSide
+        if value is not None:
+            buffer += b'624='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCurrency
+        if value is not None:
+            buffer += b'556='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegPool
+        if value is not None:
+            buffer += b'740='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegDatedDate
+        if value is not None:
+            buffer += b'739='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegContractSettlMonth
+        if value is not None:
+            buffer += b'955='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegInterestAccrualDate
+        if value is not None:
+            buffer += b'956='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegQty
+        if value is not None:
+            buffer += b'687='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSwapType
+        if value is not None:
+            buffer += b'690='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoLegStipulations
+        if value is not None:
+            buffer += b'683=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.LegPositionEffect
+        if value is not None:
+            buffer += b'564='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCoveredOrUncovered
+        if value is not None:
+            buffer += b'565='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoNestedPartyIDs
+        if value is not None:
+            buffer += b'539=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.LegRefID
+        if value is not None:
+            buffer += b'654='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegPrice
+        if value is not None:
+            buffer += b'566='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSettlType
+        if value is not None:
+            buffer += b'587='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSettlDate
+        if value is not None:
+            buffer += b'588='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegLastPx
+        if value is not None:
+            buffer += b'637='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class MiscFeesGrp(TypedGroup):
+    __slots__ = (
+        'MiscFeeAmt',
+        'MiscFeeCurr',
+        'MiscFeeType',
+        'MiscFeeBasis',
+    )
+
+    MiscFeeAmt: Decimal
+    MiscFeeCurr: str
+    MiscFeeType: str
+    MiscFeeBasis: int
+
+    fieldSpecs = {
+        137: ('MiscFeeAmt', Decimal, None),
+        138: ('MiscFeeCurr', None, None),
+        139: ('MiscFeeType', None, None),
+        891: ('MiscFeeBasis', int, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.MiscFeeAmt = None
+        self.MiscFeeCurr = None
+        self.MiscFeeType = None
+        self.MiscFeeBasis = None
+
+    def encodeFields(self, buffer):
+        value = self.MiscFeeAmt
+        if value is not None:
+            buffer += b'137='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MiscFeeCurr
+        if value is not None:
+            buffer += b'138='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MiscFeeType
+        if value is not None:
+            buffer += b'139='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MiscFeeBasis
+        if value is not None:
+            buffer += b'891='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class PositionAmountData(TypedGroup):
+    __slots__ = (
+        'PosAmtType',
+        'PosAmt',
+    )
+
+    PosAmtType: str
+    PosAmt: Decimal
+
+    fieldSpecs = {
+        707: ('PosAmtType', None, None),
+        708: ('PosAmt', Decimal, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.PosAmtType = None
+        self.PosAmt = None
+
+    def encodeFields(self, buffer):
+        value = self.PosAmtType
+        if value is not None:
+            buffer += b'707='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PosAmt
+        if value is not None:
+            buffer += b'708='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class TrdInstrmtLegGrp(TypedGroup):
+    __slots__ = (
+        'LegSymbol',
+        'LegSymbolSfx',
+        'LegSecurityID',
+        'LegSecurityIDSource',
+        'NoLegSecurityAltID',
+        'LegProduct',
+        'LegCFICode',
+        'LegSecurityType',
+        'LegSecuritySubType',
+        'LegMaturityMonthYear',
+        'LegMaturityDate',
+        'LegCouponPaymentDate',
+        'LegIssueDate',
+        'LegRepoCollateralSecurityType',
+        'LegRepurchaseTerm',
+        'LegRepurchaseRate',
+        'LegFactor',
+        'LegCreditRating',
+        'LegInstrRegistry',
+        'LegCountryOfIssue',
+        'LegStateOrProvinceOfIssue',
+        'LegLocaleOfIssue',
+        'LegRedemptionDate',
+        'LegStrikePrice',
+        'LegStrikeCurrency',
+        'LegOptAttribute',
+        'LegContractMultiplier',
+        'LegCouponRate',
+        'LegSecurityExchange',
+        'LegIssuer',
+        'EncodedLegIssuerLen',
+        'EncodedLegIssuer',
+        'LegSecurityDesc',
+        'EncodedLegSecurityDescLen',
+        'EncodedLegSecurityDesc',
+        'LegRatioQty',
+        'LegSide',
+        'LegCurrency',
+        'LegPool',
+        'LegDatedDate',
+        'LegContractSettlMonth',
+        'LegInterestAccrualDate',
+        'LegQty',
+        'LegSwapType',
+        'NoLegStipulations',
+        'LegPositionEffect',
+        'LegCoveredOrUncovered',
+        'NoNestedPartyIDs',
+        'LegRefID',
+        'LegPrice',
+        'LegSettlType',
+        'LegSettlDate',
+        'LegLastPx',
+    )
+
+    LegSymbol: str
+    LegSymbolSfx: str
+    LegSecurityID: str
+    LegSecurityIDSource: str
+    NoLegSecurityAltID: list
+    LegProduct: int
+    LegCFICode: str
+    LegSecurityType: str
+    LegSecuritySubType: str
+    LegMaturityMonthYear: str
+    LegMaturityDate: date
+    LegCouponPaymentDate: date
+    LegIssueDate: date
+    LegRepoCollateralSecurityType: str
+    LegRepurchaseTerm: int
+    LegRepurchaseRate: Decimal
+    LegFactor: Decimal
+    LegCreditRating: str
+    LegInstrRegistry: str
+    LegCountryOfIssue: str
+    LegStateOrProvinceOfIssue: str
+    LegLocaleOfIssue: str
+    LegRedemptionDate: date
+    LegStrikePrice: Decimal
+    LegStrikeCurrency: str
+    LegOptAttribute: str
+    LegContractMultiplier: Decimal
+    LegCouponRate: Decimal
+    LegSecurityExchange: str
+    LegIssuer: str
+    EncodedLegIssuerLen: int
+    EncodedLegIssuer: str
+    LegSecurityDesc: str
+    EncodedLegSecurityDescLen: int
+    EncodedLegSecurityDesc: str
+    LegRatioQty: Decimal
+    LegSide: str
+    LegCurrency: str
+    LegPool: str
+    LegDatedDate: date
+    LegContractSettlMonth: str
+    LegInterestAccrualDate: date
+    LegQty: Decimal
+    LegSwapType: int
+    NoLegStipulations: list
+    LegPositionEffect: str
+    LegCoveredOrUncovered: int
+    NoNestedPartyIDs: list
+    LegRefID: str
+    LegPrice: Decimal
+    LegSettlType: str
+    LegSettlDate: date
+    LegLastPx: Decimal
+
+    fieldSpecs = {
+        600: ('LegSymbol', None, None),
+        601: ('LegSymbolSfx', None, None),
+        602: ('LegSecurityID', None, None),
+        603: ('LegSecurityIDSource', None, None),
+        604: ('NoLegSecurityAltID', None, LegSecAltIDGrp),
+        607: ('LegProduct', int, None),
+        608: ('LegCFICode', None, None),
+        609: ('LegSecurityType', None, None),
+        764: ('LegSecuritySubType', None, None),
+        610: ('LegMaturityMonthYear', None, None),
+        611: ('LegMaturityDate', parseDate, None),
+        248: ('LegCouponPaymentDate', parseDate, None),
+        249: ('LegIssueDate', parseDate, None),
+        250: ('LegRepoCollateralSecurityType', None, None),
+        251: ('LegRepurchaseTerm', int, None),
+        252: ('LegRepurchaseRate', Decimal, None),
+        253: ('LegFactor', Decimal, None),
+        257: ('LegCreditRating', None, None),
+        599: ('LegInstrRegistry', None, None),
+        596: ('LegCountryOfIssue', None, None),
+        597: ('LegStateOrProvinceOfIssue', None, None),
+        598: ('LegLocaleOfIssue', None, None),
+        254: ('LegRedemptionDate', parseDate, None),
+        612: ('LegStrikePrice', Decimal, None),
+        942: ('LegStrikeCurrency', None, None),
+        613: ('LegOptAttribute', None, None),
+        614: ('LegContractMultiplier', Decimal, None),
+        615: ('LegCouponRate', Decimal, None),
+        616: ('LegSecurityExchange', None, None),
+        617: ('LegIssuer', None, None),
+        618: ('EncodedLegIssuerLen', int, None),
+        619: ('EncodedLegIssuer', None, None),
+        620: ('LegSecurityDesc', None, None),
+        621: ('EncodedLegSecurityDescLen', int, None),
+        622: ('EncodedLegSecurityDesc', None, None),
+        623: ('LegRatioQty', Decimal, None),
+        624: ('LegSide', None, None),
+        556: ('LegCurrency', None, None),
+        740: ('LegPool', None, None),
+        739: ('LegDatedDate', parseDate, None),
+        955: ('LegContractSettlMonth', None, None),
+        956: ('LegInterestAccrualDate', parseDate, None),
+        687: ('LegQty', Decimal, None),
+        690: ('LegSwapType', int, None),
+        683: ('NoLegStipulations', None, LegStipulations),
+        564: ('LegPositionEffect', None, None),
+        565: ('LegCoveredOrUncovered', int, None),
+        539: ('NoNestedPartyIDs', None, NestedParties),
+        654: ('LegRefID', None, None),
+        566: ('LegPrice', Decimal, None),
+        587: ('LegSettlType', None, None),
+        588: ('LegSettlDate', parseDate, None),
+        637: ('LegLastPx', Decimal, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.LegSymbol = None
+        self.LegSymbolSfx = None
+        self.LegSecurityID = None
+        self.LegSecurityIDSource = None
+        self.NoLegSecurityAltID = None
+        self.LegProduct = None
+        self.LegCFICode = None
+        self.LegSecurityType = None
+        self.LegSecuritySubType = None
+        self.LegMaturityMonthYear = None
+        self.LegMaturityDate = None
+        self.LegCouponPaymentDate = None
+        self.LegIssueDate = None
+        self.LegRepoCollateralSecurityType = None
+        self.LegRepurchaseTerm = None
+        self.LegRepurchaseRate = None
+        self.LegFactor = None
+        self.LegCreditRating = None
+        self.LegInstrRegistry = None
+        self.LegCountryOfIssue = None
+        self.LegStateOrProvinceOfIssue = None
+        self.LegLocaleOfIssue = None
+        self.LegRedemptionDate = None
+        self.LegStrikePrice = None
+        self.LegStrikeCurrency = None
+        self.LegOptAttribute = None
+        self.LegContractMultiplier = None
+        self.LegCouponRate = None
+        self.LegSecurityExchange = None
+        self.LegIssuer = None
+        self.EncodedLegIssuerLen = None
+        self.EncodedLegIssuer = None
+        self.LegSecurityDesc = None
+        self.EncodedLegSecurityDescLen = None
+        self.EncodedLegSecurityDesc = None
+        self.LegRatioQty = None
+        self.LegSide = None
+        self.LegCurrency = None
+        self.LegPool = None
+        self.LegDatedDate = None
+        self.LegContractSettlMonth = None
+        self.LegInterestAccrualDate = None
+        self.LegQty = None
+        self.LegSwapType = None
+        self.NoLegStipulations = None
+        self.LegPositionEffect = None
+        self.LegCoveredOrUncovered = None
+        self.NoNestedPartyIDs = None
+        self.LegRefID = None
+        self.LegPrice = None
+        self.LegSettlType = None
+        self.LegSettlDate = None
+        self.LegLastPx = None
+
+    def encodeFields(self, buffer):
+        value = self.LegSymbol
+        if value is not None:
+            buffer += b'600='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSymbolSfx
+        if value is not None:
+            buffer += b'601='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityID
+        if value is not None:
+            buffer += b'602='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityIDSource
+        if value is not None:
+            buffer += b'603='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoLegSecurityAltID
+        if value is not None:
+            buffer += b'604=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.LegProduct
+        if value is not None:
+            buffer += b'607='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCFICode
+        if value is not None:
+            buffer += b'608='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityType
+        if value is not None:
+            buffer += b'609='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecuritySubType
+        if value is not None:
+            buffer += b'764='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegMaturityMonthYear
+        if value is not None:
+            buffer += b'610='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegMaturityDate
+        if value is not None:
+            buffer += b'611='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCouponPaymentDate
+        if value is not None:
+            buffer += b'248='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegIssueDate
+        if value is not None:
+            buffer += b'249='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepoCollateralSecurityType
+        if value is not None:
+            buffer += b'250='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepurchaseTerm
+        if value is not None:
+            buffer += b'251='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepurchaseRate
+        if value is not None:
+            buffer += b'252='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegFactor
+        if value is not None:
+            buffer += b'253='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCreditRating
+        if value is not None:
+            buffer += b'257='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegInstrRegistry
+        if value is not None:
+            buffer += b'599='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCountryOfIssue
+        if value is not None:
+            buffer += b'596='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'597='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegLocaleOfIssue
+        if value is not None:
+            buffer += b'598='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRedemptionDate
+        if value is not None:
+            buffer += b'254='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStrikePrice
+        if value is not None:
+            buffer += b'612='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStrikeCurrency
+        if value is not None:
+            buffer += b'942='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegOptAttribute
+        if value is not None:
+            buffer += b'613='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegContractMultiplier
+        if value is not None:
+            buffer += b'614='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCouponRate
+        if value is not None:
+            buffer += b'615='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityExchange
+        if value is not None:
+            buffer += b'616='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegIssuer
+        if value is not None:
+            buffer += b'617='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegIssuerLen
+        if value is not None:
+            buffer += b'618='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegIssuer
+        if value is not None:
+            buffer += b'619='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityDesc
+        if value is not None:
+            buffer += b'620='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegSecurityDescLen
+        if value is not None:
+            buffer += b'621='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegSecurityDesc
+        if value is not None:
+            buffer += b'622='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRatioQty
+        if value is not None:
+            buffer += b'623='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSide
+        if value is not None:
+            buffer += b'624='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCurrency
+        if value is not None:
+            buffer += b'556='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegPool
+        if value is not None:
+            buffer += b'740='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegDatedDate
+        if value is not None:
+            buffer += b'739='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegContractSettlMonth
+        if value is not None:
+            buffer += b'955='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegInterestAccrualDate
+        if value is not None:
+            buffer += b'956='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegQty
+        if value is not None:
+            buffer += b'687='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSwapType
+        if value is not None:
+            buffer += b'690='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoLegStipulations
+        if value is not None:
+            buffer += b'683=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.LegPositionEffect
+        if value is not None:
+            buffer += b'564='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCoveredOrUncovered
+        if value is not None:
+            buffer += b'565='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoNestedPartyIDs
+        if value is not None:
+            buffer += b'539=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.LegRefID
+        if value is not None:
+            buffer += b'654='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegPrice
+        if value is not None:
+            buffer += b'566='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSettlType
+        if value is not None:
+            buffer += b'587='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSettlDate
+        if value is not None:
+            buffer += b'588='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegLastPx
+        if value is not None:
+            buffer += b'637='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class TrdRegTimestamps(TypedGroup):
+    __slots__ = (
+        'TrdRegTimestamp',
+        'TrdRegTimestampType',
+        'TrdRegTimestampOrigin',
+    )
+
+    TrdRegTimestamp: datetime
+    TrdRegTimestampType: int
+    TrdRegTimestampOrigin: str
+
+    fieldSpecs = {
+        769: ('TrdRegTimestamp', parseUTCTimestamp, None),
+        770: ('TrdRegTimestampType', int, None),
+        771: ('TrdRegTimestampOrigin', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.TrdRegTimestamp = None
+        self.TrdRegTimestampType = None
+        self.TrdRegTimestampOrigin = None
+
+    def encodeFields(self, buffer):
+        value = self.TrdRegTimestamp
+        if value is not None:
+            buffer += b'769='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TrdRegTimestampType
+        if value is not None:
+            buffer += b'770='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TrdRegTimestampOrigin
+        if value is not None:
+            buffer += b'771='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class ClrInstGrp(TypedGroup):
+    __slots__ = (
+        'ClearingInstruction',
+    )
+
+    ClearingInstruction: int
+
+    fieldSpecs = {
+        577: ('ClearingInstruction', int, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.ClearingInstruction = None
+
+    def encodeFields(self, buffer):
+        value = self.ClearingInstruction
+        if value is not None:
+            buffer += b'577='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class NstdPtys2SubGrp(TypedGroup):
+    __slots__ = (
+        'Nested2PartySubID',
+        'Nested2PartySubIDType',
+    )
+
+    Nested2PartySubID: str
+    Nested2PartySubIDType: int
+
+    fieldSpecs = {
+        760: ('Nested2PartySubID', None, None),
+        807: ('Nested2PartySubIDType', int, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.Nested2PartySubID = None
+        self.Nested2PartySubIDType = None
+
+    def encodeFields(self, buffer):
+        value = self.Nested2PartySubID
+        if value is not None:
+            buffer += b'760='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Nested2PartySubIDType
+        if value is not None:
+            buffer += b'807='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class NestedParties2(TypedGroup):
+    __slots__ = (
+        'Nested2PartyID',
+        'Nested2PartyIDSource',
+        'Nested2PartyRole',
+        'NoNested2PartySubIDs',
+    )
+
+    Nested2PartyID: str
+    Nested2PartyIDSource: str
+    Nested2PartyRole: int
+    NoNested2PartySubIDs: list
+
+    fieldSpecs = {
+        757: ('Nested2PartyID', None, None),
+        758: ('Nested2PartyIDSource', None, None),
+        759: ('Nested2PartyRole', int, None),
+        806: ('NoNested2PartySubIDs', None, NstdPtys2SubGrp),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.Nested2PartyID = None
+        self.Nested2PartyIDSource = None
+        self.Nested2PartyRole = None
+        self.NoNested2PartySubIDs = None
+
+    def encodeFields(self, buffer):
+        value = self.Nested2PartyID
+        if value is not None:
+            buffer += b'757='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Nested2PartyIDSource
+        if value is not None:
+            buffer += b'758='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Nested2PartyRole
+        if value is not None:
+            buffer += b'759='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoNested2PartySubIDs
+        if value is not None:
+            buffer += b'806=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class TrdAllocGrp(TypedGroup):
+    __slots__ = (
+        'AllocAccount',
+        'AllocAcctIDSource',
+        'AllocSettlCurrency',
+        'IndividualAllocID',
+        'NoNested2PartyIDs',
+        'AllocQty',
+    )
+
+    AllocAccount: str
+    AllocAcctIDSource: int
+    AllocSettlCurrency: str
+    IndividualAllocID: str
+    NoNested2PartyIDs: list
+    AllocQty: Decimal
+
+    fieldSpecs = {
+        79: ('AllocAccount', None, None),
+        661: ('AllocAcctIDSource', int, None),
+        736: ('AllocSettlCurrency', None, None),
+        467: ('IndividualAllocID', None, None),
+        756: ('NoNested2PartyIDs', None, NestedParties2),
+        80: ('AllocQty', Decimal, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.AllocAccount = None
+        self.AllocAcctIDSource = None
+        self.AllocSettlCurrency = None
+        self.IndividualAllocID = None
+        self.NoNested2PartyIDs = None
+        self.AllocQty = None
+
+    def encodeFields(self, buffer):
+        value = self.AllocAccount
+        if value is not None:
+            buffer += b'79='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocAcctIDSource
+        if value is not None:
+            buffer += b'661='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocSettlCurrency
+        if value is not None:
+            buffer += b'736='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IndividualAllocID
+        if value is not None:
+            buffer += b'467='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoNested2PartyIDs
+        if value is not None:
+            buffer += b'756=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.AllocQty
+        if value is not None:
+            buffer += b'80='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class TrdCapRptSideGrp(TypedGroup):
+    __slots__ = (
+        'Side',
+        'OrderID',
+        'SecondaryOrderID',
+        'ClOrdID',
+        'SecondaryClOrdID',
+        'ListID',
+        'NoPartyIDs',
+        'Account',
+        'AcctIDSource',
+        'AccountType',
+        'ProcessCode',
+        'OddLot',
+        'NoClearingInstructions',
+        'TradeInputSource',
+        'TradeInputDevice',
+        'OrderInputDevice',
+        'Currency',
+        'ComplianceID',
+        'SolicitedFlag',
+        'OrderCapacity',
+        'OrderRestrictions',
+        'CustOrderCapacity',
+        'OrdType',
+        'ExecInst',
+        'TransBkdTime',
+        'TradingSessionID',
+        'TradingSessionSubID',
+        'TimeBracket',
+        'Commission',
+        'CommType',
+        'CommCurrency',
+        'FundRenewWaiv',
+        'GrossTradeAmt',
+        'NumDaysInterest',
+        'ExDate',
+        'AccruedInterestRate',
+        'AccruedInterestAmt',
+        'InterestAtMaturity',
+        'EndAccruedInterestAmt',
+        'StartCash',
+        'EndCash',
+        'Concession',
+        'TotalTakedown',
+        'NetMoney',
+        'SettlCurrAmt',
+        'SettlCurrency',
+        'SettlCurrFxRate',
+        'SettlCurrFxRateCalc',
+        'PositionEffect',
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+        'SideMultiLegReportingType',
+        'NoContAmts',
+        'NoStipulations',
+        'NoMiscFees',
+        'ExchangeRule',
+        'TradeAllocIndicator',
+        'PreallocMethod',
+        'AllocID',
+        'NoAllocs',
+    )
+
+    Side: str
+    OrderID: str
+    SecondaryOrderID: str
+    ClOrdID: str
+    SecondaryClOrdID: str
+    ListID: str
+    NoPartyIDs: list
+    Account: str
+    AcctIDSource: int
+    AccountType: int
+    ProcessCode: str
+    OddLot: bool
+    NoClearingInstructions: list
+    TradeInputSource: str
+    TradeInputDevice: str
+    OrderInputDevice: str
+    Currency: str
+    ComplianceID: str
+    SolicitedFlag: bool
+    OrderCapacity: str
+    OrderRestrictions: str
+    CustOrderCapacity: int
+    OrdType: str
+    ExecInst: str
+    TransBkdTime: datetime
+    TradingSessionID: str
+    TradingSessionSubID: str
+    TimeBracket: str
+    Commission: Decimal
+    CommType: str
+    CommCurrency: str
+    FundRenewWaiv: str
+    GrossTradeAmt: Decimal
+    NumDaysInterest: int
+    ExDate: date
+    AccruedInterestRate: Decimal
+    AccruedInterestAmt: Decimal
+    InterestAtMaturity: Decimal
+    EndAccruedInterestAmt: Decimal
+    StartCash: Decimal
+    EndCash: Decimal
+    Concession: Decimal
+    TotalTakedown: Decimal
+    NetMoney: Decimal
+    SettlCurrAmt: Decimal
+    SettlCurrency: str
+    SettlCurrFxRate: Decimal
+    SettlCurrFxRateCalc: str
+    PositionEffect: str
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+    SideMultiLegReportingType: int
+    NoContAmts: list
+    NoStipulations: list
+    NoMiscFees: list
+    ExchangeRule: str
+    TradeAllocIndicator: int
+    PreallocMethod: str
+    AllocID: str
+    NoAllocs: list
+
+    fieldSpecs = {
+        54: ('Side', None, None),
+        37: ('OrderID', None, None),
+        198: ('SecondaryOrderID', None, None),
+        11: ('ClOrdID', None, None),
+        526: ('SecondaryClOrdID', None, None),
+        66: ('ListID', None, None),
+        453: ('NoPartyIDs', None, Parties),
+        1: ('Account', None, None),
+        660: ('AcctIDSource', int, None),
+        581: ('AccountType', int, None),
+        81: ('ProcessCode', None, None),
+        575: ('OddLot', parseBoolean, None),
+        576: ('NoClearingInstructions', None, ClrInstGrp),
+        578: ('TradeInputSource', None, None),
+        579: ('TradeInputDevice', None, None),
+        821: ('OrderInputDevice', None, None),
+        15: ('Currency', None, None),
+        376: ('ComplianceID', None, None),
+        377: ('SolicitedFlag', parseBoolean, None),
+        528: ('OrderCapacity', None, None),
+        529: ('OrderRestrictions', None, None),
+        582: ('CustOrderCapacity', int, None),
+        40: ('OrdType', None, None),
+        18: ('ExecInst', None, None),
+        483: ('TransBkdTime', parseUTCTimestamp, None),
+        336: ('TradingSessionID', None, None),
+        625: ('TradingSessionSubID', None, None),
+        943: ('TimeBracket', None, None),
+        12: ('Commission', Decimal, None),
+        13: ('CommType', None, None),
+        479: ('CommCurrency', None, None),
+        497: ('FundRenewWaiv', None, None),
+        381: ('GrossTradeAmt', Decimal, None),
+        157: ('NumDaysInterest', int, None),
+        230: ('ExDate', parseDate, None),
+        158: ('AccruedInterestRate', Decimal, None),
+        159: ('AccruedInterestAmt', Decimal, None),
+        738: ('InterestAtMaturity', Decimal, None),
+        920: ('EndAccruedInterestAmt', Decimal, None),
+        921: ('StartCash', Decimal, None),
+        922: ('EndCash', Decimal, None),
+        238: ('Concession', Decimal, None),
+        237: ('TotalTakedown', Decimal, None),
+        118: ('NetMoney', Decimal, None),
+        119: ('SettlCurrAmt', Decimal, None),
+        120: ('SettlCurrency', None, None),
+        155: ('SettlCurrFxRate', Decimal, None),
+        156: ('SettlCurrFxRateCalc', None, None),
+        77: ('PositionEffect', None, None),
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+        752: ('SideMultiLegReportingType', int, None),
+        518: ('NoContAmts', None, ContAmtGrp),
+        232: ('NoStipulations', None, Stipulations),
+        136: ('NoMiscFees', None, MiscFeesGrp),
+        825: ('ExchangeRule', None, None),
+        826: ('TradeAllocIndicator', int, None),
+        591: ('PreallocMethod', None, None),
+        70: ('AllocID', None, None),
+        78: ('NoAllocs', None, TrdAllocGrp),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.Side = None
+        self.OrderID = None
+        self.SecondaryOrderID = None
+        self.ClOrdID = None
+        self.SecondaryClOrdID = None
+        self.ListID = None
+        self.NoPartyIDs = None
+        self.Account = None
+        self.AcctIDSource = None
+        self.AccountType = None
+        self.ProcessCode = None
+        self.OddLot = None
+        self.NoClearingInstructions = None
+        self.TradeInputSource = None
+        self.TradeInputDevice = None
+        self.OrderInputDevice = None
+        self.Currency = None
+        self.ComplianceID = None
+        self.SolicitedFlag = None
+        self.OrderCapacity = None
+        self.OrderRestrictions = None
+        self.CustOrderCapacity = None
+        self.OrdType = None
+        self.ExecInst = None
+        self.TransBkdTime = None
+        self.TradingSessionID = None
+        self.TradingSessionSubID = None
+        self.TimeBracket = None
+        self.Commission = None
+        self.CommType = None
+        self.CommCurrency = None
+        self.FundRenewWaiv = None
+        self.GrossTradeAmt = None
+        self.NumDaysInterest = None
+        self.ExDate = None
+        self.AccruedInterestRate = None
+        self.AccruedInterestAmt = None
+        self.InterestAtMaturity = None
+        self.EndAccruedInterestAmt = None
+        self.StartCash = None
+        self.EndCash = None
+        self.Concession = None
+        self.TotalTakedown = None
+        self.NetMoney = None
+        self.SettlCurrAmt = None
+        self.SettlCurrency = None
+        self.SettlCurrFxRate = None
+        self.SettlCurrFxRateCalc = None
+        self.PositionEffect = None
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+        self.SideMultiLegReportingType = None
+        self.NoContAmts = None
+        self.NoStipulations = None
+        self.NoMiscFees = None
+        self.ExchangeRule = None
+        self.TradeAllocIndicator = None
+        self.PreallocMethod = None
+        self.AllocID = None
+        self.NoAllocs = None
+
+    def encodeFields(self, buffer):
+        value = self.Side
+        if value is not None:
+            buffer += b'54='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderID
+        if value is not None:
+            buffer += b'37='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryOrderID
+        if value is not None:
+            buffer += b'198='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdID
+        if value is not None:
+            buffer += b'11='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryClOrdID
+        if value is not None:
+            buffer += b'526='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ListID
+        if value is not None:
+            buffer += b'66='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoPartyIDs
+        if value is not None:
+            buffer += b'453=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Account
+        if value is not None:
+            buffer += b'1='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AcctIDSource
+        if value is not None:
+            buffer += b'660='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccountType
+        if value is not None:
+            buffer += b'581='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ProcessCode
+        if value is not None:
+            buffer += b'81='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OddLot
+        if value is not None:
+            buffer += b'575='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoClearingInstructions
+        if value is not None:
+            buffer += b'576=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.TradeInputSource
+        if value is not None:
+            buffer += b'578='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeInputDevice
+        if value is not None:
+            buffer += b'579='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderInputDevice
+        if value is not None:
+            buffer += b'821='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Currency
+        if value is not None:
+            buffer += b'15='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ComplianceID
+        if value is not None:
+            buffer += b'376='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SolicitedFlag
+        if value is not None:
+            buffer += b'377='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderCapacity
+        if value is not None:
+            buffer += b'528='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderRestrictions
+        if value is not None:
+            buffer += b'529='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CustOrderCapacity
+        if value is not None:
+            buffer += b'582='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdType
+        if value is not None:
+            buffer += b'40='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecInst
+        if value is not None:
+            buffer += b'18='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransBkdTime
+        if value is not None:
+            buffer += b'483='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradingSessionID
+        if value is not None:
+            buffer += b'336='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradingSessionSubID
+        if value is not None:
+            buffer += b'625='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TimeBracket
+        if value is not None:
+            buffer += b'943='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Commission
+        if value is not None:
+            buffer += b'12='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommType
+        if value is not None:
+            buffer += b'13='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommCurrency
+        if value is not None:
+            buffer += b'479='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.FundRenewWaiv
+        if value is not None:
+            buffer += b'497='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.GrossTradeAmt
+        if value is not None:
+            buffer += b'381='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NumDaysInterest
+        if value is not None:
+            buffer += b'157='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExDate
+        if value is not None:
+            buffer += b'230='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccruedInterestRate
+        if value is not None:
+            buffer += b'158='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccruedInterestAmt
+        if value is not None:
+            buffer += b'159='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAtMaturity
+        if value is not None:
+            buffer += b'738='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndAccruedInterestAmt
+        if value is not None:
+            buffer += b'920='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartCash
+        if value is not None:
+            buffer += b'921='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndCash
+        if value is not None:
+            buffer += b'922='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Concession
+        if value is not None:
+            buffer += b'238='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TotalTakedown
+        if value is not None:
+            buffer += b'237='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NetMoney
+        if value is not None:
+            buffer += b'118='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrAmt
+        if value is not None:
+            buffer += b'119='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrency
+        if value is not None:
+            buffer += b'120='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrFxRate
+        if value is not None:
+            buffer += b'155='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrFxRateCalc
+        if value is not None:
+            buffer += b'156='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PositionEffect
+        if value is not None:
+            buffer += b'77='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SideMultiLegReportingType
+        if value is not None:
+            buffer += b'752='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoContAmts
+        if value is not None:
+            buffer += b'518=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.NoStipulations
+        if value is not None:
+            buffer += b'232=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.NoMiscFees
+        if value is not None:
+            buffer += b'136=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.ExchangeRule
+        if value is not None:
+            buffer += b'825='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeAllocIndicator
+        if value is not None:
+            buffer += b'826='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PreallocMethod
+        if value is not None:
+            buffer += b'591='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocID
+        if value is not None:
+            buffer += b'70='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoAllocs
+        if value is not None:
+            buffer += b'78=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class PreAllocGrp(TypedGroup):
+    __slots__ = (
+        'AllocAccount',
+        'AllocAcctIDSource',
+        'AllocSettlCurrency',
+        'IndividualAllocID',
+        'NoNestedPartyIDs',
+        'AllocQty',
+    )
+
+    AllocAccount: str
+    AllocAcctIDSource: int
+    AllocSettlCurrency: str
+    IndividualAllocID: str
+    NoNestedPartyIDs: list
+    AllocQty: Decimal
+
+    fieldSpecs = {
+        79: ('AllocAccount', None, None),
+        661: ('AllocAcctIDSource', int, None),
+        736: ('AllocSettlCurrency', None, None),
+        467: ('IndividualAllocID', None, None),
+        539: ('NoNestedPartyIDs', None, NestedParties),
+        80: ('AllocQty', Decimal, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.AllocAccount = None
+        self.AllocAcctIDSource = None
+        self.AllocSettlCurrency = None
+        self.IndividualAllocID = None
+        self.NoNestedPartyIDs = None
+        self.AllocQty = None
+
+    def encodeFields(self, buffer):
+        value = self.AllocAccount
+        if value is not None:
+            buffer += b'79='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocAcctIDSource
+        if value is not None:
+            buffer += b'661='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocSettlCurrency
+        if value is not None:
+            buffer += b'736='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IndividualAllocID
+        if value is not None:
+            buffer += b'467='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoNestedPartyIDs
+        if value is not None:
+            buffer += b'539=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.AllocQty
+        if value is not None:
+            buffer += b'80='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class TrdgSesGrp(TypedGroup):
+    __slots__ = (
+        'TradingSessionID',
+        'TradingSessionSubID',
+    )
+
+    TradingSessionID: str
+    TradingSessionSubID: str
+
+    fieldSpecs = {
+        336: ('TradingSessionID', None, None),
+        625: ('TradingSessionSubID', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.TradingSessionID = None
+        self.TradingSessionSubID = None
+
+    def encodeFields(self, buffer):
+        value = self.TradingSessionID
+        if value is not None:
+            buffer += b'336='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradingSessionSubID
+        if value is not None:
+            buffer += b'625='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class OrdAllocGrp(TypedGroup):
+    __slots__ = (
+        'ClOrdID',
+        'OrderID',
+        'SecondaryOrderID',
+        'SecondaryClOrdID',
+        'ListID',
+        'NoNested2PartyIDs',
+        'OrderQty',
+        'OrderAvgPx',
+        'OrderBookingQty',
+    )
+
+    ClOrdID: str
+    OrderID: str
+    SecondaryOrderID: str
+    SecondaryClOrdID: str
+    ListID: str
+    NoNested2PartyIDs: list
+    OrderQty: Decimal
+    OrderAvgPx: Decimal
+    OrderBookingQty: Decimal
+
+    fieldSpecs = {
+        11: ('ClOrdID', None, None),
+        37: ('OrderID', None, None),
+        198: ('SecondaryOrderID', None, None),
+        526: ('SecondaryClOrdID', None, None),
+        66: ('ListID', None, None),
+        756: ('NoNested2PartyIDs', None, NestedParties2),
+        38: ('OrderQty', Decimal, None),
+        799: ('OrderAvgPx', Decimal, None),
+        800: ('OrderBookingQty', Decimal, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.ClOrdID = None
+        self.OrderID = None
+        self.SecondaryOrderID = None
+        self.SecondaryClOrdID = None
+        self.ListID = None
+        self.NoNested2PartyIDs = None
+        self.OrderQty = None
+        self.OrderAvgPx = None
+        self.OrderBookingQty = None
+
+    def encodeFields(self, buffer):
+        value = self.ClOrdID
+        if value is not None:
+            buffer += b'11='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderID
+        if value is not None:
+            buffer += b'37='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryOrderID
+        if value is not None:
+            buffer += b'198='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryClOrdID
+        if value is not None:
+            buffer += b'526='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ListID
+        if value is not None:
+            buffer += b'66='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoNested2PartyIDs
+        if value is not None:
+            buffer += b'756=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.OrderQty
+        if value is not None:
+            buffer += b'38='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderAvgPx
+        if value is not None:
+            buffer += b'799='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderBookingQty
+        if value is not None:
+            buffer += b'800='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class ExecAllocGrp(TypedGroup):
+    __slots__ = (
+        'LastQty',
+        'ExecID',
+        'SecondaryExecID',
+        'LastPx',
+        'LastParPx',
+        'LastCapacity',
+    )
+
+    LastQty: Decimal
+    ExecID: str
+    SecondaryExecID: str
+    LastPx: Decimal
+    LastParPx: Decimal
+    LastCapacity: str
+
+    fieldSpecs = {
+        32: ('LastQty', Decimal, None),
+        17: ('ExecID', None, None),
+        527: ('SecondaryExecID', None, None),
+        31: ('LastPx', Decimal, None),
+        669: ('LastParPx', Decimal, None),
+        29: ('LastCapacity', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.LastQty = None
+        self.ExecID = None
+        self.SecondaryExecID = None
+        self.LastPx = None
+        self.LastParPx = None
+        self.LastCapacity = None
+
+    def encodeFields(self, buffer):
+        value = self.LastQty
+        if value is not None:
+            buffer += b'32='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecID
+        if value is not None:
+            buffer += b'17='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryExecID
+        if value is not None:
+            buffer += b'527='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastPx
+        if value is not None:
+            buffer += b'31='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastParPx
+        if value is not None:
+            buffer += b'669='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastCapacity
+        if value is not None:
+            buffer += b'29='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class AttrbGrp(TypedGroup):
+    __slots__ = (
+        'InstrAttribType',
+        'InstrAttribValue',
+    )
+
+    InstrAttribType: int
+    InstrAttribValue: str
+
+    fieldSpecs = {
+        871: ('InstrAttribType', int, None),
+        872: ('InstrAttribValue', None, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.InstrAttribType = None
+        self.InstrAttribValue = None
+
+    def encodeFields(self, buffer):
+        value = self.InstrAttribType
+        if value is not None:
+            buffer += b'871='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InstrAttribValue
+        if value is not None:
+            buffer += b'872='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class InstrmtLegGrp(TypedGroup):
+    __slots__ = (
+        'LegSymbol',
+        'LegSymbolSfx',
+        'LegSecurityID',
+        'LegSecurityIDSource',
+        'NoLegSecurityAltID',
+        'LegProduct',
+        'LegCFICode',
+        'LegSecurityType',
+        'LegSecuritySubType',
+        'LegMaturityMonthYear',
+        'LegMaturityDate',
+        'LegCouponPaymentDate',
+        'LegIssueDate',
+        'LegRepoCollateralSecurityType',
+        'LegRepurchaseTerm',
+        'LegRepurchaseRate',
+        'LegFactor',
+        'LegCreditRating',
+        'LegInstrRegistry',
+        'LegCountryOfIssue',
+        'LegStateOrProvinceOfIssue',
+        'LegLocaleOfIssue',
+        'LegRedemptionDate',
+        'LegStrikePrice',
+        'LegStrikeCurrency',
+        'LegOptAttribute',
+        'LegContractMultiplier',
+        'LegCouponRate',
+        'LegSecurityExchange',
+        'LegIssuer',
+        'EncodedLegIssuerLen',
+        'EncodedLegIssuer',
+        'LegSecurityDesc',
+        'EncodedLegSecurityDescLen',
+        'EncodedLegSecurityDesc',
+        'LegRatioQty',
+        'LegSide',
+        'LegCurrency',
+        'LegPool',
+        'LegDatedDate',
+        'LegContractSettlMonth',
+        'LegInterestAccrualDate',
+    )
+
+    LegSymbol: str
+    LegSymbolSfx: str
+    LegSecurityID: str
+    LegSecurityIDSource: str
+    NoLegSecurityAltID: list
+    LegProduct: int
+    LegCFICode: str
+    LegSecurityType: str
+    LegSecuritySubType: str
+    LegMaturityMonthYear: str
+    LegMaturityDate: date
+    LegCouponPaymentDate: date
+    LegIssueDate: date
+    LegRepoCollateralSecurityType: str
+    LegRepurchaseTerm: int
+    LegRepurchaseRate: Decimal
+    LegFactor: Decimal
+    LegCreditRating: str
+    LegInstrRegistry: str
+    LegCountryOfIssue: str
+    LegStateOrProvinceOfIssue: str
+    LegLocaleOfIssue: str
+    LegRedemptionDate: date
+    LegStrikePrice: Decimal
+    LegStrikeCurrency: str
+    LegOptAttribute: str
+    LegContractMultiplier: Decimal
+    LegCouponRate: Decimal
+    LegSecurityExchange: str
+    LegIssuer: str
+    EncodedLegIssuerLen: int
+    EncodedLegIssuer: str
+    LegSecurityDesc: str
+    EncodedLegSecurityDescLen: int
+    EncodedLegSecurityDesc: str
+    LegRatioQty: Decimal
+    LegSide: str
+    LegCurrency: str
+    LegPool: str
+    LegDatedDate: date
+    LegContractSettlMonth: str
+    LegInterestAccrualDate: date
+
+    fieldSpecs = {
+        600: ('LegSymbol', None, None),
+        601: ('LegSymbolSfx', None, None),
+        602: ('LegSecurityID', None, None),
+        603: ('LegSecurityIDSource', None, None),
+        604: ('NoLegSecurityAltID', None, LegSecAltIDGrp),
+        607: ('LegProduct', int, None),
+        608: ('LegCFICode', None, None),
+        609: ('LegSecurityType', None, None),
+        764: ('LegSecuritySubType', None, None),
+        610: ('LegMaturityMonthYear', None, None),
+        611: ('LegMaturityDate', parseDate, None),
+        248: ('LegCouponPaymentDate', parseDate, None),
+        249: ('LegIssueDate', parseDate, None),
+        250: ('LegRepoCollateralSecurityType', None, None),
+        251: ('LegRepurchaseTerm', int, None),
+        252: ('LegRepurchaseRate', Decimal, None),
+        253: ('LegFactor', Decimal, None),
+        257: ('LegCreditRating', None, None),
+        599: ('LegInstrRegistry', None, None),
+        596: ('LegCountryOfIssue', None, None),
+        597: ('LegStateOrProvinceOfIssue', None, None),
+        598: ('LegLocaleOfIssue', None, None),
+        254: ('LegRedemptionDate', parseDate, None),
+        612: ('LegStrikePrice', Decimal, None),
+        942: ('LegStrikeCurrency', None, None),
+        613: ('LegOptAttribute', None, None),
+        614: ('LegContractMultiplier', Decimal, None),
+        615: ('LegCouponRate', Decimal, None),
+        616: ('LegSecurityExchange', None, None),
+        617: ('LegIssuer', None, None),
+        618: ('EncodedLegIssuerLen', int, None),
+        619: ('EncodedLegIssuer', None, None),
+        620: ('LegSecurityDesc', None, None),
+        621: ('EncodedLegSecurityDescLen', int, None),
+        622: ('EncodedLegSecurityDesc', None, None),
+        623: ('LegRatioQty', Decimal, None),
+        624: ('LegSide', None, None),
+        556: ('LegCurrency', None, None),
+        740: ('LegPool', None, None),
+        739: ('LegDatedDate', parseDate, None),
+        955: ('LegContractSettlMonth', None, None),
+        956: ('LegInterestAccrualDate', parseDate, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.LegSymbol = None
+        self.LegSymbolSfx = None
+        self.LegSecurityID = None
+        self.LegSecurityIDSource = None
+        self.NoLegSecurityAltID = None
+        self.LegProduct = None
+        self.LegCFICode = None
+        self.LegSecurityType = None
+        self.LegSecuritySubType = None
+        self.LegMaturityMonthYear = None
+        self.LegMaturityDate = None
+        self.LegCouponPaymentDate = None
+        self.LegIssueDate = None
+        self.LegRepoCollateralSecurityType = None
+        self.LegRepurchaseTerm = None
+        self.LegRepurchaseRate = None
+        self.LegFactor = None
+        self.LegCreditRating = None
+        self.LegInstrRegistry = None
+        self.LegCountryOfIssue = None
+        self.LegStateOrProvinceOfIssue = None
+        self.LegLocaleOfIssue = None
+        self.LegRedemptionDate = None
+        self.LegStrikePrice = None
+        self.LegStrikeCurrency = None
+        self.LegOptAttribute = None
+        self.LegContractMultiplier = None
+        self.LegCouponRate = None
+        self.LegSecurityExchange = None
+        self.LegIssuer = None
+        self.EncodedLegIssuerLen = None
+        self.EncodedLegIssuer = None
+        self.LegSecurityDesc = None
+        self.EncodedLegSecurityDescLen = None
+        self.EncodedLegSecurityDesc = None
+        self.LegRatioQty = None
+        self.LegSide = None
+        self.LegCurrency = None
+        self.LegPool = None
+        self.LegDatedDate = None
+        self.LegContractSettlMonth = None
+        self.LegInterestAccrualDate = None
+
+    def encodeFields(self, buffer):
+        value = self.LegSymbol
+        if value is not None:
+            buffer += b'600='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSymbolSfx
+        if value is not None:
+            buffer += b'601='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityID
+        if value is not None:
+            buffer += b'602='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityIDSource
+        if value is not None:
+            buffer += b'603='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoLegSecurityAltID
+        if value is not None:
+            buffer += b'604=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.LegProduct
+        if value is not None:
+            buffer += b'607='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCFICode
+        if value is not None:
+            buffer += b'608='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityType
+        if value is not None:
+            buffer += b'609='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecuritySubType
+        if value is not None:
+            buffer += b'764='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegMaturityMonthYear
+        if value is not None:
+            buffer += b'610='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegMaturityDate
+        if value is not None:
+            buffer += b'611='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCouponPaymentDate
+        if value is not None:
+            buffer += b'248='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegIssueDate
+        if value is not None:
+            buffer += b'249='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepoCollateralSecurityType
+        if value is not None:
+            buffer += b'250='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepurchaseTerm
+        if value is not None:
+            buffer += b'251='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRepurchaseRate
+        if value is not None:
+            buffer += b'252='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegFactor
+        if value is not None:
+            buffer += b'253='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCreditRating
+        if value is not None:
+            buffer += b'257='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegInstrRegistry
+        if value is not None:
+            buffer += b'599='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCountryOfIssue
+        if value is not None:
+            buffer += b'596='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'597='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegLocaleOfIssue
+        if value is not None:
+            buffer += b'598='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRedemptionDate
+        if value is not None:
+            buffer += b'254='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStrikePrice
+        if value is not None:
+            buffer += b'612='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegStrikeCurrency
+        if value is not None:
+            buffer += b'942='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegOptAttribute
+        if value is not None:
+            buffer += b'613='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegContractMultiplier
+        if value is not None:
+            buffer += b'614='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCouponRate
+        if value is not None:
+            buffer += b'615='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityExchange
+        if value is not None:
+            buffer += b'616='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegIssuer
+        if value is not None:
+            buffer += b'617='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegIssuerLen
+        if value is not None:
+            buffer += b'618='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegIssuer
+        if value is not None:
+            buffer += b'619='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSecurityDesc
+        if value is not None:
+            buffer += b'620='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegSecurityDescLen
+        if value is not None:
+            buffer += b'621='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedLegSecurityDesc
+        if value is not None:
+            buffer += b'622='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegRatioQty
+        if value is not None:
+            buffer += b'623='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegSide
+        if value is not None:
+            buffer += b'624='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegCurrency
+        if value is not None:
+            buffer += b'556='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegPool
+        if value is not None:
+            buffer += b'740='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegDatedDate
+        if value is not None:
+            buffer += b'739='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegContractSettlMonth
+        if value is not None:
+            buffer += b'955='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegInterestAccrualDate
+        if value is not None:
+            buffer += b'956='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class SettlPtysSubGrp(TypedGroup):
+    __slots__ = (
+        'SettlPartySubID',
+        'SettlPartySubIDType',
+    )
+
+    SettlPartySubID: str
+    SettlPartySubIDType: int
+
+    fieldSpecs = {
+        785: ('SettlPartySubID', None, None),
+        786: ('SettlPartySubIDType', int, None),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.SettlPartySubID = None
+        self.SettlPartySubIDType = None
+
+    def encodeFields(self, buffer):
+        value = self.SettlPartySubID
+        if value is not None:
+            buffer += b'785='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlPartySubIDType
+        if value is not None:
+            buffer += b'786='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class SettlParties(TypedGroup):
+    __slots__ = (
+        'SettlPartyID',
+        'SettlPartyIDSource',
+        'SettlPartyRole',
+        'NoSettlPartySubIDs',
+    )
+
+    SettlPartyID: str
+    SettlPartyIDSource: str
+    SettlPartyRole: int
+    NoSettlPartySubIDs: list
+
+    fieldSpecs = {
+        782: ('SettlPartyID', None, None),
+        783: ('SettlPartyIDSource', None, None),
+        784: ('SettlPartyRole', int, None),
+        801: ('NoSettlPartySubIDs', None, SettlPtysSubGrp),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.SettlPartyID = None
+        self.SettlPartyIDSource = None
+        self.SettlPartyRole = None
+        self.NoSettlPartySubIDs = None
+
+    def encodeFields(self, buffer):
+        value = self.SettlPartyID
+        if value is not None:
+            buffer += b'782='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlPartyIDSource
+        if value is not None:
+            buffer += b'783='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlPartyRole
+        if value is not None:
+            buffer += b'784='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSettlPartySubIDs
+        if value is not None:
+            buffer += b'801=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class DlvyInstGrp(TypedGroup):
+    __slots__ = (
+        'SettlInstSource',
+        'DlvyInstType',
+        'NoSettlPartyIDs',
+    )
+
+    SettlInstSource: str
+    DlvyInstType: str
+    NoSettlPartyIDs: list
+
+    fieldSpecs = {
+        165: ('SettlInstSource', None, None),
+        787: ('DlvyInstType', None, None),
+        781: ('NoSettlPartyIDs', None, SettlParties),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.SettlInstSource = None
+        self.DlvyInstType = None
+        self.NoSettlPartyIDs = None
+
+    def encodeFields(self, buffer):
+        value = self.SettlInstSource
+        if value is not None:
+            buffer += b'165='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DlvyInstType
+        if value is not None:
+            buffer += b'787='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSettlPartyIDs
+        if value is not None:
+            buffer += b'781=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class AllocGrp(TypedGroup):
+    __slots__ = (
+        'AllocAccount',
+        'AllocAcctIDSource',
+        'MatchStatus',
+        'AllocPrice',
+        'AllocQty',
+        'IndividualAllocID',
+        'ProcessCode',
+        'NoNestedPartyIDs',
+        'NotifyBrokerOfCredit',
+        'AllocHandlInst',
+        'AllocText',
+        'EncodedAllocTextLen',
+        'EncodedAllocText',
+        'Commission',
+        'CommType',
+        'CommCurrency',
+        'FundRenewWaiv',
+        'AllocAvgPx',
+        'AllocNetMoney',
+        'SettlCurrAmt',
+        'AllocSettlCurrAmt',
+        'SettlCurrency',
+        'AllocSettlCurrency',
+        'SettlCurrFxRate',
+        'SettlCurrFxRateCalc',
+        'AllocAccruedInterestAmt',
+        'AllocInterestAtMaturity',
+        'NoMiscFees',
+        'NoClearingInstructions',
+        'AllocSettlInstType',
+        'SettlDeliveryType',
+        'StandInstDbType',
+        'StandInstDbName',
+        'StandInstDbID',
+        'NoDlvyInst',
+    )
+
+    AllocAccount: str
+    AllocAcctIDSource: int
+    MatchStatus: str
+    AllocPrice: Decimal
+    AllocQty: Decimal
+    IndividualAllocID: str
+    ProcessCode: str
+    NoNestedPartyIDs: list
+    NotifyBrokerOfCredit: bool
+    AllocHandlInst: int
+    AllocText: str
+    EncodedAllocTextLen: int
+    EncodedAllocText: str
+    Commission: Decimal
+    CommType: str
+    CommCurrency: str
+    FundRenewWaiv: str
+    AllocAvgPx: Decimal
+    AllocNetMoney: Decimal
+    SettlCurrAmt: Decimal
+    AllocSettlCurrAmt: Decimal
+    SettlCurrency: str
+    AllocSettlCurrency: str
+    SettlCurrFxRate: Decimal
+    SettlCurrFxRateCalc: str
+    AllocAccruedInterestAmt: Decimal
+    AllocInterestAtMaturity: Decimal
+    NoMiscFees: list
+    NoClearingInstructions: list
+    AllocSettlInstType: int
+    SettlDeliveryType: int
+    StandInstDbType: int
+    StandInstDbName: str
+    StandInstDbID: str
+    NoDlvyInst: list
+
+    fieldSpecs = {
+        79: ('AllocAccount', None, None),
+        661: ('AllocAcctIDSource', int, None),
+        573: ('MatchStatus', None, None),
+        366: ('AllocPrice', Decimal, None),
+        80: ('AllocQty', Decimal, None),
+        467: ('IndividualAllocID', None, None),
+        81: ('ProcessCode', None, None),
+        539: ('NoNestedPartyIDs', None, NestedParties),
+        208: ('NotifyBrokerOfCredit', parseBoolean, None),
+        209: ('AllocHandlInst', int, None),
+        161: ('AllocText', None, None),
+        360: ('EncodedAllocTextLen', int, None),
+        361: ('EncodedAllocText', None, None),
+        12: ('Commission', Decimal, None),
+        13: ('CommType', None, None),
+        479: ('CommCurrency', None, None),
+        497: ('FundRenewWaiv', None, None),
+        153: ('AllocAvgPx', Decimal, None),
+        154: ('AllocNetMoney', Decimal, None),
+        119: ('SettlCurrAmt', Decimal, None),
+        737: ('AllocSettlCurrAmt', Decimal, None),
+        120: ('SettlCurrency', None, None),
+        736: ('AllocSettlCurrency', None, None),
+        155: ('SettlCurrFxRate', Decimal, None),
+        156: ('SettlCurrFxRateCalc', None, None),
+        742: ('AllocAccruedInterestAmt', Decimal, None),
+        741: ('AllocInterestAtMaturity', Decimal, None),
+        136: ('NoMiscFees', None, MiscFeesGrp),
+        576: ('NoClearingInstructions', None, ClrInstGrp),
+        780: ('AllocSettlInstType', int, None),
+        172: ('SettlDeliveryType', int, None),
+        169: ('StandInstDbType', int, None),
+        170: ('StandInstDbName', None, None),
+        171: ('StandInstDbID', None, None),
+        85: ('NoDlvyInst', None, DlvyInstGrp),
+    }
+
+    def __init__(self):
+        TypedGroup.__init__(self)
+        self.AllocAccount = None
+        self.AllocAcctIDSource = None
+        self.MatchStatus = None
+        self.AllocPrice = None
+        self.AllocQty = None
+        self.IndividualAllocID = None
+        self.ProcessCode = None
+        self.NoNestedPartyIDs = None
+        self.NotifyBrokerOfCredit = None
+        self.AllocHandlInst = None
+        self.AllocText = None
+        self.EncodedAllocTextLen = None
+        self.EncodedAllocText = None
+        self.Commission = None
+        self.CommType = None
+        self.CommCurrency = None
+        self.FundRenewWaiv = None
+        self.AllocAvgPx = None
+        self.AllocNetMoney = None
+        self.SettlCurrAmt = None
+        self.AllocSettlCurrAmt = None
+        self.SettlCurrency = None
+        self.AllocSettlCurrency = None
+        self.SettlCurrFxRate = None
+        self.SettlCurrFxRateCalc = None
+        self.AllocAccruedInterestAmt = None
+        self.AllocInterestAtMaturity = None
+        self.NoMiscFees = None
+        self.NoClearingInstructions = None
+        self.AllocSettlInstType = None
+        self.SettlDeliveryType = None
+        self.StandInstDbType = None
+        self.StandInstDbName = None
+        self.StandInstDbID = None
+        self.NoDlvyInst = None
+
+    def encodeFields(self, buffer):
+        value = self.AllocAccount
+        if value is not None:
+            buffer += b'79='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocAcctIDSource
+        if value is not None:
+            buffer += b'661='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MatchStatus
+        if value is not None:
+            buffer += b'573='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocPrice
+        if value is not None:
+            buffer += b'366='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocQty
+        if value is not None:
+            buffer += b'80='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IndividualAllocID
+        if value is not None:
+            buffer += b'467='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ProcessCode
+        if value is not None:
+            buffer += b'81='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoNestedPartyIDs
+        if value is not None:
+            buffer += b'539=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.NotifyBrokerOfCredit
+        if value is not None:
+            buffer += b'208='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocHandlInst
+        if value is not None:
+            buffer += b'209='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocText
+        if value is not None:
+            buffer += b'161='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedAllocTextLen
+        if value is not None:
+            buffer += b'360='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedAllocText
+        if value is not None:
+            buffer += b'361='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Commission
+        if value is not None:
+            buffer += b'12='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommType
+        if value is not None:
+            buffer += b'13='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommCurrency
+        if value is not None:
+            buffer += b'479='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.FundRenewWaiv
+        if value is not None:
+            buffer += b'497='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocAvgPx
+        if value is not None:
+            buffer += b'153='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocNetMoney
+        if value is not None:
+            buffer += b'154='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrAmt
+        if value is not None:
+            buffer += b'119='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocSettlCurrAmt
+        if value is not None:
+            buffer += b'737='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrency
+        if value is not None:
+            buffer += b'120='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocSettlCurrency
+        if value is not None:
+            buffer += b'736='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrFxRate
+        if value is not None:
+            buffer += b'155='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrFxRateCalc
+        if value is not None:
+            buffer += b'156='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocAccruedInterestAmt
+        if value is not None:
+            buffer += b'742='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocInterestAtMaturity
+        if value is not None:
+            buffer += b'741='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoMiscFees
+        if value is not None:
+            buffer += b'136=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.NoClearingInstructions
+        if value is not None:
+            buffer += b'576=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.AllocSettlInstType
+        if value is not None:
+            buffer += b'780='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDeliveryType
+        if value is not None:
+            buffer += b'172='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StandInstDbType
+        if value is not None:
+            buffer += b'169='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StandInstDbName
+        if value is not None:
+            buffer += b'170='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StandInstDbID
+        if value is not None:
+            buffer += b'171='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoDlvyInst
+        if value is not None:
+            buffer += b'85=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        for tag, value in self.tags.items():
+            buffer += b'%d=%s\x01' % (tag, str(value).encode('utf-8'))
+
+
+class Heartbeat(TypedMessage):
+    __slots__ = (
+        'TestReqID',
+    )
+
+    TestReqID: str
+
+    fieldSpecs = {
+        112: ('TestReqID', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, '0')
+        self.TestReqID = None
+
+    def encodeFields(self, buffer):
+        value = self.TestReqID
+        if value is not None:
+            buffer += b'112='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class TestRequest(TypedMessage):
+    __slots__ = (
+        'TestReqID',
+    )
+
+    TestReqID: str
+
+    fieldSpecs = {
+        112: ('TestReqID', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, '1')
+        self.TestReqID = None
+
+    def encodeFields(self, buffer):
+        value = self.TestReqID
+        if value is not None:
+            buffer += b'112='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class ResendRequest(TypedMessage):
+    __slots__ = (
+        'BeginSeqNo',
+        'EndSeqNo',
+    )
+
+    BeginSeqNo: int
+    EndSeqNo: int
+
+    fieldSpecs = {
+        7: ('BeginSeqNo', int, None),
+        16: ('EndSeqNo', int, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, '2')
+        self.BeginSeqNo = None
+        self.EndSeqNo = None
+
+    def encodeFields(self, buffer):
+        value = self.BeginSeqNo
+        if value is not None:
+            buffer += b'7='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndSeqNo
+        if value is not None:
+            buffer += b'16='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class Reject(TypedMessage):
+    __slots__ = (
+        'RefSeqNum',
+        'RefTagID',
+        'RefMsgType',
+        'SessionRejectReason',
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+    )
+
+    RefSeqNum: int
+    RefTagID: int
+    RefMsgType: str
+    SessionRejectReason: int
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+
+    fieldSpecs = {
+        45: ('RefSeqNum', int, None),
+        371: ('RefTagID', int, None),
+        372: ('RefMsgType', None, None),
+        373: ('SessionRejectReason', int, None),
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, '3')
+        self.RefSeqNum = None
+        self.RefTagID = None
+        self.RefMsgType = None
+        self.SessionRejectReason = None
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+
+    def encodeFields(self, buffer):
+        value = self.RefSeqNum
+        if value is not None:
+            buffer += b'45='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RefTagID
+        if value is not None:
+            buffer += b'371='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RefMsgType
+        if value is not None:
+            buffer += b'372='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SessionRejectReason
+        if value is not None:
+            buffer += b'373='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class SequenceReset(TypedMessage):
+    __slots__ = (
+        'GapFillFlag',
+        'NewSeqNo',
+    )
+
+    GapFillFlag: bool
+    NewSeqNo: int
+
+    fieldSpecs = {
+        123: ('GapFillFlag', parseBoolean, None),
+        36: ('NewSeqNo', int, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, '4')
+        self.GapFillFlag = None
+        self.NewSeqNo = None
+
+    def encodeFields(self, buffer):
+        value = self.GapFillFlag
+        if value is not None:
+            buffer += b'123='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NewSeqNo
+        if value is not None:
+            buffer += b'36='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class Logout(TypedMessage):
+    __slots__ = (
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+    )
+
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+
+    fieldSpecs = {
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, '5')
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+
+    def encodeFields(self, buffer):
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class ExecutionReport(TypedMessage):
+    __slots__ = (
+        'OrderID',
+        'SecondaryOrderID',
+        'SecondaryClOrdID',
+        'SecondaryExecID',
+        'ClOrdID',
+        'OrigClOrdID',
+        'ClOrdLinkID',
+        'QuoteRespID',
+        'OrdStatusReqID',
+        'MassStatusReqID',
+        'TotNumReports',
+        'LastRptRequested',
+        'NoPartyIDs',
+        'TradeOriginationDate',
+        'NoContraBrokers',
+        'ListID',
+        'CrossID',
+        'OrigCrossID',
+        'CrossType',
+        'ExecID',
+        'ExecRefID',
+        'ExecType',
+        'OrdStatus',
+        'WorkingIndicator',
+        'OrdRejReason',
+        'ExecRestatementReason',
+        'Account',
+        'AcctIDSource',
+        'AccountType',
+        'DayBookingInst',
+        'BookingUnit',
+        'PreallocMethod',
+        'SettlType',
+        'SettlDate',
+        'CashMargin',
+        'ClearingFeeIndicator',
+        'Symbol',
+        'SymbolSfx',
+        'SecurityID',
+        'SecurityIDSource',
+        'NoSecurityAltID',
+        'Product',
+        'CFICode',
+        'SecurityType',
+        'SecuritySubType',
+        'MaturityMonthYear',
+        'MaturityDate',
+        'PutOrCall',
+        'CouponPaymentDate',
+        'IssueDate',
+        'RepoCollateralSecurityType',
+        'RepurchaseTerm',
+        'RepurchaseRate',
+        'Factor',
+        'CreditRating',
+        'InstrRegistry',
+        'CountryOfIssue',
+        'StateOrProvinceOfIssue',
+        'LocaleOfIssue',
+        'RedemptionDate',
+        'StrikePrice',
+        'StrikeCurrency',
+        'OptAttribute',
+        'ContractMultiplier',
+        'CouponRate',
+        'SecurityExchange',
+        'Issuer',
+        'EncodedIssuerLen',
+        'EncodedIssuer',
+        'SecurityDesc',
+        'EncodedSecurityDescLen',
+        'EncodedSecurityDesc',
+        'Pool',
+        'ContractSettlMonth',
+        'CPProgram',
+        'CPRegType',
+        'NoEvents',
+        'DatedDate',
+        'InterestAccrualDate',
+        'AgreementDesc',
+        'AgreementID',
+        'AgreementDate',
+        'AgreementCurrency',
+        'TerminationType',
+        'StartDate',
+        'EndDate',
+        'DeliveryType',
+        'MarginRatio',
+        'NoUnderlyings',
+        'Side',
+        'NoStipulations',
+        'QtyType',
+        'OrderQty',
+        'CashOrderQty',
+        'OrderPercent',
+        'RoundingDirection',
+        'RoundingModulus',
+        'OrdType',
+        'PriceType',
+        'Price',
+        'StopPx',
+        'PegOffsetValue',
+        'PegMoveType',
+        'PegOffsetType',
+        'PegLimitType',
+        'PegRoundDirection',
+        'PegScope',
+        'DiscretionInst',
+        'DiscretionOffsetValue',
+        'DiscretionMoveType',
+        'DiscretionOffsetType',
+        'DiscretionLimitType',
+        'DiscretionRoundDirection',
+        'DiscretionScope',
+        'PeggedPrice',
+        'DiscretionPrice',
+        'TargetStrategy',
+        'TargetStrategyParameters',
+        'ParticipationRate',
+        'TargetStrategyPerformance',
+        'Currency',
+        'ComplianceID',
+        'SolicitedFlag',
+        'TimeInForce',
+        'EffectiveTime',
+        'ExpireDate',
+        'ExpireTime',
+        'ExecInst',
+        'OrderCapacity',
+        'OrderRestrictions',
+        'CustOrderCapacity',
+        'LastQty',
+        'UnderlyingLastQty',
+        'LastPx',
+        'UnderlyingLastPx',
+        'LastParPx',
+        'LastSpotRate',
+        'LastForwardPoints',
+        'LastMkt',
+        'TradingSessionID',
+        'TradingSessionSubID',
+        'TimeBracket',
+        'LastCapacity',
+        'LeavesQty',
+        'CumQty',
+        'AvgPx',
+        'DayOrderQty',
+        'DayCumQty',
+        'DayAvgPx',
+        'GTBookingInst',
+        'TradeDate',
+        'TransactTime',
+        'ReportToExch',
+        'Commission',
+        'CommType',
+        'CommCurrency',
+        'FundRenewWaiv',
+        'Spread',
+        'BenchmarkCurveCurrency',
+        'BenchmarkCurveName',
+        'BenchmarkCurvePoint',
+        'BenchmarkPrice',
+        'BenchmarkPriceType',
+        'BenchmarkSecurityID',
+        'BenchmarkSecurityIDSource',
+        'YieldType',
+        'Yield',
+        'YieldCalcDate',
+        'YieldRedemptionDate',
+        'YieldRedemptionPrice',
+        'YieldRedemptionPriceType',
+        'GrossTradeAmt',
+        'NumDaysInterest',
+        'ExDate',
+        'AccruedInterestRate',
+        'AccruedInterestAmt',
+        'InterestAtMaturity',
+        'EndAccruedInterestAmt',
+        'StartCash',
+        'EndCash',
+        'TradedFlatSwitch',
+        'BasisFeatureDate',
+        'BasisFeaturePrice',
+        'Concession',
+        'TotalTakedown',
+        'NetMoney',
+        'SettlCurrAmt',
+        'SettlCurrency',
+        'SettlCurrFxRate',
+        'SettlCurrFxRateCalc',
+        'HandlInst',
+        'MinQty',
+        'MaxFloor',
+        'PositionEffect',
+        'MaxShow',
+        'BookingType',
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+        'SettlDate2',
+        'OrderQty2',
+        'LastForwardPoints2',
+        'MultiLegReportingType',
+        'CancellationRights',
+        'MoneyLaunderingStatus',
+        'RegistID',
+        'Designation',
+        'TransBkdTime',
+        'ExecValuationPoint',
+        'ExecPriceType',
+        'ExecPriceAdjustment',
+        'PriorityIndicator',
+        'PriceImprovement',
+        'LastLiquidityInd',
+        'NoContAmts',
+        'NoLegs',
+        'CopyMsgIndicator',
+        'NoMiscFees',
+    )
+
+    OrderID: str
+    SecondaryOrderID: str
+    SecondaryClOrdID: str
+    SecondaryExecID: str
+    ClOrdID: str
+    OrigClOrdID: str
+    ClOrdLinkID: str
+    QuoteRespID: str
+    OrdStatusReqID: str
+    MassStatusReqID: str
+    TotNumReports: int
+    LastRptRequested: bool
+    NoPartyIDs: list
+    TradeOriginationDate: date
+    NoContraBrokers: list
+    ListID: str
+    CrossID: str
+    OrigCrossID: str
+    CrossType: int
+    ExecID: str
+    ExecRefID: str
+    ExecType: str
+    OrdStatus: str
+    WorkingIndicator: bool
+    OrdRejReason: int
+    ExecRestatementReason: int
+    Account: str
+    AcctIDSource: int
+    AccountType: int
+    DayBookingInst: str
+    BookingUnit: str
+    PreallocMethod: str
+    SettlType: str
+    SettlDate: date
+    CashMargin: str
+    ClearingFeeIndicator: str
+    Symbol: str
+    SymbolSfx: str
+    SecurityID: str
+    SecurityIDSource: str
+    NoSecurityAltID: list
+    Product: int
+    CFICode: str
+    SecurityType: str
+    SecuritySubType: str
+    MaturityMonthYear: str
+    MaturityDate: date
+    PutOrCall: int
+    CouponPaymentDate: date
+    IssueDate: date
+    RepoCollateralSecurityType: str
+    RepurchaseTerm: int
+    RepurchaseRate: Decimal
+    Factor: Decimal
+    CreditRating: str
+    InstrRegistry: str
+    CountryOfIssue: str
+    StateOrProvinceOfIssue: str
+    LocaleOfIssue: str
+    RedemptionDate: date
+    StrikePrice: Decimal
+    StrikeCurrency: str
+    OptAttribute: str
+    ContractMultiplier: Decimal
+    CouponRate: Decimal
+    SecurityExchange: str
+    Issuer: str
+    EncodedIssuerLen: int
+    EncodedIssuer: str
+    SecurityDesc: str
+    EncodedSecurityDescLen: int
+    EncodedSecurityDesc: str
+    Pool: str
+    ContractSettlMonth: str
+    CPProgram: int
+    CPRegType: str
+    NoEvents: list
+    DatedDate: date
+    InterestAccrualDate: date
+    AgreementDesc: str
+    AgreementID: str
+    AgreementDate: date
+    AgreementCurrency: str
+    TerminationType: int
+    StartDate: date
+    EndDate: date
+    DeliveryType: int
+    MarginRatio: Decimal
+    NoUnderlyings: list
+    Side: str
+    NoStipulations: list
+    QtyType: int
+    OrderQty: Decimal
+    CashOrderQty: Decimal
+    OrderPercent: Decimal
+    RoundingDirection: str
+    RoundingModulus: Decimal
+    OrdType: str
+    PriceType: int
+    Price: Decimal
+    StopPx: Decimal
+    PegOffsetValue: Decimal
+    PegMoveType: int
+    PegOffsetType: int
+    PegLimitType: int
+    PegRoundDirection: int
+    PegScope: int
+    DiscretionInst: str
+    DiscretionOffsetValue: Decimal
+    DiscretionMoveType: int
+    DiscretionOffsetType: int
+    DiscretionLimitType: int
+    DiscretionRoundDirection: int
+    DiscretionScope: int
+    PeggedPrice: Decimal
+    DiscretionPrice: Decimal
+    TargetStrategy: int
+    TargetStrategyParameters: str
+    ParticipationRate: Decimal
+    TargetStrategyPerformance: Decimal
+    Currency: str
+    ComplianceID: str
+    SolicitedFlag: bool
+    TimeInForce: str
+    EffectiveTime: datetime
+    ExpireDate: date
+    ExpireTime: datetime
+    ExecInst: str
+    OrderCapacity: str
+    OrderRestrictions: str
+    CustOrderCapacity: int
+    LastQty: Decimal
+    UnderlyingLastQty: Decimal
+    LastPx: Decimal
+    UnderlyingLastPx: Decimal
+    LastParPx: Decimal
+    LastSpotRate: Decimal
+    LastForwardPoints: Decimal
+    LastMkt: str
+    TradingSessionID: str
+    TradingSessionSubID: str
+    TimeBracket: str
+    LastCapacity: str
+    LeavesQty: Decimal
+    CumQty: Decimal
+    AvgPx: Decimal
+    DayOrderQty: Decimal
+    DayCumQty: Decimal
+    DayAvgPx: Decimal
+    GTBookingInst: int
+    TradeDate: date
+    TransactTime: datetime
+    ReportToExch: bool
+    Commission: Decimal
+    CommType: str
+    CommCurrency: str
+    FundRenewWaiv: str
+    Spread: Decimal
+    BenchmarkCurveCurrency: str
+    BenchmarkCurveName: str
+    BenchmarkCurvePoint: str
+    BenchmarkPrice: Decimal
+    BenchmarkPriceType: int
+    BenchmarkSecurityID: str
+    BenchmarkSecurityIDSource: str
+    YieldType: str
+    Yield: Decimal
+    YieldCalcDate: date
+    YieldRedemptionDate: date
+    YieldRedemptionPrice: Decimal
+    YieldRedemptionPriceType: int
+    GrossTradeAmt: Decimal
+    NumDaysInterest: int
+    ExDate: date
+    AccruedInterestRate: Decimal
+    AccruedInterestAmt: Decimal
+    InterestAtMaturity: Decimal
+    EndAccruedInterestAmt: Decimal
+    StartCash: Decimal
+    EndCash: Decimal
+    TradedFlatSwitch: bool
+    BasisFeatureDate: date
+    BasisFeaturePrice: Decimal
+    Concession: Decimal
+    TotalTakedown: Decimal
+    NetMoney: Decimal
+    SettlCurrAmt: Decimal
+    SettlCurrency: str
+    SettlCurrFxRate: Decimal
+    SettlCurrFxRateCalc: str
+    HandlInst: str
+    MinQty: Decimal
+    MaxFloor: Decimal
+    PositionEffect: str
+    MaxShow: Decimal
+    BookingType: int
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+    SettlDate2: date
+    OrderQty2: Decimal
+    LastForwardPoints2: Decimal
+    MultiLegReportingType: str
+    CancellationRights: str
+    MoneyLaunderingStatus: str
+    RegistID: str
+    Designation: str
+    TransBkdTime: datetime
+    ExecValuationPoint: datetime
+    ExecPriceType: str
+    ExecPriceAdjustment: Decimal
+    PriorityIndicator: int
+    PriceImprovement: Decimal
+    LastLiquidityInd: int
+    NoContAmts: list
+    NoLegs: list
+    CopyMsgIndicator: bool
+    NoMiscFees: list
+
+    fieldSpecs = {
+        37: ('OrderID', None, None),
+        198: ('SecondaryOrderID', None, None),
+        526: ('SecondaryClOrdID', None, None),
+        527: ('SecondaryExecID', None, None),
+        11: ('ClOrdID', None, None),
+        41: ('OrigClOrdID', None, None),
+        583: ('ClOrdLinkID', None, None),
+        693: ('QuoteRespID', None, None),
+        790: ('OrdStatusReqID', None, None),
+        584: ('MassStatusReqID', None, None),
+        911: ('TotNumReports', int, None),
+        912: ('LastRptRequested', parseBoolean, None),
+        453: ('NoPartyIDs', None, Parties),
+        229: ('TradeOriginationDate', parseDate, None),
+        382: ('NoContraBrokers', None, ContraGrp),
+        66: ('ListID', None, None),
+        548: ('CrossID', None, None),
+        551: ('OrigCrossID', None, None),
+        549: ('CrossType', int, None),
+        17: ('ExecID', None, None),
+        19: ('ExecRefID', None, None),
+        150: ('ExecType', None, None),
+        39: ('OrdStatus', None, None),
+        636: ('WorkingIndicator', parseBoolean, None),
+        103: ('OrdRejReason', int, None),
+        378: ('ExecRestatementReason', int, None),
+        1: ('Account', None, None),
+        660: ('AcctIDSource', int, None),
+        581: ('AccountType', int, None),
+        589: ('DayBookingInst', None, None),
+        590: ('BookingUnit', None, None),
+        591: ('PreallocMethod', None, None),
+        63: ('SettlType', None, None),
+        64: ('SettlDate', parseDate, None),
+        544: ('CashMargin', None, None),
+        635: ('ClearingFeeIndicator', None, None),
+        55: ('Symbol', None, None),
+        65: ('SymbolSfx', None, None),
+        48: ('SecurityID', None, None),
+        22: ('SecurityIDSource', None, None),
+        454: ('NoSecurityAltID', None, SecAltIDGrp),
+        460: ('Product', int, None),
+        461: ('CFICode', None, None),
+        167: ('SecurityType', None, None),
+        762: ('SecuritySubType', None, None),
+        200: ('MaturityMonthYear', None, None),
+        541: ('MaturityDate', parseDate, None),
+        201: ('PutOrCall', int, None),
+        224: ('CouponPaymentDate', parseDate, None),
+        225: ('IssueDate', parseDate, None),
+        239: ('RepoCollateralSecurityType', None, None),
+        226: ('RepurchaseTerm', int, None),
+        227: ('RepurchaseRate', Decimal, None),
+        228: ('Factor', Decimal, None),
+        255: ('CreditRating', None, None),
+        543: ('InstrRegistry', None, None),
+        470: ('CountryOfIssue', None, None),
+        471: ('StateOrProvinceOfIssue', None, None),
+        472: ('LocaleOfIssue', None, None),
+        240: ('RedemptionDate', parseDate, None),
+        202: ('StrikePrice', Decimal, None),
+        947: ('StrikeCurrency', None, None),
+        206: ('OptAttribute', None, None),
+        231: ('ContractMultiplier', Decimal, None),
+        223: ('CouponRate', Decimal, None),
+        207: ('SecurityExchange', None, None),
+        106: ('Issuer', None, None),
+        348: ('EncodedIssuerLen', int, None),
+        349: ('EncodedIssuer', None, None),
+        107: ('SecurityDesc', None, None),
+        350: ('EncodedSecurityDescLen', int, None),
+        351: ('EncodedSecurityDesc', None, None),
+        691: ('Pool', None, None),
+        667: ('ContractSettlMonth', None, None),
+        875: ('CPProgram', int, None),
+        876: ('CPRegType', None, None),
+        864: ('NoEvents', None, EvntGrp),
+        873: ('DatedDate', parseDate, None),
+        874: ('InterestAccrualDate', parseDate, None),
+        913: ('AgreementDesc', None, None),
+        914: ('AgreementID', None, None),
+        915: ('AgreementDate', parseDate, None),
+        918: ('AgreementCurrency', None, None),
+        788: ('TerminationType', int, None),
+        916: ('StartDate', parseDate, None),
+        917: ('EndDate', parseDate, None),
+        919: ('DeliveryType', int, None),
+        898: ('MarginRatio', Decimal, None),
+        711: ('NoUnderlyings', None, UndInstrmtGrp),
+        54: ('Side', None, None),
+        232: ('NoStipulations', None, Stipulations),
+        854: ('QtyType', int, None),
+        38: ('OrderQty', Decimal, None),
+        152: ('CashOrderQty', Decimal, None),
+        516: ('OrderPercent', Decimal, None),
+        468: ('RoundingDirection', None, None),
+        469: ('RoundingModulus', Decimal, None),
+        40: ('OrdType', None, None),
+        423: ('PriceType', int, None),
+        44: ('Price', Decimal, None),
+        99: ('StopPx', Decimal, None),
+        211: ('PegOffsetValue', Decimal, None),
+        835: ('PegMoveType', int, None),
+        836: ('PegOffsetType', int, None),
+        837: ('PegLimitType', int, None),
+        838: ('PegRoundDirection', int, None),
+        840: ('PegScope', int, None),
+        388: ('DiscretionInst', None, None),
+        389: ('DiscretionOffsetValue', Decimal, None),
+        841: ('DiscretionMoveType', int, None),
+        842: ('DiscretionOffsetType', int, None),
+        843: ('DiscretionLimitType', int, None),
+        844: ('DiscretionRoundDirection', int, None),
+        846: ('DiscretionScope', int, None),
+        839: ('PeggedPrice', Decimal, None),
+        845: ('DiscretionPrice', Decimal, None),
+        847: ('TargetStrategy', int, None),
+        848: ('TargetStrategyParameters', None, None),
+        849: ('ParticipationRate', Decimal, None),
+        850: ('TargetStrategyPerformance', Decimal, None),
+        15: ('Currency', None, None),
+        376: ('ComplianceID', None, None),
+        377: ('SolicitedFlag', parseBoolean, None),
+        59: ('TimeInForce', None, None),
+        168: ('EffectiveTime', parseUTCTimestamp, None),
+        432: ('ExpireDate', parseDate, None),
+        126: ('ExpireTime', parseUTCTimestamp, None),
+        18: ('ExecInst', None, None),
+        528: ('OrderCapacity', None, None),
+        529: ('OrderRestrictions', None, None),
+        582: ('CustOrderCapacity', int, None),
+        32: ('LastQty', Decimal, None),
+        652: ('UnderlyingLastQty', Decimal, None),
+        31: ('LastPx', Decimal, None),
+        651: ('UnderlyingLastPx', Decimal, None),
+        669: ('LastParPx', Decimal, None),
+        194: ('LastSpotRate', Decimal, None),
+        195: ('LastForwardPoints', Decimal, None),
+        30: ('LastMkt', None, None),
+        336: ('TradingSessionID', None, None),
+        625: ('TradingSessionSubID', None, None),
+        943: ('TimeBracket', None, None),
+        29: ('LastCapacity', None, None),
+        151: ('LeavesQty', Decimal, None),
+        14: ('CumQty', Decimal, None),
+        6: ('AvgPx', Decimal, None),
+        424: ('DayOrderQty', Decimal, None),
+        425: ('DayCumQty', Decimal, None),
+        426: ('DayAvgPx', Decimal, None),
+        427: ('GTBookingInst', int, None),
+        75: ('TradeDate', parseDate, None),
+        60: ('TransactTime', parseUTCTimestamp, None),
+        113: ('ReportToExch', parseBoolean, None),
+        12: ('Commission', Decimal, None),
+        13: ('CommType', None, None),
+        479: ('CommCurrency', None, None),
+        497: ('FundRenewWaiv', None, None),
+        218: ('Spread', Decimal, None),
+        220: ('BenchmarkCurveCurrency', None, None),
+        221: ('BenchmarkCurveName', None, None),
+        222: ('BenchmarkCurvePoint', None, None),
+        662: ('BenchmarkPrice', Decimal, None),
+        663: ('BenchmarkPriceType', int, None),
+        699: ('BenchmarkSecurityID', None, None),
+        761: ('BenchmarkSecurityIDSource', None, None),
+        235: ('YieldType', None, None),
+        236: ('Yield', Decimal, None),
+        701: ('YieldCalcDate', parseDate, None),
+        696: ('YieldRedemptionDate', parseDate, None),
+        697: ('YieldRedemptionPrice', Decimal, None),
+        698: ('YieldRedemptionPriceType', int, None),
+        381: ('GrossTradeAmt', Decimal, None),
+        157: ('NumDaysInterest', int, None),
+        230: ('ExDate', parseDate, None),
+        158: ('AccruedInterestRate', Decimal, None),
+        159: ('AccruedInterestAmt', Decimal, None),
+        738: ('InterestAtMaturity', Decimal, None),
+        920: ('EndAccruedInterestAmt', Decimal, None),
+        921: ('StartCash', Decimal, None),
+        922: ('EndCash', Decimal, None),
+        258: ('TradedFlatSwitch', parseBoolean, None),
+        259: ('BasisFeatureDate', parseDate, None),
+        260: ('BasisFeaturePrice', Decimal, None),
+        238: ('Concession', Decimal, None),
+        237: ('TotalTakedown', Decimal, None),
+        118: ('NetMoney', Decimal, None),
+        119: ('SettlCurrAmt', Decimal, None),
+        120: ('SettlCurrency', None, None),
+        155: ('SettlCurrFxRate', Decimal, None),
+        156: ('SettlCurrFxRateCalc', None, None),
+        21: ('HandlInst', None, None),
+        110: ('MinQty', Decimal, None),
+        111: ('MaxFloor', Decimal, None),
+        77: ('PositionEffect', None, None),
+        210: ('MaxShow', Decimal, None),
+        775: ('BookingType', int, None),
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+        193: ('SettlDate2', parseDate, None),
+        192: ('OrderQty2', Decimal, None),
+        641: ('LastForwardPoints2', Decimal, None),
+        442: ('MultiLegReportingType', None, None),
+        480: ('CancellationRights', None, None),
+        481: ('MoneyLaunderingStatus', None, None),
+        513: ('RegistID', None, None),
+        494: ('Designation', None, None),
+        483: ('TransBkdTime', parseUTCTimestamp, None),
+        515: ('ExecValuationPoint', parseUTCTimestamp, None),
+        484: ('ExecPriceType', None, None),
+        485: ('ExecPriceAdjustment', Decimal, None),
+        638: ('PriorityIndicator', int, None),
+        639: ('PriceImprovement', Decimal, None),
+        851: ('LastLiquidityInd', int, None),
+        518: ('NoContAmts', None, ContAmtGrp),
+        555: ('NoLegs', None, InstrmtLegExecGrp),
+        797: ('CopyMsgIndicator', parseBoolean, None),
+        136: ('NoMiscFees', None, MiscFeesGrp),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, '8')
+        self.OrderID = None
+        self.SecondaryOrderID = None
+        self.SecondaryClOrdID = None
+        self.SecondaryExecID = None
+        self.ClOrdID = None
+        self.OrigClOrdID = None
+        self.ClOrdLinkID = None
+        self.QuoteRespID = None
+        self.OrdStatusReqID = None
+        self.MassStatusReqID = None
+        self.TotNumReports = None
+        self.LastRptRequested = None
+        self.NoPartyIDs = None
+        self.TradeOriginationDate = None
+        self.NoContraBrokers = None
+        self.ListID = None
+        self.CrossID = None
+        self.OrigCrossID = None
+        self.CrossType = None
+        self.ExecID = None
+        self.ExecRefID = None
+        self.ExecType = None
+        self.OrdStatus = None
+        self.WorkingIndicator = None
+        self.OrdRejReason = None
+        self.ExecRestatementReason = None
+        self.Account = None
+        self.AcctIDSource = None
+        self.AccountType = None
+        self.DayBookingInst = None
+        self.BookingUnit = None
+        self.PreallocMethod = None
+        self.SettlType = None
+        self.SettlDate = None
+        self.CashMargin = None
+        self.ClearingFeeIndicator = None
+        self.Symbol = None
+        self.SymbolSfx = None
+        self.SecurityID = None
+        self.SecurityIDSource = None
+        self.NoSecurityAltID = None
+        self.Product = None
+        self.CFICode = None
+        self.SecurityType = None
+        self.SecuritySubType = None
+        self.MaturityMonthYear = None
+        self.MaturityDate = None
+        self.PutOrCall = None
+        self.CouponPaymentDate = None
+        self.IssueDate = None
+        self.RepoCollateralSecurityType = None
+        self.RepurchaseTerm = None
+        self.RepurchaseRate = None
+        self.Factor = None
+        self.CreditRating = None
+        self.InstrRegistry = None
+        self.CountryOfIssue = None
+        self.StateOrProvinceOfIssue = None
+        self.LocaleOfIssue = None
+        self.RedemptionDate = None
+        self.StrikePrice = None
+        self.StrikeCurrency = None
+        self.OptAttribute = None
+        self.ContractMultiplier = None
+        self.CouponRate = None
+        self.SecurityExchange = None
+        self.Issuer = None
+        self.EncodedIssuerLen = None
+        self.EncodedIssuer = None
+        self.SecurityDesc = None
+        self.EncodedSecurityDescLen = None
+        self.EncodedSecurityDesc = None
+        self.Pool = None
+        self.ContractSettlMonth = None
+        self.CPProgram = None
+        self.CPRegType = None
+        self.NoEvents = None
+        self.DatedDate = None
+        self.InterestAccrualDate = None
+        self.AgreementDesc = None
+        self.AgreementID = None
+        self.AgreementDate = None
+        self.AgreementCurrency = None
+        self.TerminationType = None
+        self.StartDate = None
+        self.EndDate = None
+        self.DeliveryType = None
+        self.MarginRatio = None
+        self.NoUnderlyings = None
+        self.Side = None
+        self.NoStipulations = None
+        self.QtyType = None
+        self.OrderQty = None
+        self.CashOrderQty = None
+        self.OrderPercent = None
+        self.RoundingDirection = None
+        self.RoundingModulus = None
+        self.OrdType = None
+        self.PriceType = None
+        self.Price = None
+        self.StopPx = None
+        self.PegOffsetValue = None
+        self.PegMoveType = None
+        self.PegOffsetType = None
+        self.PegLimitType = None
+        self.PegRoundDirection = None
+        self.PegScope = None
+        self.DiscretionInst = None
+        self.DiscretionOffsetValue = None
+        self.DiscretionMoveType = None
+        self.DiscretionOffsetType = None
+        self.DiscretionLimitType = None
+        self.DiscretionRoundDirection = None
+        self.DiscretionScope = None
+        self.PeggedPrice = None
+        self.DiscretionPrice = None
+        self.TargetStrategy = None
+        self.TargetStrategyParameters = None
+        self.ParticipationRate = None
+        self.TargetStrategyPerformance = None
+        self.Currency = None
+        self.ComplianceID = None
+        self.SolicitedFlag = None
+        self.TimeInForce = None
+        self.EffectiveTime = None
+        self.ExpireDate = None
+        self.ExpireTime = None
+        self.ExecInst = None
+        self.OrderCapacity = None
+        self.OrderRestrictions = None
+        self.CustOrderCapacity = None
+        self.LastQty = None
+        self.UnderlyingLastQty = None
+        self.LastPx = None
+        self.UnderlyingLastPx = None
+        self.LastParPx = None
+        self.LastSpotRate = None
+        self.LastForwardPoints = None
+        self.LastMkt = None
+        self.TradingSessionID = None
+        self.TradingSessionSubID = None
+        self.TimeBracket = None
+        self.LastCapacity = None
+        self.LeavesQty = None
+        self.CumQty = None
+        self.AvgPx = None
+        self.DayOrderQty = None
+        self.DayCumQty = None
+        self.DayAvgPx = None
+        self.GTBookingInst = None
+        self.TradeDate = None
+        self.TransactTime = None
+        self.ReportToExch = None
+        self.Commission = None
+        self.CommType = None
+        self.CommCurrency = None
+        self.FundRenewWaiv = None
+        self.Spread = None
+        self.BenchmarkCurveCurrency = None
+        self.BenchmarkCurveName = None
+        self.BenchmarkCurvePoint = None
+        self.BenchmarkPrice = None
+        self.BenchmarkPriceType = None
+        self.BenchmarkSecurityID = None
+        self.BenchmarkSecurityIDSource = None
+        self.YieldType = None
+        self.Yield = None
+        self.YieldCalcDate = None
+        self.YieldRedemptionDate = None
+        self.YieldRedemptionPrice = None
+        self.YieldRedemptionPriceType = None
+        self.GrossTradeAmt = None
+        self.NumDaysInterest = None
+        self.ExDate = None
+        self.AccruedInterestRate = None
+        self.AccruedInterestAmt = None
+        self.InterestAtMaturity = None
+        self.EndAccruedInterestAmt = None
+        self.StartCash = None
+        self.EndCash = None
+        self.TradedFlatSwitch = None
+        self.BasisFeatureDate = None
+        self.BasisFeaturePrice = None
+        self.Concession = None
+        self.TotalTakedown = None
+        self.NetMoney = None
+        self.SettlCurrAmt = None
+        self.SettlCurrency = None
+        self.SettlCurrFxRate = None
+        self.SettlCurrFxRateCalc = None
+        self.HandlInst = None
+        self.MinQty = None
+        self.MaxFloor = None
+        self.PositionEffect = None
+        self.MaxShow = None
+        self.BookingType = None
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+        self.SettlDate2 = None
+        self.OrderQty2 = None
+        self.LastForwardPoints2 = None
+        self.MultiLegReportingType = None
+        self.CancellationRights = None
+        self.MoneyLaunderingStatus = None
+        self.RegistID = None
+        self.Designation = None
+        self.TransBkdTime = None
+        self.ExecValuationPoint = None
+        self.ExecPriceType = None
+        self.ExecPriceAdjustment = None
+        self.PriorityIndicator = None
+        self.PriceImprovement = None
+        self.LastLiquidityInd = None
+        self.NoContAmts = None
+        self.NoLegs = None
+        self.CopyMsgIndicator = None
+        self.NoMiscFees = None
+
+    def encodeFields(self, buffer):
+        value = self.OrderID
+        if value is not None:
+            buffer += b'37='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryOrderID
+        if value is not None:
+            buffer += b'198='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryClOrdID
+        if value is not None:
+            buffer += b'526='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryExecID
+        if value is not None:
+            buffer += b'527='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdID
+        if value is not None:
+            buffer += b'11='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrigClOrdID
+        if value is not None:
+            buffer += b'41='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdLinkID
+        if value is not None:
+            buffer += b'583='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.QuoteRespID
+        if value is not None:
+            buffer += b'693='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdStatusReqID
+        if value is not None:
+            buffer += b'790='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MassStatusReqID
+        if value is not None:
+            buffer += b'584='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TotNumReports
+        if value is not None:
+            buffer += b'911='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastRptRequested
+        if value is not None:
+            buffer += b'912='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoPartyIDs
+        if value is not None:
+            buffer += b'453=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.TradeOriginationDate
+        if value is not None:
+            buffer += b'229='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoContraBrokers
+        if value is not None:
+            buffer += b'382=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.ListID
+        if value is not None:
+            buffer += b'66='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CrossID
+        if value is not None:
+            buffer += b'548='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrigCrossID
+        if value is not None:
+            buffer += b'551='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CrossType
+        if value is not None:
+            buffer += b'549='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecID
+        if value is not None:
+            buffer += b'17='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecRefID
+        if value is not None:
+            buffer += b'19='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecType
+        if value is not None:
+            buffer += b'150='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdStatus
+        if value is not None:
+            buffer += b'39='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.WorkingIndicator
+        if value is not None:
+            buffer += b'636='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdRejReason
+        if value is not None:
+            buffer += b'103='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecRestatementReason
+        if value is not None:
+            buffer += b'378='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Account
+        if value is not None:
+            buffer += b'1='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AcctIDSource
+        if value is not None:
+            buffer += b'660='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccountType
+        if value is not None:
+            buffer += b'581='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DayBookingInst
+        if value is not None:
+            buffer += b'589='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BookingUnit
+        if value is not None:
+            buffer += b'590='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PreallocMethod
+        if value is not None:
+            buffer += b'591='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlType
+        if value is not None:
+            buffer += b'63='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDate
+        if value is not None:
+            buffer += b'64='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CashMargin
+        if value is not None:
+            buffer += b'544='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClearingFeeIndicator
+        if value is not None:
+            buffer += b'635='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Symbol
+        if value is not None:
+            buffer += b'55='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SymbolSfx
+        if value is not None:
+            buffer += b'65='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityID
+        if value is not None:
+            buffer += b'48='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityIDSource
+        if value is not None:
+            buffer += b'22='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSecurityAltID
+        if value is not None:
+            buffer += b'454=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Product
+        if value is not None:
+            buffer += b'460='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CFICode
+        if value is not None:
+            buffer += b'461='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityType
+        if value is not None:
+            buffer += b'167='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecuritySubType
+        if value is not None:
+            buffer += b'762='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityMonthYear
+        if value is not None:
+            buffer += b'200='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityDate
+        if value is not None:
+            buffer += b'541='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PutOrCall
+        if value is not None:
+            buffer += b'201='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponPaymentDate
+        if value is not None:
+            buffer += b'224='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IssueDate
+        if value is not None:
+            buffer += b'225='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepoCollateralSecurityType
+        if value is not None:
+            buffer += b'239='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseTerm
+        if value is not None:
+            buffer += b'226='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseRate
+        if value is not None:
+            buffer += b'227='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Factor
+        if value is not None:
+            buffer += b'228='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CreditRating
+        if value is not None:
+            buffer += b'255='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InstrRegistry
+        if value is not None:
+            buffer += b'543='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CountryOfIssue
+        if value is not None:
+            buffer += b'470='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'471='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LocaleOfIssue
+        if value is not None:
+            buffer += b'472='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RedemptionDate
+        if value is not None:
+            buffer += b'240='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikePrice
+        if value is not None:
+            buffer += b'202='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikeCurrency
+        if value is not None:
+            buffer += b'947='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OptAttribute
+        if value is not None:
+            buffer += b'206='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractMultiplier
+        if value is not None:
+            buffer += b'231='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponRate
+        if value is not None:
+            buffer += b'223='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityExchange
+        if value is not None:
+            buffer += b'207='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Issuer
+        if value is not None:
+            buffer += b'106='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuerLen
+        if value is not None:
+            buffer += b'348='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuer
+        if value is not None:
+            buffer += b'349='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityDesc
+        if value is not None:
+            buffer += b'107='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDescLen
+        if value is not None:
+            buffer += b'350='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDesc
+        if value is not None:
+            buffer += b'351='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Pool
+        if value is not None:
+            buffer += b'691='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractSettlMonth
+        if value is not None:
+            buffer += b'667='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPProgram
+        if value is not None:
+            buffer += b'875='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPRegType
+        if value is not None:
+            buffer += b'876='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoEvents
+        if value is not None:
+            buffer += b'864=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.DatedDate
+        if value is not None:
+            buffer += b'873='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAccrualDate
+        if value is not None:
+            buffer += b'874='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDesc
+        if value is not None:
+            buffer += b'913='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementID
+        if value is not None:
+            buffer += b'914='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDate
+        if value is not None:
+            buffer += b'915='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementCurrency
+        if value is not None:
+            buffer += b'918='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TerminationType
+        if value is not None:
+            buffer += b'788='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartDate
+        if value is not None:
+            buffer += b'916='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndDate
+        if value is not None:
+            buffer += b'917='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DeliveryType
+        if value is not None:
+            buffer += b'919='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MarginRatio
+        if value is not None:
+            buffer += b'898='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoUnderlyings
+        if value is not None:
+            buffer += b'711=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Side
+        if value is not None:
+            buffer += b'54='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoStipulations
+        if value is not None:
+            buffer += b'232=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.QtyType
+        if value is not None:
+            buffer += b'854='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderQty
+        if value is not None:
+            buffer += b'38='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CashOrderQty
+        if value is not None:
+            buffer += b'152='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderPercent
+        if value is not None:
+            buffer += b'516='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingDirection
+        if value is not None:
+            buffer += b'468='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingModulus
+        if value is not None:
+            buffer += b'469='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdType
+        if value is not None:
+            buffer += b'40='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PriceType
+        if value is not None:
+            buffer += b'423='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Price
+        if value is not None:
+            buffer += b'44='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StopPx
+        if value is not None:
+            buffer += b'99='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegOffsetValue
+        if value is not None:
+            buffer += b'211='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegMoveType
+        if value is not None:
+            buffer += b'835='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegOffsetType
+        if value is not None:
+            buffer += b'836='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegLimitType
+        if value is not None:
+            buffer += b'837='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegRoundDirection
+        if value is not None:
+            buffer += b'838='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegScope
+        if value is not None:
+            buffer += b'840='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionInst
+        if value is not None:
+            buffer += b'388='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionOffsetValue
+        if value is not None:
+            buffer += b'389='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionMoveType
+        if value is not None:
+            buffer += b'841='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionOffsetType
+        if value is not None:
+            buffer += b'842='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionLimitType
+        if value is not None:
+            buffer += b'843='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionRoundDirection
+        if value is not None:
+            buffer += b'844='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionScope
+        if value is not None:
+            buffer += b'846='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PeggedPrice
+        if value is not None:
+            buffer += b'839='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionPrice
+        if value is not None:
+            buffer += b'845='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TargetStrategy
+        if value is not None:
+            buffer += b'847='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TargetStrategyParameters
+        if value is not None:
+            buffer += b'848='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ParticipationRate
+        if value is not None:
+            buffer += b'849='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TargetStrategyPerformance
+        if value is not None:
+            buffer += b'850='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Currency
+        if value is not None:
+            buffer += b'15='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ComplianceID
+        if value is not None:
+            buffer += b'376='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SolicitedFlag
+        if value is not None:
+            buffer += b'377='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TimeInForce
+        if value is not None:
+            buffer += b'59='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EffectiveTime
+        if value is not None:
+            buffer += b'168='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExpireDate
+        if value is not None:
+            buffer += b'432='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExpireTime
+        if value is not None:
+            buffer += b'126='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecInst
+        if value is not None:
+            buffer += b'18='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderCapacity
+        if value is not None:
+            buffer += b'528='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderRestrictions
+        if value is not None:
+            buffer += b'529='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CustOrderCapacity
+        if value is not None:
+            buffer += b'582='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastQty
+        if value is not None:
+            buffer += b'32='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingLastQty
+        if value is not None:
+            buffer += b'652='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastPx
+        if value is not None:
+            buffer += b'31='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingLastPx
+        if value is not None:
+            buffer += b'651='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastParPx
+        if value is not None:
+            buffer += b'669='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastSpotRate
+        if value is not None:
+            buffer += b'194='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastForwardPoints
+        if value is not None:
+            buffer += b'195='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastMkt
+        if value is not None:
+            buffer += b'30='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradingSessionID
+        if value is not None:
+            buffer += b'336='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradingSessionSubID
+        if value is not None:
+            buffer += b'625='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TimeBracket
+        if value is not None:
+            buffer += b'943='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastCapacity
+        if value is not None:
+            buffer += b'29='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LeavesQty
+        if value is not None:
+            buffer += b'151='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CumQty
+        if value is not None:
+            buffer += b'14='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AvgPx
+        if value is not None:
+            buffer += b'6='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DayOrderQty
+        if value is not None:
+            buffer += b'424='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DayCumQty
+        if value is not None:
+            buffer += b'425='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DayAvgPx
+        if value is not None:
+            buffer += b'426='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.GTBookingInst
+        if value is not None:
+            buffer += b'427='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeDate
+        if value is not None:
+            buffer += b'75='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransactTime
+        if value is not None:
+            buffer += b'60='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ReportToExch
+        if value is not None:
+            buffer += b'113='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Commission
+        if value is not None:
+            buffer += b'12='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommType
+        if value is not None:
+            buffer += b'13='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommCurrency
+        if value is not None:
+            buffer += b'479='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.FundRenewWaiv
+        if value is not None:
+            buffer += b'497='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Spread
+        if value is not None:
+            buffer += b'218='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveCurrency
+        if value is not None:
+            buffer += b'220='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveName
+        if value is not None:
+            buffer += b'221='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurvePoint
+        if value is not None:
+            buffer += b'222='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPrice
+        if value is not None:
+            buffer += b'662='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPriceType
+        if value is not None:
+            buffer += b'663='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityID
+        if value is not None:
+            buffer += b'699='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityIDSource
+        if value is not None:
+            buffer += b'761='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldType
+        if value is not None:
+            buffer += b'235='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Yield
+        if value is not None:
+            buffer += b'236='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldCalcDate
+        if value is not None:
+            buffer += b'701='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionDate
+        if value is not None:
+            buffer += b'696='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPrice
+        if value is not None:
+            buffer += b'697='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPriceType
+        if value is not None:
+            buffer += b'698='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.GrossTradeAmt
+        if value is not None:
+            buffer += b'381='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NumDaysInterest
+        if value is not None:
+            buffer += b'157='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExDate
+        if value is not None:
+            buffer += b'230='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccruedInterestRate
+        if value is not None:
+            buffer += b'158='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccruedInterestAmt
+        if value is not None:
+            buffer += b'159='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAtMaturity
+        if value is not None:
+            buffer += b'738='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndAccruedInterestAmt
+        if value is not None:
+            buffer += b'920='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartCash
+        if value is not None:
+            buffer += b'921='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndCash
+        if value is not None:
+            buffer += b'922='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradedFlatSwitch
+        if value is not None:
+            buffer += b'258='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BasisFeatureDate
+        if value is not None:
+            buffer += b'259='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BasisFeaturePrice
+        if value is not None:
+            buffer += b'260='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Concession
+        if value is not None:
+            buffer += b'238='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TotalTakedown
+        if value is not None:
+            buffer += b'237='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NetMoney
+        if value is not None:
+            buffer += b'118='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrAmt
+        if value is not None:
+            buffer += b'119='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrency
+        if value is not None:
+            buffer += b'120='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrFxRate
+        if value is not None:
+            buffer += b'155='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrFxRateCalc
+        if value is not None:
+            buffer += b'156='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.HandlInst
+        if value is not None:
+            buffer += b'21='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MinQty
+        if value is not None:
+            buffer += b'110='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaxFloor
+        if value is not None:
+            buffer += b'111='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PositionEffect
+        if value is not None:
+            buffer += b'77='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaxShow
+        if value is not None:
+            buffer += b'210='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BookingType
+        if value is not None:
+            buffer += b'775='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDate2
+        if value is not None:
+            buffer += b'193='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderQty2
+        if value is not None:
+            buffer += b'192='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastForwardPoints2
+        if value is not None:
+            buffer += b'641='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MultiLegReportingType
+        if value is not None:
+            buffer += b'442='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CancellationRights
+        if value is not None:
+            buffer += b'480='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MoneyLaunderingStatus
+        if value is not None:
+            buffer += b'481='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RegistID
+        if value is not None:
+            buffer += b'513='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Designation
+        if value is not None:
+            buffer += b'494='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransBkdTime
+        if value is not None:
+            buffer += b'483='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecValuationPoint
+        if value is not None:
+            buffer += b'515='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecPriceType
+        if value is not None:
+            buffer += b'484='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecPriceAdjustment
+        if value is not None:
+            buffer += b'485='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PriorityIndicator
+        if value is not None:
+            buffer += b'638='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PriceImprovement
+        if value is not None:
+            buffer += b'639='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastLiquidityInd
+        if value is not None:
+            buffer += b'851='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoContAmts
+        if value is not None:
+            buffer += b'518=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.NoLegs
+        if value is not None:
+            buffer += b'555=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.CopyMsgIndicator
+        if value is not None:
+            buffer += b'797='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoMiscFees
+        if value is not None:
+            buffer += b'136=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        pass
+
+
+class OrderCancelReject(TypedMessage):
+    __slots__ = (
+        'OrderID',
+        'SecondaryOrderID',
+        'SecondaryClOrdID',
+        'ClOrdID',
+        'ClOrdLinkID',
+        'OrigClOrdID',
+        'OrdStatus',
+        'WorkingIndicator',
+        'OrigOrdModTime',
+        'ListID',
+        'Account',
+        'AcctIDSource',
+        'AccountType',
+        'TradeOriginationDate',
+        'TradeDate',
+        'TransactTime',
+        'CxlRejResponseTo',
+        'CxlRejReason',
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+    )
+
+    OrderID: str
+    SecondaryOrderID: str
+    SecondaryClOrdID: str
+    ClOrdID: str
+    ClOrdLinkID: str
+    OrigClOrdID: str
+    OrdStatus: str
+    WorkingIndicator: bool
+    OrigOrdModTime: datetime
+    ListID: str
+    Account: str
+    AcctIDSource: int
+    AccountType: int
+    TradeOriginationDate: date
+    TradeDate: date
+    TransactTime: datetime
+    CxlRejResponseTo: str
+    CxlRejReason: int
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+
+    fieldSpecs = {
+        37: ('OrderID', None, None),
+        198: ('SecondaryOrderID', None, None),
+        526: ('SecondaryClOrdID', None, None),
+        11: ('ClOrdID', None, None),
+        583: ('ClOrdLinkID', None, None),
+        41: ('OrigClOrdID', None, None),
+        39: ('OrdStatus', None, None),
+        636: ('WorkingIndicator', parseBoolean, None),
+        586: ('OrigOrdModTime', parseUTCTimestamp, None),
+        66: ('ListID', None, None),
+        1: ('Account', None, None),
+        660: ('AcctIDSource', int, None),
+        581: ('AccountType', int, None),
+        229: ('TradeOriginationDate', parseDate, None),
+        75: ('TradeDate', parseDate, None),
+        60: ('TransactTime', parseUTCTimestamp, None),
+        434: ('CxlRejResponseTo', None, None),
+        102: ('CxlRejReason', int, None),
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, '9')
+        self.OrderID = None
+        self.SecondaryOrderID = None
+        self.SecondaryClOrdID = None
+        self.ClOrdID = None
+        self.ClOrdLinkID = None
+        self.OrigClOrdID = None
+        self.OrdStatus = None
+        self.WorkingIndicator = None
+        self.OrigOrdModTime = None
+        self.ListID = None
+        self.Account = None
+        self.AcctIDSource = None
+        self.AccountType = None
+        self.TradeOriginationDate = None
+        self.TradeDate = None
+        self.TransactTime = None
+        self.CxlRejResponseTo = None
+        self.CxlRejReason = None
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+
+    def encodeFields(self, buffer):
+        value = self.OrderID
+        if value is not None:
+            buffer += b'37='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryOrderID
+        if value is not None:
+            buffer += b'198='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryClOrdID
+        if value is not None:
+            buffer += b'526='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdID
+        if value is not None:
+            buffer += b'11='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdLinkID
+        if value is not None:
+            buffer += b'583='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrigClOrdID
+        if value is not None:
+            buffer += b'41='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdStatus
+        if value is not None:
+            buffer += b'39='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.WorkingIndicator
+        if value is not None:
+            buffer += b'636='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrigOrdModTime
+        if value is not None:
+            buffer += b'586='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ListID
+        if value is not None:
+            buffer += b'66='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Account
+        if value is not None:
+            buffer += b'1='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AcctIDSource
+        if value is not None:
+            buffer += b'660='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccountType
+        if value is not None:
+            buffer += b'581='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeOriginationDate
+        if value is not None:
+            buffer += b'229='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeDate
+        if value is not None:
+            buffer += b'75='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransactTime
+        if value is not None:
+            buffer += b'60='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CxlRejResponseTo
+        if value is not None:
+            buffer += b'434='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CxlRejReason
+        if value is not None:
+            buffer += b'102='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class Logon(TypedMessage):
+    __slots__ = (
+        'EncryptMethod',
+        'HeartBtInt',
+        'RawDataLength',
+        'RawData',
+        'ResetSeqNumFlag',
+        'NextExpectedMsgSeqNum',
+        'MaxMessageSize',
+        'NoMsgTypes',
+        'RefMsgType',
+        'MsgDirection',
+        'TestMessageIndicator',
+        'Username',
+        'Password',
+    )
+
+    EncryptMethod: int
+    HeartBtInt: int
+    RawDataLength: int
+    RawData: str
+    ResetSeqNumFlag: bool
+    NextExpectedMsgSeqNum: int
+    MaxMessageSize: int
+    NoMsgTypes: int
+    RefMsgType: str
+    MsgDirection: str
+    TestMessageIndicator: bool
+    Username: str
+    Password: str
+
+    fieldSpecs = {
+        98: ('EncryptMethod', int, None),
+        108: ('HeartBtInt', int, None),
+        95: ('RawDataLength', int, None),
+        96: ('RawData', None, None),
+        141: ('ResetSeqNumFlag', parseBoolean, None),
+        789: ('NextExpectedMsgSeqNum', int, None),
+        383: ('MaxMessageSize', int, None),
+        384: ('NoMsgTypes', int, None),
+        372: ('RefMsgType', None, None),
+        385: ('MsgDirection', None, None),
+        464: ('TestMessageIndicator', parseBoolean, None),
+        553: ('Username', None, None),
+        554: ('Password', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, 'A')
+        self.EncryptMethod = None
+        self.HeartBtInt = None
+        self.RawDataLength = None
+        self.RawData = None
+        self.ResetSeqNumFlag = None
+        self.NextExpectedMsgSeqNum = None
+        self.MaxMessageSize = None
+        self.NoMsgTypes = None
+        self.RefMsgType = None
+        self.MsgDirection = None
+        self.TestMessageIndicator = None
+        self.Username = None
+        self.Password = None
+
+    def encodeFields(self, buffer):
+        value = self.EncryptMethod
+        if value is not None:
+            buffer += b'98='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.HeartBtInt
+        if value is not None:
+            buffer += b'108='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RawDataLength
+        if value is not None:
+            buffer += b'95='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RawData
+        if value is not None:
+            buffer += b'96='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ResetSeqNumFlag
+        if value is not None:
+            buffer += b'141='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NextExpectedMsgSeqNum
+        if value is not None:
+            buffer += b'789='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaxMessageSize
+        if value is not None:
+            buffer += b'383='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoMsgTypes
+        if value is not None:
+            buffer += b'384='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RefMsgType
+        if value is not None:
+            buffer += b'372='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MsgDirection
+        if value is not None:
+            buffer += b'385='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TestMessageIndicator
+        if value is not None:
+            buffer += b'464='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Username
+        if value is not None:
+            buffer += b'553='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Password
+        if value is not None:
+            buffer += b'554='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class TradeCaptureReport(TypedMessage):
+    __slots__ = (
+        'TradeReportID',
+        'TradeReportTransType',
+        'TradeReportType',
+        'TradeRequestID',
+        'TrdType',
+        'TrdSubType',
+        'SecondaryTrdType',
+        'TransferReason',
+        'ExecType',
+        'TotNumTradeReports',
+        'LastRptRequested',
+        'UnsolicitedIndicator',
+        'SubscriptionRequestType',
+        'TradeReportRefID',
+        'SecondaryTradeReportRefID',
+        'SecondaryTradeReportID',
+        'TradeLinkID',
+        'TrdMatchID',
+        'ExecID',
+        'OrdStatus',
+        'SecondaryExecID',
+        'ExecRestatementReason',
+        'PreviouslyReported',
+        'PriceType',
+        'Symbol',
+        'SymbolSfx',
+        'SecurityID',
+        'SecurityIDSource',
+        'NoSecurityAltID',
+        'Product',
+        'CFICode',
+        'SecurityType',
+        'SecuritySubType',
+        'MaturityMonthYear',
+        'MaturityDate',
+        'PutOrCall',
+        'CouponPaymentDate',
+        'IssueDate',
+        'RepoCollateralSecurityType',
+        'RepurchaseTerm',
+        'RepurchaseRate',
+        'Factor',
+        'CreditRating',
+        'InstrRegistry',
+        'CountryOfIssue',
+        'StateOrProvinceOfIssue',
+        'LocaleOfIssue',
+        'RedemptionDate',
+        'StrikePrice',
+        'StrikeCurrency',
+        'OptAttribute',
+        'ContractMultiplier',
+        'CouponRate',
+        'SecurityExchange',
+        'Issuer',
+        'EncodedIssuerLen',
+        'EncodedIssuer',
+        'SecurityDesc',
+        'EncodedSecurityDescLen',
+        'EncodedSecurityDesc',
+        'Pool',
+        'ContractSettlMonth',
+        'CPProgram',
+        'CPRegType',
+        'NoEvents',
+        'DatedDate',
+        'InterestAccrualDate',
+        'AgreementDesc',
+        'AgreementID',
+        'AgreementDate',
+        'AgreementCurrency',
+        'TerminationType',
+        'StartDate',
+        'EndDate',
+        'DeliveryType',
+        'MarginRatio',
+        'OrderQty',
+        'CashOrderQty',
+        'OrderPercent',
+        'RoundingDirection',
+        'RoundingModulus',
+        'QtyType',
+        'YieldType',
+        'Yield',
+        'YieldCalcDate',
+        'YieldRedemptionDate',
+        'YieldRedemptionPrice',
+        'YieldRedemptionPriceType',
+        'NoUnderlyings',
+        'UnderlyingTradingSessionID',
+        'UnderlyingTradingSessionSubID',
+        'LastQty',
+        'LastPx',
+        'LastParPx',
+        'LastSpotRate',
+        'LastForwardPoints',
+        'LastMkt',
+        'TradeDate',
+        'ClearingBusinessDate',
+        'AvgPx',
+        'Spread',
+        'BenchmarkCurveCurrency',
+        'BenchmarkCurveName',
+        'BenchmarkCurvePoint',
+        'BenchmarkPrice',
+        'BenchmarkPriceType',
+        'BenchmarkSecurityID',
+        'BenchmarkSecurityIDSource',
+        'AvgPxIndicator',
+        'NoPosAmt',
+        'MultiLegReportingType',
+        'TradeLegRefID',
+        'NoLegs',
+        'TransactTime',
+        'NoTrdRegTimestamps',
+        'SettlType',
+        'SettlDate',
+        'MatchStatus',
+        'MatchType',
+        'NoSides',
+        'CopyMsgIndicator',
+        'PublishTrdIndicator',
+        'ShortSaleReason',
+    )
+
+    TradeReportID: str
+    TradeReportTransType: int
+    TradeReportType: int
+    TradeRequestID: str
+    TrdType: int
+    TrdSubType: int
+    SecondaryTrdType: int
+    TransferReason: str
+    ExecType: str
+    TotNumTradeReports: int
+    LastRptRequested: bool
+    UnsolicitedIndicator: bool
+    SubscriptionRequestType: str
+    TradeReportRefID: str
+    SecondaryTradeReportRefID: str
+    SecondaryTradeReportID: str
+    TradeLinkID: str
+    TrdMatchID: str
+    ExecID: str
+    OrdStatus: str
+    SecondaryExecID: str
+    ExecRestatementReason: int
+    PreviouslyReported: bool
+    PriceType: int
+    Symbol: str
+    SymbolSfx: str
+    SecurityID: str
+    SecurityIDSource: str
+    NoSecurityAltID: list
+    Product: int
+    CFICode: str
+    SecurityType: str
+    SecuritySubType: str
+    MaturityMonthYear: str
+    MaturityDate: date
+    PutOrCall: int
+    CouponPaymentDate: date
+    IssueDate: date
+    RepoCollateralSecurityType: str
+    RepurchaseTerm: int
+    RepurchaseRate: Decimal
+    Factor: Decimal
+    CreditRating: str
+    InstrRegistry: str
+    CountryOfIssue: str
+    StateOrProvinceOfIssue: str
+    LocaleOfIssue: str
+    RedemptionDate: date
+    StrikePrice: Decimal
+    StrikeCurrency: str
+    OptAttribute: str
+    ContractMultiplier: Decimal
+    CouponRate: Decimal
+    SecurityExchange: str
+    Issuer: str
+    EncodedIssuerLen: int
+    EncodedIssuer: str
+    SecurityDesc: str
+    EncodedSecurityDescLen: int
+    EncodedSecurityDesc: str
+    Pool: str
+    ContractSettlMonth: str
+    CPProgram: int
+    CPRegType: str
+    NoEvents: list
+    DatedDate: date
+    InterestAccrualDate: date
+    AgreementDesc: str
+    AgreementID: str
+    AgreementDate: date
+    AgreementCurrency: str
+    TerminationType: int
+    StartDate: date
+    EndDate: date
+    DeliveryType: int
+    MarginRatio: Decimal
+    OrderQty: Decimal
+    CashOrderQty: Decimal
+    OrderPercent: Decimal
+    RoundingDirection: str
+    RoundingModulus: Decimal
+    QtyType: int
+    YieldType: str
+    Yield: Decimal
+    YieldCalcDate: date
+    YieldRedemptionDate: date
+    YieldRedemptionPrice: Decimal
+    YieldRedemptionPriceType: int
+    NoUnderlyings: list
+    UnderlyingTradingSessionID: str
+    UnderlyingTradingSessionSubID: str
+    LastQty: Decimal
+    LastPx: Decimal
+    LastParPx: Decimal
+    LastSpotRate: Decimal
+    LastForwardPoints: Decimal
+    LastMkt: str
+    TradeDate: date
+    ClearingBusinessDate: date
+    AvgPx: Decimal
+    Spread: Decimal
+    BenchmarkCurveCurrency: str
+    BenchmarkCurveName: str
+    BenchmarkCurvePoint: str
+    BenchmarkPrice: Decimal
+    BenchmarkPriceType: int
+    BenchmarkSecurityID: str
+    BenchmarkSecurityIDSource: str
+    AvgPxIndicator: int
+    NoPosAmt: list
+    MultiLegReportingType: str
+    TradeLegRefID: str
+    NoLegs: list
+    TransactTime: datetime
+    NoTrdRegTimestamps: list
+    SettlType: str
+    SettlDate: date
+    MatchStatus: str
+    MatchType: str
+    NoSides: list
+    CopyMsgIndicator: bool
+    PublishTrdIndicator: bool
+    ShortSaleReason: int
+
+    fieldSpecs = {
+        571: ('TradeReportID', None, None),
+        487: ('TradeReportTransType', int, None),
+        856: ('TradeReportType', int, None),
+        568: ('TradeRequestID', None, None),
+        828: ('TrdType', int, None),
+        829: ('TrdSubType', int, None),
+        855: ('SecondaryTrdType', int, None),
+        830: ('TransferReason', None, None),
+        150: ('ExecType', None, None),
+        748: ('TotNumTradeReports', int, None),
+        912: ('LastRptRequested', parseBoolean, None),
+        325: ('UnsolicitedIndicator', parseBoolean, None),
+        263: ('SubscriptionRequestType', None, None),
+        572: ('TradeReportRefID', None, None),
+        881: ('SecondaryTradeReportRefID', None, None),
+        818: ('SecondaryTradeReportID', None, None),
+        820: ('TradeLinkID', None, None),
+        880: ('TrdMatchID', None, None),
+        17: ('ExecID', None, None),
+        39: ('OrdStatus', None, None),
+        527: ('SecondaryExecID', None, None),
+        378: ('ExecRestatementReason', int, None),
+        570: ('PreviouslyReported', parseBoolean, None),
+        423: ('PriceType', int, None),
+        55: ('Symbol', None, None),
+        65: ('SymbolSfx', None, None),
+        48: ('SecurityID', None, None),
+        22: ('SecurityIDSource', None, None),
+        454: ('NoSecurityAltID', None, SecAltIDGrp),
+        460: ('Product', int, None),
+        461: ('CFICode', None, None),
+        167: ('SecurityType', None, None),
+        762: ('SecuritySubType', None, None),
+        200: ('MaturityMonthYear', None, None),
+        541: ('MaturityDate', parseDate, None),
+        201: ('PutOrCall', int, None),
+        224: ('CouponPaymentDate', parseDate, None),
+        225: ('IssueDate', parseDate, None),
+        239: ('RepoCollateralSecurityType', None, None),
+        226: ('RepurchaseTerm', int, None),
+        227: ('RepurchaseRate', Decimal, None),
+        228: ('Factor', Decimal, None),
+        255: ('CreditRating', None, None),
+        543: ('InstrRegistry', None, None),
+        470: ('CountryOfIssue', None, None),
+        471: ('StateOrProvinceOfIssue', None, None),
+        472: ('LocaleOfIssue', None, None),
+        240: ('RedemptionDate', parseDate, None),
+        202: ('StrikePrice', Decimal, None),
+        947: ('StrikeCurrency', None, None),
+        206: ('OptAttribute', None, None),
+        231: ('ContractMultiplier', Decimal, None),
+        223: ('CouponRate', Decimal, None),
+        207: ('SecurityExchange', None, None),
+        106: ('Issuer', None, None),
+        348: ('EncodedIssuerLen', int, None),
+        349: ('EncodedIssuer', None, None),
+        107: ('SecurityDesc', None, None),
+        350: ('EncodedSecurityDescLen', int, None),
+        351: ('EncodedSecurityDesc', None, None),
+        691: ('Pool', None, None),
+        667: ('ContractSettlMonth', None, None),
+        875: ('CPProgram', int, None),
+        876: ('CPRegType', None, None),
+        864: ('NoEvents', None, EvntGrp),
+        873: ('DatedDate', parseDate, None),
+        874: ('InterestAccrualDate', parseDate, None),
+        913: ('AgreementDesc', None, None),
+        914: ('AgreementID', None, None),
+        915: ('AgreementDate', parseDate, None),
+        918: ('AgreementCurrency', None, None),
+        788: ('TerminationType', int, None),
+        916: ('StartDate', parseDate, None),
+        917: ('EndDate', parseDate, None),
+        919: ('DeliveryType', int, None),
+        898: ('MarginRatio', Decimal, None),
+        38: ('OrderQty', Decimal, None),
+        152: ('CashOrderQty', Decimal, None),
+        516: ('OrderPercent', Decimal, None),
+        468: ('RoundingDirection', None, None),
+        469: ('RoundingModulus', Decimal, None),
+        854: ('QtyType', int, None),
+        235: ('YieldType', None, None),
+        236: ('Yield', Decimal, None),
+        701: ('YieldCalcDate', parseDate, None),
+        696: ('YieldRedemptionDate', parseDate, None),
+        697: ('YieldRedemptionPrice', Decimal, None),
+        698: ('YieldRedemptionPriceType', int, None),
+        711: ('NoUnderlyings', None, UndInstrmtGrp),
+        822: ('UnderlyingTradingSessionID', None, None),
+        823: ('UnderlyingTradingSessionSubID', None, None),
+        32: ('LastQty', Decimal, None),
+        31: ('LastPx', Decimal, None),
+        669: ('LastParPx', Decimal, None),
+        194: ('LastSpotRate', Decimal, None),
+        195: ('LastForwardPoints', Decimal, None),
+        30: ('LastMkt', None, None),
+        75: ('TradeDate', parseDate, None),
+        715: ('ClearingBusinessDate', parseDate, None),
+        6: ('AvgPx', Decimal, None),
+        218: ('Spread', Decimal, None),
+        220: ('BenchmarkCurveCurrency', None, None),
+        221: ('BenchmarkCurveName', None, None),
+        222: ('BenchmarkCurvePoint', None, None),
+        662: ('BenchmarkPrice', Decimal, None),
+        663: ('BenchmarkPriceType', int, None),
+        699: ('BenchmarkSecurityID', None, None),
+        761: ('BenchmarkSecurityIDSource', None, None),
+        819: ('AvgPxIndicator', int, None),
+        753: ('NoPosAmt', None, PositionAmountData),
+        442: ('MultiLegReportingType', None, None),
+        824: ('TradeLegRefID', None, None),
+        555: ('NoLegs', None, TrdInstrmtLegGrp),
+        60: ('TransactTime', parseUTCTimestamp, None),
+        768: ('NoTrdRegTimestamps', None, TrdRegTimestamps),
+        63: ('SettlType', None, None),
+        64: ('SettlDate', parseDate, None),
+        573: ('MatchStatus', None, None),
+        574: ('MatchType', None, None),
+        552: ('NoSides', None, TrdCapRptSideGrp),
+        797: ('CopyMsgIndicator', parseBoolean, None),
+        852: ('PublishTrdIndicator', parseBoolean, None),
+        853: ('ShortSaleReason', int, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, 'AE')
+        self.TradeReportID = None
+        self.TradeReportTransType = None
+        self.TradeReportType = None
+        self.TradeRequestID = None
+        self.TrdType = None
+        self.TrdSubType = None
+        self.SecondaryTrdType = None
+        self.TransferReason = None
+        self.ExecType = None
+        self.TotNumTradeReports = None
+        self.LastRptRequested = None
+        self.UnsolicitedIndicator = None
+        self.SubscriptionRequestType = None
+        self.TradeReportRefID = None
+        self.SecondaryTradeReportRefID = None
+        self.SecondaryTradeReportID = None
+        self.TradeLinkID = None
+        self.TrdMatchID = None
+        self.ExecID = None
+        self.OrdStatus = None
+        self.SecondaryExecID = None
+        self.ExecRestatementReason = None
+        self.PreviouslyReported = None
+        self.PriceType = None
+        self.Symbol = None
+        self.SymbolSfx = None
+        self.SecurityID = None
+        self.SecurityIDSource = None
+        self.NoSecurityAltID = None
+        self.Product = None
+        self.CFICode = None
+        self.SecurityType = None
+        self.SecuritySubType = None
+        self.MaturityMonthYear = None
+        self.MaturityDate = None
+        self.PutOrCall = None
+        self.CouponPaymentDate = None
+        self.IssueDate = None
+        self.RepoCollateralSecurityType = None
+        self.RepurchaseTerm = None
+        self.RepurchaseRate = None
+        self.Factor = None
+        self.CreditRating = None
+        self.InstrRegistry = None
+        self.CountryOfIssue = None
+        self.StateOrProvinceOfIssue = None
+        self.LocaleOfIssue = None
+        self.RedemptionDate = None
+        self.StrikePrice = None
+        self.StrikeCurrency = None
+        self.OptAttribute = None
+        self.ContractMultiplier = None
+        self.CouponRate = None
+        self.SecurityExchange = None
+        self.Issuer = None
+        self.EncodedIssuerLen = None
+        self.EncodedIssuer = None
+        self.SecurityDesc = None
+        self.EncodedSecurityDescLen = None
+        self.EncodedSecurityDesc = None
+        self.Pool = None
+        self.ContractSettlMonth = None
+        self.CPProgram = None
+        self.CPRegType = None
+        self.NoEvents = None
+        self.DatedDate = None
+        self.InterestAccrualDate = None
+        self.AgreementDesc = None
+        self.AgreementID = None
+        self.AgreementDate = None
+        self.AgreementCurrency = None
+        self.TerminationType = None
+        self.StartDate = None
+        self.EndDate = None
+        self.DeliveryType = None
+        self.MarginRatio = None
+        self.OrderQty = None
+        self.CashOrderQty = None
+        self.OrderPercent = None
+        self.RoundingDirection = None
+        self.RoundingModulus = None
+        self.QtyType = None
+        self.YieldType = None
+        self.Yield = None
+        self.YieldCalcDate = None
+        self.YieldRedemptionDate = None
+        self.YieldRedemptionPrice = None
+        self.YieldRedemptionPriceType = None
+        self.NoUnderlyings = None
+        self.UnderlyingTradingSessionID = None
+        self.UnderlyingTradingSessionSubID = None
+        self.LastQty = None
+        self.LastPx = None
+        self.LastParPx = None
+        self.LastSpotRate = None
+        self.LastForwardPoints = None
+        self.LastMkt = None
+        self.TradeDate = None
+        self.ClearingBusinessDate = None
+        self.AvgPx = None
+        self.Spread = None
+        self.BenchmarkCurveCurrency = None
+        self.BenchmarkCurveName = None
+        self.BenchmarkCurvePoint = None
+        self.BenchmarkPrice = None
+        self.BenchmarkPriceType = None
+        self.BenchmarkSecurityID = None
+        self.BenchmarkSecurityIDSource = None
+        self.AvgPxIndicator = None
+        self.NoPosAmt = None
+        self.MultiLegReportingType = None
+        self.TradeLegRefID = None
+        self.NoLegs = None
+        self.TransactTime = None
+        self.NoTrdRegTimestamps = None
+        self.SettlType = None
+        self.SettlDate = None
+        self.MatchStatus = None
+        self.MatchType = None
+        self.NoSides = None
+        self.CopyMsgIndicator = None
+        self.PublishTrdIndicator = None
+        self.ShortSaleReason = None
+
+    def encodeFields(self, buffer):
+        value = self.TradeReportID
+        if value is not None:
+            buffer += b'571='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeReportTransType
+        if value is not None:
+            buffer += b'487='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeReportType
+        if value is not None:
+            buffer += b'856='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeRequestID
+        if value is not None:
+            buffer += b'568='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TrdType
+        if value is not None:
+            buffer += b'828='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TrdSubType
+        if value is not None:
+            buffer += b'829='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryTrdType
+        if value is not None:
+            buffer += b'855='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransferReason
+        if value is not None:
+            buffer += b'830='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecType
+        if value is not None:
+            buffer += b'150='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TotNumTradeReports
+        if value is not None:
+            buffer += b'748='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastRptRequested
+        if value is not None:
+            buffer += b'912='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnsolicitedIndicator
+        if value is not None:
+            buffer += b'325='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SubscriptionRequestType
+        if value is not None:
+            buffer += b'263='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeReportRefID
+        if value is not None:
+            buffer += b'572='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryTradeReportRefID
+        if value is not None:
+            buffer += b'881='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryTradeReportID
+        if value is not None:
+            buffer += b'818='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeLinkID
+        if value is not None:
+            buffer += b'820='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TrdMatchID
+        if value is not None:
+            buffer += b'880='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecID
+        if value is not None:
+            buffer += b'17='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdStatus
+        if value is not None:
+            buffer += b'39='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryExecID
+        if value is not None:
+            buffer += b'527='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecRestatementReason
+        if value is not None:
+            buffer += b'378='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PreviouslyReported
+        if value is not None:
+            buffer += b'570='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PriceType
+        if value is not None:
+            buffer += b'423='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Symbol
+        if value is not None:
+            buffer += b'55='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SymbolSfx
+        if value is not None:
+            buffer += b'65='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityID
+        if value is not None:
+            buffer += b'48='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityIDSource
+        if value is not None:
+            buffer += b'22='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSecurityAltID
+        if value is not None:
+            buffer += b'454=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Product
+        if value is not None:
+            buffer += b'460='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CFICode
+        if value is not None:
+            buffer += b'461='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityType
+        if value is not None:
+            buffer += b'167='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecuritySubType
+        if value is not None:
+            buffer += b'762='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityMonthYear
+        if value is not None:
+            buffer += b'200='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityDate
+        if value is not None:
+            buffer += b'541='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PutOrCall
+        if value is not None:
+            buffer += b'201='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponPaymentDate
+        if value is not None:
+            buffer += b'224='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IssueDate
+        if value is not None:
+            buffer += b'225='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepoCollateralSecurityType
+        if value is not None:
+            buffer += b'239='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseTerm
+        if value is not None:
+            buffer += b'226='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseRate
+        if value is not None:
+            buffer += b'227='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Factor
+        if value is not None:
+            buffer += b'228='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CreditRating
+        if value is not None:
+            buffer += b'255='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InstrRegistry
+        if value is not None:
+            buffer += b'543='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CountryOfIssue
+        if value is not None:
+            buffer += b'470='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'471='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LocaleOfIssue
+        if value is not None:
+            buffer += b'472='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RedemptionDate
+        if value is not None:
+            buffer += b'240='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikePrice
+        if value is not None:
+            buffer += b'202='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikeCurrency
+        if value is not None:
+            buffer += b'947='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OptAttribute
+        if value is not None:
+            buffer += b'206='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractMultiplier
+        if value is not None:
+            buffer += b'231='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponRate
+        if value is not None:
+            buffer += b'223='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityExchange
+        if value is not None:
+            buffer += b'207='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Issuer
+        if value is not None:
+            buffer += b'106='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuerLen
+        if value is not None:
+            buffer += b'348='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuer
+        if value is not None:
+            buffer += b'349='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityDesc
+        if value is not None:
+            buffer += b'107='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDescLen
+        if value is not None:
+            buffer += b'350='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDesc
+        if value is not None:
+            buffer += b'351='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Pool
+        if value is not None:
+            buffer += b'691='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractSettlMonth
+        if value is not None:
+            buffer += b'667='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPProgram
+        if value is not None:
+            buffer += b'875='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPRegType
+        if value is not None:
+            buffer += b'876='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoEvents
+        if value is not None:
+            buffer += b'864=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.DatedDate
+        if value is not None:
+            buffer += b'873='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAccrualDate
+        if value is not None:
+            buffer += b'874='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDesc
+        if value is not None:
+            buffer += b'913='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementID
+        if value is not None:
+            buffer += b'914='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDate
+        if value is not None:
+            buffer += b'915='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementCurrency
+        if value is not None:
+            buffer += b'918='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TerminationType
+        if value is not None:
+            buffer += b'788='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartDate
+        if value is not None:
+            buffer += b'916='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndDate
+        if value is not None:
+            buffer += b'917='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DeliveryType
+        if value is not None:
+            buffer += b'919='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MarginRatio
+        if value is not None:
+            buffer += b'898='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderQty
+        if value is not None:
+            buffer += b'38='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CashOrderQty
+        if value is not None:
+            buffer += b'152='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderPercent
+        if value is not None:
+            buffer += b'516='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingDirection
+        if value is not None:
+            buffer += b'468='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingModulus
+        if value is not None:
+            buffer += b'469='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.QtyType
+        if value is not None:
+            buffer += b'854='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldType
+        if value is not None:
+            buffer += b'235='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Yield
+        if value is not None:
+            buffer += b'236='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldCalcDate
+        if value is not None:
+            buffer += b'701='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionDate
+        if value is not None:
+            buffer += b'696='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPrice
+        if value is not None:
+            buffer += b'697='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPriceType
+        if value is not None:
+            buffer += b'698='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoUnderlyings
+        if value is not None:
+            buffer += b'711=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.UnderlyingTradingSessionID
+        if value is not None:
+            buffer += b'822='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.UnderlyingTradingSessionSubID
+        if value is not None:
+            buffer += b'823='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastQty
+        if value is not None:
+            buffer += b'32='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastPx
+        if value is not None:
+            buffer += b'31='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastParPx
+        if value is not None:
+            buffer += b'669='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastSpotRate
+        if value is not None:
+            buffer += b'194='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastForwardPoints
+        if value is not None:
+            buffer += b'195='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastMkt
+        if value is not None:
+            buffer += b'30='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeDate
+        if value is not None:
+            buffer += b'75='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClearingBusinessDate
+        if value is not None:
+            buffer += b'715='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AvgPx
+        if value is not None:
+            buffer += b'6='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Spread
+        if value is not None:
+            buffer += b'218='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveCurrency
+        if value is not None:
+            buffer += b'220='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveName
+        if value is not None:
+            buffer += b'221='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurvePoint
+        if value is not None:
+            buffer += b'222='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPrice
+        if value is not None:
+            buffer += b'662='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPriceType
+        if value is not None:
+            buffer += b'663='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityID
+        if value is not None:
+            buffer += b'699='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityIDSource
+        if value is not None:
+            buffer += b'761='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AvgPxIndicator
+        if value is not None:
+            buffer += b'819='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoPosAmt
+        if value is not None:
+            buffer += b'753=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.MultiLegReportingType
+        if value is not None:
+            buffer += b'442='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeLegRefID
+        if value is not None:
+            buffer += b'824='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoLegs
+        if value is not None:
+            buffer += b'555=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.TransactTime
+        if value is not None:
+            buffer += b'60='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoTrdRegTimestamps
+        if value is not None:
+            buffer += b'768=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.SettlType
+        if value is not None:
+            buffer += b'63='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDate
+        if value is not None:
+            buffer += b'64='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MatchStatus
+        if value is not None:
+            buffer += b'573='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MatchType
+        if value is not None:
+            buffer += b'574='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSides
+        if value is not None:
+            buffer += b'552=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.CopyMsgIndicator
+        if value is not None:
+            buffer += b'797='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PublishTrdIndicator
+        if value is not None:
+            buffer += b'852='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ShortSaleReason
+        if value is not None:
+            buffer += b'853='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class NewOrderSingle(TypedMessage):
+    __slots__ = (
+        'ClOrdID',
+        'SecondaryClOrdID',
+        'ClOrdLinkID',
+        'NoPartyIDs',
+        'TradeOriginationDate',
+        'TradeDate',
+        'Account',
+        'AcctIDSource',
+        'AccountType',
+        'DayBookingInst',
+        'BookingUnit',
+        'PreallocMethod',
+        'AllocID',
+        'NoAllocs',
+        'SettlType',
+        'SettlDate',
+        'CashMargin',
+        'ClearingFeeIndicator',
+        'HandlInst',
+        'ExecInst',
+        'MinQty',
+        'MaxFloor',
+        'ExDestination',
+        'NoTradingSessions',
+        'ProcessCode',
+        'Symbol',
+        'SymbolSfx',
+        'SecurityID',
+        'SecurityIDSource',
+        'NoSecurityAltID',
+        'Product',
+        'CFICode',
+        'SecurityType',
+        'SecuritySubType',
+        'MaturityMonthYear',
+        'MaturityDate',
+        'PutOrCall',
+        'CouponPaymentDate',
+        'IssueDate',
+        'RepoCollateralSecurityType',
+        'RepurchaseTerm',
+        'RepurchaseRate',
+        'Factor',
+        'CreditRating',
+        'InstrRegistry',
+        'CountryOfIssue',
+        'StateOrProvinceOfIssue',
+        'LocaleOfIssue',
+        'RedemptionDate',
+        'StrikePrice',
+        'StrikeCurrency',
+        'OptAttribute',
+        'ContractMultiplier',
+        'CouponRate',
+        'SecurityExchange',
+        'Issuer',
+        'EncodedIssuerLen',
+        'EncodedIssuer',
+        'SecurityDesc',
+        'EncodedSecurityDescLen',
+        'EncodedSecurityDesc',
+        'Pool',
+        'ContractSettlMonth',
+        'CPProgram',
+        'CPRegType',
+        'NoEvents',
+        'DatedDate',
+        'InterestAccrualDate',
+        'AgreementDesc',
+        'AgreementID',
+        'AgreementDate',
+        'AgreementCurrency',
+        'TerminationType',
+        'StartDate',
+        'EndDate',
+        'DeliveryType',
+        'MarginRatio',
+        'NoUnderlyings',
+        'PrevClosePx',
+        'Side',
+        'LocateReqd',
+        'TransactTime',
+        'NoStipulations',
+        'QtyType',
+        'OrderQty',
+        'CashOrderQty',
+        'OrderPercent',
+        'RoundingDirection',
+        'RoundingModulus',
+        'OrdType',
+        'PriceType',
+        'Price',
+        'StopPx',
+        'Spread',
+        'BenchmarkCurveCurrency',
+        'BenchmarkCurveName',
+        'BenchmarkCurvePoint',
+        'BenchmarkPrice',
+        'BenchmarkPriceType',
+        'BenchmarkSecurityID',
+        'BenchmarkSecurityIDSource',
+        'YieldType',
+        'Yield',
+        'YieldCalcDate',
+        'YieldRedemptionDate',
+        'YieldRedemptionPrice',
+        'YieldRedemptionPriceType',
+        'Currency',
+        'ComplianceID',
+        'SolicitedFlag',
+        'IOIID',
+        'QuoteID',
+        'TimeInForce',
+        'EffectiveTime',
+        'ExpireDate',
+        'ExpireTime',
+        'GTBookingInst',
+        'Commission',
+        'CommType',
+        'CommCurrency',
+        'FundRenewWaiv',
+        'OrderCapacity',
+        'OrderRestrictions',
+        'CustOrderCapacity',
+        'ForexReq',
+        'SettlCurrency',
+        'BookingType',
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+        'SettlDate2',
+        'OrderQty2',
+        'Price2',
+        'PositionEffect',
+        'CoveredOrUncovered',
+        'MaxShow',
+        'PegOffsetValue',
+        'PegMoveType',
+        'PegOffsetType',
+        'PegLimitType',
+        'PegRoundDirection',
+        'PegScope',
+        'DiscretionInst',
+        'DiscretionOffsetValue',
+        'DiscretionMoveType',
+        'DiscretionOffsetType',
+        'DiscretionLimitType',
+        'DiscretionRoundDirection',
+        'DiscretionScope',
+        'TargetStrategy',
+        'TargetStrategyParameters',
+        'ParticipationRate',
+        'CancellationRights',
+        'MoneyLaunderingStatus',
+        'RegistID',
+        'Designation',
+    )
+
+    ClOrdID: str
+    SecondaryClOrdID: str
+    ClOrdLinkID: str
+    NoPartyIDs: list
+    TradeOriginationDate: date
+    TradeDate: date
+    Account: str
+    AcctIDSource: int
+    AccountType: int
+    DayBookingInst: str
+    BookingUnit: str
+    PreallocMethod: str
+    AllocID: str
+    NoAllocs: list
+    SettlType: str
+    SettlDate: date
+    CashMargin: str
+    ClearingFeeIndicator: str
+    HandlInst: str
+    ExecInst: str
+    MinQty: Decimal
+    MaxFloor: Decimal
+    ExDestination: str
+    NoTradingSessions: list
+    ProcessCode: str
+    Symbol: str
+    SymbolSfx: str
+    SecurityID: str
+    SecurityIDSource: str
+    NoSecurityAltID: list
+    Product: int
+    CFICode: str
+    SecurityType: str
+    SecuritySubType: str
+    MaturityMonthYear: str
+    MaturityDate: date
+    PutOrCall: int
+    CouponPaymentDate: date
+    IssueDate: date
+    RepoCollateralSecurityType: str
+    RepurchaseTerm: int
+    RepurchaseRate: Decimal
+    Factor: Decimal
+    CreditRating: str
+    InstrRegistry: str
+    CountryOfIssue: str
+    StateOrProvinceOfIssue: str
+    LocaleOfIssue: str
+    RedemptionDate: date
+    StrikePrice: Decimal
+    StrikeCurrency: str
+    OptAttribute: str
+    ContractMultiplier: Decimal
+    CouponRate: Decimal
+    SecurityExchange: str
+    Issuer: str
+    EncodedIssuerLen: int
+    EncodedIssuer: str
+    SecurityDesc: str
+    EncodedSecurityDescLen: int
+    EncodedSecurityDesc: str
+    Pool: str
+    ContractSettlMonth: str
+    CPProgram: int
+    CPRegType: str
+    NoEvents: list
+    DatedDate: date
+    InterestAccrualDate: date
+    AgreementDesc: str
+    AgreementID: str
+    AgreementDate: date
+    AgreementCurrency: str
+    TerminationType: int
+    StartDate: date
+    EndDate: date
+    DeliveryType: int
+    MarginRatio: Decimal
+    NoUnderlyings: list
+    PrevClosePx: Decimal
+    Side: str
+    LocateReqd: bool
+    TransactTime: datetime
+    NoStipulations: list
+    QtyType: int
+    OrderQty: Decimal
+    CashOrderQty: Decimal
+    OrderPercent: Decimal
+    RoundingDirection: str
+    RoundingModulus: Decimal
+    OrdType: str
+    PriceType: int
+    Price: Decimal
+    StopPx: Decimal
+    Spread: Decimal
+    BenchmarkCurveCurrency: str
+    BenchmarkCurveName: str
+    BenchmarkCurvePoint: str
+    BenchmarkPrice: Decimal
+    BenchmarkPriceType: int
+    BenchmarkSecurityID: str
+    BenchmarkSecurityIDSource: str
+    YieldType: str
+    Yield: Decimal
+    YieldCalcDate: date
+    YieldRedemptionDate: date
+    YieldRedemptionPrice: Decimal
+    YieldRedemptionPriceType: int
+    Currency: str
+    ComplianceID: str
+    SolicitedFlag: bool
+    IOIID: str
+    QuoteID: str
+    TimeInForce: str
+    EffectiveTime: datetime
+    ExpireDate: date
+    ExpireTime: datetime
+    GTBookingInst: int
+    Commission: Decimal
+    CommType: str
+    CommCurrency: str
+    FundRenewWaiv: str
+    OrderCapacity: str
+    OrderRestrictions: str
+    CustOrderCapacity: int
+    ForexReq: bool
+    SettlCurrency: str
+    BookingType: int
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+    SettlDate2: date
+    OrderQty2: Decimal
+    Price2: Decimal
+    PositionEffect: str
+    CoveredOrUncovered: int
+    MaxShow: Decimal
+    PegOffsetValue: Decimal
+    PegMoveType: int
+    PegOffsetType: int
+    PegLimitType: int
+    PegRoundDirection: int
+    PegScope: int
+    DiscretionInst: str
+    DiscretionOffsetValue: Decimal
+    DiscretionMoveType: int
+    DiscretionOffsetType: int
+    DiscretionLimitType: int
+    DiscretionRoundDirection: int
+    DiscretionScope: int
+    TargetStrategy: int
+    TargetStrategyParameters: str
+    ParticipationRate: Decimal
+    CancellationRights: str
+    MoneyLaunderingStatus: str
+    RegistID: str
+    Designation: str
+
+    fieldSpecs = {
+        11: ('ClOrdID', None, None),
+        526: ('SecondaryClOrdID', None, None),
+        583: ('ClOrdLinkID', None, None),
+        453: ('NoPartyIDs', None, Parties),
+        229: ('TradeOriginationDate', parseDate, None),
+        75: ('TradeDate', parseDate, None),
+        1: ('Account', None, None),
+        660: ('AcctIDSource', int, None),
+        581: ('AccountType', int, None),
+        589: ('DayBookingInst', None, None),
+        590: ('BookingUnit', None, None),
+        591: ('PreallocMethod', None, None),
+        70: ('AllocID', None, None),
+        78: ('NoAllocs', None, PreAllocGrp),
+        63: ('SettlType', None, None),
+        64: ('SettlDate', parseDate, None),
+        544: ('CashMargin', None, None),
+        635: ('ClearingFeeIndicator', None, None),
+        21: ('HandlInst', None, None),
+        18: ('ExecInst', None, None),
+        110: ('MinQty', Decimal, None),
+        111: ('MaxFloor', Decimal, None),
+        100: ('ExDestination', None, None),
+        386: ('NoTradingSessions', None, TrdgSesGrp),
+        81: ('ProcessCode', None, None),
+        55: ('Symbol', None, None),
+        65: ('SymbolSfx', None, None),
+        48: ('SecurityID', None, None),
+        22: ('SecurityIDSource', None, None),
+        454: ('NoSecurityAltID', None, SecAltIDGrp),
+        460: ('Product', int, None),
+        461: ('CFICode', None, None),
+        167: ('SecurityType', None, None),
+        762: ('SecuritySubType', None, None),
+        200: ('MaturityMonthYear', None, None),
+        541: ('MaturityDate', parseDate, None),
+        201: ('PutOrCall', int, None),
+        224: ('CouponPaymentDate', parseDate, None),
+        225: ('IssueDate', parseDate, None),
+        239: ('RepoCollateralSecurityType', None, None),
+        226: ('RepurchaseTerm', int, None),
+        227: ('RepurchaseRate', Decimal, None),
+        228: ('Factor', Decimal, None),
+        255: ('CreditRating', None, None),
+        543: ('InstrRegistry', None, None),
+        470: ('CountryOfIssue', None, None),
+        471: ('StateOrProvinceOfIssue', None, None),
+        472: ('LocaleOfIssue', None, None),
+        240: ('RedemptionDate', parseDate, None),
+        202: ('StrikePrice', Decimal, None),
+        947: ('StrikeCurrency', None, None),
+        206: ('OptAttribute', None, None),
+        231: ('ContractMultiplier', Decimal, None),
+        223: ('CouponRate', Decimal, None),
+        207: ('SecurityExchange', None, None),
+        106: ('Issuer', None, None),
+        348: ('EncodedIssuerLen', int, None),
+        349: ('EncodedIssuer', None, None),
+        107: ('SecurityDesc', None, None),
+        350: ('EncodedSecurityDescLen', int, None),
+        351: ('EncodedSecurityDesc', None, None),
+        691: ('Pool', None, None),
+        667: ('ContractSettlMonth', None, None),
+        875: ('CPProgram', int, None),
+        876: ('CPRegType', None, None),
+        864: ('NoEvents', None, EvntGrp),
+        873: ('DatedDate', parseDate, None),
+        874: ('InterestAccrualDate', parseDate, None),
+        913: ('AgreementDesc', None, None),
+        914: ('AgreementID', None, None),
+        915: ('AgreementDate', parseDate, None),
+        918: ('AgreementCurrency', None, None),
+        788: ('TerminationType', int, None),
+        916: ('StartDate', parseDate, None),
+        917: ('EndDate', parseDate, None),
+        919: ('DeliveryType', int, None),
+        898: ('MarginRatio', Decimal, None),
+        711: ('NoUnderlyings', None, UndInstrmtGrp),
+        140: ('PrevClosePx', Decimal, None),
+        54: ('Side', None, None),
+        114: ('LocateReqd', parseBoolean, None),
+        60: ('TransactTime', parseUTCTimestamp, None),
+        232: ('NoStipulations', None, Stipulations),
+        854: ('QtyType', int, None),
+        38: ('OrderQty', Decimal, None),
+        152: ('CashOrderQty', Decimal, None),
+        516: ('OrderPercent', Decimal, None),
+        468: ('RoundingDirection', None, None),
+        469: ('RoundingModulus', Decimal, None),
+        40: ('OrdType', None, None),
+        423: ('PriceType', int, None),
+        44: ('Price', Decimal, None),
+        99: ('StopPx', Decimal, None),
+        218: ('Spread', Decimal, None),
+        220: ('BenchmarkCurveCurrency', None, None),
+        221: ('BenchmarkCurveName', None, None),
+        222: ('BenchmarkCurvePoint', None, None),
+        662: ('BenchmarkPrice', Decimal, None),
+        663: ('BenchmarkPriceType', int, None),
+        699: ('BenchmarkSecurityID', None, None),
+        761: ('BenchmarkSecurityIDSource', None, None),
+        235: ('YieldType', None, None),
+        236: ('Yield', Decimal, None),
+        701: ('YieldCalcDate', parseDate, None),
+        696: ('YieldRedemptionDate', parseDate, None),
+        697: ('YieldRedemptionPrice', Decimal, None),
+        698: ('YieldRedemptionPriceType', int, None),
+        15: ('Currency', None, None),
+        376: ('ComplianceID', None, None),
+        377: ('SolicitedFlag', parseBoolean, None),
+        23: ('IOIID', None, None),
+        117: ('QuoteID', None, None),
+        59: ('TimeInForce', None, None),
+        168: ('EffectiveTime', parseUTCTimestamp, None),
+        432: ('ExpireDate', parseDate, None),
+        126: ('ExpireTime', parseUTCTimestamp, None),
+        427: ('GTBookingInst', int, None),
+        12: ('Commission', Decimal, None),
+        13: ('CommType', None, None),
+        479: ('CommCurrency', None, None),
+        497: ('FundRenewWaiv', None, None),
+        528: ('OrderCapacity', None, None),
+        529: ('OrderRestrictions', None, None),
+        582: ('CustOrderCapacity', int, None),
+        121: ('ForexReq', parseBoolean, None),
+        120: ('SettlCurrency', None, None),
+        775: ('BookingType', int, None),
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+        193: ('SettlDate2', parseDate, None),
+        192: ('OrderQty2', Decimal, None),
+        640: ('Price2', Decimal, None),
+        77: ('PositionEffect', None, None),
+        203: ('CoveredOrUncovered', int, None),
+        210: ('MaxShow', Decimal, None),
+        211: ('PegOffsetValue', Decimal, None),
+        835: ('PegMoveType', int, None),
+        836: ('PegOffsetType', int, None),
+        837: ('PegLimitType', int, None),
+        838: ('PegRoundDirection', int, None),
+        840: ('PegScope', int, None),
+        388: ('DiscretionInst', None, None),
+        389: ('DiscretionOffsetValue', Decimal, None),
+        841: ('DiscretionMoveType', int, None),
+        842: ('DiscretionOffsetType', int, None),
+        843: ('DiscretionLimitType', int, None),
+        844: ('DiscretionRoundDirection', int, None),
+        846: ('DiscretionScope', int, None),
+        847: ('TargetStrategy', int, None),
+        848: ('TargetStrategyParameters', None, None),
+        849: ('ParticipationRate', Decimal, None),
+        480: ('CancellationRights', None, None),
+        481: ('MoneyLaunderingStatus', None, None),
+        513: ('RegistID', None, None),
+        494: ('Designation', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, 'D')
+        self.ClOrdID = None
+        self.SecondaryClOrdID = None
+        self.ClOrdLinkID = None
+        self.NoPartyIDs = None
+        self.TradeOriginationDate = None
+        self.TradeDate = None
+        self.Account = None
+        self.AcctIDSource = None
+        self.AccountType = None
+        self.DayBookingInst = None
+        self.BookingUnit = None
+        self.PreallocMethod = None
+        self.AllocID = None
+        self.NoAllocs = None
+        self.SettlType = None
+        self.SettlDate = None
+        self.CashMargin = None
+        self.ClearingFeeIndicator = None
+        self.HandlInst = None
+        self.ExecInst = None
+        self.MinQty = None
+        self.MaxFloor = None
+        self.ExDestination = None
+        self.NoTradingSessions = None
+        self.ProcessCode = None
+        self.Symbol = None
+        self.SymbolSfx = None
+        self.SecurityID = None
+        self.SecurityIDSource = None
+        self.NoSecurityAltID = None
+        self.Product = None
+        self.CFICode = None
+        self.SecurityType = None
+        self.SecuritySubType = None
+        self.MaturityMonthYear = None
+        self.MaturityDate = None
+        self.PutOrCall = None
+        self.CouponPaymentDate = None
+        self.IssueDate = None
+        self.RepoCollateralSecurityType = None
+        self.RepurchaseTerm = None
+        self.RepurchaseRate = None
+        self.Factor = None
+        self.CreditRating = None
+        self.InstrRegistry = None
+        self.CountryOfIssue = None
+        self.StateOrProvinceOfIssue = None
+        self.LocaleOfIssue = None
+        self.RedemptionDate = None
+        self.StrikePrice = None
+        self.StrikeCurrency = None
+        self.OptAttribute = None
+        self.ContractMultiplier = None
+        self.CouponRate = None
+        self.SecurityExchange = None
+        self.Issuer = None
+        self.EncodedIssuerLen = None
+        self.EncodedIssuer = None
+        self.SecurityDesc = None
+        self.EncodedSecurityDescLen = None
+        self.EncodedSecurityDesc = None
+        self.Pool = None
+        self.ContractSettlMonth = None
+        self.CPProgram = None
+        self.CPRegType = None
+        self.NoEvents = None
+        self.DatedDate = None
+        self.InterestAccrualDate = None
+        self.AgreementDesc = None
+        self.AgreementID = None
+        self.AgreementDate = None
+        self.AgreementCurrency = None
+        self.TerminationType = None
+        self.StartDate = None
+        self.EndDate = None
+        self.DeliveryType = None
+        self.MarginRatio = None
+        self.NoUnderlyings = None
+        self.PrevClosePx = None
+        self.Side = None
+        self.LocateReqd = None
+        self.TransactTime = None
+        self.NoStipulations = None
+        self.QtyType = None
+        self.OrderQty = None
+        self.CashOrderQty = None
+        self.OrderPercent = None
+        self.RoundingDirection = None
+        self.RoundingModulus = None
+        self.OrdType = None
+        self.PriceType = None
+        self.Price = None
+        self.StopPx = None
+        self.Spread = None
+        self.BenchmarkCurveCurrency = None
+        self.BenchmarkCurveName = None
+        self.BenchmarkCurvePoint = None
+        self.BenchmarkPrice = None
+        self.BenchmarkPriceType = None
+        self.BenchmarkSecurityID = None
+        self.BenchmarkSecurityIDSource = None
+        self.YieldType = None
+        self.Yield = None
+        self.YieldCalcDate = None
+        self.YieldRedemptionDate = None
+        self.YieldRedemptionPrice = None
+        self.YieldRedemptionPriceType = None
+        self.Currency = None
+        self.ComplianceID = None
+        self.SolicitedFlag = None
+        self.IOIID = None
+        self.QuoteID = None
+        self.TimeInForce = None
+        self.EffectiveTime = None
+        self.ExpireDate = None
+        self.ExpireTime = None
+        self.GTBookingInst = None
+        self.Commission = None
+        self.CommType = None
+        self.CommCurrency = None
+        self.FundRenewWaiv = None
+        self.OrderCapacity = None
+        self.OrderRestrictions = None
+        self.CustOrderCapacity = None
+        self.ForexReq = None
+        self.SettlCurrency = None
+        self.BookingType = None
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+        self.SettlDate2 = None
+        self.OrderQty2 = None
+        self.Price2 = None
+        self.PositionEffect = None
+        self.CoveredOrUncovered = None
+        self.MaxShow = None
+        self.PegOffsetValue = None
+        self.PegMoveType = None
+        self.PegOffsetType = None
+        self.PegLimitType = None
+        self.PegRoundDirection = None
+        self.PegScope = None
+        self.DiscretionInst = None
+        self.DiscretionOffsetValue = None
+        self.DiscretionMoveType = None
+        self.DiscretionOffsetType = None
+        self.DiscretionLimitType = None
+        self.DiscretionRoundDirection = None
+        self.DiscretionScope = None
+        self.TargetStrategy = None
+        self.TargetStrategyParameters = None
+        self.ParticipationRate = None
+        self.CancellationRights = None
+        self.MoneyLaunderingStatus = None
+        self.RegistID = None
+        self.Designation = None
+
+    def encodeFields(self, buffer):
+        value = self.ClOrdID
+        if value is not None:
+            buffer += b'11='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryClOrdID
+        if value is not None:
+            buffer += b'526='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdLinkID
+        if value is not None:
+            buffer += b'583='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoPartyIDs
+        if value is not None:
+            buffer += b'453=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.TradeOriginationDate
+        if value is not None:
+            buffer += b'229='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeDate
+        if value is not None:
+            buffer += b'75='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Account
+        if value is not None:
+            buffer += b'1='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AcctIDSource
+        if value is not None:
+            buffer += b'660='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccountType
+        if value is not None:
+            buffer += b'581='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DayBookingInst
+        if value is not None:
+            buffer += b'589='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BookingUnit
+        if value is not None:
+            buffer += b'590='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PreallocMethod
+        if value is not None:
+            buffer += b'591='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocID
+        if value is not None:
+            buffer += b'70='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoAllocs
+        if value is not None:
+            buffer += b'78=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.SettlType
+        if value is not None:
+            buffer += b'63='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDate
+        if value is not None:
+            buffer += b'64='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CashMargin
+        if value is not None:
+            buffer += b'544='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClearingFeeIndicator
+        if value is not None:
+            buffer += b'635='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.HandlInst
+        if value is not None:
+            buffer += b'21='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecInst
+        if value is not None:
+            buffer += b'18='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MinQty
+        if value is not None:
+            buffer += b'110='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaxFloor
+        if value is not None:
+            buffer += b'111='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExDestination
+        if value is not None:
+            buffer += b'100='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoTradingSessions
+        if value is not None:
+            buffer += b'386=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.ProcessCode
+        if value is not None:
+            buffer += b'81='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Symbol
+        if value is not None:
+            buffer += b'55='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SymbolSfx
+        if value is not None:
+            buffer += b'65='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityID
+        if value is not None:
+            buffer += b'48='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityIDSource
+        if value is not None:
+            buffer += b'22='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSecurityAltID
+        if value is not None:
+            buffer += b'454=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Product
+        if value is not None:
+            buffer += b'460='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CFICode
+        if value is not None:
+            buffer += b'461='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityType
+        if value is not None:
+            buffer += b'167='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecuritySubType
+        if value is not None:
+            buffer += b'762='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityMonthYear
+        if value is not None:
+            buffer += b'200='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityDate
+        if value is not None:
+            buffer += b'541='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PutOrCall
+        if value is not None:
+            buffer += b'201='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponPaymentDate
+        if value is not None:
+            buffer += b'224='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IssueDate
+        if value is not None:
+            buffer += b'225='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepoCollateralSecurityType
+        if value is not None:
+            buffer += b'239='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseTerm
+        if value is not None:
+            buffer += b'226='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseRate
+        if value is not None:
+            buffer += b'227='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Factor
+        if value is not None:
+            buffer += b'228='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CreditRating
+        if value is not None:
+            buffer += b'255='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InstrRegistry
+        if value is not None:
+            buffer += b'543='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CountryOfIssue
+        if value is not None:
+            buffer += b'470='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'471='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LocaleOfIssue
+        if value is not None:
+            buffer += b'472='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RedemptionDate
+        if value is not None:
+            buffer += b'240='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikePrice
+        if value is not None:
+            buffer += b'202='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikeCurrency
+        if value is not None:
+            buffer += b'947='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OptAttribute
+        if value is not None:
+            buffer += b'206='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractMultiplier
+        if value is not None:
+            buffer += b'231='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponRate
+        if value is not None:
+            buffer += b'223='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityExchange
+        if value is not None:
+            buffer += b'207='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Issuer
+        if value is not None:
+            buffer += b'106='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuerLen
+        if value is not None:
+            buffer += b'348='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuer
+        if value is not None:
+            buffer += b'349='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityDesc
+        if value is not None:
+            buffer += b'107='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDescLen
+        if value is not None:
+            buffer += b'350='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDesc
+        if value is not None:
+            buffer += b'351='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Pool
+        if value is not None:
+            buffer += b'691='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractSettlMonth
+        if value is not None:
+            buffer += b'667='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPProgram
+        if value is not None:
+            buffer += b'875='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPRegType
+        if value is not None:
+            buffer += b'876='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoEvents
+        if value is not None:
+            buffer += b'864=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.DatedDate
+        if value is not None:
+            buffer += b'873='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAccrualDate
+        if value is not None:
+            buffer += b'874='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDesc
+        if value is not None:
+            buffer += b'913='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementID
+        if value is not None:
+            buffer += b'914='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDate
+        if value is not None:
+            buffer += b'915='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementCurrency
+        if value is not None:
+            buffer += b'918='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TerminationType
+        if value is not None:
+            buffer += b'788='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartDate
+        if value is not None:
+            buffer += b'916='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndDate
+        if value is not None:
+            buffer += b'917='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DeliveryType
+        if value is not None:
+            buffer += b'919='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MarginRatio
+        if value is not None:
+            buffer += b'898='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoUnderlyings
+        if value is not None:
+            buffer += b'711=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.PrevClosePx
+        if value is not None:
+            buffer += b'140='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Side
+        if value is not None:
+            buffer += b'54='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LocateReqd
+        if value is not None:
+            buffer += b'114='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransactTime
+        if value is not None:
+            buffer += b'60='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoStipulations
+        if value is not None:
+            buffer += b'232=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.QtyType
+        if value is not None:
+            buffer += b'854='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderQty
+        if value is not None:
+            buffer += b'38='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CashOrderQty
+        if value is not None:
+            buffer += b'152='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderPercent
+        if value is not None:
+            buffer += b'516='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingDirection
+        if value is not None:
+            buffer += b'468='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingModulus
+        if value is not None:
+            buffer += b'469='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdType
+        if value is not None:
+            buffer += b'40='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PriceType
+        if value is not None:
+            buffer += b'423='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Price
+        if value is not None:
+            buffer += b'44='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StopPx
+        if value is not None:
+            buffer += b'99='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Spread
+        if value is not None:
+            buffer += b'218='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveCurrency
+        if value is not None:
+            buffer += b'220='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveName
+        if value is not None:
+            buffer += b'221='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurvePoint
+        if value is not None:
+            buffer += b'222='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPrice
+        if value is not None:
+            buffer += b'662='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPriceType
+        if value is not None:
+            buffer += b'663='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityID
+        if value is not None:
+            buffer += b'699='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityIDSource
+        if value is not None:
+            buffer += b'761='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldType
+        if value is not None:
+            buffer += b'235='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Yield
+        if value is not None:
+            buffer += b'236='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldCalcDate
+        if value is not None:
+            buffer += b'701='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionDate
+        if value is not None:
+            buffer += b'696='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPrice
+        if value is not None:
+            buffer += b'697='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPriceType
+        if value is not None:
+            buffer += b'698='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Currency
+        if value is not None:
+            buffer += b'15='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ComplianceID
+        if value is not None:
+            buffer += b'376='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SolicitedFlag
+        if value is not None:
+            buffer += b'377='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IOIID
+        if value is not None:
+            buffer += b'23='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.QuoteID
+        if value is not None:
+            buffer += b'117='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TimeInForce
+        if value is not None:
+            buffer += b'59='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EffectiveTime
+        if value is not None:
+            buffer += b'168='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExpireDate
+        if value is not None:
+            buffer += b'432='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExpireTime
+        if value is not None:
+            buffer += b'126='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.GTBookingInst
+        if value is not None:
+            buffer += b'427='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Commission
+        if value is not None:
+            buffer += b'12='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommType
+        if value is not None:
+            buffer += b'13='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommCurrency
+        if value is not None:
+            buffer += b'479='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.FundRenewWaiv
+        if value is not None:
+            buffer += b'497='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderCapacity
+        if value is not None:
+            buffer += b'528='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderRestrictions
+        if value is not None:
+            buffer += b'529='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CustOrderCapacity
+        if value is not None:
+            buffer += b'582='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ForexReq
+        if value is not None:
+            buffer += b'121='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrency
+        if value is not None:
+            buffer += b'120='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BookingType
+        if value is not None:
+            buffer += b'775='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDate2
+        if value is not None:
+            buffer += b'193='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderQty2
+        if value is not None:
+            buffer += b'192='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Price2
+        if value is not None:
+            buffer += b'640='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PositionEffect
+        if value is not None:
+            buffer += b'77='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CoveredOrUncovered
+        if value is not None:
+            buffer += b'203='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaxShow
+        if value is not None:
+            buffer += b'210='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegOffsetValue
+        if value is not None:
+            buffer += b'211='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegMoveType
+        if value is not None:
+            buffer += b'835='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegOffsetType
+        if value is not None:
+            buffer += b'836='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegLimitType
+        if value is not None:
+            buffer += b'837='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegRoundDirection
+        if value is not None:
+            buffer += b'838='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegScope
+        if value is not None:
+            buffer += b'840='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionInst
+        if value is not None:
+            buffer += b'388='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionOffsetValue
+        if value is not None:
+            buffer += b'389='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionMoveType
+        if value is not None:
+            buffer += b'841='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionOffsetType
+        if value is not None:
+            buffer += b'842='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionLimitType
+        if value is not None:
+            buffer += b'843='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionRoundDirection
+        if value is not None:
+            buffer += b'844='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionScope
+        if value is not None:
+            buffer += b'846='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TargetStrategy
+        if value is not None:
+            buffer += b'847='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TargetStrategyParameters
+        if value is not None:
+            buffer += b'848='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ParticipationRate
+        if value is not None:
+            buffer += b'849='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CancellationRights
+        if value is not None:
+            buffer += b'480='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MoneyLaunderingStatus
+        if value is not None:
+            buffer += b'481='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RegistID
+        if value is not None:
+            buffer += b'513='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Designation
+        if value is not None:
+            buffer += b'494='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class OrderCancelRequest(TypedMessage):
+    __slots__ = (
+        'OrigClOrdID',
+        'OrderID',
+        'ClOrdID',
+        'SecondaryClOrdID',
+        'ClOrdLinkID',
+        'ListID',
+        'OrigOrdModTime',
+        'Account',
+        'AcctIDSource',
+        'AccountType',
+        'NoPartyIDs',
+        'Symbol',
+        'SymbolSfx',
+        'SecurityID',
+        'SecurityIDSource',
+        'NoSecurityAltID',
+        'Product',
+        'CFICode',
+        'SecurityType',
+        'SecuritySubType',
+        'MaturityMonthYear',
+        'MaturityDate',
+        'PutOrCall',
+        'CouponPaymentDate',
+        'IssueDate',
+        'RepoCollateralSecurityType',
+        'RepurchaseTerm',
+        'RepurchaseRate',
+        'Factor',
+        'CreditRating',
+        'InstrRegistry',
+        'CountryOfIssue',
+        'StateOrProvinceOfIssue',
+        'LocaleOfIssue',
+        'RedemptionDate',
+        'StrikePrice',
+        'StrikeCurrency',
+        'OptAttribute',
+        'ContractMultiplier',
+        'CouponRate',
+        'SecurityExchange',
+        'Issuer',
+        'EncodedIssuerLen',
+        'EncodedIssuer',
+        'SecurityDesc',
+        'EncodedSecurityDescLen',
+        'EncodedSecurityDesc',
+        'Pool',
+        'ContractSettlMonth',
+        'CPProgram',
+        'CPRegType',
+        'NoEvents',
+        'DatedDate',
+        'InterestAccrualDate',
+        'AgreementDesc',
+        'AgreementID',
+        'AgreementDate',
+        'AgreementCurrency',
+        'TerminationType',
+        'StartDate',
+        'EndDate',
+        'DeliveryType',
+        'MarginRatio',
+        'NoUnderlyings',
+        'Side',
+        'TransactTime',
+        'OrderQty',
+        'CashOrderQty',
+        'OrderPercent',
+        'RoundingDirection',
+        'RoundingModulus',
+        'ComplianceID',
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+    )
+
+    OrigClOrdID: str
+    OrderID: str
+    ClOrdID: str
+    SecondaryClOrdID: str
+    ClOrdLinkID: str
+    ListID: str
+    OrigOrdModTime: datetime
+    Account: str
+    AcctIDSource: int
+    AccountType: int
+    NoPartyIDs: list
+    Symbol: str
+    SymbolSfx: str
+    SecurityID: str
+    SecurityIDSource: str
+    NoSecurityAltID: list
+    Product: int
+    CFICode: str
+    SecurityType: str
+    SecuritySubType: str
+    MaturityMonthYear: str
+    MaturityDate: date
+    PutOrCall: int
+    CouponPaymentDate: date
+    IssueDate: date
+    RepoCollateralSecurityType: str
+    RepurchaseTerm: int
+    RepurchaseRate: Decimal
+    Factor: Decimal
+    CreditRating: str
+    InstrRegistry: str
+    CountryOfIssue: str
+    StateOrProvinceOfIssue: str
+    LocaleOfIssue: str
+    RedemptionDate: date
+    StrikePrice: Decimal
+    StrikeCurrency: str
+    OptAttribute: str
+    ContractMultiplier: Decimal
+    CouponRate: Decimal
+    SecurityExchange: str
+    Issuer: str
+    EncodedIssuerLen: int
+    EncodedIssuer: str
+    SecurityDesc: str
+    EncodedSecurityDescLen: int
+    EncodedSecurityDesc: str
+    Pool: str
+    ContractSettlMonth: str
+    CPProgram: int
+    CPRegType: str
+    NoEvents: list
+    DatedDate: date
+    InterestAccrualDate: date
+    AgreementDesc: str
+    AgreementID: str
+    AgreementDate: date
+    AgreementCurrency: str
+    TerminationType: int
+    StartDate: date
+    EndDate: date
+    DeliveryType: int
+    MarginRatio: Decimal
+    NoUnderlyings: list
+    Side: str
+    TransactTime: datetime
+    OrderQty: Decimal
+    CashOrderQty: Decimal
+    OrderPercent: Decimal
+    RoundingDirection: str
+    RoundingModulus: Decimal
+    ComplianceID: str
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+
+    fieldSpecs = {
+        41: ('OrigClOrdID', None, None),
+        37: ('OrderID', None, None),
+        11: ('ClOrdID', None, None),
+        526: ('SecondaryClOrdID', None, None),
+        583: ('ClOrdLinkID', None, None),
+        66: ('ListID', None, None),
+        586: ('OrigOrdModTime', parseUTCTimestamp, None),
+        1: ('Account', None, None),
+        660: ('AcctIDSource', int, None),
+        581: ('AccountType', int, None),
+        453: ('NoPartyIDs', None, Parties),
+        55: ('Symbol', None, None),
+        65: ('SymbolSfx', None, None),
+        48: ('SecurityID', None, None),
+        22: ('SecurityIDSource', None, None),
+        454: ('NoSecurityAltID', None, SecAltIDGrp),
+        460: ('Product', int, None),
+        461: ('CFICode', None, None),
+        167: ('SecurityType', None, None),
+        762: ('SecuritySubType', None, None),
+        200: ('MaturityMonthYear', None, None),
+        541: ('MaturityDate', parseDate, None),
+        201: ('PutOrCall', int, None),
+        224: ('CouponPaymentDate', parseDate, None),
+        225: ('IssueDate', parseDate, None),
+        239: ('RepoCollateralSecurityType', None, None),
+        226: ('RepurchaseTerm', int, None),
+        227: ('RepurchaseRate', Decimal, None),
+        228: ('Factor', Decimal, None),
+        255: ('CreditRating', None, None),
+        543: ('InstrRegistry', None, None),
+        470: ('CountryOfIssue', None, None),
+        471: ('StateOrProvinceOfIssue', None, None),
+        472: ('LocaleOfIssue', None, None),
+        240: ('RedemptionDate', parseDate, None),
+        202: ('StrikePrice', Decimal, None),
+        947: ('StrikeCurrency', None, None),
+        206: ('OptAttribute', None, None),
+        231: ('ContractMultiplier', Decimal, None),
+        223: ('CouponRate', Decimal, None),
+        207: ('SecurityExchange', None, None),
+        106: ('Issuer', None, None),
+        348: ('EncodedIssuerLen', int, None),
+        349: ('EncodedIssuer', None, None),
+        107: ('SecurityDesc', None, None),
+        350: ('EncodedSecurityDescLen', int, None),
+        351: ('EncodedSecurityDesc', None, None),
+        691: ('Pool', None, None),
+        667: ('ContractSettlMonth', None, None),
+        875: ('CPProgram', int, None),
+        876: ('CPRegType', None, None),
+        864: ('NoEvents', None, EvntGrp),
+        873: ('DatedDate', parseDate, None),
+        874: ('InterestAccrualDate', parseDate, None),
+        913: ('AgreementDesc', None, None),
+        914: ('AgreementID', None, None),
+        915: ('AgreementDate', parseDate, None),
+        918: ('AgreementCurrency', None, None),
+        788: ('TerminationType', int, None),
+        916: ('StartDate', parseDate, None),
+        917: ('EndDate', parseDate, None),
+        919: ('DeliveryType', int, None),
+        898: ('MarginRatio', Decimal, None),
+        711: ('NoUnderlyings', None, UndInstrmtGrp),
+        54: ('Side', None, None),
+        60: ('TransactTime', parseUTCTimestamp, None),
+        38: ('OrderQty', Decimal, None),
+        152: ('CashOrderQty', Decimal, None),
+        516: ('OrderPercent', Decimal, None),
+        468: ('RoundingDirection', None, None),
+        469: ('RoundingModulus', Decimal, None),
+        376: ('ComplianceID', None, None),
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, 'F')
+        self.OrigClOrdID = None
+        self.OrderID = None
+        self.ClOrdID = None
+        self.SecondaryClOrdID = None
+        self.ClOrdLinkID = None
+        self.ListID = None
+        self.OrigOrdModTime = None
+        self.Account = None
+        self.AcctIDSource = None
+        self.AccountType = None
+        self.NoPartyIDs = None
+        self.Symbol = None
+        self.SymbolSfx = None
+        self.SecurityID = None
+        self.SecurityIDSource = None
+        self.NoSecurityAltID = None
+        self.Product = None
+        self.CFICode = None
+        self.SecurityType = None
+        self.SecuritySubType = None
+        self.MaturityMonthYear = None
+        self.MaturityDate = None
+        self.PutOrCall = None
+        self.CouponPaymentDate = None
+        self.IssueDate = None
+        self.RepoCollateralSecurityType = None
+        self.RepurchaseTerm = None
+        self.RepurchaseRate = None
+        self.Factor = None
+        self.CreditRating = None
+        self.InstrRegistry = None
+        self.CountryOfIssue = None
+        self.StateOrProvinceOfIssue = None
+        self.LocaleOfIssue = None
+        self.RedemptionDate = None
+        self.StrikePrice = None
+        self.StrikeCurrency = None
+        self.OptAttribute = None
+        self.ContractMultiplier = None
+        self.CouponRate = None
+        self.SecurityExchange = None
+        self.Issuer = None
+        self.EncodedIssuerLen = None
+        self.EncodedIssuer = None
+        self.SecurityDesc = None
+        self.EncodedSecurityDescLen = None
+        self.EncodedSecurityDesc = None
+        self.Pool = None
+        self.ContractSettlMonth = None
+        self.CPProgram = None
+        self.CPRegType = None
+        self.NoEvents = None
+        self.DatedDate = None
+        self.InterestAccrualDate = None
+        self.AgreementDesc = None
+        self.AgreementID = None
+        self.AgreementDate = None
+        self.AgreementCurrency = None
+        self.TerminationType = None
+        self.StartDate = None
+        self.EndDate = None
+        self.DeliveryType = None
+        self.MarginRatio = None
+        self.NoUnderlyings = None
+        self.Side = None
+        self.TransactTime = None
+        self.OrderQty = None
+        self.CashOrderQty = None
+        self.OrderPercent = None
+        self.RoundingDirection = None
+        self.RoundingModulus = None
+        self.ComplianceID = None
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+
+    def encodeFields(self, buffer):
+        value = self.OrigClOrdID
+        if value is not None:
+            buffer += b'41='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderID
+        if value is not None:
+            buffer += b'37='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdID
+        if value is not None:
+            buffer += b'11='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryClOrdID
+        if value is not None:
+            buffer += b'526='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdLinkID
+        if value is not None:
+            buffer += b'583='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ListID
+        if value is not None:
+            buffer += b'66='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrigOrdModTime
+        if value is not None:
+            buffer += b'586='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Account
+        if value is not None:
+            buffer += b'1='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AcctIDSource
+        if value is not None:
+            buffer += b'660='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccountType
+        if value is not None:
+            buffer += b'581='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoPartyIDs
+        if value is not None:
+            buffer += b'453=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Symbol
+        if value is not None:
+            buffer += b'55='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SymbolSfx
+        if value is not None:
+            buffer += b'65='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityID
+        if value is not None:
+            buffer += b'48='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityIDSource
+        if value is not None:
+            buffer += b'22='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSecurityAltID
+        if value is not None:
+            buffer += b'454=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Product
+        if value is not None:
+            buffer += b'460='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CFICode
+        if value is not None:
+            buffer += b'461='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityType
+        if value is not None:
+            buffer += b'167='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecuritySubType
+        if value is not None:
+            buffer += b'762='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityMonthYear
+        if value is not None:
+            buffer += b'200='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityDate
+        if value is not None:
+            buffer += b'541='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PutOrCall
+        if value is not None:
+            buffer += b'201='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponPaymentDate
+        if value is not None:
+            buffer += b'224='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IssueDate
+        if value is not None:
+            buffer += b'225='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepoCollateralSecurityType
+        if value is not None:
+            buffer += b'239='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseTerm
+        if value is not None:
+            buffer += b'226='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseRate
+        if value is not None:
+            buffer += b'227='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Factor
+        if value is not None:
+            buffer += b'228='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CreditRating
+        if value is not None:
+            buffer += b'255='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InstrRegistry
+        if value is not None:
+            buffer += b'543='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CountryOfIssue
+        if value is not None:
+            buffer += b'470='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'471='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LocaleOfIssue
+        if value is not None:
+            buffer += b'472='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RedemptionDate
+        if value is not None:
+            buffer += b'240='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikePrice
+        if value is not None:
+            buffer += b'202='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikeCurrency
+        if value is not None:
+            buffer += b'947='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OptAttribute
+        if value is not None:
+            buffer += b'206='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractMultiplier
+        if value is not None:
+            buffer += b'231='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponRate
+        if value is not None:
+            buffer += b'223='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityExchange
+        if value is not None:
+            buffer += b'207='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Issuer
+        if value is not None:
+            buffer += b'106='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuerLen
+        if value is not None:
+            buffer += b'348='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuer
+        if value is not None:
+            buffer += b'349='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityDesc
+        if value is not None:
+            buffer += b'107='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDescLen
+        if value is not None:
+            buffer += b'350='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDesc
+        if value is not None:
+            buffer += b'351='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Pool
+        if value is not None:
+            buffer += b'691='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractSettlMonth
+        if value is not None:
+            buffer += b'667='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPProgram
+        if value is not None:
+            buffer += b'875='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPRegType
+        if value is not None:
+            buffer += b'876='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoEvents
+        if value is not None:
+            buffer += b'864=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.DatedDate
+        if value is not None:
+            buffer += b'873='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAccrualDate
+        if value is not None:
+            buffer += b'874='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDesc
+        if value is not None:
+            buffer += b'913='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementID
+        if value is not None:
+            buffer += b'914='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDate
+        if value is not None:
+            buffer += b'915='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementCurrency
+        if value is not None:
+            buffer += b'918='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TerminationType
+        if value is not None:
+            buffer += b'788='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartDate
+        if value is not None:
+            buffer += b'916='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndDate
+        if value is not None:
+            buffer += b'917='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DeliveryType
+        if value is not None:
+            buffer += b'919='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MarginRatio
+        if value is not None:
+            buffer += b'898='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoUnderlyings
+        if value is not None:
+            buffer += b'711=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Side
+        if value is not None:
+            buffer += b'54='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransactTime
+        if value is not None:
+            buffer += b'60='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderQty
+        if value is not None:
+            buffer += b'38='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CashOrderQty
+        if value is not None:
+            buffer += b'152='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderPercent
+        if value is not None:
+            buffer += b'516='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingDirection
+        if value is not None:
+            buffer += b'468='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingModulus
+        if value is not None:
+            buffer += b'469='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ComplianceID
+        if value is not None:
+            buffer += b'376='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class OrderCancelReplaceRequest(TypedMessage):
+    __slots__ = (
+        'OrderID',
+        'NoPartyIDs',
+        'TradeOriginationDate',
+        'TradeDate',
+        'OrigClOrdID',
+        'ClOrdID',
+        'SecondaryClOrdID',
+        'ClOrdLinkID',
+        'ListID',
+        'OrigOrdModTime',
+        'Account',
+        'AcctIDSource',
+        'AccountType',
+        'DayBookingInst',
+        'BookingUnit',
+        'PreallocMethod',
+        'AllocID',
+        'NoAllocs',
+        'SettlType',
+        'SettlDate',
+        'CashMargin',
+        'ClearingFeeIndicator',
+        'HandlInst',
+        'ExecInst',
+        'MinQty',
+        'MaxFloor',
+        'ExDestination',
+        'NoTradingSessions',
+        'Symbol',
+        'SymbolSfx',
+        'SecurityID',
+        'SecurityIDSource',
+        'NoSecurityAltID',
+        'Product',
+        'CFICode',
+        'SecurityType',
+        'SecuritySubType',
+        'MaturityMonthYear',
+        'MaturityDate',
+        'PutOrCall',
+        'CouponPaymentDate',
+        'IssueDate',
+        'RepoCollateralSecurityType',
+        'RepurchaseTerm',
+        'RepurchaseRate',
+        'Factor',
+        'CreditRating',
+        'InstrRegistry',
+        'CountryOfIssue',
+        'StateOrProvinceOfIssue',
+        'LocaleOfIssue',
+        'RedemptionDate',
+        'StrikePrice',
+        'StrikeCurrency',
+        'OptAttribute',
+        'ContractMultiplier',
+        'CouponRate',
+        'SecurityExchange',
+        'Issuer',
+        'EncodedIssuerLen',
+        'EncodedIssuer',
+        'SecurityDesc',
+        'EncodedSecurityDescLen',
+        'EncodedSecurityDesc',
+        'Pool',
+        'ContractSettlMonth',
+        'CPProgram',
+        'CPRegType',
+        'NoEvents',
+        'DatedDate',
+        'InterestAccrualDate',
+        'AgreementDesc',
+        'AgreementID',
+        'AgreementDate',
+        'AgreementCurrency',
+        'TerminationType',
+        'StartDate',
+        'EndDate',
+        'DeliveryType',
+        'MarginRatio',
+        'NoUnderlyings',
+        'Side',
+        'TransactTime',
+        'QtyType',
+        'OrderQty',
+        'CashOrderQty',
+        'OrderPercent',
+        'RoundingDirection',
+        'RoundingModulus',
+        'OrdType',
+        'PriceType',
+        'Price',
+        'StopPx',
+        'Spread',
+        'BenchmarkCurveCurrency',
+        'BenchmarkCurveName',
+        'BenchmarkCurvePoint',
+        'BenchmarkPrice',
+        'BenchmarkPriceType',
+        'BenchmarkSecurityID',
+        'BenchmarkSecurityIDSource',
+        'YieldType',
+        'Yield',
+        'YieldCalcDate',
+        'YieldRedemptionDate',
+        'YieldRedemptionPrice',
+        'YieldRedemptionPriceType',
+        'PegOffsetValue',
+        'PegMoveType',
+        'PegOffsetType',
+        'PegLimitType',
+        'PegRoundDirection',
+        'PegScope',
+        'DiscretionInst',
+        'DiscretionOffsetValue',
+        'DiscretionMoveType',
+        'DiscretionOffsetType',
+        'DiscretionLimitType',
+        'DiscretionRoundDirection',
+        'DiscretionScope',
+        'TargetStrategy',
+        'TargetStrategyParameters',
+        'ParticipationRate',
+        'ComplianceID',
+        'SolicitedFlag',
+        'Currency',
+        'TimeInForce',
+        'EffectiveTime',
+        'ExpireDate',
+        'ExpireTime',
+        'GTBookingInst',
+        'Commission',
+        'CommType',
+        'CommCurrency',
+        'FundRenewWaiv',
+        'OrderCapacity',
+        'OrderRestrictions',
+        'CustOrderCapacity',
+        'ForexReq',
+        'SettlCurrency',
+        'BookingType',
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+        'SettlDate2',
+        'OrderQty2',
+        'Price2',
+        'PositionEffect',
+        'CoveredOrUncovered',
+        'MaxShow',
+        'LocateReqd',
+        'CancellationRights',
+        'MoneyLaunderingStatus',
+        'RegistID',
+        'Designation',
+    )
+
+    OrderID: str
+    NoPartyIDs: list
+    TradeOriginationDate: date
+    TradeDate: date
+    OrigClOrdID: str
+    ClOrdID: str
+    SecondaryClOrdID: str
+    ClOrdLinkID: str
+    ListID: str
+    OrigOrdModTime: datetime
+    Account: str
+    AcctIDSource: int
+    AccountType: int
+    DayBookingInst: str
+    BookingUnit: str
+    PreallocMethod: str
+    AllocID: str
+    NoAllocs: list
+    SettlType: str
+    SettlDate: date
+    CashMargin: str
+    ClearingFeeIndicator: str
+    HandlInst: str
+    ExecInst: str
+    MinQty: Decimal
+    MaxFloor: Decimal
+    ExDestination: str
+    NoTradingSessions: list
+    Symbol: str
+    SymbolSfx: str
+    SecurityID: str
+    SecurityIDSource: str
+    NoSecurityAltID: list
+    Product: int
+    CFICode: str
+    SecurityType: str
+    SecuritySubType: str
+    MaturityMonthYear: str
+    MaturityDate: date
+    PutOrCall: int
+    CouponPaymentDate: date
+    IssueDate: date
+    RepoCollateralSecurityType: str
+    RepurchaseTerm: int
+    RepurchaseRate: Decimal
+    Factor: Decimal
+    CreditRating: str
+    InstrRegistry: str
+    CountryOfIssue: str
+    StateOrProvinceOfIssue: str
+    LocaleOfIssue: str
+    RedemptionDate: date
+    StrikePrice: Decimal
+    StrikeCurrency: str
+    OptAttribute: str
+    ContractMultiplier: Decimal
+    CouponRate: Decimal
+    SecurityExchange: str
+    Issuer: str
+    EncodedIssuerLen: int
+    EncodedIssuer: str
+    SecurityDesc: str
+    EncodedSecurityDescLen: int
+    EncodedSecurityDesc: str
+    Pool: str
+    ContractSettlMonth: str
+    CPProgram: int
+    CPRegType: str
+    NoEvents: list
+    DatedDate: date
+    InterestAccrualDate: date
+    AgreementDesc: str
+    AgreementID: str
+    AgreementDate: date
+    AgreementCurrency: str
+    TerminationType: int
+    StartDate: date
+    EndDate: date
+    DeliveryType: int
+    MarginRatio: Decimal
+    NoUnderlyings: list
+    Side: str
+    TransactTime: datetime
+    QtyType: int
+    OrderQty: Decimal
+    CashOrderQty: Decimal
+    OrderPercent: Decimal
+    RoundingDirection: str
+    RoundingModulus: Decimal
+    OrdType: str
+    PriceType: int
+    Price: Decimal
+    StopPx: Decimal
+    Spread: Decimal
+    BenchmarkCurveCurrency: str
+    BenchmarkCurveName: str
+    BenchmarkCurvePoint: str
+    BenchmarkPrice: Decimal
+    BenchmarkPriceType: int
+    BenchmarkSecurityID: str
+    BenchmarkSecurityIDSource: str
+    YieldType: str
+    Yield: Decimal
+    YieldCalcDate: date
+    YieldRedemptionDate: date
+    YieldRedemptionPrice: Decimal
+    YieldRedemptionPriceType: int
+    PegOffsetValue: Decimal
+    PegMoveType: int
+    PegOffsetType: int
+    PegLimitType: int
+    PegRoundDirection: int
+    PegScope: int
+    DiscretionInst: str
+    DiscretionOffsetValue: Decimal
+    DiscretionMoveType: int
+    DiscretionOffsetType: int
+    DiscretionLimitType: int
+    DiscretionRoundDirection: int
+    DiscretionScope: int
+    TargetStrategy: int
+    TargetStrategyParameters: str
+    ParticipationRate: Decimal
+    ComplianceID: str
+    SolicitedFlag: bool
+    Currency: str
+    TimeInForce: str
+    EffectiveTime: datetime
+    ExpireDate: date
+    ExpireTime: datetime
+    GTBookingInst: int
+    Commission: Decimal
+    CommType: str
+    CommCurrency: str
+    FundRenewWaiv: str
+    OrderCapacity: str
+    OrderRestrictions: str
+    CustOrderCapacity: int
+    ForexReq: bool
+    SettlCurrency: str
+    BookingType: int
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+    SettlDate2: date
+    OrderQty2: Decimal
+    Price2: Decimal
+    PositionEffect: str
+    CoveredOrUncovered: int
+    MaxShow: Decimal
+    LocateReqd: bool
+    CancellationRights: str
+    MoneyLaunderingStatus: str
+    RegistID: str
+    Designation: str
+
+    fieldSpecs = {
+        37: ('OrderID', None, None),
+        453: ('NoPartyIDs', None, Parties),
+        229: ('TradeOriginationDate', parseDate, None),
+        75: ('TradeDate', parseDate, None),
+        41: ('OrigClOrdID', None, None),
+        11: ('ClOrdID', None, None),
+        526: ('SecondaryClOrdID', None, None),
+        583: ('ClOrdLinkID', None, None),
+        66: ('ListID', None, None),
+        586: ('OrigOrdModTime', parseUTCTimestamp, None),
+        1: ('Account', None, None),
+        660: ('AcctIDSource', int, None),
+        581: ('AccountType', int, None),
+        589: ('DayBookingInst', None, None),
+        590: ('BookingUnit', None, None),
+        591: ('PreallocMethod', None, None),
+        70: ('AllocID', None, None),
+        78: ('NoAllocs', None, PreAllocGrp),
+        63: ('SettlType', None, None),
+        64: ('SettlDate', parseDate, None),
+        544: ('CashMargin', None, None),
+        635: ('ClearingFeeIndicator', None, None),
+        21: ('HandlInst', None, None),
+        18: ('ExecInst', None, None),
+        110: ('MinQty', Decimal, None),
+        111: ('MaxFloor', Decimal, None),
+        100: ('ExDestination', None, None),
+        386: ('NoTradingSessions', None, TrdgSesGrp),
+        55: ('Symbol', None, None),
+        65: ('SymbolSfx', None, None),
+        48: ('SecurityID', None, None),
+        22: ('SecurityIDSource', None, None),
+        454: ('NoSecurityAltID', None, SecAltIDGrp),
+        460: ('Product', int, None),
+        461: ('CFICode', None, None),
+        167: ('SecurityType', None, None),
+        762: ('SecuritySubType', None, None),
+        200: ('MaturityMonthYear', None, None),
+        541: ('MaturityDate', parseDate, None),
+        201: ('PutOrCall', int, None),
+        224: ('CouponPaymentDate', parseDate, None),
+        225: ('IssueDate', parseDate, None),
+        239: ('RepoCollateralSecurityType', None, None),
+        226: ('RepurchaseTerm', int, None),
+        227: ('RepurchaseRate', Decimal, None),
+        228: ('Factor', Decimal, None),
+        255: ('CreditRating', None, None),
+        543: ('InstrRegistry', None, None),
+        470: ('CountryOfIssue', None, None),
+        471: ('StateOrProvinceOfIssue', None, None),
+        472: ('LocaleOfIssue', None, None),
+        240: ('RedemptionDate', parseDate, None),
+        202: ('StrikePrice', Decimal, None),
+        947: ('StrikeCurrency', None, None),
+        206: ('OptAttribute', None, None),
+        231: ('ContractMultiplier', Decimal, None),
+        223: ('CouponRate', Decimal, None),
+        207: ('SecurityExchange', None, None),
+        106: ('Issuer', None, None),
+        348: ('EncodedIssuerLen', int, None),
+        349: ('EncodedIssuer', None, None),
+        107: ('SecurityDesc', None, None),
+        350: ('EncodedSecurityDescLen', int, None),
+        351: ('EncodedSecurityDesc', None, None),
+        691: ('Pool', None, None),
+        667: ('ContractSettlMonth', None, None),
+        875: ('CPProgram', int, None),
+        876: ('CPRegType', None, None),
+        864: ('NoEvents', None, EvntGrp),
+        873: ('DatedDate', parseDate, None),
+        874: ('InterestAccrualDate', parseDate, None),
+        913: ('AgreementDesc', None, None),
+        914: ('AgreementID', None, None),
+        915: ('AgreementDate', parseDate, None),
+        918: ('AgreementCurrency', None, None),
+        788: ('TerminationType', int, None),
+        916: ('StartDate', parseDate, None),
+        917: ('EndDate', parseDate, None),
+        919: ('DeliveryType', int, None),
+        898: ('MarginRatio', Decimal, None),
+        711: ('NoUnderlyings', None, UndInstrmtGrp),
+        54: ('Side', None, None),
+        60: ('TransactTime', parseUTCTimestamp, None),
+        854: ('QtyType', int, None),
+        38: ('OrderQty', Decimal, None),
+        152: ('CashOrderQty', Decimal, None),
+        516: ('OrderPercent', Decimal, None),
+        468: ('RoundingDirection', None, None),
+        469: ('RoundingModulus', Decimal, None),
+        40: ('OrdType', None, None),
+        423: ('PriceType', int, None),
+        44: ('Price', Decimal, None),
+        99: ('StopPx', Decimal, None),
+        218: ('Spread', Decimal, None),
+        220: ('BenchmarkCurveCurrency', None, None),
+        221: ('BenchmarkCurveName', None, None),
+        222: ('BenchmarkCurvePoint', None, None),
+        662: ('BenchmarkPrice', Decimal, None),
+        663: ('BenchmarkPriceType', int, None),
+        699: ('BenchmarkSecurityID', None, None),
+        761: ('BenchmarkSecurityIDSource', None, None),
+        235: ('YieldType', None, None),
+        236: ('Yield', Decimal, None),
+        701: ('YieldCalcDate', parseDate, None),
+        696: ('YieldRedemptionDate', parseDate, None),
+        697: ('YieldRedemptionPrice', Decimal, None),
+        698: ('YieldRedemptionPriceType', int, None),
+        211: ('PegOffsetValue', Decimal, None),
+        835: ('PegMoveType', int, None),
+        836: ('PegOffsetType', int, None),
+        837: ('PegLimitType', int, None),
+        838: ('PegRoundDirection', int, None),
+        840: ('PegScope', int, None),
+        388: ('DiscretionInst', None, None),
+        389: ('DiscretionOffsetValue', Decimal, None),
+        841: ('DiscretionMoveType', int, None),
+        842: ('DiscretionOffsetType', int, None),
+        843: ('DiscretionLimitType', int, None),
+        844: ('DiscretionRoundDirection', int, None),
+        846: ('DiscretionScope', int, None),
+        847: ('TargetStrategy', int, None),
+        848: ('TargetStrategyParameters', None, None),
+        849: ('ParticipationRate', Decimal, None),
+        376: ('ComplianceID', None, None),
+        377: ('SolicitedFlag', parseBoolean, None),
+        15: ('Currency', None, None),
+        59: ('TimeInForce', None, None),
+        168: ('EffectiveTime', parseUTCTimestamp, None),
+        432: ('ExpireDate', parseDate, None),
+        126: ('ExpireTime', parseUTCTimestamp, None),
+        427: ('GTBookingInst', int, None),
+        12: ('Commission', Decimal, None),
+        13: ('CommType', None, None),
+        479: ('CommCurrency', None, None),
+        497: ('FundRenewWaiv', None, None),
+        528: ('OrderCapacity', None, None),
+        529: ('OrderRestrictions', None, None),
+        582: ('CustOrderCapacity', int, None),
+        121: ('ForexReq', parseBoolean, None),
+        120: ('SettlCurrency', None, None),
+        775: ('BookingType', int, None),
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+        193: ('SettlDate2', parseDate, None),
+        192: ('OrderQty2', Decimal, None),
+        640: ('Price2', Decimal, None),
+        77: ('PositionEffect', None, None),
+        203: ('CoveredOrUncovered', int, None),
+        210: ('MaxShow', Decimal, None),
+        114: ('LocateReqd', parseBoolean, None),
+        480: ('CancellationRights', None, None),
+        481: ('MoneyLaunderingStatus', None, None),
+        513: ('RegistID', None, None),
+        494: ('Designation', None, None),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, 'G')
+        self.OrderID = None
+        self.NoPartyIDs = None
+        self.TradeOriginationDate = None
+        self.TradeDate = None
+        self.OrigClOrdID = None
+        self.ClOrdID = None
+        self.SecondaryClOrdID = None
+        self.ClOrdLinkID = None
+        self.ListID = None
+        self.OrigOrdModTime = None
+        self.Account = None
+        self.AcctIDSource = None
+        self.AccountType = None
+        self.DayBookingInst = None
+        self.BookingUnit = None
+        self.PreallocMethod = None
+        self.AllocID = None
+        self.NoAllocs = None
+        self.SettlType = None
+        self.SettlDate = None
+        self.CashMargin = None
+        self.ClearingFeeIndicator = None
+        self.HandlInst = None
+        self.ExecInst = None
+        self.MinQty = None
+        self.MaxFloor = None
+        self.ExDestination = None
+        self.NoTradingSessions = None
+        self.Symbol = None
+        self.SymbolSfx = None
+        self.SecurityID = None
+        self.SecurityIDSource = None
+        self.NoSecurityAltID = None
+        self.Product = None
+        self.CFICode = None
+        self.SecurityType = None
+        self.SecuritySubType = None
+        self.MaturityMonthYear = None
+        self.MaturityDate = None
+        self.PutOrCall = None
+        self.CouponPaymentDate = None
+        self.IssueDate = None
+        self.RepoCollateralSecurityType = None
+        self.RepurchaseTerm = None
+        self.RepurchaseRate = None
+        self.Factor = None
+        self.CreditRating = None
+        self.InstrRegistry = None
+        self.CountryOfIssue = None
+        self.StateOrProvinceOfIssue = None
+        self.LocaleOfIssue = None
+        self.RedemptionDate = None
+        self.StrikePrice = None
+        self.StrikeCurrency = None
+        self.OptAttribute = None
+        self.ContractMultiplier = None
+        self.CouponRate = None
+        self.SecurityExchange = None
+        self.Issuer = None
+        self.EncodedIssuerLen = None
+        self.EncodedIssuer = None
+        self.SecurityDesc = None
+        self.EncodedSecurityDescLen = None
+        self.EncodedSecurityDesc = None
+        self.Pool = None
+        self.ContractSettlMonth = None
+        self.CPProgram = None
+        self.CPRegType = None
+        self.NoEvents = None
+        self.DatedDate = None
+        self.InterestAccrualDate = None
+        self.AgreementDesc = None
+        self.AgreementID = None
+        self.AgreementDate = None
+        self.AgreementCurrency = None
+        self.TerminationType = None
+        self.StartDate = None
+        self.EndDate = None
+        self.DeliveryType = None
+        self.MarginRatio = None
+        self.NoUnderlyings = None
+        self.Side = None
+        self.TransactTime = None
+        self.QtyType = None
+        self.OrderQty = None
+        self.CashOrderQty = None
+        self.OrderPercent = None
+        self.RoundingDirection = None
+        self.RoundingModulus = None
+        self.OrdType = None
+        self.PriceType = None
+        self.Price = None
+        self.StopPx = None
+        self.Spread = None
+        self.BenchmarkCurveCurrency = None
+        self.BenchmarkCurveName = None
+        self.BenchmarkCurvePoint = None
+        self.BenchmarkPrice = None
+        self.BenchmarkPriceType = None
+        self.BenchmarkSecurityID = None
+        self.BenchmarkSecurityIDSource = None
+        self.YieldType = None
+        self.Yield = None
+        self.YieldCalcDate = None
+        self.YieldRedemptionDate = None
+        self.YieldRedemptionPrice = None
+        self.YieldRedemptionPriceType = None
+        self.PegOffsetValue = None
+        self.PegMoveType = None
+        self.PegOffsetType = None
+        self.PegLimitType = None
+        self.PegRoundDirection = None
+        self.PegScope = None
+        self.DiscretionInst = None
+        self.DiscretionOffsetValue = None
+        self.DiscretionMoveType = None
+        self.DiscretionOffsetType = None
+        self.DiscretionLimitType = None
+        self.DiscretionRoundDirection = None
+        self.DiscretionScope = None
+        self.TargetStrategy = None
+        self.TargetStrategyParameters = None
+        self.ParticipationRate = None
+        self.ComplianceID = None
+        self.SolicitedFlag = None
+        self.Currency = None
+        self.TimeInForce = None
+        self.EffectiveTime = None
+        self.ExpireDate = None
+        self.ExpireTime = None
+        self.GTBookingInst = None
+        self.Commission = None
+        self.CommType = None
+        self.CommCurrency = None
+        self.FundRenewWaiv = None
+        self.OrderCapacity = None
+        self.OrderRestrictions = None
+        self.CustOrderCapacity = None
+        self.ForexReq = None
+        self.SettlCurrency = None
+        self.BookingType = None
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+        self.SettlDate2 = None
+        self.OrderQty2 = None
+        self.Price2 = None
+        self.PositionEffect = None
+        self.CoveredOrUncovered = None
+        self.MaxShow = None
+        self.LocateReqd = None
+        self.CancellationRights = None
+        self.MoneyLaunderingStatus = None
+        self.RegistID = None
+        self.Designation = None
+
+    def encodeFields(self, buffer):
+        value = self.OrderID
+        if value is not None:
+            buffer += b'37='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoPartyIDs
+        if value is not None:
+            buffer += b'453=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.TradeOriginationDate
+        if value is not None:
+            buffer += b'229='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeDate
+        if value is not None:
+            buffer += b'75='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrigClOrdID
+        if value is not None:
+            buffer += b'41='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdID
+        if value is not None:
+            buffer += b'11='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryClOrdID
+        if value is not None:
+            buffer += b'526='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClOrdLinkID
+        if value is not None:
+            buffer += b'583='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ListID
+        if value is not None:
+            buffer += b'66='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrigOrdModTime
+        if value is not None:
+            buffer += b'586='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Account
+        if value is not None:
+            buffer += b'1='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AcctIDSource
+        if value is not None:
+            buffer += b'660='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccountType
+        if value is not None:
+            buffer += b'581='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DayBookingInst
+        if value is not None:
+            buffer += b'589='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BookingUnit
+        if value is not None:
+            buffer += b'590='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PreallocMethod
+        if value is not None:
+            buffer += b'591='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocID
+        if value is not None:
+            buffer += b'70='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoAllocs
+        if value is not None:
+            buffer += b'78=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.SettlType
+        if value is not None:
+            buffer += b'63='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDate
+        if value is not None:
+            buffer += b'64='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CashMargin
+        if value is not None:
+            buffer += b'544='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ClearingFeeIndicator
+        if value is not None:
+            buffer += b'635='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.HandlInst
+        if value is not None:
+            buffer += b'21='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExecInst
+        if value is not None:
+            buffer += b'18='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MinQty
+        if value is not None:
+            buffer += b'110='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaxFloor
+        if value is not None:
+            buffer += b'111='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExDestination
+        if value is not None:
+            buffer += b'100='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoTradingSessions
+        if value is not None:
+            buffer += b'386=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Symbol
+        if value is not None:
+            buffer += b'55='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SymbolSfx
+        if value is not None:
+            buffer += b'65='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityID
+        if value is not None:
+            buffer += b'48='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityIDSource
+        if value is not None:
+            buffer += b'22='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSecurityAltID
+        if value is not None:
+            buffer += b'454=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Product
+        if value is not None:
+            buffer += b'460='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CFICode
+        if value is not None:
+            buffer += b'461='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityType
+        if value is not None:
+            buffer += b'167='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecuritySubType
+        if value is not None:
+            buffer += b'762='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityMonthYear
+        if value is not None:
+            buffer += b'200='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityDate
+        if value is not None:
+            buffer += b'541='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PutOrCall
+        if value is not None:
+            buffer += b'201='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponPaymentDate
+        if value is not None:
+            buffer += b'224='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IssueDate
+        if value is not None:
+            buffer += b'225='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepoCollateralSecurityType
+        if value is not None:
+            buffer += b'239='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseTerm
+        if value is not None:
+            buffer += b'226='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseRate
+        if value is not None:
+            buffer += b'227='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Factor
+        if value is not None:
+            buffer += b'228='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CreditRating
+        if value is not None:
+            buffer += b'255='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InstrRegistry
+        if value is not None:
+            buffer += b'543='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CountryOfIssue
+        if value is not None:
+            buffer += b'470='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'471='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LocaleOfIssue
+        if value is not None:
+            buffer += b'472='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RedemptionDate
+        if value is not None:
+            buffer += b'240='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikePrice
+        if value is not None:
+            buffer += b'202='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikeCurrency
+        if value is not None:
+            buffer += b'947='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OptAttribute
+        if value is not None:
+            buffer += b'206='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractMultiplier
+        if value is not None:
+            buffer += b'231='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponRate
+        if value is not None:
+            buffer += b'223='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityExchange
+        if value is not None:
+            buffer += b'207='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Issuer
+        if value is not None:
+            buffer += b'106='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuerLen
+        if value is not None:
+            buffer += b'348='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuer
+        if value is not None:
+            buffer += b'349='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityDesc
+        if value is not None:
+            buffer += b'107='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDescLen
+        if value is not None:
+            buffer += b'350='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDesc
+        if value is not None:
+            buffer += b'351='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Pool
+        if value is not None:
+            buffer += b'691='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractSettlMonth
+        if value is not None:
+            buffer += b'667='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPProgram
+        if value is not None:
+            buffer += b'875='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPRegType
+        if value is not None:
+            buffer += b'876='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoEvents
+        if value is not None:
+            buffer += b'864=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.DatedDate
+        if value is not None:
+            buffer += b'873='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAccrualDate
+        if value is not None:
+            buffer += b'874='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDesc
+        if value is not None:
+            buffer += b'913='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementID
+        if value is not None:
+            buffer += b'914='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDate
+        if value is not None:
+            buffer += b'915='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementCurrency
+        if value is not None:
+            buffer += b'918='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TerminationType
+        if value is not None:
+            buffer += b'788='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartDate
+        if value is not None:
+            buffer += b'916='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndDate
+        if value is not None:
+            buffer += b'917='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DeliveryType
+        if value is not None:
+            buffer += b'919='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MarginRatio
+        if value is not None:
+            buffer += b'898='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoUnderlyings
+        if value is not None:
+            buffer += b'711=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Side
+        if value is not None:
+            buffer += b'54='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransactTime
+        if value is not None:
+            buffer += b'60='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.QtyType
+        if value is not None:
+            buffer += b'854='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderQty
+        if value is not None:
+            buffer += b'38='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CashOrderQty
+        if value is not None:
+            buffer += b'152='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderPercent
+        if value is not None:
+            buffer += b'516='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingDirection
+        if value is not None:
+            buffer += b'468='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RoundingModulus
+        if value is not None:
+            buffer += b'469='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrdType
+        if value is not None:
+            buffer += b'40='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PriceType
+        if value is not None:
+            buffer += b'423='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Price
+        if value is not None:
+            buffer += b'44='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StopPx
+        if value is not None:
+            buffer += b'99='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Spread
+        if value is not None:
+            buffer += b'218='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveCurrency
+        if value is not None:
+            buffer += b'220='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveName
+        if value is not None:
+            buffer += b'221='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurvePoint
+        if value is not None:
+            buffer += b'222='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPrice
+        if value is not None:
+            buffer += b'662='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPriceType
+        if value is not None:
+            buffer += b'663='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityID
+        if value is not None:
+            buffer += b'699='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityIDSource
+        if value is not None:
+            buffer += b'761='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldType
+        if value is not None:
+            buffer += b'235='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Yield
+        if value is not None:
+            buffer += b'236='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldCalcDate
+        if value is not None:
+            buffer += b'701='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionDate
+        if value is not None:
+            buffer += b'696='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPrice
+        if value is not None:
+            buffer += b'697='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPriceType
+        if value is not None:
+            buffer += b'698='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegOffsetValue
+        if value is not None:
+            buffer += b'211='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegMoveType
+        if value is not None:
+            buffer += b'835='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegOffsetType
+        if value is not None:
+            buffer += b'836='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegLimitType
+        if value is not None:
+            buffer += b'837='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegRoundDirection
+        if value is not None:
+            buffer += b'838='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PegScope
+        if value is not None:
+            buffer += b'840='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionInst
+        if value is not None:
+            buffer += b'388='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionOffsetValue
+        if value is not None:
+            buffer += b'389='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionMoveType
+        if value is not None:
+            buffer += b'841='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionOffsetType
+        if value is not None:
+            buffer += b'842='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionLimitType
+        if value is not None:
+            buffer += b'843='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionRoundDirection
+        if value is not None:
+            buffer += b'844='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DiscretionScope
+        if value is not None:
+            buffer += b'846='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TargetStrategy
+        if value is not None:
+            buffer += b'847='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TargetStrategyParameters
+        if value is not None:
+            buffer += b'848='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ParticipationRate
+        if value is not None:
+            buffer += b'849='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ComplianceID
+        if value is not None:
+            buffer += b'376='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SolicitedFlag
+        if value is not None:
+            buffer += b'377='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Currency
+        if value is not None:
+            buffer += b'15='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TimeInForce
+        if value is not None:
+            buffer += b'59='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EffectiveTime
+        if value is not None:
+            buffer += b'168='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExpireDate
+        if value is not None:
+            buffer += b'432='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ExpireTime
+        if value is not None:
+            buffer += b'126='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.GTBookingInst
+        if value is not None:
+            buffer += b'427='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Commission
+        if value is not None:
+            buffer += b'12='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommType
+        if value is not None:
+            buffer += b'13='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CommCurrency
+        if value is not None:
+            buffer += b'479='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.FundRenewWaiv
+        if value is not None:
+            buffer += b'497='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderCapacity
+        if value is not None:
+            buffer += b'528='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderRestrictions
+        if value is not None:
+            buffer += b'529='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CustOrderCapacity
+        if value is not None:
+            buffer += b'582='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ForexReq
+        if value is not None:
+            buffer += b'121='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlCurrency
+        if value is not None:
+            buffer += b'120='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BookingType
+        if value is not None:
+            buffer += b'775='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDate2
+        if value is not None:
+            buffer += b'193='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OrderQty2
+        if value is not None:
+            buffer += b'192='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Price2
+        if value is not None:
+            buffer += b'640='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PositionEffect
+        if value is not None:
+            buffer += b'77='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CoveredOrUncovered
+        if value is not None:
+            buffer += b'203='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaxShow
+        if value is not None:
+            buffer += b'210='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LocateReqd
+        if value is not None:
+            buffer += b'114='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CancellationRights
+        if value is not None:
+            buffer += b'480='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MoneyLaunderingStatus
+        if value is not None:
+            buffer += b'481='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RegistID
+        if value is not None:
+            buffer += b'513='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Designation
+        if value is not None:
+            buffer += b'494='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        pass
+
+
+class AllocationInstruction(TypedMessage):
+    __slots__ = (
+        'AllocID',
+        'AllocTransType',
+        'AllocType',
+        'SecondaryAllocID',
+        'RefAllocID',
+        'AllocCancReplaceReason',
+        'AllocIntermedReqType',
+        'AllocLinkID',
+        'AllocLinkType',
+        'BookingRefID',
+        'AllocNoOrdersType',
+        'NoOrders',
+        'NoExecs',
+        'PreviouslyReported',
+        'ReversalIndicator',
+        'MatchType',
+        'Side',
+        'Symbol',
+        'SymbolSfx',
+        'SecurityID',
+        'SecurityIDSource',
+        'NoSecurityAltID',
+        'Product',
+        'CFICode',
+        'SecurityType',
+        'SecuritySubType',
+        'MaturityMonthYear',
+        'MaturityDate',
+        'PutOrCall',
+        'CouponPaymentDate',
+        'IssueDate',
+        'RepoCollateralSecurityType',
+        'RepurchaseTerm',
+        'RepurchaseRate',
+        'Factor',
+        'CreditRating',
+        'InstrRegistry',
+        'CountryOfIssue',
+        'StateOrProvinceOfIssue',
+        'LocaleOfIssue',
+        'RedemptionDate',
+        'StrikePrice',
+        'StrikeCurrency',
+        'OptAttribute',
+        'ContractMultiplier',
+        'CouponRate',
+        'SecurityExchange',
+        'Issuer',
+        'EncodedIssuerLen',
+        'EncodedIssuer',
+        'SecurityDesc',
+        'EncodedSecurityDescLen',
+        'EncodedSecurityDesc',
+        'Pool',
+        'ContractSettlMonth',
+        'CPProgram',
+        'CPRegType',
+        'NoEvents',
+        'DatedDate',
+        'InterestAccrualDate',
+        'DeliveryForm',
+        'PctAtRisk',
+        'NoInstrAttrib',
+        'AgreementDesc',
+        'AgreementID',
+        'AgreementDate',
+        'AgreementCurrency',
+        'TerminationType',
+        'StartDate',
+        'EndDate',
+        'DeliveryType',
+        'MarginRatio',
+        'NoUnderlyings',
+        'NoLegs',
+        'Quantity',
+        'QtyType',
+        'LastMkt',
+        'TradeOriginationDate',
+        'TradingSessionID',
+        'TradingSessionSubID',
+        'PriceType',
+        'AvgPx',
+        'AvgParPx',
+        'Spread',
+        'BenchmarkCurveCurrency',
+        'BenchmarkCurveName',
+        'BenchmarkCurvePoint',
+        'BenchmarkPrice',
+        'BenchmarkPriceType',
+        'BenchmarkSecurityID',
+        'BenchmarkSecurityIDSource',
+        'Currency',
+        'AvgPxPrecision',
+        'NoPartyIDs',
+        'TradeDate',
+        'TransactTime',
+        'SettlType',
+        'SettlDate',
+        'BookingType',
+        'GrossTradeAmt',
+        'Concession',
+        'TotalTakedown',
+        'NetMoney',
+        'PositionEffect',
+        'AutoAcceptIndicator',
+        'Text',
+        'EncodedTextLen',
+        'EncodedText',
+        'NumDaysInterest',
+        'AccruedInterestRate',
+        'AccruedInterestAmt',
+        'TotalAccruedInterestAmt',
+        'InterestAtMaturity',
+        'EndAccruedInterestAmt',
+        'StartCash',
+        'EndCash',
+        'LegalConfirm',
+        'NoStipulations',
+        'YieldType',
+        'Yield',
+        'YieldCalcDate',
+        'YieldRedemptionDate',
+        'YieldRedemptionPrice',
+        'YieldRedemptionPriceType',
+        'TotNoAllocs',
+        'LastFragment',
+        'NoAllocs',
+    )
+
+    AllocID: str
+    AllocTransType: str
+    AllocType: int
+    SecondaryAllocID: str
+    RefAllocID: str
+    AllocCancReplaceReason: int
+    AllocIntermedReqType: int
+    AllocLinkID: str
+    AllocLinkType: int
+    BookingRefID: str
+    AllocNoOrdersType: int
+    NoOrders: list
+    NoExecs: list
+    PreviouslyReported: bool
+    ReversalIndicator: bool
+    MatchType: str
+    Side: str
+    Symbol: str
+    SymbolSfx: str
+    SecurityID: str
+    SecurityIDSource: str
+    NoSecurityAltID: list
+    Product: int
+    CFICode: str
+    SecurityType: str
+    SecuritySubType: str
+    MaturityMonthYear: str
+    MaturityDate: date
+    PutOrCall: int
+    CouponPaymentDate: date
+    IssueDate: date
+    RepoCollateralSecurityType: str
+    RepurchaseTerm: int
+    RepurchaseRate: Decimal
+    Factor: Decimal
+    CreditRating: str
+    InstrRegistry: str
+    CountryOfIssue: str
+    StateOrProvinceOfIssue: str
+    LocaleOfIssue: str
+    RedemptionDate: date
+    StrikePrice: Decimal
+    StrikeCurrency: str
+    OptAttribute: str
+    ContractMultiplier: Decimal
+    CouponRate: Decimal
+    SecurityExchange: str
+    Issuer: str
+    EncodedIssuerLen: int
+    EncodedIssuer: str
+    SecurityDesc: str
+    EncodedSecurityDescLen: int
+    EncodedSecurityDesc: str
+    Pool: str
+    ContractSettlMonth: str
+    CPProgram: int
+    CPRegType: str
+    NoEvents: list
+    DatedDate: date
+    InterestAccrualDate: date
+    DeliveryForm: int
+    PctAtRisk: Decimal
+    NoInstrAttrib: list
+    AgreementDesc: str
+    AgreementID: str
+    AgreementDate: date
+    AgreementCurrency: str
+    TerminationType: int
+    StartDate: date
+    EndDate: date
+    DeliveryType: int
+    MarginRatio: Decimal
+    NoUnderlyings: list
+    NoLegs: list
+    Quantity: Decimal
+    QtyType: int
+    LastMkt: str
+    TradeOriginationDate: date
+    TradingSessionID: str
+    TradingSessionSubID: str
+    PriceType: int
+    AvgPx: Decimal
+    AvgParPx: Decimal
+    Spread: Decimal
+    BenchmarkCurveCurrency: str
+    BenchmarkCurveName: str
+    BenchmarkCurvePoint: str
+    BenchmarkPrice: Decimal
+    BenchmarkPriceType: int
+    BenchmarkSecurityID: str
+    BenchmarkSecurityIDSource: str
+    Currency: str
+    AvgPxPrecision: int
+    NoPartyIDs: list
+    TradeDate: date
+    TransactTime: datetime
+    SettlType: str
+    SettlDate: date
+    BookingType: int
+    GrossTradeAmt: Decimal
+    Concession: Decimal
+    TotalTakedown: Decimal
+    NetMoney: Decimal
+    PositionEffect: str
+    AutoAcceptIndicator: bool
+    Text: str
+    EncodedTextLen: int
+    EncodedText: str
+    NumDaysInterest: int
+    AccruedInterestRate: Decimal
+    AccruedInterestAmt: Decimal
+    TotalAccruedInterestAmt: Decimal
+    InterestAtMaturity: Decimal
+    EndAccruedInterestAmt: Decimal
+    StartCash: Decimal
+    EndCash: Decimal
+    LegalConfirm: bool
+    NoStipulations: list
+    YieldType: str
+    Yield: Decimal
+    YieldCalcDate: date
+    YieldRedemptionDate: date
+    YieldRedemptionPrice: Decimal
+    YieldRedemptionPriceType: int
+    TotNoAllocs: int
+    LastFragment: bool
+    NoAllocs: list
+
+    fieldSpecs = {
+        70: ('AllocID', None, None),
+        71: ('AllocTransType', None, None),
+        626: ('AllocType', int, None),
+        793: ('SecondaryAllocID', None, None),
+        72: ('RefAllocID', None, None),
+        796: ('AllocCancReplaceReason', int, None),
+        808: ('AllocIntermedReqType', int, None),
+        196: ('AllocLinkID', None, None),
+        197: ('AllocLinkType', int, None),
+        466: ('BookingRefID', None, None),
+        857: ('AllocNoOrdersType', int, None),
+        73: ('NoOrders', None, OrdAllocGrp),
+        124: ('NoExecs', None, ExecAllocGrp),
+        570: ('PreviouslyReported', parseBoolean, None),
+        700: ('ReversalIndicator', parseBoolean, None),
+        574: ('MatchType', None, None),
+        54: ('Side', None, None),
+        55: ('Symbol', None, None),
+        65: ('SymbolSfx', None, None),
+        48: ('SecurityID', None, None),
+        22: ('SecurityIDSource', None, None),
+        454: ('NoSecurityAltID', None, SecAltIDGrp),
+        460: ('Product', int, None),
+        461: ('CFICode', None, None),
+        167: ('SecurityType', None, None),
+        762: ('SecuritySubType', None, None),
+        200: ('MaturityMonthYear', None, None),
+        541: ('MaturityDate', parseDate, None),
+        201: ('PutOrCall', int, None),
+        224: ('CouponPaymentDate', parseDate, None),
+        225: ('IssueDate', parseDate, None),
+        239: ('RepoCollateralSecurityType', None, None),
+        226: ('RepurchaseTerm', int, None),
+        227: ('RepurchaseRate', Decimal, None),
+        228: ('Factor', Decimal, None),
+        255: ('CreditRating', None, None),
+        543: ('InstrRegistry', None, None),
+        470: ('CountryOfIssue', None, None),
+        471: ('StateOrProvinceOfIssue', None, None),
+        472: ('LocaleOfIssue', None, None),
+        240: ('RedemptionDate', parseDate, None),
+        202: ('StrikePrice', Decimal, None),
+        947: ('StrikeCurrency', None, None),
+        206: ('OptAttribute', None, None),
+        231: ('ContractMultiplier', Decimal, None),
+        223: ('CouponRate', Decimal, None),
+        207: ('SecurityExchange', None, None),
+        106: ('Issuer', None, None),
+        348: ('EncodedIssuerLen', int, None),
+        349: ('EncodedIssuer', None, None),
+        107: ('SecurityDesc', None, None),
+        350: ('EncodedSecurityDescLen', int, None),
+        351: ('EncodedSecurityDesc', None, None),
+        691: ('Pool', None, None),
+        667: ('ContractSettlMonth', None, None),
+        875: ('CPProgram', int, None),
+        876: ('CPRegType', None, None),
+        864: ('NoEvents', None, EvntGrp),
+        873: ('DatedDate', parseDate, None),
+        874: ('InterestAccrualDate', parseDate, None),
+        668: ('DeliveryForm', int, None),
+        869: ('PctAtRisk', Decimal, None),
+        870: ('NoInstrAttrib', None, AttrbGrp),
+        913: ('AgreementDesc', None, None),
+        914: ('AgreementID', None, None),
+        915: ('AgreementDate', parseDate, None),
+        918: ('AgreementCurrency', None, None),
+        788: ('TerminationType', int, None),
+        916: ('StartDate', parseDate, None),
+        917: ('EndDate', parseDate, None),
+        919: ('DeliveryType', int, None),
+        898: ('MarginRatio', Decimal, None),
+        711: ('NoUnderlyings', None, UndInstrmtGrp),
+        555: ('NoLegs', None, InstrmtLegGrp),
+        53: ('Quantity', Decimal, None),
+        854: ('QtyType', int, None),
+        30: ('LastMkt', None, None),
+        229: ('TradeOriginationDate', parseDate, None),
+        336: ('TradingSessionID', None, None),
+        625: ('TradingSessionSubID', None, None),
+        423: ('PriceType', int, None),
+        6: ('AvgPx', Decimal, None),
+        860: ('AvgParPx', Decimal, None),
+        218: ('Spread', Decimal, None),
+        220: ('BenchmarkCurveCurrency', None, None),
+        221: ('BenchmarkCurveName', None, None),
+        222: ('BenchmarkCurvePoint', None, None),
+        662: ('BenchmarkPrice', Decimal, None),
+        663: ('BenchmarkPriceType', int, None),
+        699: ('BenchmarkSecurityID', None, None),
+        761: ('BenchmarkSecurityIDSource', None, None),
+        15: ('Currency', None, None),
+        74: ('AvgPxPrecision', int, None),
+        453: ('NoPartyIDs', None, Parties),
+        75: ('TradeDate', parseDate, None),
+        60: ('TransactTime', parseUTCTimestamp, None),
+        63: ('SettlType', None, None),
+        64: ('SettlDate', parseDate, None),
+        775: ('BookingType', int, None),
+        381: ('GrossTradeAmt', Decimal, None),
+        238: ('Concession', Decimal, None),
+        237: ('TotalTakedown', Decimal, None),
+        118: ('NetMoney', Decimal, None),
+        77: ('PositionEffect', None, None),
+        754: ('AutoAcceptIndicator', parseBoolean, None),
+        58: ('Text', None, None),
+        354: ('EncodedTextLen', int, None),
+        355: ('EncodedText', None, None),
+        157: ('NumDaysInterest', int, None),
+        158: ('AccruedInterestRate', Decimal, None),
+        159: ('AccruedInterestAmt', Decimal, None),
+        540: ('TotalAccruedInterestAmt', Decimal, None),
+        738: ('InterestAtMaturity', Decimal, None),
+        920: ('EndAccruedInterestAmt', Decimal, None),
+        921: ('StartCash', Decimal, None),
+        922: ('EndCash', Decimal, None),
+        650: ('LegalConfirm', parseBoolean, None),
+        232: ('NoStipulations', None, Stipulations),
+        235: ('YieldType', None, None),
+        236: ('Yield', Decimal, None),
+        701: ('YieldCalcDate', parseDate, None),
+        696: ('YieldRedemptionDate', parseDate, None),
+        697: ('YieldRedemptionPrice', Decimal, None),
+        698: ('YieldRedemptionPriceType', int, None),
+        892: ('TotNoAllocs', int, None),
+        893: ('LastFragment', parseBoolean, None),
+        78: ('NoAllocs', None, AllocGrp),
+    }
+
+    def __init__(self):
+        TypedMessage.__init__(self, 'J')
+        self.AllocID = None
+        self.AllocTransType = None
+        self.AllocType = None
+        self.SecondaryAllocID = None
+        self.RefAllocID = None
+        self.AllocCancReplaceReason = None
+        self.AllocIntermedReqType = None
+        self.AllocLinkID = None
+        self.AllocLinkType = None
+        self.BookingRefID = None
+        self.AllocNoOrdersType = None
+        self.NoOrders = None
+        self.NoExecs = None
+        self.PreviouslyReported = None
+        self.ReversalIndicator = None
+        self.MatchType = None
+        self.Side = None
+        self.Symbol = None
+        self.SymbolSfx = None
+        self.SecurityID = None
+        self.SecurityIDSource = None
+        self.NoSecurityAltID = None
+        self.Product = None
+        self.CFICode = None
+        self.SecurityType = None
+        self.SecuritySubType = None
+        self.MaturityMonthYear = None
+        self.MaturityDate = None
+        self.PutOrCall = None
+        self.CouponPaymentDate = None
+        self.IssueDate = None
+        self.RepoCollateralSecurityType = None
+        self.RepurchaseTerm = None
+        self.RepurchaseRate = None
+        self.Factor = None
+        self.CreditRating = None
+        self.InstrRegistry = None
+        self.CountryOfIssue = None
+        self.StateOrProvinceOfIssue = None
+        self.LocaleOfIssue = None
+        self.RedemptionDate = None
+        self.StrikePrice = None
+        self.StrikeCurrency = None
+        self.OptAttribute = None
+        self.ContractMultiplier = None
+        self.CouponRate = None
+        self.SecurityExchange = None
+        self.Issuer = None
+        self.EncodedIssuerLen = None
+        self.EncodedIssuer = None
+        self.SecurityDesc = None
+        self.EncodedSecurityDescLen = None
+        self.EncodedSecurityDesc = None
+        self.Pool = None
+        self.ContractSettlMonth = None
+        self.CPProgram = None
+        self.CPRegType = None
+        self.NoEvents = None
+        self.DatedDate = None
+        self.InterestAccrualDate = None
+        self.DeliveryForm = None
+        self.PctAtRisk = None
+        self.NoInstrAttrib = None
+        self.AgreementDesc = None
+        self.AgreementID = None
+        self.AgreementDate = None
+        self.AgreementCurrency = None
+        self.TerminationType = None
+        self.StartDate = None
+        self.EndDate = None
+        self.DeliveryType = None
+        self.MarginRatio = None
+        self.NoUnderlyings = None
+        self.NoLegs = None
+        self.Quantity = None
+        self.QtyType = None
+        self.LastMkt = None
+        self.TradeOriginationDate = None
+        self.TradingSessionID = None
+        self.TradingSessionSubID = None
+        self.PriceType = None
+        self.AvgPx = None
+        self.AvgParPx = None
+        self.Spread = None
+        self.BenchmarkCurveCurrency = None
+        self.BenchmarkCurveName = None
+        self.BenchmarkCurvePoint = None
+        self.BenchmarkPrice = None
+        self.BenchmarkPriceType = None
+        self.BenchmarkSecurityID = None
+        self.BenchmarkSecurityIDSource = None
+        self.Currency = None
+        self.AvgPxPrecision = None
+        self.NoPartyIDs = None
+        self.TradeDate = None
+        self.TransactTime = None
+        self.SettlType = None
+        self.SettlDate = None
+        self.BookingType = None
+        self.GrossTradeAmt = None
+        self.Concession = None
+        self.TotalTakedown = None
+        self.NetMoney = None
+        self.PositionEffect = None
+        self.AutoAcceptIndicator = None
+        self.Text = None
+        self.EncodedTextLen = None
+        self.EncodedText = None
+        self.NumDaysInterest = None
+        self.AccruedInterestRate = None
+        self.AccruedInterestAmt = None
+        self.TotalAccruedInterestAmt = None
+        self.InterestAtMaturity = None
+        self.EndAccruedInterestAmt = None
+        self.StartCash = None
+        self.EndCash = None
+        self.LegalConfirm = None
+        self.NoStipulations = None
+        self.YieldType = None
+        self.Yield = None
+        self.YieldCalcDate = None
+        self.YieldRedemptionDate = None
+        self.YieldRedemptionPrice = None
+        self.YieldRedemptionPriceType = None
+        self.TotNoAllocs = None
+        self.LastFragment = None
+        self.NoAllocs = None
+
+    def encodeFields(self, buffer):
+        value = self.AllocID
+        if value is not None:
+            buffer += b'70='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocTransType
+        if value is not None:
+            buffer += b'71='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocType
+        if value is not None:
+            buffer += b'626='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecondaryAllocID
+        if value is not None:
+            buffer += b'793='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RefAllocID
+        if value is not None:
+            buffer += b'72='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocCancReplaceReason
+        if value is not None:
+            buffer += b'796='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocIntermedReqType
+        if value is not None:
+            buffer += b'808='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocLinkID
+        if value is not None:
+            buffer += b'196='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocLinkType
+        if value is not None:
+            buffer += b'197='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BookingRefID
+        if value is not None:
+            buffer += b'466='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AllocNoOrdersType
+        if value is not None:
+            buffer += b'857='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoOrders
+        if value is not None:
+            buffer += b'73=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.NoExecs
+        if value is not None:
+            buffer += b'124=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.PreviouslyReported
+        if value is not None:
+            buffer += b'570='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ReversalIndicator
+        if value is not None:
+            buffer += b'700='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MatchType
+        if value is not None:
+            buffer += b'574='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Side
+        if value is not None:
+            buffer += b'54='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Symbol
+        if value is not None:
+            buffer += b'55='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SymbolSfx
+        if value is not None:
+            buffer += b'65='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityID
+        if value is not None:
+            buffer += b'48='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityIDSource
+        if value is not None:
+            buffer += b'22='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoSecurityAltID
+        if value is not None:
+            buffer += b'454=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Product
+        if value is not None:
+            buffer += b'460='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CFICode
+        if value is not None:
+            buffer += b'461='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityType
+        if value is not None:
+            buffer += b'167='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecuritySubType
+        if value is not None:
+            buffer += b'762='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityMonthYear
+        if value is not None:
+            buffer += b'200='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MaturityDate
+        if value is not None:
+            buffer += b'541='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PutOrCall
+        if value is not None:
+            buffer += b'201='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponPaymentDate
+        if value is not None:
+            buffer += b'224='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.IssueDate
+        if value is not None:
+            buffer += b'225='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepoCollateralSecurityType
+        if value is not None:
+            buffer += b'239='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseTerm
+        if value is not None:
+            buffer += b'226='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RepurchaseRate
+        if value is not None:
+            buffer += b'227='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Factor
+        if value is not None:
+            buffer += b'228='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CreditRating
+        if value is not None:
+            buffer += b'255='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InstrRegistry
+        if value is not None:
+            buffer += b'543='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CountryOfIssue
+        if value is not None:
+            buffer += b'470='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StateOrProvinceOfIssue
+        if value is not None:
+            buffer += b'471='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LocaleOfIssue
+        if value is not None:
+            buffer += b'472='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.RedemptionDate
+        if value is not None:
+            buffer += b'240='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikePrice
+        if value is not None:
+            buffer += b'202='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StrikeCurrency
+        if value is not None:
+            buffer += b'947='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.OptAttribute
+        if value is not None:
+            buffer += b'206='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractMultiplier
+        if value is not None:
+            buffer += b'231='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CouponRate
+        if value is not None:
+            buffer += b'223='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityExchange
+        if value is not None:
+            buffer += b'207='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Issuer
+        if value is not None:
+            buffer += b'106='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuerLen
+        if value is not None:
+            buffer += b'348='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedIssuer
+        if value is not None:
+            buffer += b'349='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SecurityDesc
+        if value is not None:
+            buffer += b'107='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDescLen
+        if value is not None:
+            buffer += b'350='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedSecurityDesc
+        if value is not None:
+            buffer += b'351='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Pool
+        if value is not None:
+            buffer += b'691='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.ContractSettlMonth
+        if value is not None:
+            buffer += b'667='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPProgram
+        if value is not None:
+            buffer += b'875='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.CPRegType
+        if value is not None:
+            buffer += b'876='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoEvents
+        if value is not None:
+            buffer += b'864=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.DatedDate
+        if value is not None:
+            buffer += b'873='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAccrualDate
+        if value is not None:
+            buffer += b'874='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DeliveryForm
+        if value is not None:
+            buffer += b'668='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PctAtRisk
+        if value is not None:
+            buffer += b'869='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoInstrAttrib
+        if value is not None:
+            buffer += b'870=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.AgreementDesc
+        if value is not None:
+            buffer += b'913='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementID
+        if value is not None:
+            buffer += b'914='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementDate
+        if value is not None:
+            buffer += b'915='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AgreementCurrency
+        if value is not None:
+            buffer += b'918='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TerminationType
+        if value is not None:
+            buffer += b'788='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartDate
+        if value is not None:
+            buffer += b'916='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndDate
+        if value is not None:
+            buffer += b'917='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.DeliveryType
+        if value is not None:
+            buffer += b'919='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.MarginRatio
+        if value is not None:
+            buffer += b'898='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoUnderlyings
+        if value is not None:
+            buffer += b'711=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.NoLegs
+        if value is not None:
+            buffer += b'555=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.Quantity
+        if value is not None:
+            buffer += b'53='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.QtyType
+        if value is not None:
+            buffer += b'854='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastMkt
+        if value is not None:
+            buffer += b'30='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradeOriginationDate
+        if value is not None:
+            buffer += b'229='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradingSessionID
+        if value is not None:
+            buffer += b'336='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TradingSessionSubID
+        if value is not None:
+            buffer += b'625='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PriceType
+        if value is not None:
+            buffer += b'423='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AvgPx
+        if value is not None:
+            buffer += b'6='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AvgParPx
+        if value is not None:
+            buffer += b'860='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Spread
+        if value is not None:
+            buffer += b'218='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveCurrency
+        if value is not None:
+            buffer += b'220='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurveName
+        if value is not None:
+            buffer += b'221='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkCurvePoint
+        if value is not None:
+            buffer += b'222='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPrice
+        if value is not None:
+            buffer += b'662='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkPriceType
+        if value is not None:
+            buffer += b'663='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityID
+        if value is not None:
+            buffer += b'699='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BenchmarkSecurityIDSource
+        if value is not None:
+            buffer += b'761='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Currency
+        if value is not None:
+            buffer += b'15='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AvgPxPrecision
+        if value is not None:
+            buffer += b'74='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoPartyIDs
+        if value is not None:
+            buffer += b'453=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.TradeDate
+        if value is not None:
+            buffer += b'75='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TransactTime
+        if value is not None:
+            buffer += b'60='
+            buffer += formatUTCTimestamp(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlType
+        if value is not None:
+            buffer += b'63='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.SettlDate
+        if value is not None:
+            buffer += b'64='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.BookingType
+        if value is not None:
+            buffer += b'775='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.GrossTradeAmt
+        if value is not None:
+            buffer += b'381='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Concession
+        if value is not None:
+            buffer += b'238='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TotalTakedown
+        if value is not None:
+            buffer += b'237='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NetMoney
+        if value is not None:
+            buffer += b'118='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.PositionEffect
+        if value is not None:
+            buffer += b'77='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AutoAcceptIndicator
+        if value is not None:
+            buffer += b'754='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Text
+        if value is not None:
+            buffer += b'58='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedTextLen
+        if value is not None:
+            buffer += b'354='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EncodedText
+        if value is not None:
+            buffer += b'355='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NumDaysInterest
+        if value is not None:
+            buffer += b'157='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccruedInterestRate
+        if value is not None:
+            buffer += b'158='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.AccruedInterestAmt
+        if value is not None:
+            buffer += b'159='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TotalAccruedInterestAmt
+        if value is not None:
+            buffer += b'540='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.InterestAtMaturity
+        if value is not None:
+            buffer += b'738='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndAccruedInterestAmt
+        if value is not None:
+            buffer += b'920='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.StartCash
+        if value is not None:
+            buffer += b'921='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.EndCash
+        if value is not None:
+            buffer += b'922='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LegalConfirm
+        if value is not None:
+            buffer += b'650='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoStipulations
+        if value is not None:
+            buffer += b'232=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        value = self.YieldType
+        if value is not None:
+            buffer += b'235='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.Yield
+        if value is not None:
+            buffer += b'236='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldCalcDate
+        if value is not None:
+            buffer += b'701='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionDate
+        if value is not None:
+            buffer += b'696='
+            buffer += formatDate(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPrice
+        if value is not None:
+            buffer += b'697='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.YieldRedemptionPriceType
+        if value is not None:
+            buffer += b'698='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.TotNoAllocs
+        if value is not None:
+            buffer += b'892='
+            buffer += str(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.LastFragment
+        if value is not None:
+            buffer += b'893='
+            buffer += formatBoolean(value).encode('utf-8')
+            buffer += b'\x01'
+        value = self.NoAllocs
+        if value is not None:
+            buffer += b'78=%d\x01' % (len(value), )
+            for group in value:
+                group.encodeFields(buffer)
+        pass
+
+
+messageClasses = {
+    '0': Heartbeat,
+    '1': TestRequest,
+    '2': ResendRequest,
+    '3': Reject,
+    '4': SequenceReset,
+    '5': Logout,
+    '8': ExecutionReport,
+    '9': OrderCancelReject,
+    'A': Logon,
+    'AE': TradeCaptureReport,
+    'D': NewOrderSingle,
+    'F': OrderCancelRequest,
+    'G': OrderCancelReplaceRequest,
+    'J': AllocationInstruction,
+}
+
+
+def fromMessage(msg):
+    """The typed version of msg, or msg itself when its type wasn't generated"""
+    cls = messageClasses.get(msg.msgType)
+    return cls.fromMessage(msg) if cls is not None else msg
@@ -0,0 +1,217 @@
+"""Bulk decoding of captured FIX wire logs and journals.
+
+The file is memory mapped and scanned with NumPy, producing columnar arrays of message and field offsets instead of
+message objects, so gigabytes of messages can be filtered by msg type or tag before anything is decoded. Messages
+are located with the same 8=/9=/10= framing rules Codec.frame() uses; bytes between messages (newlines, log
+prefixes) are skipped. Requires numpy.
+"""
+import logging
+import os
+import numpy as np
+from pyfix.codec import TRAILER_LENGTH
+
+SOH = 1
+EQUALS = ord('=')
+ZERO = ord('0')
+NINE = ord('9')
+
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _parseInts(data, starts, ends):
+    # parse the decimal numbers data[starts[i]:ends[i]] all at once, -1 where there is no valid number
+    values = np.zeros(len(starts), dtype=np.int64)
+    lengths = ends - starts
+    valid = (lengths > 0) & (lengths <= 18)
+    maxLength = int(lengths[valid].max()) if valid.any() else 0
+    for k in range(maxLength):
+        mask = valid & (lengths > k)
+        digits = data[starts[mask] + k].astype(np.int64)
+        isDigit = (digits >= ZERO) & (digits <= NINE)
+        valid[np.flatnonzero(mask)[~isDigit]] = False
+        values[mask] = values[mask] * 10 + (digits - ZERO)
+    values[~valid] = -1
+    return values
+
+
+def _matches(data, positions, pattern):
+    # which of positions have pattern (bytes) starting there
+    result = positions + len(pattern) <= len(data)
+    for k, c in enumerate(pattern):
+        candidates = np.flatnonzero(result)
+        result[candidates[data[positions[candidates] + k] != c]] = False
+    return result
+
+
+def _indexMessages(data):
+    """Find the complete messages in data, returns their (starts, ends) and the offset of the first incomplete one"""
+    n = len(data)
+    empty = np.zeros(0, dtype=np.int64)
+    if n < 5:
+        return empty, empty, 0
+
+    candidates = np.flatnonzero((data[:-4] == ord('8')) & (data[1:-3] == EQUALS) & (data[2:-2] == ord('F')) &
+                                (data[3:-1] == ord('I')) & (data[4:] == ord('X')))
+    # "8=FIX" preceded by a digit is the value of some other tag ending in 8
+    previous = data[np.maximum(candidates - 1, 0)]
+    candidates = candidates[(candidates == 0) | (previous < ZERO) | (previous > NINE)]
+
+    sohs = np.flatnonzero(data == SOH)
+    # BeginString ends at the first SOH after the start, BodyLength at the next one
+    first = np.searchsorted(sohs, candidates)
+    hasLength = first + 1 < len(sohs)
+    lengthStarts = np.full(len(candidates), n, dtype=np.int64)
+    lengthEnds = np.full(len(candidates), n, dtype=np.int64)
+    lengthStarts[hasLength] = sohs[first[hasLength]] + 1
+    lengthEnds[hasLength] = sohs[first[hasLength] + 1]
+
+    bodyLengths = _parseInts(data, lengthStarts + 2, lengthEnds)
+    hasLength &= _matches(data, lengthStarts, b'9=') & (bodyLengths >= 0)
+    ends = lengthEnds + 1 + bodyLengths + TRAILER_LENGTH
+    # not enough data to tell yet, as opposed to something which just isn't a message
+    truncated = (first + 1 >= len(sohs)) | (hasLength & (ends > n))
+    valid = hasLength & (ends <= n)
+    valid[valid] = _matches(data, ends[valid] - TRAILER_LENGTH, b'10=') & (data[ends[valid] - 1] == SOH)
+
+    # anything that starts inside an earlier message is part of its body
+    starts = candidates[valid]
+    ends = ends[valid]
+    if len(starts):
+        keep = starts >= np.concatenate(([0], np.maximum.accumulate(ends)[:-1]))
+        starts = starts[keep]
+        ends = ends[keep]
+
+    lastEnd = int(ends[-1]) if len(ends) else 0
+    # resume at the first message we haven't been able to frame yet, it may still be arriving in the next chunk
+    pending = candidates[(candidates >= lastEnd) & truncated]
+    resume = int(pending[0]) if len(pending) else max(lastEnd, n - 4)
+    return starts, ends, resume
+
+
+def _indexFields(data, starts, ends):
+    sohs = np.flatnonzero(data == SOH)
+    first = np.searchsorted(sohs, starts)
+    counts = np.searchsorted(sohs, ends) - first
+
+    messageFirstField = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    total = int(messageFirstField[-1])
+    fieldMessages = np.repeat(np.arange(len(starts), dtype=np.int64), counts)
+    positionInMessage = np.arange(total, dtype=np.int64) - messageFirstField[:-1][fieldMessages]
+    sohIndex = first[fieldMessages] + positionInMessage
+
+    valueEnds = sohs[sohIndex]
+    fieldStarts = np.where(positionInMessage == 0, starts[fieldMessages], sohs[np.maximum(sohIndex - 1, 0)] + 1)
+
+    equals = np.flatnonzero(data == EQUALS)
+    equalsIndex = np.searchsorted(equals, fieldStarts)
+    hasEquals = equalsIndex < len(equals)
+    equalsPositions = np.full(total, -1, dtype=np.int64)
+    equalsPositions[hasEquals] = equals[equalsIndex[hasEquals]]
+    hasEquals &= equalsPositions < valueEnds
+
+    tags = np.full(total, -1, dtype=np.int64)
+    tags[hasEquals] = _parseInts(data, fieldStarts[hasEquals], equalsPositions[hasEquals])
+    valueStarts = np.where(hasEquals, equalsPositions + 1, fieldStarts)
+    return messageFirstField, fieldMessages, tags, valueStarts, valueEnds
+
+
+class BulkIndex(object):
+    """Columnar index over the messages in a buffer.
+
+    For message i: messageStarts[i]/messageEnds[i] are its offsets in data and its fields are
+    messageFirstField[i] up to messageFirstField[i + 1]. For field j: fieldMessages[j] is the message it belongs to,
+    tags[j] its tag (-1 if malformed) and valueStarts[j]/valueEnds[j] the offsets of its value in data."""
+    def __init__(self, data, messageStarts, messageEnds, messageFirstField, fieldMessages, tags, valueStarts, valueEnds):
+        self.data = data
+        self.messageStarts = messageStarts
+        self.messageEnds = messageEnds
+        self.messageFirstField = messageFirstField
+        self.fieldMessages = fieldMessages
+        self.tags = tags
+        self.valueStarts = valueStarts
+        self.valueEnds = valueEnds
+
+    def __len__(self):
+        return len(self.messageStarts)
+
+    def fieldsWithTag(self, tag, messages=None):
+        """Indices of the fields with tag, optionally only those in messages"""
+        mask = self.tags == int(tag)
+        if messages is not None:
+            mask &= np.isin(self.fieldMessages, messages)
+        return np.flatnonzero(mask)
+
+    def fieldsWithValue(self, tag, value, messages=None):
+        """Indices of the fields with tag whose value is value"""
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        fields = self.fieldsWithTag(tag, messages)
+        fields = fields[self.valueEnds[fields] - self.valueStarts[fields] == len(value)]
+        return fields[_matches(self.data, self.valueStarts[fields], value)]
+
+    def messagesOfType(self, msgType):
+        """Indices of the messages with MsgType(35) msgType"""
+        return self.fieldMessages[self.fieldsWithValue(35, str(msgType))]
+
+    def messagesWithValue(self, tag, value):
+        return np.unique(self.fieldMessages[self.fieldsWithValue(tag, value)])
+
+    def value(self, field):
+        return str(self.data[self.valueStarts[field]:self.valueEnds[field]].tobytes(), 'utf-8')
+
+    def values(self, fields):
+        return [self.value(field) for field in fields]
+
+    def rawMessage(self, message):
+        return memoryview(self.data[self.messageStarts[message]:self.messageEnds[message]])
+
+    def decode(self, message, codec):
+        return codec.decodeFrame(self.rawMessage(message))
+
+
+def decodeBuffer(data):
+    """Index all the complete messages in data (anything supporting the buffer protocol)"""
+    data = np.frombuffer(data, dtype=np.uint8)
+    starts, ends, resume = _indexMessages(data)
+    return BulkIndex(data, starts, ends, *_indexFields(data, starts, ends))
+
+
+def decodeFile(filename, chunkSize=DEFAULT_CHUNK_SIZE):
+    """Memory map filename and index all the messages in it.
+
+    The file is scanned chunkSize bytes at a time, which bounds the size of the temporary arrays; the resulting
+    index refers to the whole mapping."""
+    if os.path.getsize(filename) == 0:
+        return decodeBuffer(b'')
+    data = np.memmap(filename, dtype=np.uint8, mode='r')
+
+    columns = [[] for i in range(7)]
+    fieldCount = 0
+    offset = 0
+    size = chunkSize
+    while offset < len(data):
+        chunk = data[offset:offset + size]
+        last = offset + size >= len(data)
+        starts, ends, resume = _indexMessages(chunk)
+        if not last and resume == 0:
+            # a message bigger than the chunk, try again with more of the file
+            size *= 2
+            continue
+        firstField, fieldMessages, tags, valueStarts, valueEnds = _indexFields(chunk, starts, ends)
+        columns[0].append(starts + offset)
+        columns[1].append(ends + offset)
+        columns[2].append(firstField[:-1] + fieldCount)
+        columns[3].append(fieldMessages + sum(len(c) for c in columns[0][:-1]))
+        columns[4].append(tags)
+        columns[5].append(valueStarts + offset)
+        columns[6].append(valueEnds + offset)
+        fieldCount += int(firstField[-1])
+        if last:
+            break
+        offset += resume
+        size = chunkSize
+
+    messageStarts, messageEnds, messageFirstField, fieldMessages, tags, valueStarts, valueEnds = (np.concatenate(c) for c in columns)
+    messageFirstField = np.concatenate((messageFirstField, [fieldCount])).astype(np.int64)
+    logging.debug("Indexed %s messages (%s fields) in %s" % (len(messageStarts), fieldCount, filename))
+    return BulkIndex(data, messageStarts, messageEnds, messageFirstField, fieldMessages, tags, valueStarts, valueEnds)
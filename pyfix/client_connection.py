@@ -3,11 +3,11 @@ import socket
 from pyfix.journaler import DuplicateSeqNoError
 from pyfix.message import FIXMessage
 from pyfix.session import FIXSession
-from pyfix.connection import FIXEndPoint, ConnectionState, MessageDirection, FIXConnectionHandler
+from pyfix.connection import FIXEndPoint, ConnectionState, MessageDirection, FIXConnectionHandler, SessionError
 from pyfix.event import TimerEventRegistration
 
 class FIXClientConnectionHandler(FIXConnectionHandler):
-    def __init__(self, engine, protocol, targetCompId, senderCompId, sock=None, addr=None, observer=None, targetSubId = None, senderSubId = None, heartbeatTimeout = 30):
+    def __init__(self, engine, protocol, targetCompId, senderCompId, sock=None, addr=None, observer=None, targetSubId = None, senderSubId = None, heartbeatTimeout = 30, resetSeqNum = False):
         FIXConnectionHandler.__init__(self, engine, protocol, sock, addr, observer)
 
         self.targetCompId = targetCompId
@@ -15,19 +15,25 @@ class FIXClientConnectionHandler(FIXConnectionHandler):
         self.targetSubId = targetSubId
         self.senderSubId = senderSubId
         self.heartbeatPeriod = float(heartbeatTimeout)
+        self.resetSeqNum = resetSeqNum
 
         # we need to send a login request.
         self.session = self.engine.getOrCreateSessionFromCompIds(self.targetCompId, self.senderCompId)
         if self.session is None:
             raise RuntimeError("Failed to create client session")
 
-        self.sendMsg(protocol.messages.Messages.logon())
+        logon = protocol.messages.Messages.logon()
+        if resetSeqNum:
+            # logon with ResetSeqNumFlag(141)=Y, starting both sequences again from 1
+            self.resetSeqNos()
+            logon.setField(protocol.fixtags.ResetSeqNumFlag, "Y")
+        self.sendMsg(logon)
 
     def handleSessionMessage(self, msg):
         protocol = self.codec.protocol
         responses = []
 
-        recvSeqNo = msg[protocol.fixtags.MsgSeqNum]
+        recvSeqNo = msg.getInt(protocol.fixtags.MsgSeqNum)
 
         msgType = msg[protocol.fixtags.MsgType]
         targetCompId = msg[protocol.fixtags.TargetCompID]
@@ -37,6 +43,9 @@ class FIXClientConnectionHandler(FIXConnectionHandler):
             if self.connectionState == ConnectionState.LOGGED_IN:
                 logging.warning("Client session already logged in - ignoring login request")
             else:
+                if protocol.fixtags.ResetSeqNumFlag in msg and msg.getBool(protocol.fixtags.ResetSeqNumFlag) and not self.resetSeqNum:
+                    # we have sent messages of the old sequence since, there is no following the reset
+                    raise SessionError("Counterparty reset the seq nos without being asked to")
                 try:
                     self.connectionState = ConnectionState.LOGGED_IN
                     self.heartbeatPeriod = float(msg[protocol.fixtags.HeartBtInt])
@@ -59,15 +68,15 @@ class FIXClientConnectionHandler(FIXConnectionHandler):
             elif msgType == protocol.msgtype.TESTREQUEST:
                 responses.append(protocol.messages.Messages.heartbeat())
             elif msgType == protocol.msgtype.RESENDREQUEST:
-                responses.extend(self._handleResendRequest(msg))
+                responses = self._handleResendRequest(msg)
             elif msgType == protocol.msgtype.SEQUENCERESET:
                 # we can treat GapFill and SequenceReset in the same way
                 # in both cases we will just reset the seq number to the
                 # NewSeqNo received in the message
-                newSeqNo = msg[protocol.fixtags.NewSeqNo]
+                newSeqNo = msg.getInt(protocol.fixtags.NewSeqNo)
                 if msg[protocol.fixtags.GapFillFlag] == "Y":
                     logging.info("Received SequenceReset(GapFill) filling gap from %s to %s" % (recvSeqNo, newSeqNo))
-                self.session.setRecvSeqNo(int(newSeqNo) - 1)
+                self.session.setRecvSeqNo(newSeqNo - 1)
                 recvSeqNo = newSeqNo
         else:
             logging.warning("Can't process message, counterparty is not logged in")
@@ -77,12 +86,14 @@ class FIXClientConnectionHandler(FIXConnectionHandler):
 
 
 class FIXClient(FIXEndPoint):
-    def __init__(self, engine, protocol, targetCompId, senderCompId, targetSubId = None, senderSubId = None, heartbeatTimeout = 30):
+    def __init__(self, engine, protocol, targetCompId, senderCompId, targetSubId = None, senderSubId = None, heartbeatTimeout = 30, resetSeqNum = False):
         self.targetCompId = targetCompId
         self.senderCompId = senderCompId
         self.targetSubId = targetSubId
         self.senderSubId = senderSubId
         self.heartbeatTimeout = heartbeatTimeout
+        # every connection logs on with ResetSeqNumFlag(141)=Y
+        self.resetSeqNum = resetSeqNum
 
         FIXEndPoint.__init__(self, engine, protocol)
 
@@ -112,7 +123,7 @@ class FIXClient(FIXEndPoint):
     def connected(self):
         self.addr = (self.host, self.port)
         logging.info("Connected to %s" % repr(self.addr))
-        connection = FIXClientConnectionHandler(self.engine, self.protocol, self.targetCompId, self.senderCompId, self.socket, self.addr, self, self.targetSubId, self.senderSubId, self.heartbeatTimeout)
+        connection = FIXClientConnectionHandler(self.engine, self.protocol, self.targetCompId, self.senderCompId, self.socket, self.addr, self, self.targetSubId, self.senderSubId, self.heartbeatTimeout, self.resetSeqNum)
         self.connections.append(connection)
         for handler in filter(lambda x: x[1] == ConnectionState.CONNECTED, self.connectionHandlers):
                 handler[0](connection)
@@ -0,0 +1,29 @@
+import time
+
+
+class Clock(object):
+    """Time source shared by the engine.
+
+    monotonic() is for measuring intervals (timers), time() is wall clock seconds since the epoch and utcTimestamp()
+    renders the wall clock as a FIX UTCTimestamp. Rendering the date and time is only done once a second, in between
+    only the milliseconds change."""
+    def __init__(self):
+        self.cachedSecond = None
+        self.cachedPrefix = None
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def time(self):
+        return time.time()
+
+    def utcTimestamp(self):
+        millis = int(self.time() * 1000)
+        second, millis = divmod(millis, 1000)
+        if second != self.cachedSecond:
+            self.cachedPrefix = time.strftime("%Y%m%d-%H:%M:%S.", time.gmtime(second))
+            self.cachedSecond = second
+        return "%s%03d" % (self.cachedPrefix, millis)
+
+
+systemClock = Clock()
@@ -1,163 +1,71 @@
-from datetime import datetime
+import importlib
 import logging
-from pyfix.message import FIXMessage, FIXContext
-from fixorchestra.orchestration import *
-from more_itertools import peekable
+import re
+from pyfix.clock import systemClock
+from pyfix.message import FIXMessage, FIXContext, FIXMessageView, _FIXRepeatingGroupContainer, formatBoolean
+from pyfix.typed import TypedMessage
+from pyfix.dictionary import ParseTable, PARSE_FIELD, PARSE_GROUP, PARSE_DELIMITER
 
 
-class DictBuilder(object):
-    def insert(self, obj, value):
-        obj.append(value)
+def _flagSet(msg, tag):
+    # by its wire form, typed messages hold Boolean fields as a bool
+    return tag in msg and formatBoolean(msg[tag]) == "Y"
 
-    def createNode(self):
-        return []
 
-    def insertList(self, output, tag):
-        node = []
-        output.append(node)
-        return node
-
-    def insertNode(self, output, tag, t):
-        node = []
-        output.append({tag: node})
-        return node
+class Parser(object):
+    """Works out the layout of a message from the flat index of (tag, value start, value end) produced by the decoder.
 
+    The layout is a list holding the index position of each top level field. A repeating group is a tuple of the
+    position of its NumInGroup field and a list of instances, each of which is a layout of its own.
 
-class Parser(object):
-    def __init__(self, dictionary, builder):
+    The structure of each message type is compiled into ParseTables by the dictionary, so this is a single loop over
+    the tags with a stack of the groups we're in."""
+    def __init__(self, dictionary):
         self.dictionary = dictionary
-        self.builder = builder
-        self.output = builder.createNode()
-        self.header_tags = tuple(x.field_id for x in dictionary.orchestration.components["1024"].references)
-
-    def parse(self, it):
-        message = self.parseHeader(it)
-        try:
-            self.parseMessage(it, message, self.output)
-        except StopIteration as e:
-            pass
-
-    def parseHeader(self, it):
-        tag, value = it.peek()
-        while tag in self.header_tags:
-            if tag == 35:
-                message = self.dictionary.orchestration.messages_by_msg_type[value]
-            tag, value = next(it)
-            self.builder.insert(self.output, (tag, value))
-            tag, value = it.peek()
-        return message
-
-    def parseMessage(self, it, message, output):
-        index = self.dictionary.tag_index[message.id]
-        while True:
-            tag, value = it.peek()
-            entity = index.get(tag)
-            if entity is None:
-                pass
-            elif entity is message:
-                pass
-            elif isinstance(entity, Component):
-                self.parseComponent(it, entity, self.output)
-            else:
-                self.parseGroup(it, entity, self.output)
-                continue
-            tag, value = next(it)
-            self.builder.insert(self.output, (tag, value))
-
-    def parseComponent(self, it, message, output):
-        index = self.dictionary.tag_index[message.id]
-        while True:
-            tag, value = it.peek()
-            entity = index.get(tag)
-            if entity is None:
-                return
-            elif entity is message:
-                pass
-            elif isinstance(entity, Component):
-                self.parse_component(it, entity, self.output)
+        self.tables = dictionary.parse_tables
+        # unknown message types are kept as plain fields
+        self.unknown = ParseTable((PARSE_FIELD, None))
+
+    def parse(self, fields, msgType):
+        table = self.tables.get(msgType, self.unknown)
+        transitions = table.transitions
+        default = table.default
+        output = layout = []
+        instances = None
+        stack = []
+        p = 0
+        end = len(fields)
+        while p < end:
+            action, child = transitions.get(fields[p], default)
+            if action == PARSE_FIELD:
+                output.append(p)
+                p += 3
+            elif action == PARSE_GROUP:
+                stack.append((transitions, default, output, instances))
+                instances = []
+                output.append((p, instances))
+                transitions = child.start
+                default = child.default
+                p += 3
+            elif action == PARSE_DELIMITER:
+                output = []
+                instances.append(output)
+                transitions = child.transitions
+                output.append(p)
+                p += 3
             else:
-                self.parseGroup(it, entity, self.output)
-                continue
-            self.builder.insert(self.output, (tag, value))
-            next(it)
-
-    def parseGroup(self, it, group, output):
-        index = self.dictionary.tag_index[group.id]
-        tag, value = next(it)
-        node = self.builder.insertNode(output, tag, (tag, value))
-        tag, value = it.peek()
-        first = tag
-        while True:
-            while True:
-                entity = index.get(tag)
-                if entity is group:
-                    if tag == first:
-                        ol = self.builder.insertList(node, tag)
-                    self.builder.insert(ol, (tag, value))
-                    next(it)
-                    tag, value = it.peek()
-                elif isinstance(entity, Group):
-                    self.parseGroup(it, entity, ol)
-                    tag, value = it.peek()
-                    break
-                else:
-                    break
-            if tag != first:
-                break
+                transitions, default, output, instances = stack.pop()
+        return layout
 
 
-class Dictionary:
-    def __init__(self, orchestration):
-        self.orchestration = orchestration
-        self.tag_index = {}
-        self.buildIndex()
-
-    def buildIndex(self):
-        for k, v in self.orchestration.messages.items():
-            message = self.orchestration.messages_by_msg_type[v.msg_type]
-            references = iter(message.references)
-            next(references)  # skip header
-            self.references_to_fields(references, 0, (message,))
-
-    def references_to_fields(self, references, depth, context):
-        result = {}
-        for reference in references:
-            if reference.field_id:
-                adding = (MessageField(self.orchestration.fields_by_tag[reference.field_id], reference.presence, depth), context)
-                result[reference.field_id] = context[-1]
-            elif reference.group_id:
-                group = self.orchestration.groups[reference.group_id]
-                adding = self.references_to_fields(group.references, depth, context + (group,))
-                first = next(iter(adding))
-                result[first] = adding[first]
-            elif reference.component_id:
-                component = self.orchestration.components[reference.component_id]
-                adding = self.references_to_fields(component.references, depth, context + (component,))
-                result.update(adding)
-        self.tag_index.setdefault(context[-1].id, result)
-        return result
-
-
-class Writer:
-
-    def __init__(self):
-        self.txt = ''
-
-    def write(self, msg):
-        self.txt = '|'.join(self.get_item(item) for item in msg)
-
-    def get_item(self, msg):
-        if isinstance(msg, tuple):
-            return str(msg[0]) + '=' + msg[1]
-        elif isinstance(msg, dict):
-            txt = ''
-            for k, v in msg.items():
-                txt += str(k) + '=' + str(len(v)) + '=>'
-                txt += '['
-                txt += ', '.join(['|'.join(self.get_item(y) for y in x) for x in v])
-                txt += ']'
-
-            return txt
+SOH = b'\x01'
+BEGIN_STRING = b'8='
+BODY_LENGTH = b'9='
+CHECKSUM = b'10='
+TRAILER_LENGTH = len(b'10=000\x01')
+FIELD = re.compile(b'([0-9]+)=([^\x01]*)\x01')
+# longest BeginString(8)/BodyLength(9) field we accept before giving up on finding the end of it
+MAX_HEADER_FIELD_LENGTH = 32
 
 
 class EncodingError(Exception):
@@ -176,37 +84,93 @@ class RepeatingGroupContext(FIXContext):
         FIXContext.__init__(self)
 
 
+# the Parser of each protocol we have a codec for, by BeginString
+parsers = {}
+
+
+def protocolParser(beginString):
+    """The Parser for the protocol with beginString, for decoding messages without a codec (e.g. from the journal)"""
+    parser = parsers.get(beginString)
+    if parser is None:
+        protocol = importlib.import_module('pyfix.' + beginString.replace('.', ''))
+        parser = parsers[beginString] = Parser(protocol.dictionary)
+    return parser
+
+
+def indexFields(frame):
+    """The msg type and flat index of (tag, value start, value end) of every field in frame"""
+    fields = []
+    msgType = None
+    match = FIELD.match
+    pos = 0
+    end = len(frame)
+    while pos < end:
+        m = match(frame, pos)
+        if m is None:
+            raise DecodingError("Malformed field at offset %s" % (pos, ))
+        tag = int(m.group(1))
+        if tag == 35:
+            msgType = str(m.group(2), 'ascii')
+        fields.append(tag)
+        fields.append(m.start(2))
+        fields.append(m.end(2))
+        pos = m.end()
+    return msgType, fields
+
+
 class Codec(object):
-    def __init__(self, protocol):
+    def __init__(self, protocol, clock=systemClock):
         self.protocol = protocol
-        self.SOH = '\x01'
-
-    @staticmethod
-    def current_datetime():
-        return datetime.utcnow().strftime("%Y%m%d-%H:%M:%S.%f")[:-3]
-
-    def _addTag(self, body, t, msg):
-        if msg.isRepeatingGroup(t):
-            count, groups = msg.getRepeatingGroup(t)
-            body.append("%s=%s" % (t, count))
-            for group in groups:
-                for tag in group.tags:
-                    self._addTag(body, tag, group)
-        else:
-            body.append("%s=%s" % (t, msg[t]))
+        self.clock = clock
+        self.dictionary = protocol.dictionary
+        self.parser = Parser(self.dictionary)
+        parsers.setdefault(protocol.beginstring, self.parser)
 
-    def encode(self, msg, session):
-        # Create body
-        body = []
+        # everything constant is pre-encoded, encode() only has to append the values
+        self.tagPrefixes = {int(tag): b'%d=' % (tag, ) for tag in protocol.fixtags}
+        self.headerPrefix = b'%d=%s\x01%d=' % (protocol.fixtags.BeginString, protocol.beginstring.encode('ascii'), protocol.fixtags.BodyLength)
+        self.sessionPrefixes = {}
+        self.buffer = bytearray()
 
-        msgType = msg.msgType
+    def current_datetime(self):
+        return self.clock.utcTimestamp()
 
-        body.append("%s=%s" % (int(self.protocol.fixtags.SenderCompID), session.senderCompId))
-        body.append("%s=%s" % (int(self.protocol.fixtags.TargetCompID), session.targetCompId))
+    def _tagPrefix(self, tag):
+        try:
+            return self.tagPrefixes[tag]
+        except KeyError:
+            prefix = self.tagPrefixes[tag] = b'%d=' % (int(tag), )
+            return prefix
+
+    def _sessionPrefix(self, session):
+        # SenderCompID, TargetCompID and the MsgSeqNum tag that follows them never change for a session
+        key = (session.senderCompId, session.targetCompId)
+        try:
+            return self.sessionPrefixes[key]
+        except KeyError:
+            fixtags = self.protocol.fixtags
+            prefix = self.sessionPrefixes[key] = b'%d=%s\x01%d=%s\x01%d=' % (fixtags.SenderCompID, str(session.senderCompId).encode('utf-8'),
+                                                                               fixtags.TargetCompID, str(session.targetCompId).encode('utf-8'),
+                                                                               fixtags.MsgSeqNum)
+            return prefix
+
+    def _addTag(self, buffer, t, value):
+        buffer += self._tagPrefix(t)
+        if type(value) is _FIXRepeatingGroupContainer:
+            buffer += b'%d\x01' % (len(value.groups), )
+            for group in value.groups:
+                for tag, groupValue in group.tags.items():
+                    self._addTag(buffer, tag, groupValue)
+        else:
+            buffer += str(value).encode('utf-8')
+            buffer += SOH
+
+    def _encode(self, buffer, msg, session):
+        msgType = msg.msgType
 
         seqNo = 0
         if msgType == self.protocol.msgtype.SequenceReset:
-            if self.protocol.fixtags.GapFillFlag in msg and msg[self.protocol.fixtags.GapFillFlag] == "Y":
+            if _flagSet(msg, self.protocol.fixtags.GapFillFlag):
                 # in this case the sequence number should already be on the message
                 try:
                     seqNo = msg[int(self.protocol.fixtags.MsgSeqNum)]
@@ -217,7 +181,7 @@ class Codec(object):
                 seqNo = msg[int(self.protocol.fixtags.MsgSeqNum)]
         else:
             # if we have the PossDupFlag set, we need to send the message with the same seqNo
-            if self.protocol.fixtags.PossDupFlag in msg and msg[self.protocol.fixtags.PossDupFlag] == "Y":
+            if _flagSet(msg, self.protocol.fixtags.PossDupFlag):
                 try:
                     seqNo = msg[int(self.protocol.fixtags.MsgSeqNum)]
                 except KeyError:
@@ -225,39 +189,124 @@ class Codec(object):
             else:
                 seqNo = session.allocateSndSeqNo()
 
-        body.append("%s=%s" % (int(self.protocol.fixtags.MsgSeqNum), seqNo))
-        body.append("%s=%s" % (int(self.protocol.fixtags.SendingTime), self.current_datetime()))
-
-        for t in msg.tags:
-            self._addTag(body, t, msg)
-
-        # Enable easy change when debugging
-        SEP = self.SOH
-
-        body = self.SOH.join(body) + self.SOH
+        msgStart = len(buffer)
+        buffer += self.headerPrefix
+        bodyStart = len(buffer)
+
+        buffer += self.tagPrefixes[self.protocol.fixtags.MsgType]
+        buffer += str(msgType).encode('ascii')
+        buffer += SOH
+        buffer += self._sessionPrefix(session)
+        buffer += str(seqNo).encode('ascii')
+        buffer += SOH
+        buffer += self.tagPrefixes[self.protocol.fixtags.SendingTime]
+        buffer += self.current_datetime().encode('ascii')
+        buffer += SOH
+
+        for t, value in msg.tags.items():
+            self._addTag(buffer, t, value)
+        if isinstance(msg, TypedMessage):
+            msg.encodeFields(buffer)
+
+        # BodyLength is only known now, slot it in front of the body
+        buffer[bodyStart:bodyStart] = b'%d\x01' % (len(buffer) - bodyStart, )
+        with memoryview(buffer) as view:
+            checksum = sum(view[msgStart:]) % 256
+        buffer += b'10=%03d\x01' % (checksum, )
+        return int(seqNo)
 
-        # Create header
-        header = []
-        msgType = "%s=%s" % (int(self.protocol.fixtags.MsgType), str(msgType))
-        header.append("%s=%s" % (int(self.protocol.fixtags.BeginString), self.protocol.beginstring))
-        header.append("%s=%i" % (int(self.protocol.fixtags.BodyLength), len(body) + len(msgType) + 1))
-        header.append(msgType)
-
-        fixmsg = self.SOH.join(header) + self.SOH + body
+    def encode(self, msg, session):
+        buffer = self.buffer
+        del buffer[:]
+        self._encode(buffer, msg, session)
+        return bytes(buffer)
+
+    def encode_many(self, msgs, session):
+        """Encode msgs back to back into a single buffer, allocating their sequence numbers in order.
+
+        The result can be written with a single send(), frame() splits it up into the individual messages again."""
+        buffer = self.buffer
+        del buffer[:]
+        for msg in msgs:
+            self._encode(buffer, msg, session)
+        return bytes(buffer)
+
+    def encode_frames(self, msgs, session, onError = None):
+        """Like encode_many(), also returning (seqNo, msgType, frame) for each message so the encoded messages can be
+        journalled without decoding them again; the frames are memoryviews over the returned bytes.
+
+        If onError is given a message which fails to encode is left out, without using up a seq no, and
+        onError(msg, exception) is called for it; otherwise the exception is raised."""
+        buffer = self.buffer
+        del buffer[:]
+        positions = []
+        for msg in msgs:
+            start = len(buffer)
+            sndSeqNum = session.sndSeqNum
+            try:
+                seqNo = self._encode(buffer, msg, session)
+            except Exception as why:
+                if onError is None:
+                    raise
+                del buffer[start:]
+                session.sndSeqNum = sndSeqNum
+                onError(msg, why)
+                continue
+            positions.append((seqNo, msg.msgType, start, len(buffer)))
+        data = bytes(buffer)
+        view = memoryview(data)
+        return data, [(seqNo, msgType, view[start:end]) for seqNo, msgType, start, end in positions]
+
+    def frame(self, buffer):
+        """Split buffer into complete messages using the BodyLength(9) field.
+
+        Returns the list of messages, as memoryviews over buffer, and the number of bytes they take up; anything after
+        that is the start of a message which hasn't been fully received yet."""
+        view = memoryview(buffer)
+        frames = []
+        end = len(buffer)
+        pos = 0
+        while end - pos >= 2:
+            if buffer[pos:pos + 2] != BEGIN_STRING:
+                raise DecodingError("Expected BeginString(8) at offset %s" % (pos, ))
+            beginEnd = buffer.find(SOH, pos, pos + MAX_HEADER_FIELD_LENGTH)
+            if beginEnd == -1:
+                if end - pos >= MAX_HEADER_FIELD_LENGTH:
+                    raise DecodingError("BeginString(8) is not terminated")
+                break
+            lengthStart = beginEnd + 1
+            if end - lengthStart < 2:
+                break
+            if buffer[lengthStart:lengthStart + 2] != BODY_LENGTH:
+                raise DecodingError("Expected BodyLength(9) at offset %s" % (lengthStart, ))
+            lengthEnd = buffer.find(SOH, lengthStart, lengthStart + MAX_HEADER_FIELD_LENGTH)
+            if lengthEnd == -1:
+                if end - lengthStart >= MAX_HEADER_FIELD_LENGTH:
+                    raise DecodingError("BodyLength(9) is not terminated")
+                break
+            try:
+                bodyLength = int(buffer[lengthStart + 2:lengthEnd])
+            except ValueError:
+                raise DecodingError("Invalid BodyLength(9) %r" % (bytes(buffer[lengthStart + 2:lengthEnd]), ))
+            msgEnd = lengthEnd + 1 + bodyLength + TRAILER_LENGTH
+            if msgEnd > end:
+                break
+            if buffer[msgEnd - TRAILER_LENGTH:msgEnd - TRAILER_LENGTH + 3] != CHECKSUM or buffer[msgEnd - 1] != SOH[0]:
+                raise DecodingError("Expected CheckSum(10) at offset %s" % (msgEnd - TRAILER_LENGTH, ))
+            frames.append(view[pos:msgEnd])
+            pos = msgEnd
+        return frames, pos
 
-        cksum = sum([ord(i) for i in list(fixmsg)]) % 256
-        fixmsg = fixmsg + "%s=%0.3i" % (int(self.protocol.fixtags.CheckSum), cksum)
+    def decodeFrame(self, frame):
+        """Decode a single message, as returned by frame().
 
-        return fixmsg + SEP
+        Only the position of each field is worked out here, values are decoded and repeating groups are built by the
+        returned FIXMessageView when they are first accessed."""
+        msgType, fields = indexFields(frame)
+        return FIXMessageView(msgType, frame, fields, self.parser)
 
     def decode(self, rawmsg):
-        rawmsg = rawmsg.decode('utf-8')
-        tup = [(int(k), v) for k, v in tuple((x.split('=')) for x in rawmsg[:-1].split(self.SOH))]
-        builder = DictBuilder()
-        theIndex = Dictionary(Orchestration('fix_repository_4_4.xml'))
-        p = Parser(theIndex, builder)
-        it = peekable(tup)
-        p.parse(it)
-        writer = Writer()
-        writer.write(p.output)
-        return writer.txt, None
+        frames, parsedLength = self.frame(rawmsg)
+        if not frames:
+            return None, 0
+        return self.decodeFrame(frames[0]), len(frames[0])
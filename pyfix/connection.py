@@ -1,7 +1,8 @@
 import importlib
+import itertools
 import sys
-from pyfix.codec import Codec
-from pyfix.journaler import DuplicateSeqNoError
+from pyfix.codec import Codec, DecodingError
+from pyfix.journaler import DuplicateSeqNoError, CHUNK_SIZE
 from pyfix.message import FIXMessage, MessageDirection
 
 from pyfix.session import *
@@ -33,13 +34,14 @@ class SessionError(Exception):
 
 class FIXConnectionHandler(object):
     def __init__(self, engine, protocol, sock=None, addr=None, observer=None):
-        self.codec = Codec(protocol)
+        self.codec = Codec(protocol, engine.clock)
         self.engine = engine
         self.connectionState = ConnectionState.CONNECTED
         self.session = None
         self.addr = addr
         self.observer = observer
         self.msgBuffer = b''
+        self.pendingMsgs = []
         self.heartbeatPeriod = 30.0
         self.msgHandlers = []
         self.sock = sock
@@ -54,6 +56,14 @@ class FIXConnectionHandler(object):
     def disconnect(self):
         self.handle_close()
 
+    def resetSeqNos(self):
+        """Start both seq nos of the session again from 1, for a Logon with ResetSeqNumFlag(141)=Y"""
+        try:
+            self.engine.resetSeqNos(self.session)
+        except RuntimeError as why:
+            # the journal can't start a new sequence (NotImplementedError is a RuntimeError too)
+            raise SessionError("Can't reset the seq nos of the session: %s" % (why, ))
+
     def _notifyMessageObservers(self, msg, direction, persistMessage=True):
         if persistMessage is True:
             self.engine.journaller.persistMsg(msg, self.session, direction)
@@ -94,19 +104,20 @@ class FIXConnectionHandler(object):
             self.expectedHeartbeatRegistration = None
 
     def _handleResendRequest(self, msg):
+        """Generates the replies to a ResendRequest; the journal is read as they are generated, so they should be
+        sent as they are (processMessage does) rather than collected first."""
         protocol = self.codec.protocol
-        responses = []
 
-        beginSeqNo = msg[protocol.fixtags.BeginSeqNo]
-        endSeqNo = msg[protocol.fixtags.EndSeqNo]
-        if int(endSeqNo) == 0:
+        beginSeqNo = msg.getInt(protocol.fixtags.BeginSeqNo)
+        endSeqNo = msg.getInt(protocol.fixtags.EndSeqNo)
+        if endSeqNo == 0:
             endSeqNo = sys.maxsize
         logging.info("Received resent request from %s to %s", beginSeqNo, endSeqNo)
-        replayMsgs = self.engine.journaller.recoverMsgs(self.session, MessageDirection.OUTBOUND, beginSeqNo, endSeqNo)
-        gapFillBegin = int(beginSeqNo)
-        gapFillEnd = int(beginSeqNo)
+        replayMsgs = self._replayMsgs(beginSeqNo, endSeqNo)
+        gapFillBegin = beginSeqNo
+        gapFillEnd = beginSeqNo
         for replayMsg in replayMsgs:
-            msgSeqNum = int(replayMsg[protocol.fixtags.MsgSeqNum])
+            msgSeqNum = replayMsg.getInt(protocol.fixtags.MsgSeqNum)
             if replayMsg[protocol.fixtags.MsgType] in protocol.msgtype.sessionMessageTypes:
                 gapFillEnd = msgSeqNum + 1
             else:
@@ -117,9 +128,10 @@ class FIXConnectionHandler(object):
                         gapFillMsg.setField(protocol.fixtags.GapFillFlag, 'Y')
                         gapFillMsg.setField(protocol.fixtags.MsgSeqNum, gapFillBegin)
                         gapFillMsg.setField(protocol.fixtags.NewSeqNo, str(gapFillEnd))
-                        responses.append(gapFillMsg)
+                        yield gapFillMsg
 
-                    # and then resent the replayMsg
+                    # and then resent the replayMsg, on a copy as it may be shared with whoever gave it to us
+                    replayMsg = replayMsg.clone()
                     replayMsg.removeField(protocol.fixtags.BeginString)
                     replayMsg.removeField(protocol.fixtags.BodyLength)
                     replayMsg.removeField(protocol.fixtags.SendingTime)
@@ -127,12 +139,12 @@ class FIXConnectionHandler(object):
                     replayMsg.removeField(protocol.fixtags.TargetCompID)
                     replayMsg.removeField(protocol.fixtags.CheckSum)
                     replayMsg.setField(protocol.fixtags.PossDupFlag, "Y")
-                    responses.append(replayMsg)
+                    yield replayMsg
 
                     gapFillBegin = msgSeqNum + 1
                 else:
                     gapFillEnd = msgSeqNum + 1
-                    responses.append(replayMsg)
+                    yield replayMsg
 
         if gapFillBegin < gapFillEnd:
             # we need to send a gap fill message
@@ -140,22 +152,36 @@ class FIXConnectionHandler(object):
             gapFillMsg.setField(protocol.fixtags.GapFillFlag, 'Y')
             gapFillMsg.setField(protocol.fixtags.MsgSeqNum, gapFillBegin)
             gapFillMsg.setField(protocol.fixtags.NewSeqNo, str(gapFillEnd))
-            responses.append(gapFillMsg)
-
-        return responses
+            yield gapFillMsg
+
+    def _replayMsgs(self, beginSeqNo, endSeqNo):
+        # the resend cache as far back as it goes, the journal for anything older
+        cache = self.engine.resendCache(self.session)
+        frames = []
+        firstCached = None
+        if cache is not None:
+            frames = cache.lookup(beginSeqNo, endSeqNo)
+            firstCached = cache.firstSeqNo()
+        if firstCached is None or beginSeqNo < firstCached:
+            lastSeqNo = endSeqNo if firstCached is None else min(endSeqNo, firstCached - 1)
+            yield from self.engine.journaller.iterMsgs(self.session, MessageDirection.OUTBOUND, beginSeqNo, lastSeqNo)
+        for seqNo, frame in frames:
+            yield self.codec.decodeFrame(frame)
 
     def handle_read(self, type, closure):
         protocol = self.codec.protocol
         try:
             msg = self.sock.recv(8192)
             if msg:
-                self.msgBuffer = self.msgBuffer + msg
-                (decodedMsg, parsedLength) = self.codec.decode(self.msgBuffer)
-                self.msgBuffer = self.msgBuffer[parsedLength:]
-                while decodedMsg is not None and self.connectionState != ConnectionState.DISCONNECTED:
-                    self.processMessage(decodedMsg)
-                    (decodedMsg, parsedLength) = self.codec.decode(self.msgBuffer)
-                    self.msgBuffer = self.msgBuffer[parsedLength:]
+                if self.msgBuffer:
+                    msg = self.msgBuffer + msg
+                # frames are views onto msg, only the incomplete tail is kept for the next read
+                (frames, parsedLength) = self.codec.frame(msg)
+                self.msgBuffer = msg[parsedLength:]
+                for frame in frames:
+                    if self.connectionState == ConnectionState.DISCONNECTED:
+                        break
+                    self.processMessage(self.codec.decodeFrame(frame))
                 if self.expectedHeartbeatRegistration is not None:
                     self.expectedHeartbeatRegistration.reset()
             else:
@@ -164,6 +190,9 @@ class FIXConnectionHandler(object):
         except ConnectionError as why:
                 logging.debug("Connection has been closed %s" % (why, ))
                 self.disconnect()
+        except DecodingError as why:
+                logging.error("Failed to decode message stream, disconnecting: %s" % (why, ))
+                self.disconnect()
 
     def handleSessionMessage(self, msg):
         return -1
@@ -180,11 +209,13 @@ class FIXConnectionHandler(object):
         msgType = decodedMsg[protocol.fixtags.MsgType]
 
         try:
+            # handleSessionMessage can return a generator (see _handleResendRequest), anything else goes after it
             responses = []
+            moreResponses = []
             if msgType in protocol.msgtype.sessionMessageTypes:
                 (recvSeqNo, responses) = self.handleSessionMessage(decodedMsg)
             else:
-                recvSeqNo = decodedMsg[protocol.fixtags.MsgSeqNum]
+                recvSeqNo = decodedMsg.getInt(protocol.fixtags.MsgSeqNum)
 
             # validate the seq number
             (seqNoState, lastKnownSeqNo) = self.session.validateRecvSeqNo(recvSeqNo)
@@ -192,7 +223,7 @@ class FIXConnectionHandler(object):
             if seqNoState is False:
                 # We should send a resend request
                 logging.info("Requesting resend of messages: %s to %s" % (lastKnownSeqNo, 0))
-                responses.append(protocol.messages.Messages.resend_request(lastKnownSeqNo, 0))
+                moreResponses.append(protocol.messages.Messages.resend_request(lastKnownSeqNo, 0))
                 # we still need to notify if we are processing Logon message
                 if msgType == protocol.msgtype.LOGON:
                     self._notifyMessageObservers(decodedMsg, MessageDirection.INBOUND, False)
@@ -201,8 +232,11 @@ class FIXConnectionHandler(object):
                 self._notifyMessageObservers(decodedMsg, MessageDirection.INBOUND)
 
 
-            for m in responses:
+            for m in itertools.chain(responses, moreResponses):
                 self.sendMsg(m)
+                # send long replays a chunk at a time instead of holding all of it
+                if len(self.pendingMsgs) >= CHUNK_SIZE:
+                    self.flush()
 
         except SessionWarning as sw:
             logging.warning(sw)
@@ -221,6 +255,9 @@ class FIXConnectionHandler(object):
 
 
     def handle_close(self):
+        if self.connectionState != ConnectionState.DISCONNECTED:
+            # send anything still pending, this can find the connection has already gone and close it
+            self.flush()
         if self.connectionState != ConnectionState.DISCONNECTED:
             logging.info("Client disconnected")
             self.registerLoggedOut()
@@ -236,17 +273,50 @@ class FIXConnectionHandler(object):
         if self.connectionState != ConnectionState.CONNECTED and self.connectionState != ConnectionState.LOGGED_IN:
             raise FIXException(FIXException.FIXExceptionReason.NOT_CONNECTED)
 
-        encodedMsg = self.codec.encode(msg, self.session).encode('utf-8')
-        self.sock.send(encodedMsg)
-        if self.heartbeatTimerRegistration is not None:
-            self.heartbeatTimerRegistration.reset()
+        # everything sent while the event manager is servicing events goes out in a single write once it is done
+        self.pendingMsgs.append(msg)
+        if len(self.pendingMsgs) == 1:
+            self.engine.eventManager.callAfterEvents(self.flush)
 
-        decodedMsg, junk = self.codec.decode(encodedMsg)
+    def _encodingFailed(self, msg, why):
+        logging.error("Failed to encode message, it hasn't been sent: %s (%s)" % (why, msg))
+
+    def flush(self):
+        if not self.pendingMsgs:
+            return
+        msgs = self.pendingMsgs
+        self.pendingMsgs = []
+
+        # the journal gets the encoded messages as they are, they are only decoded again if they are ever resent; a
+        # message which can't be encoded is dropped on its own rather than with the rest of the batch
+        encodedMsgs, frames = self.codec.encode_frames(msgs, self.session, self._encodingFailed)
+        if not frames:
+            return
+
+        # journal before sending, depending on the durability policy this is where the journal is committed
+        journaller = self.engine.journaller
+        cache = self.engine.resendCache(self.session)
+        for seqNo, msgType, frame in frames:
+            try:
+                journaller.persistFrame(seqNo, msgType, frame, self.session, MessageDirection.OUTBOUND)
+            except DuplicateSeqNoError:
+                logging.error("We have sent a message with a duplicate seq no, failed to persist it (MsgSeqNum: %s)" % (seqNo, ))
+            if cache is not None:
+                cache.add(seqNo, frame)
+        journaller.beforeSend()
 
         try:
-            self._notifyMessageObservers(decodedMsg, MessageDirection.OUTBOUND)
-        except DuplicateSeqNoError:
-            logging.error("We have sent a message with a duplicate seq no, failed to persist it (MsgSeqNum: %s)" % (decodedMsg[self.codec.protocol.fixtags.MsgSeqNum]))
+            self.sock.sendall(encodedMsgs)
+        except OSError as why:
+            logging.debug("Connection has been closed %s" % (why, ))
+            self.disconnect()
+            return
+        if self.heartbeatTimerRegistration is not None:
+            self.heartbeatTimerRegistration.reset()
+
+        # observers get what was actually sent, header fields and all, as views over the encoded frames
+        for seqNo, msgType, frame in frames:
+            self._notifyMessageObservers(self.codec.decodeFrame(frame), MessageDirection.OUTBOUND, False)
 
 
 class FIXEndPoint(object):
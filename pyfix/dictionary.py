@@ -0,0 +1,192 @@
+import hashlib
+import logging
+import os
+import pickle
+from fixorchestra.orchestration import Orchestration
+
+# bump this whenever the layout of the compiled dictionary changes, so stale cache files are ignored
+CACHE_VERSION = 3
+
+
+class Entity(object):
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+        # tag -> entity (self, a nested Component or a Group) that owns the tag
+        self.index = {}
+
+    def __str__(self):
+        return "%s(%s)" % (type(self).__name__, self.name)
+
+    __repr__ = __str__
+
+
+class MessageDef(Entity):
+    def __init__(self, id, name, msg_type):
+        Entity.__init__(self, id, name)
+        self.msg_type = msg_type
+
+
+class ComponentDef(Entity):
+    pass
+
+
+class GroupDef(Entity):
+    pass
+
+
+# parse table actions
+PARSE_FIELD = 0      # a field of the current message or group instance
+PARSE_GROUP = 1      # NumInGroup of a nested group, the next state is the group's start state
+PARSE_DELIMITER = 2  # first field of a group instance, starts a new instance
+PARSE_END = 3        # not part of the current group, it ends and the tag is looked at again by the enclosing table
+
+
+class ParseTable(object):
+    """Transitions for the table driven message parser (see codec.Parser).
+
+    transitions maps tag -> (action, child table) and default is the action for tags that aren't in it. A group also
+    has a start state, which only accepts the delimiter (the first field of each instance)."""
+    def __init__(self, default, delimiter=None):
+        self.transitions = {}
+        self.default = default
+        self.delimiter = delimiter
+        self.start = {}
+
+
+class Dictionary(object):
+    def __init__(self, orchestration):
+        self.field_names = {tag: field.name for tag, field in orchestration.fields_by_tag.items()}
+        # tag -> datatype name (e.g. 'Price', 'SeqNum', 'UTCTimestamp'), fields using a code set get the code set's type
+        self.field_types = {}
+        for tag, field in orchestration.fields_by_tag.items():
+            codeSet = orchestration.code_sets.get(field.type)
+            self.field_types[tag] = codeSet.type if codeSet is not None else field.type
+        self.messages = {}
+        self.components = {}
+        self.groups = {}
+
+        header = self._component(orchestration, self._findComponent(orchestration, 'StandardHeader'))
+        self.header_tags = frozenset(tag for tag, owner in header.index.items() if owner is header)
+
+        for message in orchestration.messages.values():
+            entity = MessageDef(message.id, message.name, message.msg_type)
+            self.messages[message.msg_type] = entity
+            references = iter(message.references)
+            next(references)  # skip header
+            self._compile(orchestration, references, entity)
+
+        # msg type -> ParseTable
+        self.parse_tables = {}
+        groupTables = {}
+        for msgType, message in self.messages.items():
+            self.parse_tables[msgType] = self._parseTable(message, groupTables)
+
+    @staticmethod
+    def _findComponent(orchestration, name):
+        for component in orchestration.components.values():
+            if component.name == name:
+                return component
+        raise KeyError(name)
+
+    def _component(self, orchestration, component):
+        entity = self.components.get(component.id)
+        if entity is None:
+            entity = ComponentDef(component.id, component.name)
+            self.components[component.id] = entity
+            self._compile(orchestration, component.references, entity)
+        return entity
+
+    def _group(self, orchestration, group):
+        entity = self.groups.get(group.id)
+        if entity is None:
+            entity = GroupDef(group.id, group.name)
+            self.groups[group.id] = entity
+            self._compile(orchestration, group.references, entity)
+        return entity
+
+    def _compile(self, orchestration, references, entity):
+        # Components and groups share the same id space in the repository, so each entity keeps its own index
+        # rather than being looked up by id.
+        index = entity.index
+        for reference in references:
+            if reference.field_id:
+                index.setdefault(reference.field_id, entity)
+            elif reference.group_id:
+                group = self._group(orchestration, orchestration.groups[reference.group_id])
+                first = next(iter(group.index))  # the NumInGroup tag
+                index.setdefault(first, group)
+            elif reference.component_id:
+                component = self._component(orchestration, orchestration.components[reference.component_id])
+                for tag, owner in component.index.items():
+                    index.setdefault(tag, owner)
+        return index
+
+    def _parseTable(self, entity, groupTables):
+        # a message table keeps anything it doesn't know about as a field, a group table ends the group
+        if isinstance(entity, GroupDef):
+            table = groupTables.get(entity)
+            if table is not None:
+                return table
+            tags = iter(entity.index)
+            next(tags)  # NumInGroup
+            table = groupTables[entity] = ParseTable((PARSE_END, None), next(tags, None))
+            table.start[table.delimiter] = (PARSE_DELIMITER, table)
+        else:
+            table = ParseTable((PARSE_FIELD, None))
+
+        for tag, owner in entity.index.items():
+            if tag == table.delimiter:
+                table.transitions[tag] = (PARSE_DELIMITER, table)
+            elif owner is not entity and isinstance(owner, GroupDef):
+                table.transitions[tag] = (PARSE_GROUP, self._parseTable(owner, groupTables))
+            else:
+                table.transitions[tag] = (PARSE_FIELD, None)
+        return table
+
+
+_dictionaries = {}
+
+
+def defaultCacheDir():
+    return os.environ.get('PYFIX_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'pyfix'))
+
+
+def load_dictionary(filename, cacheDir=None):
+    """Return the compiled Dictionary for a FIX repository file.
+
+    The result is shared by everybody in the process and written to an on disk cache keyed by a hash of the
+    repository contents, so only the first run after the XML changes pays for parsing it."""
+    with open(filename, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+
+    dictionary = _dictionaries.get(digest)
+    if dictionary is not None:
+        return dictionary
+
+    if cacheDir is None:
+        cacheDir = defaultCacheDir()
+    name = os.path.splitext(os.path.basename(filename))[0]
+    cacheFile = os.path.join(cacheDir, "%s-%s-v%s.pickle" % (name, digest, CACHE_VERSION))
+
+    try:
+        with open(cacheFile, 'rb') as f:
+            dictionary = pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as why:
+        logging.warning("Ignoring unreadable dictionary cache %s (%s)" % (cacheFile, why))
+
+    if dictionary is None:
+        dictionary = Dictionary(Orchestration(filename))
+        try:
+            os.makedirs(cacheDir, exist_ok=True)
+            tmpFile = "%s.%s.tmp" % (cacheFile, os.getpid())
+            with open(tmpFile, 'wb') as f:
+                pickle.dump(dictionary, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpFile, cacheFile)
+        except OSError as why:
+            logging.warning("Failed to write dictionary cache %s (%s)" % (cacheFile, why))
+
+    _dictionaries[digest] = dictionary
+    return dictionary
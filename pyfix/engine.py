@@ -1,16 +1,59 @@
-from pyfix.event import EventManager
-from pyfix.journaler import Journaler
+from pyfix.clock import systemClock
+from pyfix.event import EventManager, TimerEventRegistration
+from pyfix.journaler import Journaler, JournalerBase, DurabilityPolicy
+from pyfix.journalwriter import JournalWriter
+from pyfix.resendcache import ResendCache
 
 class FIXEngine(object):
-    def __init__(self, journalfile = None):
-        self.eventManager = EventManager()
-        self.journaller = Journaler(journalfile)
+    def __init__(self, journalfile = None, durability = DurabilityPolicy.SYNC_PER_MESSAGE, batchSize = 1000, batchInterval = 0.1, journalClass = Journaler, journalQueueSize = None, journalRollTime = None, resendCacheSize = 1000, resendCacheBytes = None):
+        self.clock = systemClock
+        self.eventManager = EventManager(self.clock)
+        # journalClass is Journaler (sqlite, journalfile is the database) or logjournal.LogJournaler (journalfile is a directory)
+        if journalRollTime is not None and journalClass.roll is JournalerBase.roll:
+            raise RuntimeError("%s journals can't be rolled, journalRollTime can't be used with them" % (journalClass.__name__, ))
+        self.journaller = journalClass(journalfile, durability, batchSize, batchInterval, self.clock)
         self.sessions = {}
+        # the last resendCacheSize messages (and at most resendCacheBytes of them) sent on each session are kept to
+        # answer resend requests without going to the journal, a resendCacheSize of 0 turns this off
+        self.resendCacheSize = resendCacheSize
+        self.resendCacheBytes = resendCacheBytes
+        self.resendCaches = {}
+
+        # see DurabilityPolicy for what each of these guarantees
+        if journalQueueSize is not None:
+            # journal on a thread of its own, which commits as it goes
+            self.journaller = JournalWriter(self.journaller, journalQueueSize)
+        elif durability == DurabilityPolicy.SYNC_BEFORE_SEND or durability == DurabilityPolicy.BATCHED:
+            self.journaller.batchStarted = lambda: self.eventManager.callAfterEvents(self.journaller.endOfBatch)
+        elif durability == DurabilityPolicy.ASYNC:
+            self.journalTimer = TimerEventRegistration(lambda type, closure: self.journaller.checkBatchInterval(), batchInterval)
+            self.eventManager.registerHandler(self.journalTimer)
+
+        # roll the journal into its archive once a day at journalRollTime (a datetime.time, UTC)
+        self.journalRollTime = journalRollTime
+        if journalRollTime is not None:
+            self.nextJournalRoll = self._nextJournalRoll()
+            self.journalRollTimer = TimerEventRegistration(lambda type, closure: self.checkJournalRoll(), 60)
+            self.eventManager.registerHandler(self.journalRollTimer)
 
         # We load all sessions from the journal and add to our list
         for session in self.journaller.sessions():
             self.sessions[session.key] = session
 
+    def _nextJournalRoll(self):
+        now = self.clock.time()
+        rollTime = now - now % 86400 + self.journalRollTime.hour * 3600 + self.journalRollTime.minute * 60 + self.journalRollTime.second
+        return rollTime if rollTime > now else rollTime + 86400
+
+    def checkJournalRoll(self):
+        if self.clock.time() >= self.nextJournalRoll:
+            self.journaller.roll()
+            self.nextJournalRoll = self._nextJournalRoll()
+
+    def close(self):
+        """Commit and close the journal"""
+        self.journaller.close()
+
     def validateSession(self, targetCompId, senderCompId):
         # this make any session we receive valid
         return True
@@ -27,6 +70,25 @@ class FIXEngine(object):
             raise RuntimeError("Failed to add session with duplicate key")
         return session
 
+    def resendCache(self, session):
+        if not self.resendCacheSize:
+            return None
+        try:
+            return self.resendCaches[session.key]
+        except KeyError:
+            cache = self.resendCaches[session.key] = ResendCache(self.resendCacheSize, self.resendCacheBytes)
+            return cache
+
+    def resetSeqNos(self, session):
+        """Start both seq nos of session again from 1"""
+        self.journaller.resetSeqNos(session)
+        session.sndSeqNum = 0
+        session.nextExpectedMsgSeqNum = 1
+        # what was cached was sent with the old seq nos
+        cache = self.resendCaches.get(session.key)
+        if cache is not None:
+            cache.clear()
+
     def getSession(self, identifier):
         try:
             return self.sessions[identifier]
@@ -1,9 +1,13 @@
 from enum import Enum
-import datetime
-import os
-from select import select, error
+import heapq
+import itertools
+import logging
+from select import select
 import errno
+import selectors
+import sys
 import time
+from pyfix.clock import systemClock
 
 class EventType(Enum):
     NONE = 0
@@ -18,23 +22,27 @@ class EventRegistration(object):
         self.closure = closure
 
 class TimerEventRegistration(EventRegistration):
-    class TimeoutState(Enum):
-        NONE = 0
-        START = 1
-        PROGRESS = 2
-
+    """Calls back timeout seconds after it was registered, reset or last fired. deadline is the (absolute, clock
+    monotonic()) time it fires next, None while it isn't registered."""
     def __init__(self, callback, timeout, closure=None):
         EventRegistration.__init__(self, callback, closure)
         self.timeout = timeout
-        self.timeoutState = TimerEventRegistration.TimeoutState.START
-        self.timeLeft = timeout
-        self.lastTime = None
+        self.deadline = None
+        self.manager = None
+        # the entry for this timer in its manager's heap, see EventManager
+        self.entry = None
 
     def reset(self):
-        self.timeLeft = self.timeout
+        if self.manager is not None:
+            self.manager._resetTimer(self)
+
+    def timeLeft(self):
+        if self.deadline is None:
+            return self.timeout
+        return max(0.0, self.deadline - self.manager.clock.monotonic())
 
     def __str__(self):
-        return "TimerEvent interval: %s, remaining: %s" % (self.timeout, self.timeLeft)
+        return "TimerEvent interval: %s, remaining: %s" % (self.timeout, self.timeLeft())
 
 
 class FileDescriptorEventRegistration(EventRegistration):
@@ -60,6 +68,10 @@ class EventLoop(object):
     def remove(self, event):
         pass
 
+    def modify(self, oldEvent, newEvent):
+        self.remove(oldEvent)
+        self.add(newEvent)
+
     def run(self, timeout):
         pass
 
@@ -89,24 +101,94 @@ class SelectEventLoop(EventLoop):
                 try:
                     readReady, writeReady, exceptReady = select(self.readSet, self.writeSet, [], timeout)
                     events = []
-                    for r in readReady:
+                    # an fd is in the sets once for each event added for it, but is only reported once
+                    for r in dict.fromkeys(readReady):
                         events.append(_Event(r, EventType.READ))
-                    for r in writeReady:
+                    for r in dict.fromkeys(writeReady):
                         events.append(_Event(r, EventType.WRITE))
                     return events
-                except error as why:
-                    if os.name == 'posix':
-                        if why[0] != errno.EAGAIN and why[0] != errno.EINTR:
-                            break
-                    else:
-                        if why[0] == errno.WSAEADDRINUSE:
-                            break
+                except OSError as why:
+                    if why.errno != errno.EAGAIN and why.errno != errno.EINTR:
+                        raise
 
+class SelectorEventLoop(EventLoop):
+    """Event loop on the best selector the platform has (epoll on Linux), which keeps the file descriptors registered
+    with the kernel between calls rather than passing all of them in each time.
 
-class EventManager(object):
+    Several events can be added for the same file descriptor (they have to use the same object for it), the interest
+    registered with the selector is the union of them."""
     def __init__(self):
-        self.eventLoop = SelectEventLoop()
-        self.handlers = []
+        self.selector = selectors.DefaultSelector()
+        # fd -> [events added for reading, events added for writing]
+        self.interest = {}
+
+    def _update(self, fd, filter, change):
+        counts = self.interest.get(fd)
+        if counts is None:
+            counts = self.interest[fd] = [0, 0]
+        if filter.value & EventType.READ.value:
+            counts[0] += change
+        if filter.value & EventType.WRITE.value:
+            counts[1] += change
+        mask = (selectors.EVENT_READ if counts[0] else 0) | (selectors.EVENT_WRITE if counts[1] else 0)
+        try:
+            registered = self.selector.get_key(fd).events
+        except KeyError:
+            registered = 0
+        if mask == registered:
+            return
+        if mask == 0:
+            del self.interest[fd]
+            self.selector.unregister(fd)
+        elif registered == 0:
+            self.selector.register(fd, mask)
+        else:
+            self.selector.modify(fd, mask)
+
+    def add(self, event):
+        self._update(event.fd, event.filter, 1)
+
+    def remove(self, event):
+        self._update(event.fd, event.filter, -1)
+
+    def modify(self, oldEvent, newEvent):
+        counts = self.interest[oldEvent.fd]
+        if oldEvent.filter.value & EventType.READ.value:
+            counts[0] -= 1
+        if oldEvent.filter.value & EventType.WRITE.value:
+            counts[1] -= 1
+        self._update(newEvent.fd, newEvent.filter, 1)
+
+    def run(self, timeout):
+        if not self.interest:
+            time.sleep(timeout)
+            return []
+        events = []
+        for key, mask in self.selector.select(timeout):
+            filter = (EventType.READ.value if mask & selectors.EVENT_READ else 0) | (EventType.WRITE.value if mask & selectors.EVENT_WRITE else 0)
+            events.append(_Event(key.fileobj, EventType(filter)))
+        return events
+
+
+class EventManager(object):
+    def __init__(self, clock=systemClock, eventLoop=None):
+        self.clock = clock
+        if eventLoop is None:
+            # epoll where there is one, select() elsewhere
+            eventLoop = SelectorEventLoop() if sys.platform.startswith('linux') else SelectEventLoop()
+        self.eventLoop = eventLoop
+        # all the handlers in the order they were registered (a dict for O(1) removal), and the fd ones by fd
+        self.handlers = {}
+        self.fdHandlers = {}
+        # Timers are a heap of [deadline, sequence, timer] entries. A timer only ever has one live entry (its
+        # entry), others are left where they are once it is unregistered and dropped when they reach the top. A reset,
+        # which is done for every message received, only moves the timer's deadline later and the entry is moved down
+        # the heap when it comes up, so it costs nothing and arming or firing a timer is O(log n).
+        self.timers = []
+        self.timerSequence = itertools.count()
+        self.timerCount = 0
+        self.servicingEvents = False
+        self.afterEventsCallbacks = []
 
     def waitForEvent(self):
         self.waitForEventWithTimeout(None)
@@ -117,55 +199,133 @@ class EventManager(object):
 
         timeout = self._setTimeout(timeout)
         events = self.eventLoop.run(timeout)
-        self._serviceEvents(events)
+        self.servicingEvents = True
+        try:
+            self._serviceEvents(events)
+        finally:
+            self.servicingEvents = False
+            self._runAfterEventsCallbacks()
+
+    def callAfterEvents(self, callback):
+        # While events are being serviced, defer callback until all of them have been handled (so work triggered by
+        # several events can be done in one go), otherwise call it straight away.
+        if self.servicingEvents:
+            self.afterEventsCallbacks.append(callback)
+        else:
+            callback()
+
+    def _runAfterEventsCallbacks(self):
+        while self.afterEventsCallbacks:
+            callbacks = self.afterEventsCallbacks
+            self.afterEventsCallbacks = []
+            for callback in callbacks:
+                # one failing doesn't stop the rest, they are usually flushes of different connections
+                try:
+                    callback()
+                except Exception:
+                    logging.exception("After events callback %s failed" % (callback, ))
 
     def _setTimeout(self, timeout):
-        nowTime = datetime.datetime.utcnow()
-        duration = timeout
-
-        for handler in self.handlers:
-            if type(handler) is TimerEventRegistration:
-                if handler.timeoutState == TimerEventRegistration.TimeoutState.START:
-                    handler.timeoutState = TimerEventRegistration.TimeoutState.PROGRESS
-
-                handler.lastTime = nowTime
-                if duration is None or handler.timeLeft < duration:
-                    duration = handler.timeLeft
-
-        return duration
+        entry = self._nextTimer()
+        if entry is None:
+            return timeout
+        duration = max(0.0, entry[0] - self.clock.monotonic())
+        if timeout is None or duration < timeout:
+            return duration
+        return timeout
+
+    def _armTimer(self, timer, deadline):
+        timer.deadline = deadline
+        timer.entry = [deadline, next(self.timerSequence), timer]
+        heapq.heappush(self.timers, timer.entry)
+
+    def _resetTimer(self, timer):
+        deadline = self.clock.monotonic() + timer.timeout
+        if timer.entry[0] <= deadline:
+            timer.deadline = deadline
+        else:
+            # sooner than the entry, which can only be when the timeout was changed
+            self._armTimer(timer, deadline)
+
+    def _nextTimer(self):
+        """The entry of the timer due first, or None if there are no timers"""
+        timers = self.timers
+        while timers:
+            entry = timers[0]
+            timer = entry[2]
+            if timer.entry is not entry:
+                heapq.heappop(timers)
+            elif entry[0] < timer.deadline:
+                # reset since it was armed
+                entry = timer.entry = [timer.deadline, next(self.timerSequence), timer]
+                heapq.heapreplace(timers, entry)
+            else:
+                return entry
+        return None
 
     def _serviceEvents(self, events):
-        nowTime = datetime.datetime.utcnow()
-        for handler in self.handlers:
-            if isinstance(handler, FileDescriptorEventRegistration):
-                for event in events:
-                    if event.fd == handler.fd:
-                        type = handler.eventType.value & event.filter.value
-                        if type != EventType.NONE:
-                            handler.callback(type, handler.closure)
-            elif isinstance(handler, TimerEventRegistration):
-                if handler.timeoutState == TimerEventRegistration.TimeoutState.PROGRESS:
-                    elapsedTime = nowTime - handler.lastTime
-                    handler.timeLeft -= elapsedTime.total_seconds()
-                    if handler.timeLeft <= 0.0:
-                        handler.timeLeft = handler.timeout
-                        handler.callback(EventType.TIMEOUT, handler.closure)
-
+        nowTime = self.clock.monotonic()
+        for event in events:
+            for handler in self.fdHandlers.get(event.fd, ()):
+                # a callback may have unregistered this handler (e.g. closed the connection) while servicing the event
+                if handler not in self.handlers:
+                    continue
+                type = handler.eventType.value & event.filter.value
+                if type != EventType.NONE.value:
+                    handler.callback(EventType(type), handler.closure)
+        # every timer due is rearmed before any of them is called back, so they can be reset or unregistered by the
+        # callbacks (and a timeout of 0 doesn't fire more than once per wait)
+        due = []
+        while True:
+            entry = self._nextTimer()
+            if entry is None or entry[0] > nowTime:
+                break
+            timer = entry[2]
+            heapq.heappop(self.timers)
+            self._armTimer(timer, nowTime + timer.timeout)
+            due.append(timer)
+        for timer in due:
+            if timer.manager is self:
+                timer.callback(EventType.TIMEOUT, timer.closure)
 
     def registerHandler(self, handler):
         if isinstance(handler, TimerEventRegistration):
-            pass
+            if handler.manager is self:
+                return
+            handler.manager = self
+            self.timerCount += 1
+            self._armTimer(handler, self.clock.monotonic() + handler.timeout)
         elif isinstance(handler, FileDescriptorEventRegistration):
             self.eventLoop.add(_Event(handler.fd, handler.eventType))
+            # a copy on write, so a callback can register and unregister handlers while they are being dispatched to
+            self.fdHandlers[handler.fd] = self.fdHandlers.get(handler.fd, []) + [handler]
         else:
             raise RuntimeError("Trying to register invalid handler")
-        self.handlers.append(handler)
+        self.handlers[handler] = None
 
     def unregisterHandler(self, handler):
         if self.isRegistered(handler):
-            self.handlers.remove(handler)
-            if isinstance(handler, FileDescriptorEventRegistration):
+            del self.handlers[handler]
+            if isinstance(handler, TimerEventRegistration):
+                handler.manager = handler.entry = handler.deadline = None
+                self.timerCount -= 1
+                if len(self.timers) > 2 * self.timerCount + 64:
+                    # don't let the entries of timers that were unregistered build up
+                    self.timers = [entry for entry in self.timers if entry[2].entry is entry]
+                    heapq.heapify(self.timers)
+            elif isinstance(handler, FileDescriptorEventRegistration):
                 self.eventLoop.remove(_Event(handler.fd, handler.eventType))
+                remaining = [h for h in self.fdHandlers[handler.fd] if h is not handler]
+                if remaining:
+                    self.fdHandlers[handler.fd] = remaining
+                else:
+                    del self.fdHandlers[handler.fd]
+
+    def modifyHandler(self, handler, eventType):
+        """Change the events a registered fd handler is interested in, e.g. to add WRITE while there is output queued"""
+        if eventType != handler.eventType and self.isRegistered(handler):
+            self.eventLoop.modify(_Event(handler.fd, handler.eventType), _Event(handler.fd, eventType))
+        handler.eventType = eventType
 
 
     def isRegistered(self, handler):
@@ -0,0 +1,202 @@
+"""Generate typed message classes from a FIX repository.
+
+    python -m pyfix.generator fix_repository_4_4.xml pyfix/FIX44/generated.py
+
+For every message (and every repeating group they use) a class is written with a slot per field, the fields in wire
+order and an encodeFields() method with the tags pre-encoded, see pyfix.typed. The output only imports pyfix, the
+repository isn't needed to use it."""
+import argparse
+import logging
+import os
+from fixorchestra.orchestration import Orchestration
+from pyfix.dictionary import Dictionary, GroupDef
+from pyfix.message import datatypeConverters, datatypeFormatters
+
+# python type of the value held for each datatype
+datatypeAnnotations = {
+    'int': 'int',
+    'Length': 'int',
+    'NumInGroup': 'int',
+    'SeqNum': 'int',
+    'TagNum': 'int',
+    'DayOfMonth': 'int',
+    'float': 'Decimal',
+    'Qty': 'Decimal',
+    'Price': 'Decimal',
+    'PriceOffset': 'Decimal',
+    'Amt': 'Decimal',
+    'Percentage': 'Decimal',
+    'Boolean': 'bool',
+    'UTCTimestamp': 'datetime',
+    'UTCTimeOnly': 'time',
+    'UTCDateOnly': 'date',
+    'LocalMktDate': 'date',
+}
+
+HEADER = '# Generated by pyfix.generator from %s%s, do not edit.'
+
+# what the generated code can refer to, only the names it does refer to are imported
+IMPORTS = [
+    ('datetime', ['date', 'datetime', 'time']),
+    ('decimal', ['Decimal']),
+    ('pyfix.message', ['parseBoolean', 'parseUTCTimestamp', 'parseUTCTimeOnly', 'parseDate']),
+    ('pyfix.message', ['formatBoolean', 'formatUTCTimestamp', 'formatUTCTimeOnly', 'formatDate']),
+    ('pyfix.typed', ['TypedGroup', 'TypedMessage']),
+]
+
+
+class Generator(object):
+    def __init__(self, dictionary):
+        self.dictionary = dictionary
+        self.groupNames = {}
+        self.usedNames = set()
+        # the names the generated code uses
+        self.referenced = set()
+        self.lines = []
+        # the encoder takes care of the header and trailer
+        trailer = [component for component in dictionary.components.values() if component.name == 'StandardTrailer']
+        self.excludedTags = set(dictionary.header_tags).union(*(component.index for component in trailer))
+
+    def _fields(self, entity):
+        # (tag, owning group or None) for the fields belonging directly to entity, in wire order
+        tags = iter(entity.index.items())
+        if isinstance(entity, GroupDef):
+            next(tags)  # NumInGroup, written by the enclosing message or group
+        for tag, owner in tags:
+            if tag in self.excludedTags:
+                continue
+            if owner is not entity and isinstance(owner, GroupDef):
+                yield tag, owner
+            else:
+                yield tag, None
+
+    def _groupName(self, group):
+        name = self.groupNames.get(group)
+        if name is None:
+            name = group.name
+            if name in self.usedNames:
+                name += 'Group'
+            self.usedNames.add(name)
+            self.groupNames[group] = name
+        return name
+
+    def _emitGroups(self, entity, emitted):
+        # groups have to be defined before anything referring to them
+        for tag, group in self._fields(entity):
+            if group is not None and group not in emitted:
+                emitted.add(group)
+                self._emitGroups(group, emitted)
+                self._emitClass(group, self._groupName(group), 'TypedGroup')
+
+    def _emitClass(self, entity, className, base, msgType=None):
+        fieldNames = self.dictionary.field_names
+        fieldTypes = self.dictionary.field_types
+        fields = list(self._fields(entity))
+        out = self.lines.append
+
+        self.referenced.add(base)
+        out('')
+        out('')
+        out('class %s(%s):' % (className, base))
+        out('    __slots__ = (')
+        for tag, group in fields:
+            out("        '%s'," % (fieldNames[tag], ))
+        out('    )')
+        out('')
+        for tag, group in fields:
+            annotation = 'list' if group is not None else datatypeAnnotations.get(fieldTypes[tag], 'str')
+            self.referenced.add(annotation)
+            out('    %s: %s' % (fieldNames[tag], annotation))
+        out('')
+        out('    fieldSpecs = {')
+        for tag, group in fields:
+            converter = datatypeConverters.get(fieldTypes[tag])
+            if group is None and converter is not None:
+                self.referenced.add(converter.__name__)
+            out("        %d: ('%s', %s, %s)," % (tag, fieldNames[tag], 'None' if group is not None or converter is None else converter.__name__,
+                                               self._groupName(group) if group is not None else 'None'))
+        out('    }')
+        out('')
+        out('    def __init__(self):')
+        if msgType is not None:
+            out("        %s.__init__(self, '%s')" % (base, msgType))
+        else:
+            out('        %s.__init__(self)' % (base, ))
+        for tag, group in fields:
+            out('        self.%s = None' % (fieldNames[tag], ))
+        out('')
+        out('    def encodeFields(self, buffer):')
+        for tag, group in fields:
+            out('        value = self.%s' % (fieldNames[tag], ))
+            out('        if value is not None:')
+            if group is not None:
+                out("            buffer += b'%d=%%d\\x01' %% (len(value), )" % (tag, ))
+                out('            for group in value:')
+                out('                group.encodeFields(buffer)')
+            else:
+                formatter = datatypeFormatters.get(fieldTypes[tag])
+                out("            buffer += b'%d='" % (tag, ))
+                if formatter is not None:
+                    self.referenced.add(formatter.__name__)
+                    out("            buffer += %s(value).encode('utf-8')" % (formatter.__name__, ))
+                else:
+                    out("            buffer += str(value).encode('utf-8')")
+                out("            buffer += b'\\x01'")
+        if base == 'TypedGroup':
+            # anything undeclared follows the declared fields, the delimiter has to stay first
+            out('        for tag, value in self.tags.items():')
+            out("            buffer += b'%d=%s\\x01' % (tag, str(value).encode('utf-8'))")
+        else:
+            out('        pass')
+
+    def generate(self, source, msgTypes=None):
+        messages = [message for msgType, message in sorted(self.dictionary.messages.items())
+                    if msgTypes is None or msgType in msgTypes]
+        self.lines = []
+        self.usedNames = set(message.name for message in messages)
+        self.groupNames = {}
+        self.referenced = set()
+        emitted = set()
+        for message in messages:
+            self._emitGroups(message, emitted)
+        for message in messages:
+            self._emitClass(message, message.name, 'TypedMessage', message.msg_type)
+
+        out = self.lines.append
+        out('')
+        out('')
+        out('messageClasses = {')
+        for message in messages:
+            out("    '%s': %s," % (message.msg_type, message.name))
+        out('}')
+        out('')
+        out('')
+        out('def fromMessage(msg):')
+        out('    """The typed version of msg, or msg itself when its type wasn\'t generated"""')
+        out('    cls = messageClasses.get(msg.msgType)')
+        out('    return cls.fromMessage(msg) if cls is not None else msg')
+
+        header = [HEADER % (source, '' if msgTypes is None else ' (msg types %s)' % (' '.join(msgTypes), ))]
+        for module, names in IMPORTS:
+            names = [name for name in names if name in self.referenced]
+            if names:
+                header.append('from %s import %s' % (module, ', '.join(names)))
+        return '\n'.join(header + [''] + self.lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate typed message classes from a FIX repository')
+    parser.add_argument('repository', help='FIX repository (orchestration) xml file')
+    parser.add_argument('output', help='python module to write')
+    parser.add_argument('-m', '--msgtype', dest='msgTypes', action='append', help='only generate this message type (repeatable)')
+    args = parser.parse_args()
+
+    dictionary = Dictionary(Orchestration(args.repository))
+    source = Generator(dictionary).generate(os.path.basename(args.repository), args.msgTypes)
+    with open(args.output, 'w') as f:
+        f.write(source)
+    logging.info("Wrote %s" % (args.output, ))
+
+
+if __name__ == '__main__':
+    main()
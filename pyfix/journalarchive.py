@@ -0,0 +1,74 @@
+"""Compressed segments the sqlite Journaler rolls its messages into.
+
+A segment holds the messages of one session up to the time it was rolled, in the order they were journalled, and is
+named after them:
+
+    <session>-<rolled at, YYYYMMDDHHMMSS UTC>-<first rowid>-<last rowid>.gz
+
+The rowids are those the messages had in the journal, which never reuses them, so segments and the messages still in
+the journal can be merged back into the order everything was journalled in. The segment is a gzip stream of entries:
+
+    entry = ENTRY(rowid, seqNo, direction, len(record))  record"""
+import calendar
+import gzip
+import os
+import struct
+import time
+
+ENTRY = struct.Struct('<qqbi')
+
+SUFFIX = '.gz'
+
+
+class ArchiveSegment(object):
+    def __init__(self, directory, name):
+        self.path = os.path.join(directory, name)
+        session, rolledAt, firstRowid, lastRowid = name[:-len(SUFFIX)].rsplit('-', 3)
+        self.session = session
+        self.rolledAt = calendar.timegm(time.strptime(rolledAt, '%Y%m%d%H%M%S'))
+        self.firstRowid = int(firstRowid)
+        self.lastRowid = int(lastRowid)
+
+    def entries(self, direction = None):
+        """(rowid, seqNo, direction value, record) of the messages in the segment"""
+        with gzip.open(self.path, 'rb') as f:
+            while True:
+                header = f.read(ENTRY.size)
+                if not header:
+                    return
+                rowid, seqNo, d, length = ENTRY.unpack(header)
+                record = f.read(length)
+                if direction is None or d == direction.value:
+                    yield rowid, seqNo, d, record
+
+
+def segments(directory):
+    """The segments in directory, oldest first"""
+    if directory is None or not os.path.isdir(directory):
+        return []
+    found = [ArchiveSegment(directory, name) for name in os.listdir(directory) if name.endswith(SUFFIX)]
+    return sorted(found, key=lambda segment: segment.firstRowid)
+
+
+def writeSegment(directory, session, rolledAt, rows):
+    """Write rows of (rowid, seqNo, direction value, record), in rowid order, to a new segment. Returns the segment,
+    or None if there were no rows. The segment only appears once it is complete and on disk."""
+    os.makedirs(directory, exist_ok=True)
+    tmpPath = os.path.join(directory, '%s.tmp' % (session, ))
+    firstRowid = lastRowid = None
+    with open(tmpPath, 'wb') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='wb') as f:
+            for rowid, seqNo, direction, record in rows:
+                if firstRowid is None:
+                    firstRowid = rowid
+                lastRowid = rowid
+                f.write(ENTRY.pack(rowid, seqNo, direction, len(record)))
+                f.write(record)
+        raw.flush()
+        os.fsync(raw.fileno())
+    if firstRowid is None:
+        os.remove(tmpPath)
+        return None
+    name = '%s-%s-%d-%d%s' % (session, time.strftime('%Y%m%d%H%M%S', time.gmtime(rolledAt)), firstRowid, lastRowid, SUFFIX)
+    os.replace(tmpPath, os.path.join(directory, name))
+    return ArchiveSegment(directory, name)
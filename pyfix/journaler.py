@@ -1,20 +1,245 @@
+import heapq
+import itertools
+import os
 import sqlite3
 import pickle
-from pyfix.message import MessageDirection
+import urllib.request
+from enum import Enum
+from pyfix import journalarchive
+from pyfix.clock import systemClock
+from pyfix.message import FIXMessageView, MessageDirection, _FIXRepeatingGroupContainer
+from pyfix.record import encodeRecord, encodeRawRecord, decodeRecord, decodeFrame, VERSION, RAW_VERSION
 from pyfix.session import FIXSession
 
 
+# messages read from the journal at a time when iterating over them
+CHUNK_SIZE = 1000
+
+# tags the sqlite journal indexes by default: ClOrdID, OrderID, MsgType and SendingTime
+DEFAULT_INDEX_TAGS = (11, 37, 35, 52)
+
+
 class DuplicateSeqNoError(Exception):
     pass
 
-class Journaler(object):
-    def __init__(self, filename = None):
+def loadMsg(data):
+    # journals written before the record format have pickled messages
+    if data[0] == VERSION or data[0] == RAW_VERSION:
+        return decodeRecord(data)
+    return pickle.loads(data)
+
+class DurabilityPolicy(Enum):
+    """When journalled messages are committed to disk.
+
+    SYNC_PER_MESSAGE: every message is committed (and fsynced) before persistMsg() returns. Nothing we have processed
+        or sent is lost in a crash, at the cost of an fsync per message.
+    SYNC_BEFORE_SEND: messages are committed together at the end of each event loop iteration and before anything is
+        written to the socket. Everything we have sent, and every inbound message we acted on in a way the peer could
+        see, is on disk; inbound messages received since the last send may be lost, and will be asked for again
+        with a resend request after a restart.
+    BATCHED: messages are committed at the end of each event loop iteration, or as soon as batchSize of them are
+        waiting. Messages sent in the iteration in which the process dies may be lost, so after a restart our
+        outbound MsgSeqNum can go back to a number the peer has already seen.
+    ASYNC: messages are committed every batchSize messages or batchInterval seconds, without waiting for the disk
+        (synchronous=OFF). Up to batchInterval of messages in both directions can be lost, on an OS crash
+        possibly more; after a restart both sequence numbers may need to be reset with the peer."""
+    SYNC_PER_MESSAGE = 0
+    SYNC_BEFORE_SEND = 1
+    BATCHED = 2
+    ASYNC = 3
+
+
+class JournalerBase(object):
+    """Group commit according to a DurabilityPolicy, shared by the journal backends.
+
+    Backends implement _persist() to store the record of a message, calling _written() after each one, and _sync() to
+    make everything written so far durable. The values of the indexTags of each message are passed to _persist() as
+    keys, a list of (tag, value), for backends which index them; only top level fields are keys, whether the message
+    is stored encoded or not."""
+    def __init__(self, durability = DurabilityPolicy.SYNC_PER_MESSAGE, batchSize = 1000, batchInterval = 0.1, clock = systemClock):
+        self.durability = durability
+        self.batchSize = batchSize
+        self.batchInterval = batchInterval
+        self.clock = clock
+        self.pendingCount = 0
+        self.pendingSince = None
+        self.indexTags = ()
+        # called when the first message of a batch is written (the engine uses it to commit after the event loop
+        # iteration)
+        self.batchStarted = None
+
+    def _persist(self, seqNo, record, session, direction, keys):
+        raise NotImplementedError()
+
+    def _sync(self):
+        raise NotImplementedError()
+
+    def setIndexTags(self, indexTags):
+        self.indexTags = tuple(int(tag) for tag in indexTags)
+
+    def _msgKeys(self, msg):
+        keys = []
+        for tag in self.indexTags:
+            if tag in msg:
+                value = msg[tag]
+                if type(value) is not _FIXRepeatingGroupContainer and type(value) is not list:
+                    keys.append((tag, str(value)))
+            elif tag == 35:
+                keys.append((tag, str(msg.msgType)))
+        return keys
+
+    def persistMsg(self, msg, session, direction):
+        frame = msg.frame() if isinstance(msg, FIXMessageView) else None
+        if frame is not None:
+            # a message as it was received is stored as it was received, without decoding the rest of it
+            self._persist(int(msg["34"]), encodeRawRecord(msg.msgType, frame), session, direction, self._msgKeys(msg))
+            return
+        self._persist(int(msg["34"]), encodeRecord(msg), session, direction, self._msgKeys(msg))
+
+    def persistFrame(self, seqNo, msgType, frame, session, direction):
+        """Store a message as it was encoded for the wire, it is only decoded again if it is recovered"""
+        # the top level fields, as for any other message, not the first occurrence of the tag which could be in a group
+        keys = self._msgKeys(decodeFrame(frame)) if self.indexTags else []
+        self._persist(seqNo, encodeRawRecord(msgType, frame), session, direction, keys)
+
+    def _written(self):
+        if self.durability == DurabilityPolicy.SYNC_PER_MESSAGE:
+            self._sync()
+            return
+        self.pendingCount += 1
+        if self.pendingCount == 1:
+            self.pendingSince = self.clock.monotonic()
+            if self.batchStarted is not None:
+                self.batchStarted()
+        if self.pendingCount >= self.batchSize:
+            self.commit()
+        elif self.durability == DurabilityPolicy.ASYNC and self.clock.monotonic() - self.pendingSince >= self.batchInterval:
+            self.commit()
+
+    def commit(self):
+        if self.pendingCount:
+            self._sync()
+            self.pendingCount = 0
+            self.pendingSince = None
+
+    def beforeSend(self):
+        """Called before messages are written to the socket"""
+        if self.durability == DurabilityPolicy.SYNC_BEFORE_SEND:
+            self.commit()
+
+    def endOfBatch(self):
+        """Called at the end of each event loop iteration in which messages were written"""
+        if self.durability == DurabilityPolicy.SYNC_BEFORE_SEND or self.durability == DurabilityPolicy.BATCHED:
+            self.commit()
+
+    def checkBatchInterval(self):
+        """Called periodically, commits anything older than batchInterval"""
+        if self.pendingCount and self.clock.monotonic() - self.pendingSince >= self.batchInterval:
+            self.commit()
+
+    def iterMsgs(self, session, direction, startSeqNo, endSeqNo, chunkSize = CHUNK_SIZE):
+        """The messages from startSeqNo to endSeqNo in order, read from the journal chunkSize at a time as they are
+        iterated over"""
+        raise NotImplementedError()
+
+    def iterAllMsgs(self, sessions = [], direction = None, chunkSize = CHUNK_SIZE):
+        """(seqNo, msg, direction value, session key) of every message in the order they were journalled, read
+        chunkSize at a time as they are iterated over"""
+        raise NotImplementedError()
+
+    def recoverMsgs(self, session, direction, startSeqNo, endSeqNo):
+        return list(self.iterMsgs(session, direction, startSeqNo, endSeqNo))
+
+    def getAllMsgs(self, sessions = [], direction = None):
+        return list(self.iterAllMsgs(sessions, direction))
+
+    def recoverMsg(self, session, direction, seqNo):
+        try:
+            msgs = self.recoverMsgs(session, direction, seqNo, seqNo)
+            return msgs[0]
+        except IndexError:
+            return None
+
+    def roll(self, sessions = None):
+        """Move the messages of sessions (all of them by default) out of the active journal into the archive"""
+        raise NotImplementedError()
+
+    def resetSeqNos(self, session):
+        """Start the seq nos of session again from 1. The messages journalled so far are no longer recovered or
+        checked for duplicates but are kept, getAllMsgs() still returns them."""
+        raise NotImplementedError()
+
+    def close(self):
+        self.commit()
+
+
+class Journaler(JournalerBase):
+    """Journal in a sqlite database.
+
+    roll() moves the messages of each session into a compressed segment in archiveDirectory (see journalarchive), which
+    keeps the database, and the cost of inserting into and querying it, down to the messages since the last roll; the
+    engine can roll every day (see FIXEngine). Segments are deleted retentionDays after they were rolled, until then
+    getAllMsgs() and iterAllMsgs() include them. Rolling doesn't end a session's sequence: iterMsgs() (and so resend
+    requests) and the duplicate seq no check also cover the archived messages of its current sequence, which are
+    those since resetSeqNos() was last called for it.
+
+    The values of indexTags are stored in the indexed message_key table as messages are journalled, queryMsgs() uses
+    it to find messages by them without decoding every message in the journal. The archive isn't indexed, so querying
+    it means decoding the segments of the sessions queried.
+
+    A readOnly journal opens an existing database without changing it, for looking at what is in it: nothing can be
+    journalled, and the messages of a roll which didn't finish are returned twice until the journal is opened to be
+    written to again, which removes them."""
+    def __init__(self, filename = None, durability = DurabilityPolicy.SYNC_PER_MESSAGE, batchSize = 1000, batchInterval = 0.1, clock = systemClock, archiveDirectory = None, retentionDays = None, indexTags = DEFAULT_INDEX_TAGS, readOnly = False):
+        JournalerBase.__init__(self, durability, batchSize, batchInterval, clock)
+        self.setIndexTags(indexTags)
+        if archiveDirectory is None and filename is not None:
+            archiveDirectory = filename + '.archive'
+        self.archiveDirectory = archiveDirectory
+        self.retentionDays = retentionDays
+        # a JournalWriter uses the connection from its own thread (never at the same time as anything else)
         if filename is None:
-            self.conn = sqlite3.connect(":memory:")
+            if readOnly:
+                raise ValueError("A read only journal needs a filename")
+            self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        elif readOnly:
+            self.conn = sqlite3.connect("file:%s?mode=ro" % (urllib.request.pathname2url(os.path.abspath(filename)), ), uri=True, check_same_thread=False)
         else:
-            self.conn = sqlite3.connect(filename)
+            self.conn = sqlite3.connect(filename, check_same_thread=False)
 
         self.cursor = self.conn.cursor()
+        if not readOnly:
+            self._createTables(filename, durability)
+
+        # the last seq no journalled in each direction of a session, kept here and written to the session table on commit
+        self.lastSeqNos = {}
+
+        # sqlite would reuse the rowids of rolled messages, so new messages get rowids after those in the archive
+        self.archivedRowid = 0
+        self.archiveSequences = {}
+        # a store from before archive_sequence, opened read only, doesn't have it
+        self.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'archive_sequence'")
+        if self.cursor.fetchone() is not None:
+            self.cursor.execute("SELECT session, direction, firstRowid, lastSeqNo FROM archive_sequence")
+            for session, direction, firstRowid, lastSeqNo in self.cursor.fetchall():
+                self.archiveSequences[(session, direction)] = (firstRowid, lastSeqNo)
+        # the archived seq nos of a direction of a session, read from the segments when they are first needed
+        self.archivedSeqNos = {}
+        for segment in journalarchive.segments(self.archiveDirectory):
+            if not readOnly:
+                # we may have stopped after writing the segment but before removing its messages from the journal
+                self._deleteMsgs(segment.session, segment.lastRowid)
+            self.archivedRowid = max(self.archivedRowid, segment.lastRowid)
+        self.conn.commit()
+
+    def _createTables(self, filename, durability):
+        if filename is not None and durability != DurabilityPolicy.SYNC_PER_MESSAGE:
+            # with a write ahead log a commit is a single append to the log rather than a rewrite of the pages
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            if durability == DurabilityPolicy.BATCHED:
+                self.cursor.execute("PRAGMA synchronous=NORMAL")
+            elif durability == DurabilityPolicy.ASYNC:
+                self.cursor.execute("PRAGMA synchronous=OFF")
         self.cursor.execute("CREATE TABLE IF NOT EXISTS message("
                                "seqNo INTEGER NOT NULL,"
                                "session TEXT NOT NULL,"
@@ -30,13 +255,30 @@ class Journaler(object):
                                "inboundSeqNo INTEGER DEFAULT 0,"
                                "UNIQUE (targetCompId, senderCompId))")
 
+        # resend requests look messages up by session and direction, which the primary key doesn't start with
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS message_session ON message(session, direction, seqNo)")
+        self.cursor.execute("CREATE TABLE IF NOT EXISTS message_key("
+                               "message INTEGER NOT NULL,"
+                               "tag INTEGER NOT NULL,"
+                               "value TEXT NOT NULL)")
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS message_key_value ON message_key(tag, value, message)")
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS message_key_message ON message_key(message)")
+        # what of the current sequence of each direction of a session has been rolled into the archive: the messages
+        # from firstRowid on, up to lastSeqNo
+        self.cursor.execute("CREATE TABLE IF NOT EXISTS archive_sequence("
+                               "session TEXT NOT NULL,"
+                               "direction INTEGER NOT NULL,"
+                               "firstRowid INTEGER NOT NULL,"
+                               "lastSeqNo INTEGER NOT NULL,"
+                               "PRIMARY KEY (session, direction))")
+
     def sessions(self):
         sessions = []
         self.cursor.execute("SELECT sessionId, targetCompId, senderCompId, outboundSeqNo, inboundSeqNo FROM session")
         for sessionInfo in self.cursor:
             session = FIXSession(sessionInfo[0], sessionInfo[1], sessionInfo[2])
-            session.sndSeqNum = sessionInfo[3]
-            session.nextExpectedMsgSeqNum = sessionInfo[4] + 1
+            session.sndSeqNum = self.lastSeqNos.get((session.key, MessageDirection.OUTBOUND), sessionInfo[3])
+            session.nextExpectedMsgSeqNum = self.lastSeqNos.get((session.key, MessageDirection.INBOUND), sessionInfo[4]) + 1
             sessions.append(session)
 
         return sessions
@@ -46,43 +288,61 @@ class Journaler(object):
         try:
             self.cursor.execute("INSERT INTO session(targetCompId, senderCompId) VALUES(?, ?)", (targetCompId, senderCompId))
             sessionId = self.cursor.lastrowid
+            self._checkpoint()
             self.conn.commit()
+            self.pendingCount = 0
+            self.pendingSince = None
             session = FIXSession(sessionId, targetCompId, senderCompId)
         except sqlite3.IntegrityError:
             raise RuntimeError("Session already exists for TargetCompId: %s SenderCompId: %s" % (targetCompId, senderCompId))
 
         return session
 
-    def persistMsg(self, msg, session, direction):
-        msgStr = pickle.dumps(msg)
-        seqNo = msg["34"]
+    def _persist(self, seqNo, record, session, direction, keys = ()):
+        archived = self.archiveSequences.get((str(session.key), direction.value))
+        if archived is not None and seqNo <= archived[1] and seqNo in self._archivedSeqNos(str(session.key), direction.value):
+            raise DuplicateSeqNoError("%s is a duplicate of an archived message" % (seqNo, ))
         try:
-            self.cursor.execute("INSERT INTO message VALUES(?, ?, ?, ?)", (seqNo, session.key, direction.value, msgStr))
-            if direction == MessageDirection.OUTBOUND:
-                self.cursor.execute("UPDATE session SET outboundSeqNo=?", (seqNo,))
-            elif direction == MessageDirection.INBOUND:
-                self.cursor.execute("UPDATE session SET inboundSeqNo=?", (seqNo,))
-
-            self.conn.commit()
+            self.cursor.execute("INSERT INTO message(rowid, seqNo, session, direction, msg) VALUES(MAX(?, (SELECT IFNULL(MAX(rowid), 0) FROM message)) + 1, ?, ?, ?, ?)", (self.archivedRowid, seqNo, session.key, direction.value, record))
         except sqlite3.IntegrityError as e:
             raise DuplicateSeqNoError("%s is a duplicate" % (seqNo, ))
+        if keys:
+            rowid = self.cursor.lastrowid
+            self.cursor.executemany("INSERT INTO message_key VALUES(?, ?, ?)", [(rowid, tag, value) for tag, value in keys])
+        self.lastSeqNos[(session.key, direction)] = seqNo
+        self._written()
 
-    def recoverMsg(self, session, direction, seqNo):
-        try:
-            msgs = self.recoverMsgs(session, direction, seqNo, seqNo)
-            return msgs[0]
-        except IndexError:
-            return None
+    def _checkpoint(self):
+        # the seq nos of the sessions journalled to since the last commit, in the same transaction as their messages
+        for (key, direction), seqNo in self.lastSeqNos.items():
+            if direction == MessageDirection.OUTBOUND:
+                self.cursor.execute("UPDATE session SET outboundSeqNo=? WHERE sessionId=?", (seqNo, key))
+            else:
+                self.cursor.execute("UPDATE session SET inboundSeqNo=? WHERE sessionId=?", (seqNo, key))
+        self.lastSeqNos.clear()
 
-    def recoverMsgs(self, session, direction, startSeqNo, endSeqNo):
-        self.cursor.execute("SELECT msg FROM message WHERE session = ? AND direction = ? AND seqNo >= ? AND seqNo <= ? ORDER BY seqNo", (session.key, direction.value, startSeqNo, endSeqNo))
-        msgs = []
-        for msg in self.cursor:
-            msgs.append(pickle.loads(msg[0]))
-        return msgs
+    def _sync(self):
+        self._checkpoint()
+        self.conn.commit()
 
-    def getAllMsgs(self, sessions = [], direction = None):
-        sql = "SELECT seqNo, msg, direction, session FROM message"
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def iterMsgs(self, session, direction, startSeqNo, endSeqNo, chunkSize = CHUNK_SIZE):
+        # a cursor of its own, so messages can be journalled while this is being iterated over
+        rows = self._rows("SELECT seqNo, msg FROM message WHERE session = ? AND direction = ? AND seqNo >= ? AND seqNo <= ? ORDER BY seqNo", (session.key, direction.value, startSeqNo, endSeqNo), chunkSize)
+        archived = self.archiveSequences.get((str(session.key), direction.value))
+        if archived is not None and startSeqNo <= archived[1]:
+            # a direction of a sequence is journalled in seq no order, so the archived messages are merged with the
+            # rows as they are read, and reading the archive stops at the end of the range
+            entries = ((seqNo, record) for rowid, seqNo, record in self._archivedEntries(str(session.key), direction.value) if startSeqNo <= seqNo)
+            rows = heapq.merge(itertools.takewhile(lambda entry: entry[0] <= endSeqNo, entries), rows, key=lambda row: row[0])
+        for seqNo, record in rows:
+            yield loadMsg(record)
+
+    def iterAllMsgs(self, sessions = [], direction = None, chunkSize = CHUNK_SIZE):
+        sql = "SELECT rowid, seqNo, direction, msg, session FROM message"
         clauses = []
         args = []
         if sessions is not None and len(sessions) != 0:
@@ -97,9 +357,169 @@ class Journaler(object):
 
         sql = sql + " ORDER BY rowid"
 
-        self.cursor.execute(sql, tuple(args))
-        msgs = []
-        for msg in self.cursor:
-            msgs.append((msg[0], pickle.loads(msg[1]), msg[2], msg[3]))
+        streams = [self._rows(sql, args, chunkSize)]
+        for segment in journalarchive.segments(self.archiveDirectory):
+            if sessions is None or len(sessions) == 0 or segment.session in [str(s) for s in sessions]:
+                streams.append(self._segmentRows(segment, direction))
+        for rowid, seqNo, d, record, session in heapq.merge(*streams, key=lambda row: row[0]):
+            yield (seqNo, loadMsg(record), d, session)
+
+    def _rows(self, sql, args, chunkSize):
+        cursor = self.conn.cursor()
+        cursor.execute(sql, tuple(args))
+        try:
+            rows = cursor.fetchmany(chunkSize)
+            while rows:
+                yield from rows
+                rows = cursor.fetchmany(chunkSize)
+        finally:
+            cursor.close()
+
+    def queryMsgs(self, keys = {}, ranges = {}, sessions = [], direction = None, chunkSize = CHUNK_SIZE, archived = True):
+        """(seqNo, msg, direction value, session key) of the messages which have the value given in keys (tag ->
+        value) for each tag, and a value between low and high (inclusive) in ranges (tag -> (low, high), either can be
+        None) for each tag, in the order they were journalled. The tags have to be indexTags,
+        e.g. queryMsgs({35: "D"}, {52: ("20150619-09:00:00", "20150619-10:00:00")})
+
+        The active journal is looked up in its index. Archived segments aren't indexed, every message in those of
+        the sessions asked for is decoded and checked, unless archived is False to only query the messages since
+        the last roll."""
+        clauses = []
+        args = []
+        for tag, value in keys.items():
+            self._checkIndexed(tag)
+            clauses.append("rowid IN (SELECT message FROM message_key WHERE tag = ? AND value = ?)")
+            args.extend((int(tag), str(value)))
+        for tag, (low, high) in ranges.items():
+            self._checkIndexed(tag)
+            clause = "rowid IN (SELECT message FROM message_key WHERE tag = ?"
+            args.append(int(tag))
+            if low is not None:
+                clause += " AND value >= ?"
+                args.append(str(low))
+            if high is not None:
+                clause += " AND value <= ?"
+                args.append(str(high))
+            clauses.append(clause + ")")
+        if sessions is not None and len(sessions) != 0:
+            clauses.append("session in (" + ','.join('?'*len(sessions)) + ")")
+            args.extend(sessions)
+        if direction is not None:
+            clauses.append("direction = ?")
+            args.append(direction.value)
+
+        sql = "SELECT rowid, seqNo, direction, msg, session FROM message"
+        if clauses:
+            sql = sql + " WHERE " + " AND ".join(clauses)
+        sql = sql + " ORDER BY rowid"
+        streams = [self._rows(sql, args, chunkSize)]
+        if archived:
+            for segment in journalarchive.segments(self.archiveDirectory):
+                if sessions is None or len(sessions) == 0 or segment.session in [str(s) for s in sessions]:
+                    streams.append(self._matchingRows(self._segmentRows(segment, direction), keys, ranges))
+        for rowid, seqNo, d, record, session in heapq.merge(*streams, key=lambda row: row[0]):
+            yield (seqNo, loadMsg(record), d, session)
+
+    def _matchingRows(self, rows, keys, ranges):
+        # what the index does for the active journal, on the decoded messages
+        for row in rows:
+            msgKeys = dict(self._msgKeys(loadMsg(row[3])))
+            if all(msgKeys.get(int(tag)) == str(value) for tag, value in keys.items()) and \
+                    all(int(tag) in msgKeys and (low is None or msgKeys[int(tag)] >= str(low)) and (high is None or msgKeys[int(tag)] <= str(high)) for tag, (low, high) in ranges.items()):
+                yield row
+
+    def indexMsgs(self, chunkSize = CHUNK_SIZE):
+        """Index the messages which were journalled before the journal had indexes, returns how many there were"""
+        self.commit()
+        count = 0
+        lastRowid = 0
+        while True:
+            # a chunk at a time, as the index is written to while going through the messages
+            self.cursor.execute("SELECT rowid, msg FROM message WHERE rowid > ? AND rowid NOT IN (SELECT message FROM message_key) ORDER BY rowid LIMIT ?", (lastRowid, chunkSize))
+            rows = self.cursor.fetchall()
+            if not rows:
+                return count
+            for rowid, record in rows:
+                keys = self._msgKeys(loadMsg(record))
+                self.cursor.executemany("INSERT INTO message_key VALUES(?, ?, ?)", [(rowid, tag, value) for tag, value in keys])
+            self.conn.commit()
+            count += len(rows)
+            lastRowid = rows[-1][0]
+
+    def _checkIndexed(self, tag):
+        if int(tag) not in self.indexTags:
+            raise ValueError("Tag %s isn't indexed, the journal indexes %s" % (tag, ", ".join(str(t) for t in self.indexTags)))
+
+    def _archivedEntries(self, session, direction):
+        # (rowid, seqNo, record) of the archived messages of the current sequence of a direction of a session
+        firstRowid, lastSeqNo = self.archiveSequences[(session, direction)]
+        for segment in journalarchive.segments(self.archiveDirectory):
+            if segment.session == session and segment.lastRowid >= firstRowid:
+                for rowid, seqNo, d, record in segment.entries():
+                    if d == direction and rowid >= firstRowid:
+                        yield rowid, seqNo, record
+
+    def _archivedSeqNos(self, session, direction):
+        seqNos = self.archivedSeqNos.get((session, direction))
+        if seqNos is None:
+            seqNos = self.archivedSeqNos[(session, direction)] = set(seqNo for rowid, seqNo, record in self._archivedEntries(session, direction))
+        return seqNos
+
+    def _deleteMsgs(self, session, lastRowid):
+        # the archive now has these messages of the current sequence
+        self.cursor.execute("SELECT direction, MIN(rowid), MAX(seqNo) FROM message WHERE session = ? AND rowid <= ? GROUP BY direction", (session, lastRowid))
+        for direction, firstRowid, lastSeqNo in self.cursor.fetchall():
+            archived = self.archiveSequences.get((session, direction))
+            if archived is not None:
+                firstRowid, lastSeqNo = archived[0], max(archived[1], lastSeqNo)
+            self.archiveSequences[(session, direction)] = (firstRowid, lastSeqNo)
+            self.archivedSeqNos.pop((session, direction), None)
+            self.cursor.execute("INSERT OR REPLACE INTO archive_sequence VALUES(?, ?, ?, ?)", (session, direction, firstRowid, lastSeqNo))
+        self.cursor.execute("DELETE FROM message_key WHERE message IN (SELECT rowid FROM message WHERE session = ? AND rowid <= ?)", (session, lastRowid))
+        self.cursor.execute("DELETE FROM message WHERE session = ? AND rowid <= ?", (session, lastRowid))
+
+    def _segmentRows(self, segment, direction):
+        for rowid, seqNo, d, record in segment.entries(direction):
+            yield (rowid, seqNo, d, record, segment.session)
+
+    def roll(self, sessions = None, chunkSize = CHUNK_SIZE):
+        if self.archiveDirectory is None:
+            raise RuntimeError("There is no archive directory to roll the journal into")
+        self.commit()
+        rolledAt = self.clock.time()
+        if sessions is None:
+            self.cursor.execute("SELECT DISTINCT session FROM message")
+            sessions = [row[0] for row in self.cursor.fetchall()]
+        else:
+            # keys are stored as text
+            sessions = [str(session) for session in sessions]
+        for session in sessions:
+            rows = self._rows("SELECT rowid, seqNo, direction, msg FROM message WHERE session = ? ORDER BY rowid", (session, ), chunkSize)
+            segment = journalarchive.writeSegment(self.archiveDirectory, session, rolledAt, rows)
+            if segment is not None:
+                self._deleteMsgs(session, segment.lastRowid)
+                self.conn.commit()
+                self.archivedRowid = max(self.archivedRowid, segment.lastRowid)
+        self.expireArchives()
+
+    def resetSeqNos(self, session):
+        if self.archiveDirectory is None:
+            raise RuntimeError("There is no archive directory to keep the messages of the old sequence in")
+        key = str(session.key)
+        self.roll([key])
+        self.cursor.execute("DELETE FROM archive_sequence WHERE session = ?", (key, ))
+        for direction in MessageDirection:
+            self.archiveSequences.pop((key, direction.value), None)
+            self.archivedSeqNos.pop((key, direction.value), None)
+            self.lastSeqNos[(session.key, direction)] = 0
+        self._checkpoint()
+        self.conn.commit()
 
-        return msgs
\ No newline at end of file
+    def expireArchives(self):
+        """Delete the segments rolled more than retentionDays ago"""
+        if self.retentionDays is None:
+            return
+        expiry = self.clock.time() - self.retentionDays * 24 * 60 * 60
+        for segment in journalarchive.segments(self.archiveDirectory):
+            if segment.rolledAt < expiry:
+                os.remove(segment.path)
@@ -0,0 +1,188 @@
+"""Journalling on a thread of its own, so the event loop doesn't wait for the disk.
+
+JournalWriter wraps a journal backend (Journaler or LogJournaler) and has the same interface. Messages are encoded
+into records on the calling thread and put on a bounded queue; the writer thread stores them in batches of up to
+batchSize and commits after each batch. When the queue is full the caller waits for the writer to catch up.
+
+The durability policy of the backend decides when the event loop waits for the writer:
+
+    SYNC_PER_MESSAGE: persistMsg() returns once the message is committed
+    SYNC_BEFORE_SEND: beforeSend() waits for everything queued so far, so nothing is sent before it is on disk
+    BATCHED, ASYNC:   never; messages queued when the process dies are lost like an uncommitted batch would be
+
+close() writes and commits everything still queued. persistMsg() raises DuplicateSeqNoError for a duplicate seq no
+where the plain backend would before the message is handled: under SYNC_PER_MESSAGE, and for inbound messages under
+SYNC_BEFORE_SEND, it waits for the writer to store the message. Otherwise the writer stores messages after
+persistMsg() returns and logs duplicates instead."""
+import itertools
+import logging
+import queue
+import threading
+from pyfix.journaler import JournalerBase, DurabilityPolicy, DuplicateSeqNoError, CHUNK_SIZE
+from pyfix.message import MessageDirection
+
+DEFAULT_QUEUE_SIZE = 10000
+
+# how often a caller waiting for room in the queue checks the writer is still running
+PUT_TIMEOUT = 0.5
+
+
+class JournalWriterError(Exception):
+    pass
+
+
+class JournalWriter(JournalerBase):
+    def __init__(self, journaler, queueSize = DEFAULT_QUEUE_SIZE):
+        JournalerBase.__init__(self, journaler.durability, journaler.batchSize, journaler.batchInterval, journaler.clock)
+        self.journaler = journaler
+        self.setIndexTags(journaler.indexTags)
+        self.queue = queue.Queue(queueSize)
+        # held by the writer while it uses the backend, and by anything reading from it
+        self.lock = threading.Lock()
+        self.written = threading.Condition()
+        self.submittedCount = 0
+        self.writtenCount = 0
+        self.error = None
+        # the DuplicateSeqNoError of the message a caller is waiting for
+        self.duplicate = None
+        self.thread = threading.Thread(target=self._run, name="JournalWriter", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asynchronous = self.durability == DurabilityPolicy.ASYNC
+        stopping = False
+        while not stopping:
+            try:
+                batch = [self.queue.get(timeout=self.batchInterval if asynchronous else None)]
+            except queue.Empty:
+                with self.lock:
+                    self.journaler.checkBatchInterval()
+                continue
+            while len(batch) < self.batchSize:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self.lock:
+                    for entry in batch:
+                        if entry is None:
+                            stopping = True
+                            continue
+                        persistArgs, report = entry
+                        try:
+                            self.journaler._persist(*persistArgs)
+                        except DuplicateSeqNoError as why:
+                            if report:
+                                self.duplicate = why
+                            else:
+                                logging.error("Failed to journal message with a duplicate seq no: %s" % (why, ))
+                    if asynchronous and not stopping:
+                        self.journaler.checkBatchInterval()
+                    else:
+                        self.journaler.commit()
+            except Exception as why:
+                logging.exception("Journal writer failed")
+                with self.written:
+                    self.error = why
+                    self.written.notify_all()
+                return
+            with self.written:
+                self.writtenCount += len(batch)
+                self.written.notify_all()
+
+    def _checkError(self):
+        if self.error is not None:
+            raise JournalWriterError("Journal writer failed: %s" % (self.error, )) from self.error
+
+    def _put(self, entry):
+        self._checkError()
+        # a writer which has stopped would never make room in a full queue
+        while True:
+            try:
+                self.queue.put(entry, timeout=PUT_TIMEOUT)
+                break
+            except queue.Full:
+                self._checkError()
+                if not self.thread.is_alive():
+                    raise JournalWriterError("Journal writer has stopped")
+        self.submittedCount += 1
+
+    def _persist(self, seqNo, record, session, direction, keys = ()):
+        # an inbound duplicate is a message we have already handled, the caller has to know before handling it again
+        report = self.durability == DurabilityPolicy.SYNC_PER_MESSAGE or (self.durability == DurabilityPolicy.SYNC_BEFORE_SEND and direction == MessageDirection.INBOUND)
+        self._put(((seqNo, record, session, direction, keys), report))
+        if report:
+            self.commit()
+            duplicate, self.duplicate = self.duplicate, None
+            if duplicate is not None:
+                raise duplicate
+
+    def commit(self):
+        """Wait until everything queued so far has been stored and committed"""
+        with self.written:
+            while self.writtenCount < self.submittedCount and self.error is None:
+                self.written.wait()
+        self._checkError()
+
+    def beforeSend(self):
+        if self.durability == DurabilityPolicy.SYNC_BEFORE_SEND:
+            self.commit()
+
+    def endOfBatch(self):
+        # the writer commits each batch
+        pass
+
+    def checkBatchInterval(self):
+        pass
+
+    def sessions(self):
+        with self.lock:
+            return self.journaler.sessions()
+
+    def createSession(self, targetCompId, senderCompId):
+        with self.lock:
+            return self.journaler.createSession(targetCompId, senderCompId)
+
+    def _iterLocked(self, msgs, chunkSize):
+        # the backend is only used with the lock held, a chunk at a time
+        while True:
+            with self.lock:
+                chunk = list(itertools.islice(msgs, chunkSize))
+            if not chunk:
+                return
+            yield from chunk
+
+    def iterMsgs(self, session, direction, startSeqNo, endSeqNo, chunkSize = CHUNK_SIZE):
+        # include everything that has been queued
+        self.commit()
+        return self._iterLocked(self.journaler.iterMsgs(session, direction, startSeqNo, endSeqNo, chunkSize), chunkSize)
+
+    def iterAllMsgs(self, sessions = [], direction = None, chunkSize = CHUNK_SIZE):
+        self.commit()
+        return self._iterLocked(self.journaler.iterAllMsgs(sessions, direction, chunkSize), chunkSize)
+
+    def queryMsgs(self, keys = {}, ranges = {}, sessions = [], direction = None, chunkSize = CHUNK_SIZE, archived = True):
+        self.commit()
+        return self._iterLocked(self.journaler.queryMsgs(keys, ranges, sessions, direction, chunkSize, archived), chunkSize)
+
+    def roll(self, sessions = None):
+        self.commit()
+        with self.lock:
+            self.journaler.roll(sessions)
+
+    def resetSeqNos(self, session):
+        self.commit()
+        with self.lock:
+            self.journaler.resetSeqNos(session)
+
+    def close(self):
+        if self.thread.is_alive():
+            try:
+                self._put(None)
+            except JournalWriterError:
+                pass
+            self.thread.join()
+        with self.lock:
+            self.journaler.close()
+        self._checkError()
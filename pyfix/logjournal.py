@@ -0,0 +1,306 @@
+"""Append-only journal backend, an alternative to the sqlite Journaler with the same interface.
+
+Each session and direction is a stream of segments in the journal directory:
+
+    sessions                    one line per session: key, TargetCompID, SenderCompID
+    <session>-<in|out>/N.log    the records (see pyfix.record) back to back
+    <session>-<in|out>/N.idx    fixed width entries of (seqNo, offset, length, serial) for each record in N.log
+    <session>-<in|out>/N.reset  empty, the seq nos were reset before segment N: the segments before it are only kept
+                                for getAllMsgs(), they aren't recovered or checked for duplicates any more
+
+Storing a message is two buffered writes, nothing is read back. The index of every segment is kept in memory and the
+logs are memory mapped, so recovering a range of messages is a binary search and a single slice of the mapping.
+serial numbers every message in the journal, getAllMsgs() uses it to return them in the order they were stored."""
+import bisect
+import heapq
+import itertools
+import logging
+import mmap
+import os
+import struct
+from array import array
+from pyfix.clock import systemClock
+from pyfix.journaler import JournalerBase, DurabilityPolicy, DuplicateSeqNoError, CHUNK_SIZE
+from pyfix.message import MessageDirection
+from pyfix.record import decodeRecord
+from pyfix.session import FIXSession
+
+INDEX_ENTRY = struct.Struct('<qqiq')
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+
+
+class _Segment(object):
+    def __init__(self, path):
+        self.logPath = path + '.log'
+        self.indexPath = path + '.idx'
+        self.seqNos = array('q')
+        self.offsets = array('q')
+        self.lengths = array('q')
+        self.serials = array('q')
+        self.logFile = None
+        self.indexFile = None
+        self.size = 0
+        self.map = None
+
+    def load(self):
+        size = os.path.getsize(self.logPath) if os.path.exists(self.logPath) else 0
+        if os.path.exists(self.indexPath):
+            with open(self.indexPath, 'rb') as f:
+                data = f.read()
+            # a crash can leave half an index entry, or entries for records which never made it to the log
+            data = data[:len(data) - len(data) % INDEX_ENTRY.size]
+            for seqNo, offset, length, serial in INDEX_ENTRY.iter_unpack(data):
+                if offset + length > size:
+                    logging.warning("Ignoring truncated record %s in %s" % (seqNo, self.logPath))
+                    break
+                self.seqNos.append(seqNo)
+                self.offsets.append(offset)
+                self.lengths.append(length)
+                self.serials.append(serial)
+        self.size = size
+
+    def openForAppend(self):
+        self.logFile = open(self.logPath, 'ab')
+        self.indexFile = open(self.indexPath, 'ab')
+        # drop anything after the last complete entry
+        self.indexFile.truncate(len(self.seqNos) * INDEX_ENTRY.size)
+        self.size = self.logFile.tell()
+
+    def append(self, seqNo, record, serial):
+        offset = self.size
+        self.logFile.write(record)
+        self.indexFile.write(INDEX_ENTRY.pack(seqNo, offset, len(record), serial))
+        self.size += len(record)
+        self.seqNos.append(seqNo)
+        self.offsets.append(offset)
+        self.lengths.append(len(record))
+        self.serials.append(serial)
+
+    def sync(self, fsync):
+        self.logFile.flush()
+        self.indexFile.flush()
+        if fsync:
+            os.fsync(self.logFile.fileno())
+            os.fsync(self.indexFile.fileno())
+
+    def find(self, seqNo):
+        i = bisect.bisect_left(self.seqNos, seqNo)
+        return i if i < len(self.seqNos) and self.seqNos[i] == seqNo else -1
+
+    def _read(self, start, end):
+        # the records of entries start up to end, which are back to back in the log
+        if self.logFile is not None:
+            self.logFile.flush()
+        offset = self.offsets[start]
+        last = self.offsets[end - 1] + self.lengths[end - 1]
+        if self.map is None or len(self.map) < last:
+            if self.map is not None:
+                self.map.close()
+            with open(self.logPath, 'rb') as f:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return offset, self.map[offset:last]
+
+    def records(self, startSeqNo, endSeqNo, chunkSize):
+        """(seqNo, serial, record) for the entries with startSeqNo <= seqNo <= endSeqNo, a slice of chunkSize records
+        at a time"""
+        start = bisect.bisect_left(self.seqNos, startSeqNo)
+        end = bisect.bisect_right(self.seqNos, endSeqNo)
+        while start < end:
+            chunkEnd = min(start + chunkSize, end)
+            base, data = self._read(start, chunkEnd)
+            view = memoryview(data)
+            for i in range(start, chunkEnd):
+                yield (self.seqNos[i], self.serials[i], view[self.offsets[i] - base:self.offsets[i] - base + self.lengths[i]])
+            start = chunkEnd
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.logFile is not None:
+            self.logFile.close()
+            self.indexFile.close()
+            self.logFile = self.indexFile = None
+
+
+class _Stream(object):
+    # the segments holding one direction of a session, each segment's seqNos are increasing. The current sequence is
+    # in the segments numbered from start on (those from segments[first] on)
+    def __init__(self, directory, segmentSize):
+        self.directory = directory
+        self.segmentSize = segmentSize
+        self.segments = []
+        self.start = 0
+        if os.path.isdir(directory):
+            names = os.listdir(directory)
+            self.start = max((int(name[:-6]) for name in names if name.endswith('.reset')), default=0)
+            for number in sorted(int(name[:-4]) for name in names if name.endswith('.log')):
+                segment = _Segment(os.path.join(directory, '%08d' % (number, )))
+                segment.load()
+                self.segments.append(segment)
+        self.first = len([segment for segment in self.segments if self._number(segment) < self.start])
+        self.lastSeqNo = 0
+        for segment in reversed(self.segments[self.first:]):
+            if segment.seqNos:
+                self.lastSeqNo = segment.seqNos[-1]
+                break
+        self.dirty = False
+
+    def _number(self, segment):
+        return int(os.path.basename(segment.logPath)[:-4])
+
+    def lastSerial(self):
+        return max((segment.serials[-1] for segment in self.segments if segment.serials), default=0)
+
+    def contains(self, seqNo):
+        return any(segment.find(seqNo) >= 0 for segment in self.segments[self.first:])
+
+    def _closeLast(self):
+        segment = self.segments[-1] if self.segments else None
+        if segment is not None and segment.logFile is not None:
+            segment.sync(False)
+            segment.logFile.close()
+            segment.indexFile.close()
+            segment.logFile = segment.indexFile = None
+
+    def append(self, seqNo, record, serial):
+        segment = self.segments[-1] if len(self.segments) > self.first else None
+        if segment is None or segment.size >= self.segmentSize or (segment.seqNos and seqNo <= segment.seqNos[-1]):
+            os.makedirs(self.directory, exist_ok=True)
+            self._closeLast()
+            number = max(self._number(self.segments[-1]) + 1, self.start) if self.segments else self.start
+            segment = _Segment(os.path.join(self.directory, '%08d' % (number, )))
+            self.segments.append(segment)
+        if segment.logFile is None:
+            segment.openForAppend()
+        segment.append(seqNo, record, serial)
+        self.lastSeqNo = seqNo
+        self.dirty = True
+
+    def sync(self, fsync):
+        if self.dirty:
+            self.segments[-1].sync(fsync)
+            self.dirty = False
+
+    def reset(self, fsync):
+        # the segments so far are kept, the next message starts a segment of its own after the marker
+        self.lastSeqNo = 0
+        if not self.segments:
+            return
+        self._closeLast()
+        self.dirty = False
+        self.start = self._number(self.segments[-1]) + 1
+        self.first = len(self.segments)
+        with open(os.path.join(self.directory, '%08d.reset' % (self.start, )), 'wb') as f:
+            if fsync:
+                os.fsync(f.fileno())
+
+    def records(self, startSeqNo, endSeqNo, chunkSize):
+        segments = self.segments[self.first:]
+        if len(segments) == 1:
+            return segments[0].records(startSeqNo, endSeqNo, chunkSize)
+        return heapq.merge(*[segment.records(startSeqNo, endSeqNo, chunkSize) for segment in segments], key=lambda entry: entry[0])
+
+    def allRecords(self, chunkSize):
+        # every segment, including those from before a reset, in the order they were written
+        return itertools.chain.from_iterable(segment.records(0, 2 ** 62, chunkSize) for segment in self.segments)
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+
+
+class LogJournaler(JournalerBase):
+    def __init__(self, directory, durability = DurabilityPolicy.SYNC_PER_MESSAGE, batchSize = 1000, batchInterval = 0.1, clock = systemClock, segmentSize = DEFAULT_SEGMENT_SIZE):
+        JournalerBase.__init__(self, durability, batchSize, batchInterval, clock)
+        if directory is None:
+            raise ValueError("LogJournaler needs a directory")
+        self.directory = directory
+        self.segmentSize = segmentSize
+        os.makedirs(directory, exist_ok=True)
+        self.sessionsPath = os.path.join(directory, 'sessions')
+        self.sessionInfo = []
+        if os.path.exists(self.sessionsPath):
+            with open(self.sessionsPath) as f:
+                for line in f:
+                    key, targetCompId, senderCompId = line.rstrip('\n').split('\t')
+                    self.sessionInfo.append((int(key), targetCompId, senderCompId))
+        self.streams = {}
+        self.serial = 0
+        for key, targetCompId, senderCompId in self.sessionInfo:
+            for direction in MessageDirection:
+                self.serial = max(self.serial, self._stream(key, direction).lastSerial())
+
+    def _stream(self, key, direction):
+        stream = self.streams.get((key, direction))
+        if stream is None:
+            name = "%s-%s" % (key, 'in' if direction == MessageDirection.INBOUND else 'out')
+            stream = self.streams[(key, direction)] = _Stream(os.path.join(self.directory, name), self.segmentSize)
+        return stream
+
+    def sessions(self):
+        sessions = []
+        for key, targetCompId, senderCompId in self.sessionInfo:
+            session = FIXSession(key, targetCompId, senderCompId)
+            session.sndSeqNum = self._stream(key, MessageDirection.OUTBOUND).lastSeqNo
+            session.nextExpectedMsgSeqNum = self._stream(key, MessageDirection.INBOUND).lastSeqNo + 1
+            sessions.append(session)
+        return sessions
+
+    def createSession(self, targetCompId, senderCompId):
+        for key, target, sender in self.sessionInfo:
+            if target == targetCompId and sender == senderCompId:
+                raise RuntimeError("Session already exists for TargetCompId: %s SenderCompId: %s" % (targetCompId, senderCompId))
+        key = max((info[0] for info in self.sessionInfo), default=0) + 1
+        self.sessionInfo.append((key, targetCompId, senderCompId))
+        tmpPath = self.sessionsPath + '.tmp'
+        with open(tmpPath, 'w') as f:
+            for info in self.sessionInfo:
+                f.write("%s\t%s\t%s\n" % info)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmpPath, self.sessionsPath)
+        return FIXSession(key, targetCompId, senderCompId)
+
+    def _persist(self, seqNo, record, session, direction, keys = ()):
+        stream = self._stream(session.key, direction)
+        if seqNo <= stream.lastSeqNo and stream.contains(seqNo):
+            raise DuplicateSeqNoError("%s is a duplicate" % (seqNo, ))
+        self.serial += 1
+        stream.append(seqNo, record, self.serial)
+        self._written()
+
+    def _sync(self):
+        fsync = self.durability != DurabilityPolicy.ASYNC
+        for stream in self.streams.values():
+            stream.sync(fsync)
+
+    def resetSeqNos(self, session):
+        self.commit()
+        self._sync()
+        for direction in MessageDirection:
+            self._stream(session.key, direction).reset(self.durability != DurabilityPolicy.ASYNC)
+
+    def iterMsgs(self, session, direction, startSeqNo, endSeqNo, chunkSize = CHUNK_SIZE):
+        for seqNo, serial, record in self._stream(session.key, direction).records(startSeqNo, endSeqNo, chunkSize):
+            yield decodeRecord(record)
+
+    def iterAllMsgs(self, sessions = [], direction = None, chunkSize = CHUNK_SIZE):
+        keys = [info[0] for info in self.sessionInfo]
+        if sessions is not None and len(sessions) != 0:
+            keys = [key for key in keys if str(key) in [str(s) for s in sessions]]
+        directions = list(MessageDirection) if direction is None else [direction]
+        streams = [self._allRecords(key, d, chunkSize) for key in keys for d in directions]
+        for serial, seqNo, record, d, key in heapq.merge(*streams, key=lambda entry: entry[0]):
+            yield (seqNo, decodeRecord(record), d, key)
+
+    def _allRecords(self, key, direction, chunkSize):
+        for seqNo, serial, record in self._stream(key, direction).allRecords(chunkSize):
+            yield (serial, seqNo, record, direction.value, key)
+
+    def close(self):
+        self.commit()
+        self._sync()
+        for stream in self.streams.values():
+            stream.close()
@@ -1,50 +1,345 @@
-from collections import OrderedDict
+from collections.abc import MutableMapping
+from datetime import date, datetime, time
+from decimal import Decimal
 from enum import Enum
 
 class MessageDirection(Enum):
     INBOUND = 0
     OUTBOUND = 1
 
+def parseBoolean(value):
+    return value == 'Y'
+
+def parseUTCTimestamp(value):
+    # YYYYMMDD-HH:MM:SS[.sss]
+    return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]), int(value[9:11]), int(value[12:14]), int(value[15:17]),
+                    int(value[18:21]) * 1000 if len(value) > 17 else 0)
+
+def parseUTCTimeOnly(value):
+    # HH:MM:SS[.sss]
+    return time(int(value[0:2]), int(value[3:5]), int(value[6:8]), int(value[9:12]) * 1000 if len(value) > 8 else 0)
+
+def parseDate(value):
+    # YYYYMMDD
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+def formatBoolean(value):
+    if type(value) is str:
+        return value
+    return 'Y' if value else 'N'
+
+def formatUTCTimestamp(value):
+    if type(value) is str:
+        return value
+    return "%s.%03d" % (value.strftime("%Y%m%d-%H:%M:%S"), value.microsecond // 1000)
+
+def formatUTCTimeOnly(value):
+    if type(value) is str:
+        return value
+    return "%s.%03d" % (value.strftime("%H:%M:%S"), value.microsecond // 1000)
+
+def formatDate(value):
+    if type(value) is str:
+        return value
+    return value.strftime("%Y%m%d")
+
+# converters for the datatypes in the FIX repository, anything not listed here stays a string
+datatypeConverters = {
+    'int': int,
+    'Length': int,
+    'NumInGroup': int,
+    'SeqNum': int,
+    'TagNum': int,
+    'DayOfMonth': int,
+    'float': Decimal,
+    'Qty': Decimal,
+    'Price': Decimal,
+    'PriceOffset': Decimal,
+    'Amt': Decimal,
+    'Percentage': Decimal,
+    'Boolean': parseBoolean,
+    'UTCTimestamp': parseUTCTimestamp,
+    'UTCTimeOnly': parseUTCTimeOnly,
+    'UTCDateOnly': parseDate,
+    'LocalMktDate': parseDate,
+}
+
+# the reverse of datatypeConverters where str() doesn't produce the wire format
+datatypeFormatters = {
+    'Boolean': formatBoolean,
+    'UTCTimestamp': formatUTCTimestamp,
+    'UTCTimeOnly': formatUTCTimeOnly,
+    'UTCDateOnly': formatDate,
+    'LocalMktDate': formatDate,
+}
+
+# canonical int object for each tag seen, so the millions of fields held in memory share their tags
+_internedTags = {}
+
+def internTag(tag):
+    try:
+        return _internedTags[tag]
+    except KeyError:
+        value = int(tag)
+        interned = _internedTags.setdefault(value, value)
+        _internedTags[tag] = interned
+        return interned
+
+def _valuesEqual(a, b):
+    # messages built locally can hold ints etc. where a decoded one has strings, only then compare the wire form
+    return a == b or (type(a) is not type(b) and str(a) == str(b))
+
+class _FIXFields(MutableMapping):
+    # The fields of a FIXContext, in order, as parallel lists of tags and values. Small contexts are searched
+    # linearly, which is about as quick as hashing for a handful of ints; larger ones get a tag -> position index.
+    #
+    # clone() shares the lists until either side is modified. The repeating group containers in them stay shared
+    # after that; private is the set of tags whose container has been copied since (None when nothing was ever
+    # shared) and privateContainer() copies the others before they are handed out.
+    __slots__ = ('tagList', 'valueList', 'index', 'shared', 'private')
+
+    INDEX_THRESHOLD = 16
+
+    def __init__(self, items=()):
+        self.tagList = []
+        self.valueList = []
+        self.index = None
+        self.shared = False
+        self.private = None
+        for tag, value in items:
+            self[tag] = value
+
+    def _find(self, tag):
+        if self.index is not None:
+            return self.index.get(tag, -1)
+        try:
+            return self.tagList.index(tag)
+        except ValueError:
+            return -1
+
+    def _buildIndex(self):
+        if len(self.tagList) > self.INDEX_THRESHOLD:
+            self.index = {tag: i for i, tag in enumerate(self.tagList)}
+        else:
+            self.index = None
+
+    def __getitem__(self, tag):
+        i = self._find(tag)
+        if i < 0:
+            raise KeyError(tag)
+        return self.valueList[i]
+
+    def clone(self):
+        copy = _FIXFields()
+        copy.tagList = self.tagList
+        copy.valueList = self.valueList
+        copy.index = self.index
+        copy.shared = self.shared = True
+        copy.private = set()
+        self.private = set()
+        return copy
+
+    def _unshare(self):
+        self.tagList = list(self.tagList)
+        self.valueList = list(self.valueList)
+        if self.index is not None:
+            self.index = dict(self.index)
+        self.shared = False
+
+    def privateContainer(self, tag):
+        container = self[tag]
+        if self.private is None or tag in self.private or type(container) is not _FIXRepeatingGroupContainer:
+            return container
+        container = self[tag] = container.clone()
+        return container
+
+    def __setitem__(self, tag, value):
+        if self.shared:
+            self._unshare()
+        if self.private is not None and type(value) is _FIXRepeatingGroupContainer:
+            self.private.add(tag)
+        i = self._find(tag)
+        if i >= 0:
+            self.valueList[i] = value
+            return
+        tag = internTag(tag)
+        self.tagList.append(tag)
+        self.valueList.append(value)
+        if self.index is not None:
+            self.index[tag] = len(self.tagList) - 1
+        elif len(self.tagList) > self.INDEX_THRESHOLD:
+            self._buildIndex()
+
+    def __delitem__(self, tag):
+        i = self._find(tag)
+        if i < 0:
+            raise KeyError(tag)
+        if self.shared:
+            self._unshare()
+        if self.private is not None:
+            self.private.discard(tag)
+        del self.tagList[i]
+        del self.valueList[i]
+        if self.index is not None:
+            self._buildIndex()
+
+    def __contains__(self, tag):
+        return self._find(tag) >= 0
+
+    def __iter__(self):
+        return iter(self.tagList)
+
+    def __len__(self):
+        return len(self.tagList)
+
+    def items(self):
+        return zip(self.tagList, self.valueList)
+
+    def __reduce__(self):
+        return (_FIXFields, (list(self.items()), ))
+
+    def __repr__(self):
+        return "_FIXFields(%r)" % (list(self.items()), )
+
 class _FIXRepeatingGroupContainer:
+    __slots__ = ('groups', 'indexes', 'indexedLength')
+
     def __init__(self):
         self.groups = []
+        # identifier tag -> {value: group}, see findGroup()
+        self.indexes = None
+        self.indexedLength = 0
 
     def addGroup(self, group, index):
         if index == -1:
             self.groups.append(group)
         else:
             self.groups.insert(index, group)
+        group.container = self
+        self.indexes = None
 
     def removeGroup(self, index):
-        del self.groups[index]
+        self.groups.pop(index).container = None
+        self.indexes = None
 
     def getGroup(self, index):
         return self.groups[index]
 
+    def clone(self):
+        container = _FIXRepeatingGroupContainer()
+        container.groups = [group.clone() for group in self.groups]
+        for group in container.groups:
+            group.container = container
+        return container
+
+    def findGroup(self, identifierTag, identifierValue):
+        """The first group with identifierTag set to identifierValue, or None.
+
+        An index of the groups by the value of identifierTag is built on first use and kept until groups are added or
+        removed, or a field of one of them is set or removed (groups tell the container they were added to)."""
+        if self.indexes is None or self.indexedLength != len(self.groups):
+            self.indexes = {}
+            self.indexedLength = len(self.groups)
+        index = self.indexes.get(identifierTag)
+        if index is None:
+            index = self.indexes[identifierTag] = {}
+            for group in self.groups:
+                if identifierTag in group:
+                    index.setdefault(group.getField(identifierTag), group)
+        return index.get(identifierValue)
+
     def __str__(self):
         return str(len(self.groups)) + "=>" + str(self.groups)
 
+    def __eq__(self, other):
+        if not isinstance(other, _FIXRepeatingGroupContainer):
+            return NotImplemented
+        return self.groups == other.groups
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return {'groups': self.groups}
+
+    def __setstate__(self, state):
+        self.groups = state['groups']
+        for group in self.groups:
+            group.container = self
+        self.indexes = None
+        self.indexedLength = 0
+
     __repr__ = __str__
 
 class FIXContext(object):
+    # container is the _FIXRepeatingGroupContainer a group was added to, whose index is dropped when it is modified
+    __slots__ = ('tags', 'converted', 'container')
+
     def __init__(self):
-        self.tags = OrderedDict()
+        self.tags = _FIXFields()
+        self.converted = None
+        self.container = None
 
     def setField(self, tag, value):
-        self.tags[int(tag)] = value
+        tag = internTag(tag)
+        self.tags[tag] = value
+        if self.converted is not None:
+            self.converted.pop(tag, None)
+        if self.container is not None:
+            self.container.indexes = None
 
     def removeField(self, tag):
+        tag = internTag(tag)
         try:
             del self.tags[tag]
         except KeyError:
             pass
+        if self.converted is not None:
+            self.converted.pop(tag, None)
+        if self.container is not None:
+            self.container.indexes = None
 
     def getField(self, tag):
-        return self.tags[int(tag)]
+        return self.tags[internTag(tag)]
+
+    def getConvertedField(self, tag, converter):
+        # the converted value is kept, so each field is only parsed once however many times it is read
+        tag = internTag(tag)
+        if self.converted is None:
+            self.converted = {}
+        else:
+            try:
+                cachedConverter, value = self.converted[tag]
+                if cachedConverter is converter:
+                    return value
+            except KeyError:
+                pass
+        value = converter(self.tags[tag])
+        self.converted[tag] = (converter, value)
+        return value
+
+    def getInt(self, tag):
+        return self.getConvertedField(tag, int)
+
+    def getDecimal(self, tag):
+        return self.getConvertedField(tag, Decimal)
+
+    def getFloat(self, tag):
+        return self.getConvertedField(tag, float)
+
+    def getBool(self, tag):
+        return self.getConvertedField(tag, parseBoolean)
+
+    def getTimestamp(self, tag):
+        return self.getConvertedField(tag, parseUTCTimestamp)
+
+    def getTypedField(self, tag, dictionary):
+        """Return the value of tag converted according to its datatype in dictionary"""
+        return self.getConvertedField(tag, datatypeConverters.get(dictionary.field_types.get(internTag(tag)), str))
 
     def addRepeatingGroup(self, tag, group, index=-1):
+        tag = internTag(tag)
         if tag in self.tags:
-            groupContainer = self.tags[tag]
+            groupContainer = self.tags.privateContainer(tag)
             groupContainer.addGroup(group, index)
         else:
             groupContainer = _FIXRepeatingGroupContainer()
@@ -52,35 +347,46 @@ class FIXContext(object):
             self.tags[tag] = groupContainer
 
     def removeRepeatingGroupByIndex(self, tag, index=-1):
+        tag = internTag(tag)
         if self.isRepeatingGroup(tag):
             try:
                 if index == -1:
                     del self.tags[tag]
                     pass
                 else:
-                    groups = self.tags[tag]
+                    groups = self.tags.privateContainer(tag)
                     groups.removeGroup(index)
             except KeyError:
                 pass
 
     def getRepeatingGroup(self, tag):
+        tag = internTag(tag)
         if self.isRepeatingGroup(tag):
-            return (len(self.tags[tag].groups), self.tags[tag].groups)
+            groups = self.tags.privateContainer(tag).groups
+            return (len(groups), groups)
         return None
 
     def getRepeatingGroupByTag(self, tag, identifierTag, identifierValue):
+        tag = internTag(tag)
         if self.isRepeatingGroup(tag):
-            for group in self.tags[tag].groups:
-                if int(identifierTag) in group.tags:
-                    if group.getField(identifierTag) == identifierValue:
-                        return group
+            return self.tags.privateContainer(tag).findGroup(internTag(identifierTag), identifierValue)
         return None
 
     def getRepeatingGroupByIndex(self, tag, index):
+        tag = internTag(tag)
         if self.isRepeatingGroup(tag):
-            return self.tags[tag].groups[index]
+            return self.tags.privateContainer(tag).groups[index]
         return None
 
+    def clone(self):
+        """A copy sharing the fields (and repeating groups) with self until either of them is modified.
+
+        Only the layer being modified is copied: changing a field copies the list of fields, getting at a repeating
+        group copies that group's container, but not the groups in it until they are changed in turn."""
+        context = FIXContext()
+        context.tags = self.tags.clone()
+        return context
+
     def __getitem__(self, tag):
         return self.getField(tag)
 
@@ -88,29 +394,203 @@ class FIXContext(object):
         self.setField(tag, value)
 
     def isRepeatingGroup(self, tag):
-        return type(self.tags[tag]) is _FIXRepeatingGroupContainer
+        return type(self.tags[internTag(tag)]) is _FIXRepeatingGroupContainer
 
     def __contains__(self, item):
-        return item in self.tags
+        return internTag(item) in self.tags
 
     def __str__(self):
-        r= ""
-        allTags = []
-        for tag in self.tags:
-            allTags.append("%s=%s" % (tag, self.tags[tag]))
-        r += "|".join(allTags)
-        return r
+        return "|".join("%s=%s" % (tag, value) for tag, value in self.tags.items())
 
     def __eq__(self, other):
-        # if our string representation looks the same, the objects are equivalent
-        return self.__str__() == other.__str__()
+        if not isinstance(other, FIXContext):
+            return NotImplemented
+        if len(self.tags) != len(other.tags):
+            return False
+        for (tag, value), (otherTag, otherValue) in zip(self.tags.items(), other.tags.items()):
+            if tag != otherTag or not _valuesEqual(value, otherValue):
+                return False
+        return True
+
+    def __hash__(self):
+        # only the tags, values which compare equal can have different types
+        return hash(tuple(self.tags))
+
+    def __getstate__(self):
+        return {'tags': self.tags}
+
+    def __setstate__(self, state):
+        # also takes the __dict__ of contexts pickled before FIXContext had __slots__
+        for name, value in state.items():
+            if name == 'tags' and not isinstance(value, _FIXFields):
+                value = _FIXFields(value.items())
+            if name != 'converted' and name != 'container':
+                setattr(self, name, value)
+        self.converted = None
+        self.container = None
 
     __repr__ = __str__
 
 class FIXMessage(FIXContext):
+    __slots__ = ('msgType', )
+
     def __init__(self, msgType):
         self.msgType = msgType
         FIXContext.__init__(self)
 
     def setMsgType(self, msgType):
         self.msgType = msgType
+
+    def clone(self):
+        msg = FIXMessage(self.msgType)
+        msg.tags = self.tags.clone()
+        return msg
+
+    def __eq__(self, other):
+        result = FIXContext.__eq__(self, other)
+        if result is True and isinstance(other, FIXMessage):
+            return self.msgType == other.msgType
+        return result
+
+    __hash__ = FIXContext.__hash__
+
+    def __getstate__(self):
+        return {'msgType': self.msgType, 'tags': self.tags}
+
+
+class _FIXMessageViewFields(MutableMapping):
+    # Stands in for the _FIXFields of tags on a FIXMessageView. Until the message is modified, values are looked up
+    # through the layout from the parser and decoded (and cached) on first access; any modification converts it
+    # into a plain _FIXFields.
+    __slots__ = ('buffer', 'fields', 'parser', 'msgType', 'layout', 'values', 'materialized')
+
+    def __init__(self, buffer, fields, parser, msgType):
+        self.buffer = buffer
+        self.fields = fields
+        self.parser = parser
+        self.msgType = msgType
+        self.layout = None
+        self.values = {}
+        self.materialized = False
+
+    def _layout(self):
+        if self.layout is None:
+            fields = self.fields
+            self.layout = layout = {}
+            for entry in self.parser.parse(fields, self.msgType):
+                layout[fields[entry if type(entry) is int else entry[0]]] = entry
+        return self.layout
+
+    def _decode(self, p):
+        return str(self.buffer[self.fields[p + 1]:self.fields[p + 2]], 'utf-8')
+
+    def _build(self, entry):
+        if type(entry) is int:
+            return self._decode(entry)
+        container = _FIXRepeatingGroupContainer()
+        for instance in entry[1]:
+            group = FIXContext()
+            for e in instance:
+                group.tags[self.fields[e if type(e) is int else e[0]]] = self._build(e)
+            container.addGroup(group, -1)
+        return container
+
+    def _materialize(self):
+        if not self.materialized:
+            self.values = _FIXFields([(tag, self[tag]) for tag in self._layout()])
+            self.materialized = True
+            self.layout = None
+            self.buffer = None
+
+    def clone(self):
+        if not self.materialized and self.unmodifiedBuffer() is None:
+            # groups built from the buffer may have been changed in place, which a copy of the buffer wouldn't have
+            self._materialize()
+        if self.materialized:
+            return self.values.clone()
+        # the buffer and the layout never change, only values built from them need to be kept apart
+        fields = _FIXMessageViewFields(self.buffer, self.fields, self.parser, self.msgType)
+        fields.layout = self.layout
+        return fields
+
+    def privateContainer(self, tag):
+        if self.materialized:
+            return self.values.privateContainer(tag)
+        return self[tag]
+
+    def unmodifiedBuffer(self):
+        # repeating groups handed out can be changed in place, so only a message none were built for is known to be
+        # as received
+        if self.materialized or any(type(value) is _FIXRepeatingGroupContainer for value in self.values.values()):
+            return None
+        return self.buffer
+
+    def __getitem__(self, tag):
+        try:
+            return self.values[tag]
+        except KeyError:
+            if self.materialized:
+                raise
+        value = self.values[tag] = self._build(self._layout()[tag])
+        return value
+
+    def __setitem__(self, tag, value):
+        self._materialize()
+        self.values[tag] = value
+
+    def __delitem__(self, tag):
+        self._materialize()
+        del self.values[tag]
+
+    def __contains__(self, tag):
+        return tag in (self.values if self.materialized else self._layout())
+
+    def __iter__(self):
+        return iter(self.values if self.materialized else self._layout())
+
+    def __len__(self):
+        return len(self.values if self.materialized else self._layout())
+
+
+class FIXMessageView(FIXMessage):
+    """A FIXMessage backed by the buffer it was received in.
+
+    fields is the flat index of (tag, value start, value end) for every field of the message, it is all the decoder
+    has to produce. Values are decoded and repeating groups are built when they are first accessed."""
+    __slots__ = ()
+
+    def __init__(self, msgType, buffer, fields, parser):
+        self.msgType = msgType
+        self.tags = _FIXMessageViewFields(buffer, fields, parser, msgType)
+        self.converted = None
+        self.container = None
+
+    def clone(self):
+        tags = self.tags.clone()
+        if type(tags) is not _FIXMessageViewFields:
+            # once modified it is a plain message
+            msg = FIXMessage(self.msgType)
+            msg.tags = tags
+            return msg
+        view = FIXMessageView.__new__(FIXMessageView)
+        view.msgType = self.msgType
+        view.tags = tags
+        view.converted = None
+        view.container = None
+        return view
+
+    def frame(self):
+        """The encoded message this is a view over, or None once it has been (or may have been) modified"""
+        if type(self.tags) is not _FIXMessageViewFields:
+            return None
+        return self.tags.unmodifiedBuffer()
+
+    def __reduce__(self):
+        # the receive buffer can't be pickled, so store a copy as a regular message
+        return (_unpickleMessage, (self.msgType, _FIXFields(self.tags.items())))
+
+
+def _unpickleMessage(msgType, tags):
+    msg = FIXMessage(msgType)
+    msg.tags = tags if isinstance(tags, _FIXFields) else _FIXFields(tags.items())
+    return msg
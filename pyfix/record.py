@@ -0,0 +1,183 @@
+"""Binary record format the journal stores messages in.
+
+A record is the format version, the msg type and then the fields in order, all built from varints:
+
+    record   = VERSION  varint(len(msgType))  msgType  fields
+    fields   = varint(count)  field*
+    field    = varint(tag)  varint(len(value) << 1)  value            a plain field, value is utf-8
+             | varint(tag)  varint(instances << 1 | 1)  fields*       a repeating group
+
+Only the msg type is decoded up front, the fields of a message are decoded the first time they are used.
+
+Messages we send are journalled as the bytes that went out on the wire instead, so they don't have to be decoded
+after encoding them:
+
+    raw      = RAW_VERSION  varint(len(msgType))  msgType  message
+
+which is decoded like a received message, into a FIXMessageView using the parser of the protocol in its BeginString."""
+from collections.abc import MutableMapping
+from pyfix.codec import protocolParser, indexFields, DecodingError
+from pyfix.message import FIXContext, FIXMessage, FIXMessageView, _FIXFields, _FIXRepeatingGroupContainer
+
+VERSION = 1
+RAW_VERSION = 2
+
+
+class RecordError(Exception):
+    pass
+
+
+def _writeVarint(buffer, value):
+    while value >= 0x80:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _readVarint(data, pos):
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value = byte & 0x7f
+    shift = 7
+    while True:
+        pos += 1
+        byte = data[pos]
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, pos + 1
+        shift += 7
+
+
+def _writeFields(buffer, context):
+    _writeVarint(buffer, len(context.tags))
+    for tag, value in context.tags.items():
+        _writeVarint(buffer, int(tag))
+        if type(value) is _FIXRepeatingGroupContainer:
+            _writeVarint(buffer, len(value.groups) << 1 | 1)
+            for group in value.groups:
+                _writeFields(buffer, group)
+        else:
+            value = str(value).encode('utf-8')
+            _writeVarint(buffer, len(value) << 1)
+            buffer += value
+
+
+def _readFields(data, pos):
+    fields = _FIXFields()
+    count, pos = _readVarint(data, pos)
+    for i in range(count):
+        tag, pos = _readVarint(data, pos)
+        length, pos = _readVarint(data, pos)
+        if length & 1:
+            container = _FIXRepeatingGroupContainer()
+            for j in range(length >> 1):
+                group = FIXContext()
+                group.tags, pos = _readFields(data, pos)
+                container.addGroup(group, -1)
+            fields[tag] = container
+        else:
+            end = pos + (length >> 1)
+            fields[tag] = str(data[pos:end], 'utf-8')
+            pos = end
+    return fields, pos
+
+
+def encodeRecord(msg):
+    if hasattr(msg, 'toMessage'):
+        msg = msg.toMessage()
+    buffer = bytearray()
+    buffer.append(VERSION)
+    msgType = str(msg.msgType).encode('utf-8')
+    _writeVarint(buffer, len(msgType))
+    buffer += msgType
+    _writeFields(buffer, msg)
+    return bytes(buffer)
+
+
+def encodeRawRecord(msgType, frame):
+    """Record for the encoded message frame (bytes or a memoryview)"""
+    buffer = bytearray()
+    buffer.append(RAW_VERSION)
+    msgType = str(msgType).encode('utf-8')
+    _writeVarint(buffer, len(msgType))
+    buffer += msgType
+    buffer += frame
+    return bytes(buffer)
+
+
+class _RecordFields(MutableMapping):
+    # Stands in for the fields of a message read from a record until they are first used
+    __slots__ = ('data', 'pos', 'fields')
+
+    def __init__(self, data, pos):
+        self.data = data
+        self.pos = pos
+        self.fields = None
+
+    def _fields(self):
+        if self.fields is None:
+            try:
+                self.fields, pos = _readFields(self.data, self.pos)
+            except (IndexError, UnicodeDecodeError) as why:
+                raise RecordError("Corrupt record (%s)" % (why, ))
+            self.data = None
+        return self.fields
+
+    def __getitem__(self, tag):
+        return self._fields()[tag]
+
+    def __setitem__(self, tag, value):
+        self._fields()[tag] = value
+
+    def __delitem__(self, tag):
+        del self._fields()[tag]
+
+    def __contains__(self, tag):
+        return tag in self._fields()
+
+    def __iter__(self):
+        return iter(self._fields())
+
+    def __len__(self):
+        return len(self._fields())
+
+    def items(self):
+        return self._fields().items()
+
+    def clone(self):
+        return self._fields().clone()
+
+    def privateContainer(self, tag):
+        return self._fields().privateContainer(tag)
+
+    def __reduce__(self):
+        return self._fields().__reduce__()
+
+
+def decodeFrame(frame):
+    """A view over an encoded message, laid out by the protocol its BeginString names"""
+    try:
+        msgType, fields = indexFields(frame)
+        if not fields or fields[0] != 8:
+            raise DecodingError("Expected BeginString(8)")
+        parser = protocolParser(str(frame[fields[1]:fields[2]], 'ascii'))
+    except (DecodingError, ImportError, UnicodeDecodeError) as why:
+        raise RecordError("Corrupt record (%s)" % (why, ))
+    return FIXMessageView(msgType, frame, fields, parser)
+
+
+def decodeRecord(data):
+    """The message stored in data (bytes), its fields are decoded when first accessed"""
+    if not data or data[0] not in (VERSION, RAW_VERSION):
+        raise RecordError("Unsupported record version %r" % (data[:1], ))
+    try:
+        length, pos = _readVarint(data, 1)
+        msgType = str(data[pos:pos + length], 'utf-8')
+    except (IndexError, UnicodeDecodeError) as why:
+        raise RecordError("Corrupt record (%s)" % (why, ))
+    if data[0] == RAW_VERSION:
+        return decodeFrame(memoryview(data)[pos + length:])
+    msg = FIXMessage(msgType)
+    msg.tags = _RecordFields(data, pos + length)
+    return msg
@@ -0,0 +1,63 @@
+from collections import deque
+
+
+class ResendCache(object):
+    """The most recently sent messages of a session, as encoded, so that resend requests for them don't have to go to
+    the journal.
+
+    Holds at most maxMessages messages and, if maxBytes is given, at most maxBytes of them. Messages are added in the
+    order they are sent; anything with a seqNo that isn't after the last one (a PossDupFlag resend, a gap fill) is
+    already in the cache or the journal and is ignored. hits and misses count the ranges that were and weren't
+    entirely in the cache."""
+    def __init__(self, maxMessages = 1000, maxBytes = None):
+        self.maxMessages = maxMessages
+        self.maxBytes = maxBytes
+        self.frames = deque()
+        self.seqNos = {}
+        self.size = 0
+        self.lastSeqNo = 0
+        self.hits = 0
+        self.misses = 0
+
+    def add(self, seqNo, frame):
+        if seqNo <= self.lastSeqNo:
+            return
+        # a copy, frames are usually views of the buffer a whole batch was encoded into
+        frame = bytes(frame)
+        self.frames.append((seqNo, frame))
+        self.seqNos[seqNo] = frame
+        self.size += len(frame)
+        self.lastSeqNo = seqNo
+        while len(self.frames) > self.maxMessages or (self.maxBytes is not None and self.size > self.maxBytes):
+            oldSeqNo, oldFrame = self.frames.popleft()
+            del self.seqNos[oldSeqNo]
+            self.size -= len(oldFrame)
+
+    def firstSeqNo(self):
+        """The seqNo of the oldest message in the cache, None if it is empty"""
+        return self.frames[0][0] if self.frames else None
+
+    def lookup(self, startSeqNo, endSeqNo):
+        """The frames of the messages from startSeqNo to endSeqNo which are in the cache, a list of (seqNo, frame).
+        Anything before firstSeqNo() has to come from the journal."""
+        first = self.firstSeqNo()
+        if first is None:
+            self.misses += 1
+            return []
+        if startSeqNo >= first:
+            self.hits += 1
+        else:
+            self.misses += 1
+        frames = []
+        for seqNo in range(max(startSeqNo, first), min(endSeqNo, self.lastSeqNo) + 1):
+            frame = self.seqNos.get(seqNo)
+            if frame is not None:
+                frames.append((seqNo, frame))
+        return frames
+
+    def clear(self):
+        """Forget everything, e.g. when the sequence numbers are reset"""
+        self.frames.clear()
+        self.seqNos.clear()
+        self.size = 0
+        self.lastSeqNo = 0
@@ -12,7 +12,7 @@ class FIXServerConnectionHandler(FIXConnectionHandler):
     def handleSessionMessage(self, msg):
         protocol = self.codec.protocol
 
-        recvSeqNo = msg[protocol.fixtags.MsgSeqNum]
+        recvSeqNo = msg.getInt(protocol.fixtags.MsgSeqNum)
 
         msgType = msg[protocol.fixtags.MsgType]
         targetCompId = msg[protocol.fixtags.TargetCompID]
@@ -27,9 +27,14 @@ class FIXServerConnectionHandler(FIXConnectionHandler):
                 self.session = self.engine.getOrCreateSessionFromCompIds(senderCompId, targetCompId)
                 if self.session is not None:
                     try:
+                        logon = protocol.messages.Messages.logon()
+                        if protocol.fixtags.ResetSeqNumFlag in msg and msg.getBool(protocol.fixtags.ResetSeqNumFlag):
+                            # this Logon and our reply are 1 of the new sequence
+                            self.resetSeqNos()
+                            logon.setField(protocol.fixtags.ResetSeqNumFlag, "Y")
                         self.connectionState = ConnectionState.LOGGED_IN
                         self.heartbeatPeriod = float(msg[protocol.fixtags.HeartBtInt])
-                        responses.append(protocol.messages.Messages.logon())
+                        responses.append(logon)
                         self.registerLoggedIn()
                     except DuplicateSeqNoError:
                         logging.error("Failed to process login request with duplicate seq no")
@@ -53,10 +58,10 @@ class FIXServerConnectionHandler(FIXConnectionHandler):
             elif msgType == protocol.msgtype.TESTREQUEST:
                 responses.append(protocol.messages.Messages.heartbeat())
             elif msgType == protocol.msgtype.RESENDREQUEST:
-                responses.extend(self._handleResendRequest(msg))
+                responses = self._handleResendRequest(msg)
             elif msgType == protocol.msgtype.SEQUENCERESET:
-                newSeqNo = msg[protocol.fixtags.NewSeqNo]
-                self.session.setRecvSeqNo(int(newSeqNo) - 1)
+                newSeqNo = msg.getInt(protocol.fixtags.NewSeqNo)
+                self.session.setRecvSeqNo(newSeqNo - 1)
                 recvSeqNo = newSeqNo
         else:
             logging.warning("Can't process message, counterparty is not logged in")
@@ -17,14 +17,14 @@ class FIXSession:
         return str(self.sndSeqNum)
 
     def validateRecvSeqNo(self, seqNo):
-        if self.nextExpectedMsgSeqNum < int(seqNo):
+        if self.nextExpectedMsgSeqNum < seqNo:
             logging.warning("SeqNum from client unexpected (Rcvd: %s Expected: %s)" % (seqNo, self.nextExpectedMsgSeqNum))
             return (False, self.nextExpectedMsgSeqNum)
         else:
             return (True, seqNo)
 
     def setRecvSeqNo(self, seqNo):
-        # if self.nextExpectedMsgSeqNum != int(seqNo):
+        # if self.nextExpectedMsgSeqNum != seqNo:
         #     logging.warning("SeqNum from client unexpected (Rcvd: %s Expected: %s)" % (seqNo, self.nextExpectedMsgSeqNum))
-        self.nextExpectedMsgSeqNum = int(seqNo) + 1
+        self.nextExpectedMsgSeqNum = seqNo + 1
 
@@ -0,0 +1,137 @@
+from pyfix.message import FIXContext, FIXMessage, _FIXRepeatingGroupContainer, _unpickleMessage, internTag
+
+
+class TypedFields(object):
+    """Behaviour shared by the message and group classes written by pyfix.generator.
+
+    Every field the dictionary declares for the message (or group) is a slot holding its value, None when it isn't
+    set; repeating groups are a list of the generated group class. Anything else, such as header fields, is kept in
+    tags like on any FIXContext. Generated classes provide:
+
+      fieldSpecs: tag -> (attribute, converter from the wire string or None, group class or None), in wire order
+      encodeFields(buffer): appends the declared fields to buffer"""
+    __slots__ = ()
+
+    fieldSpecs = {}
+
+    def getField(self, tag):
+        tag = internTag(tag)
+        spec = self.fieldSpecs.get(tag)
+        if spec is None:
+            return self.tags[tag]
+        value = getattr(self, spec[0])
+        if value is None:
+            raise KeyError(tag)
+        return value
+
+    def setField(self, tag, value):
+        tag = internTag(tag)
+        spec = self.fieldSpecs.get(tag)
+        if spec is None:
+            FIXContext.setField(self, tag, value)
+        else:
+            setattr(self, spec[0], value)
+
+    def removeField(self, tag):
+        tag = internTag(tag)
+        spec = self.fieldSpecs.get(tag)
+        if spec is None:
+            FIXContext.removeField(self, tag)
+        else:
+            setattr(self, spec[0], None)
+
+    def __contains__(self, tag):
+        tag = internTag(tag)
+        spec = self.fieldSpecs.get(tag)
+        if spec is None:
+            return tag in self.tags
+        return getattr(self, spec[0]) is not None
+
+    def _setFields(self, context):
+        for tag, value in context.tags.items():
+            spec = self.fieldSpecs.get(tag)
+            if spec is None:
+                self.tags[tag] = value
+                continue
+            name, converter, groupClass = spec
+            if groupClass is not None:
+                value = [groupClass.fromContext(group) for group in value.groups]
+            elif converter is not None and type(value) is str:
+                value = converter(value)
+            setattr(self, name, value)
+
+    def _copyFields(self, context):
+        # the declared fields into the plain context, in wire order
+        for tag, (name, converter, groupClass) in self.fieldSpecs.items():
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if groupClass is not None:
+                container = _FIXRepeatingGroupContainer()
+                for group in value:
+                    container.addGroup(group.toContext(), -1)
+                value = container
+            context.tags[tag] = value
+        return context
+
+    def clone(self):
+        copy = type(self)()
+        copy.tags = self.tags.clone()
+        for name, converter, groupClass in self.fieldSpecs.values():
+            value = getattr(self, name)
+            if groupClass is not None and value is not None:
+                value = [group.clone() for group in value]
+            setattr(copy, name, value)
+        return copy
+
+    def __str__(self):
+        return str(self.toContext())
+
+    def __eq__(self, other):
+        if isinstance(other, TypedFields):
+            other = other.toContext()
+        return self.toContext() == other
+
+    def __hash__(self):
+        return hash(self.toContext())
+
+    __repr__ = __str__
+
+
+class TypedGroup(TypedFields, FIXContext):
+    __slots__ = ()
+
+    @classmethod
+    def fromContext(cls, context):
+        group = cls()
+        group._setFields(context)
+        return group
+
+    def toContext(self):
+        context = self._copyFields(FIXContext())
+        for tag, value in self.tags.items():
+            context.tags[tag] = value
+        return context
+
+
+class TypedMessage(TypedFields, FIXMessage):
+    __slots__ = ()
+
+    @classmethod
+    def fromMessage(cls, msg):
+        """Convert a decoded (or any other) FIXMessage, values of declared fields are converted to their types"""
+        typed = cls()
+        typed._setFields(msg)
+        return typed
+
+    def toContext(self):
+        # anything undeclared (the header fields) goes first, as that is where the encoder writes it
+        context = FIXMessage(self.msgType)
+        for tag, value in self.tags.items():
+            context.tags[tag] = value
+        return self._copyFields(context)
+
+    toMessage = toContext
+
+    def __reduce__(self):
+        return (_unpickleMessage, (self.msgType, self.toContext().tags))
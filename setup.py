@@ -12,7 +12,8 @@ config = {
     'maintainer': 'Eddy Pronk',
     'maintainer_email': 'epronk@muftor.com',
     'version': '0.1',
-    'install_requires': ['fixorchestra', 'more-itertools', 'mock'],
+    'install_requires': ['fixorchestra', 'mock'],
+    'extras_require': {'bulk': ['numpy']},
     'packages': ['pyfix', 'pyfix/FIX44'],
     'scripts': [],
     'name': 'pyfix-fork'
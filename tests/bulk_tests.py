@@ -0,0 +1,79 @@
+import importlib
+import os
+import tempfile
+import unittest
+import mock
+from pyfix.codec import Codec
+from pyfix.message import FIXMessage
+
+try:
+    import numpy
+    from pyfix.bulk import decodeBuffer, decodeFile
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class BulkDecodeTests(unittest.TestCase):
+    def setUp(self):
+        self.protocol = importlib.import_module("pyfix.FIX44")
+        self.codec = Codec(self.protocol)
+        session = mock.Mock()
+        session.senderCompId = "sender"
+        session.targetCompId = "target"
+        session.allocateSndSeqNo.side_effect = range(1, 100)
+
+        self.messages = []
+        lines = []
+        for i in range(20):
+            if i % 3 == 0:
+                msg = FIXMessage(self.protocol.msgtype.Heartbeat)
+            else:
+                msg = FIXMessage(self.protocol.msgtype.NewOrderSingle)
+                msg.setField(self.protocol.fixtags.ClOrdID, "order%s" % i)
+                msg.setField(self.protocol.fixtags.Symbol, "VOD.L" if i % 2 else "BARC.L")
+                # a value which looks like the start of a message
+                msg.setField(self.protocol.fixtags.Text, "8=FIX.4.4")
+            encoded = self.codec.encode(msg, session)
+            self.messages.append(encoded)
+            lines.append(b'2015-06-19 11:08:54 OUT ' + encoded + b'\n')
+        self.data = b''.join(lines)
+
+    def checkIndex(self, index):
+        self.assertEqual(self.messages, [bytes(index.rawMessage(i)) for i in range(len(index))])
+
+        orders = index.messagesOfType(self.protocol.msgtype.NewOrderSingle)
+        self.assertEqual([i for i in range(20) if i % 3], list(orders))
+        self.assertEqual(["order%s" % i for i in range(20) if i % 3],
+                         index.values(index.fieldsWithTag(self.protocol.fixtags.ClOrdID)))
+        self.assertEqual([i for i in range(20) if i % 3 and i % 2], list(index.messagesWithValue(55, "VOD.L")))
+        self.assertEqual(["20"], index.values(index.fieldsWithTag(34, [19])))
+
+        msg = index.decode(orders[0], self.codec)
+        self.assertEqual("order1", msg[self.protocol.fixtags.ClOrdID])
+        self.assertEqual("8=FIX.4.4", msg[self.protocol.fixtags.Text])
+
+    def testDecodeBuffer(self):
+        self.checkIndex(decodeBuffer(self.data))
+
+        # an incomplete message at the end is left out
+        index = decodeBuffer(self.data + self.messages[0][:-3])
+        self.assertEqual(20, len(index))
+
+        self.assertEqual(0, len(decodeBuffer(b'')))
+
+    def testDecodeFile(self):
+        fd, filename = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.data)
+            self.checkIndex(decodeFile(filename))
+            # chunks smaller than a message
+            self.checkIndex(decodeFile(filename, chunkSize=64))
+            self.checkIndex(decodeFile(filename, chunkSize=1000))
+        finally:
+            os.remove(filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import calendar
+import unittest
+from pyfix.clock import Clock
+
+
+class FixedClock(Clock):
+    def __init__(self, now):
+        Clock.__init__(self)
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class ClockTests(unittest.TestCase):
+    def testUtcTimestamp(self):
+        second = calendar.timegm((2015, 6, 19, 11, 8, 54))
+        clock = FixedClock(second)
+        self.assertEqual("20150619-11:08:54.000", clock.utcTimestamp())
+
+        clock.now = second + 0.5
+        self.assertEqual("20150619-11:08:54.500", clock.utcTimestamp())
+
+        clock.now = second + 5.999
+        self.assertEqual("20150619-11:08:59.999", clock.utcTimestamp())
+
+        clock.now = calendar.timegm((2015, 6, 19, 23, 59, 59)) + 1.007
+        self.assertEqual("20150620-00:00:00.007", clock.utcTimestamp())
+
+    def testMonotonic(self):
+        clock = Clock()
+        first = clock.monotonic()
+        self.assertLessEqual(first, clock.monotonic())
+
+
+if __name__ == '__main__':
+    unittest.main()
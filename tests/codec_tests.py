@@ -1,37 +1,94 @@
 import importlib
-import datetime
+import pickle
+import calendar
 import mock as mock
-from pyfix.codec import Codec
+from pyfix.clock import Clock
+from pyfix.codec import Codec, DecodingError
 from pyfix.message import FIXMessage, FIXContext
 
 __author__ = 'tom'
 
 import unittest
 
-class FakeDate(datetime.datetime):
-    @classmethod
-    def utcnow(cls):
-        return cls(2015, 6, 19, 11, 8, 54)
+class FakeClock(Clock):
+    def time(self):
+        return calendar.timegm((2015, 6, 19, 11, 8, 54))
 
 class FIXCodecTests(unittest.TestCase):
     def testDecode(self):
         protocol = importlib.import_module("pyfix.FIX44")
         codec = Codec(protocol)
-        inMsg = b'8=FIX.4.4\x019=817\x0135=J\x0134=953\x0149=FIX_ALAUDIT\x0156=BFUT_ALAUDIT\x0143=N\x0152=20150615-09:21:42.459\x0170=00000002664ASLO1001\x01626=2\x0171=0\x0160=20150615-10:21:42\x01857=1\x0173=1\x0111=00000006321ORLO1\x0138=100.0\x01800=100.0\x01124=1\x0132=100.0\x0117=00000009758TRLO1\x0131=484.50\x0154=2\x0153=100.0\x0155=FTI\x01207=XEUE\x01454=1\x01455=EOM5\x01456=A\x01200=201506\x01541=20150619\x01461=FXXXXX\x016=484.50\x0174=2\x0175=20150615\x0178=2\x0179=TEST123\x01467=00000014901CALO1001\x0180=33.0\x01366=484.50\x0181=0\x01153=484.50\x0179=TEST124\x01467=00000014903CALO1001\x0180=67.0\x01366=484.50\x0181=0\x01153=484.50\x01453=3\x01448=TEST1\x01447=D\x01452=3\x01802=2\x01523=12345\x01803=3\x01523=TEST1\x01803=19\x01448=TEST1WA\x01447=D\x01452=38\x01802=4\x01523=Test1 Wait\x01803=10\x01523= \x01803=26\x01523=\x01803=3\x01523=TestWaCRF2\x01803=28\x01448=hagap\x01447=D\x01452=11\x01802=2\x01523=GB\x01803=25\x01523=BarCapFutures.FETService\x01803=24\x0110=033\x01'
+        inMsg = b'8=FIX.4.4\x019=725\x0135=J\x0134=953\x0149=FIX_ALAUDIT\x0156=BFUT_ALAUDIT\x0143=N\x0152=20150615-09:21:42.459\x0170=00000002664ASLO1001\x01626=2\x0171=0\x0160=20150615-10:21:42\x01857=1\x0173=1\x0111=00000006321ORLO1\x0138=100.0\x01800=100.0\x01124=1\x0132=100.0\x0117=00000009758TRLO1\x0131=484.50\x0154=2\x0153=100.0\x0155=FTI\x01207=XEUE\x01454=1\x01455=EOM5\x01456=A\x01200=201506\x01541=20150619\x01461=FXXXXX\x016=484.50\x0174=2\x0175=20150615\x0178=2\x0179=TEST123\x01467=00000014901CALO1001\x0180=33.0\x01366=484.50\x0181=0\x01153=484.50\x0179=TEST124\x01467=00000014903CALO1001\x0180=67.0\x01366=484.50\x0181=0\x01153=484.50\x01453=3\x01448=TEST1\x01447=D\x01452=3\x01802=2\x01523=12345\x01803=3\x01523=TEST1\x01803=19\x01448=TEST1WA\x01447=D\x01452=38\x01802=4\x01523=Test1 Wait\x01803=10\x01523= \x01803=26\x01523=\x01803=3\x01523=TestWaCRF2\x01803=28\x01448=hagap\x01447=D\x01452=11\x01802=2\x01523=GB\x01803=25\x01523=BarCapFutures.FETService\x01803=24\x0110=033\x01'
         msg, remaining = codec.decode(inMsg)
-        self.assertEqual("8=FIX.4.4|9=817|35=J|34=953|49=FIX_ALAUDIT|56=BFUT_ALAUDIT|43=N|52=20150615-09:21:42.459|70=00000002664ASLO1001|626=2|71=0|60=20150615-10:21:42|857=1|73=1=>[11=00000006321ORLO1|38=100.0|800=100.0]|124=1=>[32=100.0|17=00000009758TRLO1|31=484.50]|54=2|53=100.0|55=FTI|207=XEUE|454=1=>[455=EOM5|456=A]|200=201506|541=20150619|461=FXXXXX|6=484.50|74=2|75=20150615|78=2=>[79=TEST123|467=00000014901CALO1001|80=33.0|366=484.50|81=0|153=484.50, 79=TEST124|467=00000014903CALO1001|80=67.0|366=484.50|81=0|153=484.50]|453=3=>[448=TEST1|447=D|452=3|802=2=>[523=12345|803=3, 523=TEST1|803=19], 448=TEST1WA|447=D|452=38|802=4=>[523=Test1 Wait|803=10, 523= |803=26, 523=|803=3, 523=TestWaCRF2|803=28], 448=hagap|447=D|452=11|802=2=>[523=GB|803=25, 523=BarCapFutures.FETService|803=24]]|10=033", str(msg))
+        self.assertEqual("8=FIX.4.4|9=725|35=J|34=953|49=FIX_ALAUDIT|56=BFUT_ALAUDIT|43=N|52=20150615-09:21:42.459|70=00000002664ASLO1001|626=2|71=0|60=20150615-10:21:42|857=1|73=1=>[11=00000006321ORLO1|38=100.0|800=100.0]|124=1=>[32=100.0|17=00000009758TRLO1|31=484.50]|54=2|53=100.0|55=FTI|207=XEUE|454=1=>[455=EOM5|456=A]|200=201506|541=20150619|461=FXXXXX|6=484.50|74=2|75=20150615|78=2=>[79=TEST123|467=00000014901CALO1001|80=33.0|366=484.50|81=0|153=484.50, 79=TEST124|467=00000014903CALO1001|80=67.0|366=484.50|81=0|153=484.50]|453=3=>[448=TEST1|447=D|452=3|802=2=>[523=12345|803=3, 523=TEST1|803=19], 448=TEST1WA|447=D|452=38|802=4=>[523=Test1 Wait|803=10, 523= |803=26, 523=|803=3, 523=TestWaCRF2|803=28], 448=hagap|447=D|452=11|802=2=>[523=GB|803=25, 523=BarCapFutures.FETService|803=24]]|10=033", str(msg))
 
-    @mock.patch("pyfix.codec.datetime", FakeDate)
-    def testEncode(self):
-        from datetime import datetime
+    def testDecodeLazy(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        codec = Codec(protocol)
+        inMsg = b'8=FIX.4.4\x019=111\x0135=D\x0134=7\x0149=S\x0156=T\x0152=20150619-11:08:54.000\x0111=abc\x0155=VOD.L\x01453=2\x01448=P1\x01447=D\x01452=3\x01448=P2\x01447=D\x01452=11\x0154=1\x0110=000\x01'
+        msg, parsedLength = codec.decode(inMsg)
+        self.assertEqual(len(inMsg), parsedLength)
+        self.assertEqual("D", msg.msgType)
+        self.assertEqual("abc", msg[protocol.fixtags.ClOrdID])
+        self.assertEqual("T", msg.getField(56))
+        self.assertNotIn(448, msg)
+        self.assertIn(54, msg)
+
+        count, groups = msg.getRepeatingGroup(protocol.fixtags.NoPartyIDs)
+        self.assertEqual(2, count)
+        self.assertEqual("448=P2|447=D|452=11", str(groups[1]))
+        self.assertEqual("452=3", str(msg.getRepeatingGroupByTag(453, 448, "P1"))[-5:])
+
+        msg.removeField(protocol.fixtags.CheckSum)
+        msg.setField(protocol.fixtags.PossDupFlag, "Y")
+        self.assertEqual("8=FIX.4.4|9=111|35=D|34=7|49=S|56=T|52=20150619-11:08:54.000|11=abc|55=VOD.L|453=2=>[448=P1|447=D|452=3, 448=P2|447=D|452=11]|54=1|43=Y", str(msg))
+
+        msg2 = pickle.loads(pickle.dumps(msg))
+        self.assertIs(FIXMessage, type(msg2))
+        self.assertEqual(msg, msg2)
+
+        copy = codec.decode(inMsg)[0].clone()
+        copy.getRepeatingGroupByIndex(453, 0).setField(448, "X")
+        self.assertEqual("448=X|447=D|452=3", str(copy.getRepeatingGroupByIndex(453, 0)))
+        self.assertEqual("X", pickle.loads(pickle.dumps(copy)).getRepeatingGroupByIndex(453, 0)[448])
+
+    def testFrame(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        codec = Codec(protocol)
+        heartbeat = b'8=FIX.4.4\x019=11\x0135=0\x0134=12\x0110=196\x01'
+        stream = heartbeat * 3
+
+        for chunkSize in (1, 7, len(heartbeat), len(stream)):
+            frames = []
+            buffer = b''
+            for i in range(0, len(stream), chunkSize):
+                buffer = buffer + stream[i:i + chunkSize]
+                complete, parsedLength = codec.frame(buffer)
+                frames.extend(bytes(f) for f in complete)
+                buffer = buffer[parsedLength:]
+            self.assertEqual([heartbeat] * 3, frames)
+            self.assertEqual(b'', buffer)
+
+        msg, parsedLength = codec.decode(heartbeat[:-3])
+        self.assertIsNone(msg)
+        self.assertEqual(0, parsedLength)
+
+        msg, parsedLength = codec.decode(heartbeat + heartbeat[:10])
+        self.assertEqual(len(heartbeat), parsedLength)
+        self.assertEqual("8=FIX.4.4|9=11|35=0|34=12|10=196", str(msg))
+
+        self.assertRaises(DecodingError, codec.frame, b'35=0\x01')
+        self.assertRaises(DecodingError, codec.frame, b'8=FIX.4.4\x019=x\x01')
+        self.assertRaises(DecodingError, codec.frame, b'8=FIX.4.4\x019=4\x0135=0\x0134=12\x0110=196\x01')
 
+    def testEncode(self):
         mock_session = mock.Mock()
         mock_session.senderCompId = "sender"
         mock_session.targetCompId = "target"
         mock_session.allocateSndSeqNo.return_value = 1
 
         protocol = importlib.import_module("pyfix.FIX44")
-        codec = Codec(protocol)
+        codec = Codec(protocol, FakeClock())
 
         msg = FIXMessage(codec.protocol.msgtype.NewOrderSingle)
         msg.setField(codec.protocol.fixtags.Price, "123.45")
@@ -61,10 +118,43 @@ class FIXCodecTests(unittest.TestCase):
         msg.addRepeatingGroup("444", rptgrp2, 1)
 
         result = codec.encode(msg, mock_session)
-        expected = '8=FIX.4.4\x019=201\x0135=D\x0149=sender\x0156=target\x0134=1\x0152=20150619-11:08:54.000\x0144=123.45\x0138=9876\x0155=VOD.L\x0148=GB00BH4HKS39\x0122=4\x011=TEST\x0121=1\x01100=XLON\x0154=1\x0111=abcdefg\x0115=GBP\x01444=2\x01611=aaa\x01612=bbb\x01613=ccc\x01611=zzz\x01612=yyy\x01613=xxx\x0110=255\x01'
+        expected = b'8=FIX.4.4\x019=201\x0135=D\x0149=sender\x0156=target\x0134=1\x0152=20150619-11:08:54.000\x0144=123.45\x0138=9876\x0155=VOD.L\x0148=GB00BH4HKS39\x0122=4\x011=TEST\x0121=1\x01100=XLON\x0154=1\x0111=abcdefg\x0115=GBP\x01444=2\x01611=aaa\x01612=bbb\x01613=ccc\x01611=zzz\x01612=yyy\x01613=xxx\x0110=255\x01'
         self.assertEqual(expected, result)
 
 
+    def testEncodeMany(self):
+        mock_session = mock.Mock()
+        mock_session.senderCompId = "sender"
+        mock_session.targetCompId = "target"
+        mock_session.allocateSndSeqNo.side_effect = [1, 2, 3]
+
+        protocol = importlib.import_module("pyfix.FIX44")
+        codec = Codec(protocol, FakeClock())
+
+        msgs = []
+        for clOrdID in ("a", "b", "c"):
+            msg = FIXMessage(codec.protocol.msgtype.NewOrderSingle)
+            msg.setField(codec.protocol.fixtags.ClOrdID, clOrdID)
+            msgs.append(msg)
+
+        result = codec.encode_many(msgs, mock_session)
+        frames, parsedLength = codec.frame(result)
+        self.assertEqual(len(result), parsedLength)
+        self.assertEqual(3, len(frames))
+        for i, frame in enumerate(frames):
+            decoded = codec.decodeFrame(frame)
+            self.assertEqual(str(i + 1), decoded[codec.protocol.fixtags.MsgSeqNum])
+            self.assertEqual(msgs[i][codec.protocol.fixtags.ClOrdID], decoded[codec.protocol.fixtags.ClOrdID])
+
+        # each message is checksummed on its own
+        mock_session.allocateSndSeqNo.side_effect = [2]
+        self.assertEqual(bytes(frames[1]), codec.encode(msgs[1], mock_session))
+
+        mock_session.allocateSndSeqNo.side_effect = [4, 5, 6]
+        result, encodedFrames = codec.encode_frames(msgs, mock_session)
+        self.assertEqual([(4, "D"), (5, "D"), (6, "D")], [(seqNo, msgType) for seqNo, msgType, frame in encodedFrames])
+        self.assertEqual([bytes(frame) for frame in codec.frame(result)[0]], [bytes(frame) for seqNo, msgType, frame in encodedFrames])
+
+
 if __name__ == '__main__':
     unittest.main()
-
@@ -0,0 +1,143 @@
+import importlib
+import socket
+import tempfile
+import unittest
+from pyfix.codec import Codec
+from pyfix.event import TimerEventRegistration
+from pyfix.connection import FIXConnectionHandler, SessionError
+from pyfix.engine import FIXEngine
+from pyfix.logjournal import LogJournaler
+from pyfix.message import FIXMessage, MessageDirection
+
+
+class ConnectionTests(unittest.TestCase):
+    def testOutboundObservers(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        engine = FIXEngine()
+        session = engine.createSession("T1", "S1")
+        sock, peer = socket.socketpair()
+        try:
+            handler = FIXConnectionHandler(engine, protocol, sock)
+            handler.session = session
+            sent = []
+            handler.addMessageHandler(lambda connection, msg: sent.append(msg), MessageDirection.OUTBOUND, protocol.msgtype.NewOrderSingle)
+
+            msg = FIXMessage(protocol.msgtype.NewOrderSingle)
+            msg.setField(protocol.fixtags.ClOrdID, "1")
+            handler.sendMsg(msg)
+
+            # observers see the message as it went on the wire
+            self.assertEqual(1, len(sent))
+            self.assertEqual("1", sent[0][protocol.fixtags.ClOrdID])
+            self.assertEqual("1", sent[0][protocol.fixtags.MsgSeqNum])
+            self.assertEqual("S1", sent[0][protocol.fixtags.SenderCompID])
+            self.assertEqual("T1", sent[0][protocol.fixtags.TargetCompID])
+            self.assertTrue(protocol.fixtags.SendingTime in sent[0])
+        finally:
+            engine.eventManager.unregisterHandler(handler.socketEvent)
+            sock.close()
+            peer.close()
+
+
+    def receivedFrames(self, protocol, peer):
+        peer.settimeout(1.0)
+        frames, length = Codec(protocol).frame(peer.recv(65536))
+        return [Codec(protocol).decodeFrame(frame) for frame in frames]
+
+    def order(self, protocol, clOrdID):
+        msg = FIXMessage(protocol.msgtype.NewOrderSingle)
+        msg.setField(protocol.fixtags.ClOrdID, clOrdID)
+        return msg
+
+    def testFailedFlush(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        engine = FIXEngine()
+        pairs = [socket.socketpair() for i in range(2)]
+        handlers = []
+        try:
+            for i, (sock, peer) in enumerate(pairs):
+                handler = FIXConnectionHandler(engine, protocol, sock)
+                handler.session = engine.createSession("T%d" % (i, ), "S%d" % (i, ))
+                handlers.append(handler)
+
+            # the first flush after the events fails, the other connection is still flushed
+            failures = [RuntimeError("journal failed")]
+            beforeSend = engine.journaller.beforeSend
+            def failOnce():
+                if failures:
+                    raise failures.pop()
+                beforeSend()
+            engine.journaller.beforeSend = failOnce
+
+            def onTimeout(type, closure):
+                for handler in handlers:
+                    handler.sendMsg(self.order(protocol, "a"))
+            timer = TimerEventRegistration(onTimeout, 0.01)
+            engine.eventManager.registerHandler(timer)
+            with self.assertLogs(level='ERROR'):
+                engine.eventManager.waitForEventWithTimeout(1.0)
+            engine.eventManager.unregisterHandler(timer)
+            self.assertEqual(["a"], [msg[protocol.fixtags.ClOrdID] for msg in self.receivedFrames(protocol, pairs[1][1])])
+
+            # and the connection whose flush failed still sends
+            handlers[0].sendMsg(self.order(protocol, "b"))
+            self.assertEqual(["b"], [msg[protocol.fixtags.ClOrdID] for msg in self.receivedFrames(protocol, pairs[0][1])])
+        finally:
+            for handler in handlers:
+                engine.eventManager.unregisterHandler(handler.socketEvent)
+            for sock, peer in pairs:
+                sock.close()
+                peer.close()
+
+    def testEncodingFailure(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        engine = FIXEngine()
+        session = engine.createSession("T1", "S1")
+        sock, peer = socket.socketpair()
+        try:
+            handler = FIXConnectionHandler(engine, protocol, sock)
+            handler.session = session
+            # a resend without the seq no it is resending can't be encoded
+            bad = self.order(protocol, "bad")
+            bad.setField(protocol.fixtags.PossDupFlag, "Y")
+            handler.pendingMsgs = [self.order(protocol, "a"), bad, self.order(protocol, "b")]
+            with self.assertLogs(level='ERROR'):
+                handler.flush()
+            received = self.receivedFrames(protocol, peer)
+            self.assertEqual([("1", "a"), ("2", "b")], [(msg[protocol.fixtags.MsgSeqNum], msg[protocol.fixtags.ClOrdID]) for msg in received])
+            self.assertEqual(2, session.sndSeqNum)
+        finally:
+            engine.eventManager.unregisterHandler(handler.socketEvent)
+            sock.close()
+            peer.close()
+    def testResetSeqNos(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        directory = tempfile.TemporaryDirectory()
+        for engine in [FIXEngine(directory.name, journalClass=LogJournaler), FIXEngine()]:
+            session = engine.createSession("T1", "S1")
+            sock, peer = socket.socketpair()
+            try:
+                handler = FIXConnectionHandler(engine, protocol, sock)
+                handler.session = session
+                handler.sendMsg(self.order(protocol, "a"))
+                self.assertEqual(1, session.sndSeqNum)
+                if engine.journaller.__class__ is LogJournaler:
+                    handler.resetSeqNos()
+                    self.assertEqual(0, session.sndSeqNum)
+                    handler.sendMsg(self.order(protocol, "b"))
+                    self.assertEqual([("1", "a"), ("1", "b")], [(msg[protocol.fixtags.MsgSeqNum], msg[protocol.fixtags.ClOrdID]) for msg in self.receivedFrames(protocol, peer)])
+                else:
+                    # an in memory journal can't keep the old sequence, the logon is refused and nothing is lost
+                    self.assertRaises(SessionError, handler.resetSeqNos)
+                    self.assertEqual(1, session.sndSeqNum)
+                    self.assertEqual(1, len(engine.journaller.recoverMsgs(session, MessageDirection.OUTBOUND, 1, 10)))
+            finally:
+                engine.eventManager.unregisterHandler(handler.socketEvent)
+                engine.close()
+                sock.close()
+                peer.close()
+        directory.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pyfix import dictionary
+from pyfix.dictionary import load_dictionary, GroupDef, PARSE_FIELD, PARSE_GROUP, PARSE_DELIMITER, PARSE_END
+
+
+class DictionaryTests(unittest.TestCase):
+    def setUp(self):
+        self.cacheDir = tempfile.mkdtemp()
+        dictionary._dictionaries.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.cacheDir)
+        dictionary._dictionaries.clear()
+
+    def testIndex(self):
+        d = load_dictionary('fix_repository_4_4.xml', self.cacheDir)
+        self.assertIn(35, d.header_tags)
+        self.assertIn(49, d.header_tags)
+        self.assertNotIn(11, d.header_tags)
+
+        newOrder = d.messages['D']
+        self.assertEqual('NewOrderSingle', newOrder.name)
+        self.assertIs(newOrder, newOrder.index[11])
+
+        self.assertEqual('Price', d.field_types[44])
+        self.assertEqual('char', d.field_types[54])
+        self.assertEqual('SeqNum', d.field_types[34])
+
+        allocation = d.messages['J']
+        self.assertIsInstance(allocation.index[73], GroupDef)
+        self.assertIs(allocation.index[73], allocation.index[73].index[11])
+
+    def testParseTables(self):
+        d = load_dictionary('fix_repository_4_4.xml', self.cacheDir)
+        table = d.parse_tables['J']
+        self.assertEqual((PARSE_FIELD, None), table.default)
+        self.assertEqual(PARSE_FIELD, table.transitions[70][0])
+
+        action, parties = table.transitions[453]
+        self.assertEqual(PARSE_GROUP, action)
+        self.assertEqual(448, parties.delimiter)
+        self.assertEqual({448: (PARSE_DELIMITER, parties)}, parties.start)
+        self.assertEqual((PARSE_END, None), parties.default)
+        self.assertEqual(PARSE_FIELD, parties.transitions[447][0])
+
+        action, subIDs = parties.transitions[802]
+        self.assertEqual(PARSE_GROUP, action)
+        self.assertEqual(523, subIDs.delimiter)
+        # groups are shared between the messages using them
+        self.assertIs(parties, d.parse_tables['D'].transitions[453][1])
+
+    def testCache(self):
+        d = load_dictionary('fix_repository_4_4.xml', self.cacheDir)
+        self.assertIs(d, load_dictionary('fix_repository_4_4.xml', self.cacheDir))
+        self.assertEqual(1, len(os.listdir(self.cacheDir)))
+
+        dictionary._dictionaries.clear()
+        cached = load_dictionary('fix_repository_4_4.xml', self.cacheDir)
+        self.assertIsNot(d, cached)
+        self.assertEqual(d.field_names, cached.field_names)
+        self.assertEqual(set(d.messages), set(cached.messages))
+        self.assertEqual(d.header_tags, cached.header_tags)
+
+
+if __name__ == '__main__':
+    unittest.main()
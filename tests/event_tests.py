@@ -1,6 +1,29 @@
 import datetime
+import socket
 import unittest
-from pyfix.event import EventManager, TimerEventRegistration
+from pyfix.clock import Clock
+from pyfix.event import EventLoop, EventManager, EventType, FileDescriptorEventRegistration, SelectEventLoop, SelectorEventLoop, TimerEventRegistration
+
+
+class ManualClock(Clock):
+    def __init__(self):
+        Clock.__init__(self)
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class SleeplessEventLoop(EventLoop):
+    """Moves the clock on by the timeout rather than waiting for it"""
+    def __init__(self, clock):
+        self.clock = clock
+        self.timeouts = []
+
+    def run(self, timeout):
+        self.timeouts.append(timeout)
+        self.clock.now += timeout
+        return []
 
 
 class EventTimerTests(unittest.TestCase):
@@ -19,3 +42,120 @@ class EventTimerTests(unittest.TestCase):
 
         for i in range(0, 3):
             mgr.waitForEventWithTimeout(10.0)
+
+    def testTimerScheduling(self):
+        clock = ManualClock()
+        loop = SleeplessEventLoop(clock)
+        mgr = EventManager(clock, loop)
+        fired = []
+        timers = {}
+        for name, timeout in (("heartbeat", 30.0), ("expected", 33.0), ("batch", 0.5)):
+            timers[name] = TimerEventRegistration(lambda type, closure: fired.append((closure, clock.now)), timeout, name)
+            mgr.registerHandler(timers[name])
+
+        mgr.waitForEventWithTimeout(10.0)
+        self.assertEqual([0.5], loop.timeouts)
+        self.assertEqual([("batch", 1000.5)], fired)
+        mgr.unregisterHandler(timers["batch"])
+        self.assertIsNone(timers["batch"].deadline)
+
+        # resets on every message received push the deadline on
+        for i in range(100):
+            clock.now += 0.1
+            timers["expected"].reset()
+        self.assertAlmostEqual(1043.5, timers["expected"].deadline)
+        self.assertAlmostEqual(33.0, timers["expected"].timeLeft())
+        del fired[:]
+        mgr.waitForEventWithTimeout(None)
+        self.assertEqual([("heartbeat", 1030.0)], fired)
+        mgr.waitForEventWithTimeout(None)
+        self.assertEqual("expected", fired[-1][0])
+        self.assertAlmostEqual(1043.5, fired[-1][1])
+        # the unregistered batch timer's entry went when it came to the top
+        self.assertEqual(2, len(mgr.timers))
+
+        # nor do timers unregistered before they are due pile up
+        for i in range(1000):
+            timer = TimerEventRegistration(lambda type, closure: None, 1.0)
+            mgr.registerHandler(timer)
+            mgr.unregisterHandler(timer)
+        self.assertLess(len(mgr.timers), 100)
+        self.assertEqual(2, mgr.timerCount)
+
+    def testCallAfterEvents(self):
+        mgr = EventManager()
+        calls = []
+        mgr.callAfterEvents(lambda: calls.append("now"))
+        self.assertEqual(["now"], calls)
+
+        def onTimeout(fire, closure):
+            mgr.callAfterEvents(lambda: calls.append("after"))
+            calls.append("timer")
+
+        mgr.registerHandler(TimerEventRegistration(onTimeout, 0.1))
+        mgr.waitForEventWithTimeout(1.0)
+        self.assertEqual(["now", "timer", "after"], calls)
+
+
+class EventLoopTests(unittest.TestCase):
+    def checkFileDescriptorEvents(self, mgr):
+        sock, peer = socket.socketpair()
+        try:
+            calls = []
+            def onReady(type, closure):
+                calls.append((closure, type, sock.recv(100) if type == EventType.READ else None))
+
+            reader = FileDescriptorEventRegistration(onReady, sock, EventType.READ, "reader")
+            mgr.registerHandler(reader)
+            mgr.registerHandler(TimerEventRegistration(lambda type, closure: None, 0.05))
+            peer.send(b"hello")
+            mgr.waitForEventWithTimeout(1.0)
+            self.assertEqual([("reader", EventType.READ, b"hello")], calls)
+
+            # a second handler on the same socket, and interest in writing added to the first
+            writes = []
+            writer = FileDescriptorEventRegistration(lambda type, closure: writes.append(type), sock, EventType.WRITE)
+            mgr.registerHandler(writer)
+            mgr.modifyHandler(reader, EventType.READWRITE)
+            mgr.waitForEventWithTimeout(1.0)
+            self.assertEqual([EventType.WRITE], writes)
+            self.assertEqual(("reader", EventType.WRITE, None), calls[-1])
+
+            # unregistering the writer leaves the reader, which then only wants to read again
+            mgr.unregisterHandler(writer)
+            mgr.modifyHandler(reader, EventType.READ)
+            del calls[:]
+            mgr.waitForEventWithTimeout(0.1)
+            self.assertEqual(([], [EventType.WRITE]), (calls, writes))
+
+            # connections close their socket before unregistering it
+            sock.close()
+            mgr.unregisterHandler(reader)
+            self.assertFalse(mgr.isRegistered(reader))
+            self.assertEqual({}, mgr.fdHandlers)
+        finally:
+            sock.close()
+            peer.close()
+
+    def checkUnregisterWhileServicing(self, mgr):
+        sock, peer = socket.socketpair()
+        try:
+            calls = []
+            first = FileDescriptorEventRegistration(lambda type, closure: (calls.append("first"), mgr.unregisterHandler(second)), sock, EventType.READ)
+            second = FileDescriptorEventRegistration(lambda type, closure: calls.append("second"), sock, EventType.READ)
+            mgr.registerHandler(first)
+            mgr.registerHandler(second)
+            peer.send(b"x")
+            mgr.waitForEventWithTimeout(1.0)
+            self.assertEqual(["first"], calls)
+        finally:
+            sock.close()
+            peer.close()
+
+    def testSelectorEventLoop(self):
+        self.checkFileDescriptorEvents(EventManager(eventLoop=SelectorEventLoop()))
+        self.checkUnregisterWhileServicing(EventManager(eventLoop=SelectorEventLoop()))
+
+    def testSelectEventLoop(self):
+        self.checkFileDescriptorEvents(EventManager(eventLoop=SelectEventLoop()))
+        self.checkUnregisterWhileServicing(EventManager(eventLoop=SelectEventLoop()))
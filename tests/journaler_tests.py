@@ -1,10 +1,35 @@
+import datetime
+import importlib
+import os
+import sqlite3
+import tempfile
+import time
 import unittest
+from pyfix import journalarchive
+from pyfix.clock import Clock
+from pyfix.codec import Codec
 from pyfix.connection import MessageDirection
-from pyfix.journaler import Journaler
+from pyfix.engine import FIXEngine
+from pyfix.journaler import Journaler, DurabilityPolicy, DuplicateSeqNoError
+from pyfix.logjournal import LogJournaler
 from pyfix.message import FIXMessage, FIXContext
+from pyfix.record import encodeRecord
 from pyfix.session import FIXSession
 
 
+class FakeClock(Clock):
+    def __init__(self):
+        Clock.__init__(self)
+        self.now = 0.0
+        self.wallTime = 1434712134.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.wallTime
+
+
 class JournalerTests(unittest.TestCase):
     def testAddExtractMsg(self):
         journal = Journaler()
@@ -50,3 +75,317 @@ class JournalerTests(unittest.TestCase):
         for i in range(0, len(msgs)):
             msg.setField("34", str(i))
             self.assertEqual(msg, msgs[i])
+
+    def testIterMsgs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            journal = Journaler(os.path.join(directory, "journal.store"))
+            session = journal.createSession("T1", "S1")
+            self.persist(journal, session, range(1, 11))
+
+            # messages can be journalled, and committed, while a range is being read
+            msgs = journal.iterMsgs(session, MessageDirection.INBOUND, 2, 100, chunkSize=3)
+            seqNos = []
+            for msg in msgs:
+                seqNos.append(msg["34"])
+                if msg["34"] == "3":
+                    self.persist(journal, session, [11])
+            self.assertEqual([str(seqNo) for seqNo in range(2, 11)], seqNos[:9])
+
+            allMsgs = list(journal.iterAllMsgs([session.key], MessageDirection.INBOUND, chunkSize=4))
+            self.assertEqual(list(range(1, 12)), [seqNo for seqNo, msg, direction, key in allMsgs])
+            self.assertEqual([(seqNo, msg) for seqNo, msg, direction, key in allMsgs], [(seqNo, msg) for seqNo, msg, direction, key in journal.getAllMsgs()])
+            journal.conn.close()
+
+    def persist(self, journal, session, seqNos):
+        for seqNo in seqNos:
+            msg = FIXMessage("0")
+            msg.setField(34, str(seqNo))
+            journal.persistMsg(msg, session, MessageDirection.INBOUND)
+
+    def testDurability(self):
+        session = FIXSession(1, "S1", "T1")
+
+        journal = Journaler()
+        self.persist(journal, session, [1])
+        self.assertFalse(journal.conn.in_transaction)
+
+        journal = Journaler(durability=DurabilityPolicy.BATCHED, batchSize=3)
+        self.persist(journal, session, [1, 2])
+        self.assertTrue(journal.conn.in_transaction)
+        journal.beforeSend()
+        self.assertTrue(journal.conn.in_transaction)
+        self.persist(journal, session, [3])
+        self.assertFalse(journal.conn.in_transaction)
+        self.persist(journal, session, [4])
+        journal.endOfBatch()
+        self.assertFalse(journal.conn.in_transaction)
+
+        journal = Journaler(durability=DurabilityPolicy.SYNC_BEFORE_SEND)
+        self.persist(journal, session, [1])
+        self.assertTrue(journal.conn.in_transaction)
+        journal.beforeSend()
+        self.assertFalse(journal.conn.in_transaction)
+
+        clock = FakeClock()
+        journal = Journaler(durability=DurabilityPolicy.ASYNC, batchInterval=0.1, clock=clock)
+        self.persist(journal, session, [1])
+        journal.endOfBatch()
+        journal.checkBatchInterval()
+        self.assertTrue(journal.conn.in_transaction)
+        clock.now = 0.2
+        journal.checkBatchInterval()
+        self.assertFalse(journal.conn.in_transaction)
+        self.persist(journal, session, [2])
+        clock.now = 0.4
+        self.persist(journal, session, [3])
+        self.assertFalse(journal.conn.in_transaction)
+        self.assertEqual(3, len(journal.recoverMsgs(session, MessageDirection.INBOUND, 1, 3)))
+
+    def testEngineCommitsAfterEvents(self):
+        engine = FIXEngine(durability=DurabilityPolicy.BATCHED)
+        session = engine.createSession("T1", "S1")
+        engine.eventManager.servicingEvents = True
+        self.persist(engine.journaller, session, [1, 2])
+        self.assertTrue(engine.journaller.conn.in_transaction)
+        engine.eventManager.servicingEvents = False
+        engine.eventManager._runAfterEventsCallbacks()
+        self.assertFalse(engine.journaller.conn.in_transaction)
+
+    def testSessionSeqNos(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "journal.store")
+            journal = Journaler(filename, DurabilityPolicy.BATCHED)
+            session1 = journal.createSession("T1", "S1")
+            session2 = journal.createSession("T2", "S2")
+            updates = []
+            journal.conn.set_trace_callback(lambda statement: updates.append(statement) if statement.startswith("UPDATE") else None)
+            self.persist(journal, session1, range(1, 101))
+            self.persist(journal, session2, range(1, 4))
+            for seqNo in range(1, 6):
+                msg = FIXMessage("0")
+                msg.setField(34, str(seqNo))
+                journal.persistMsg(msg, session2, MessageDirection.OUTBOUND)
+            self.assertEqual([], updates)
+            self.assertEqual([(0, 101), (5, 4)], [(s.sndSeqNum, s.nextExpectedMsgSeqNum) for s in journal.sessions()])
+
+            # one update per session and direction journalled to, when the batch is committed
+            journal.commit()
+            self.assertEqual(3, len(updates))
+            journal.conn.close()
+
+            journal = Journaler(filename)
+            self.assertEqual([(0, 101), (5, 4)], [(s.sndSeqNum, s.nextExpectedMsgSeqNum) for s in journal.sessions()])
+            journal.close()
+
+    def order(self, seqNo, clOrdID, sendingTime, msgType = "D"):
+        msg = FIXMessage(msgType)
+        msg.setField(34, str(seqNo))
+        msg.setField(52, sendingTime)
+        msg.setField(11, clOrdID)
+        return msg
+
+    def testQueryMsgs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "journal.store")
+            journal = Journaler(filename, indexTags=())
+            session = journal.createSession("T1", "S1")
+            journal.persistMsg(self.order(1, "a", "20150619-09:00:00.000"), session, MessageDirection.INBOUND)
+            journal.close()
+
+            journal = Journaler(filename)
+            journal.persistMsg(self.order(2, "b", "20150619-10:00:00.000"), session, MessageDirection.INBOUND)
+            journal.persistMsg(self.order(3, "a", "20150619-11:00:00.000", "F"), session, MessageDirection.INBOUND)
+            codec = Codec(importlib.import_module("pyfix.FIX44"))
+            data, frames = codec.encode_frames([self.order(0, "a", "ignored", "8")], session)
+            seqNo, msgType, frame = frames[0]
+            journal.persistFrame(seqNo, msgType, frame, session, MessageDirection.OUTBOUND)
+
+            def query(*args, **kwargs):
+                return [(seqNo, direction) for seqNo, msg, direction, key in journal.queryMsgs(*args, **kwargs)]
+
+            self.assertEqual([(3, 0), (1, 1)], query({11: "a"}))
+            self.assertEqual(1, journal.indexMsgs())
+            self.assertEqual([(1, 0), (3, 0), (1, 1)], query({11: "a"}))
+            self.assertEqual([(1, 0), (3, 0)], query({11: "a"}, direction=MessageDirection.INBOUND))
+            self.assertEqual([(1, 1)], query({35: "8"}))
+            self.assertEqual([(2, 0)], query({35: "D"}, {52: ("20150619-09:30:00", None)}))
+            self.assertEqual([(1, 0), (2, 0)], query(ranges={52: ("20150619", "20150619-10:00:00.000")}))
+            self.assertEqual([], query({11: "a"}, sessions=["2"]))
+            self.assertEqual("b", next(journal.queryMsgs({11: "b"}))[1][11])
+            self.assertRaises(ValueError, query, {55: "VOD.L"})
+
+            journal.roll()
+            journal.cursor.execute("SELECT COUNT(*) FROM message_key")
+            self.assertEqual(0, journal.cursor.fetchone()[0])
+            # archived messages are still found, by decoding them, unless only the active journal is asked for
+            self.assertEqual([(1, 0), (3, 0), (1, 1)], query({11: "a"}))
+            self.assertEqual([(2, 0)], query({35: "D"}, {52: ("20150619-09:30:00", None)}))
+            self.assertEqual([(1, 0), (2, 0)], query(ranges={52: ("20150619", "20150619-10:00:00.000")}))
+            self.assertEqual([], query({11: "a"}, sessions=["2"]))
+            self.assertEqual([], query({11: "a"}, archived=False))
+            journal.persistMsg(self.order(4, "a", "20150619-12:00:00.000"), session, MessageDirection.INBOUND)
+            self.assertEqual([(1, 0), (3, 0), (1, 1), (4, 0)], query({11: "a"}))
+            self.assertEqual([(4, 0)], query({11: "a"}, archived=False))
+            journal.close()
+
+    def testQueryGroupFields(self):
+        # only top level fields are keys, a ClOrdID in the NoOrders group of an allocation isn't
+        with tempfile.TemporaryDirectory() as directory:
+            journal = Journaler(os.path.join(directory, "journal.store"))
+            session = journal.createSession("T1", "S1")
+            protocol = importlib.import_module("pyfix.FIX44")
+            allocation = FIXMessage(protocol.msgtype.AllocationInstruction)
+            allocation.setField(protocol.fixtags.AllocID, "alloc")
+            order = FIXContext()
+            order.setField(protocol.fixtags.ClOrdID, "a")
+            allocation.addRepeatingGroup(protocol.fixtags.NoOrders, order)
+            data, frames = Codec(protocol).encode_frames([allocation, self.order(0, "a", "ignored", "8")], session)
+            for seqNo, msgType, frame in frames:
+                journal.persistFrame(seqNo, msgType, frame, session, MessageDirection.OUTBOUND)
+
+            def query(*args, **kwargs):
+                return [(seqNo, direction) for seqNo, msg, direction, key in journal.queryMsgs(*args, **kwargs)]
+
+            before = (query({11: "a"}), query({35: "J"}))
+            self.assertEqual(([(2, 1)], [(1, 1)]), before)
+            journal.roll()
+            self.assertEqual(before, (query({11: "a"}), query({35: "J"})))
+            journal.close()
+
+    def testRoll(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "journal.store")
+            clock = FakeClock()
+            journal = Journaler(filename, clock=clock, retentionDays=2)
+            session1 = journal.createSession("T1", "S1")
+            session2 = journal.createSession("T2", "S2")
+            for seqNo in range(1, 4):
+                self.persist(journal, session1, [seqNo])
+                self.persist(journal, session2, [seqNo])
+            msg = FIXMessage("D")
+            msg.setField(34, "1")
+            journal.persistMsg(msg, session1, MessageDirection.OUTBOUND)
+            before = journal.getAllMsgs()
+
+            journal.roll()
+            journal.cursor.execute("SELECT COUNT(*) FROM message")
+            self.assertEqual(0, journal.cursor.fetchone()[0])
+            self.assertEqual(2, len(os.listdir(journal.archiveDirectory)))
+            self.assertEqual(before, journal.getAllMsgs())
+            # rolling doesn't end the sequence, resend requests and the duplicate check still see the rolled messages
+            self.assertEqual(["2", "3"], [msg[34] for msg in journal.recoverMsgs(session1, MessageDirection.INBOUND, 2, 10)])
+            self.assertRaises(DuplicateSeqNoError, self.persist, journal, session1, [2])
+
+            # a sequence reset starts again from 1, after the archived messages
+            clock.wallTime += 86400
+            journal.resetSeqNos(session2)
+            self.persist(journal, session2, [1])
+            journal.roll([session2.key])
+            self.persist(journal, session1, [4])
+            self.persist(journal, session2, [2])
+            after = [(seqNo, direction, key) for seqNo, msg, direction, key in journal.getAllMsgs()]
+            self.assertEqual([(seqNo, direction, key) for seqNo, msg, direction, key in before] + [(1, 0, '2'), (4, 0, '1'), (2, 0, '2')], after)
+            self.assertEqual([1, 2, 3, 1, 2], [seqNo for seqNo, msg, direction, key in journal.getAllMsgs([session2.key])])
+            self.assertEqual([1], [seqNo for seqNo, msg, direction, key in journal.getAllMsgs([session1.key], MessageDirection.OUTBOUND)])
+            self.assertEqual(4, len(journal.recoverMsgs(session1, MessageDirection.INBOUND, 1, 4)))
+            self.assertEqual(["1", "2"], [msg[34] for msg in journal.recoverMsgs(session2, MessageDirection.INBOUND, 1, 10)])
+            self.assertRaises(DuplicateSeqNoError, self.persist, journal, session2, [1])
+            journal.close()
+
+            # messages left behind by a roll which didn't finish are dropped, new ones still come after the archive
+            journalarchive.writeSegment(journal.archiveDirectory, str(session1.key), clock.wallTime, [(9, 4, 0, encodeRecord(msg))])
+            journal = Journaler(filename, clock=clock, retentionDays=2)
+            self.assertEqual(after, [(seqNo, direction, key) for seqNo, msg, direction, key in journal.getAllMsgs()])
+            self.assertRaises(DuplicateSeqNoError, self.persist, journal, session1, [4])
+            self.persist(journal, session1, [5])
+            seqNo, msg, direction, key = journal.getAllMsgs()[-1]
+            self.assertEqual((5, 0, '1'), (seqNo, direction, key))
+
+            # only what was rolled in the last two days is kept
+            clock.wallTime += 2 * 86400
+            journal.roll()
+            self.assertEqual([(1, 0, '2'), (4, 0, '1'), (2, 0, '2'), (5, 0, '1')], [(seqNo, direction, key) for seqNo, msg, direction, key in journal.getAllMsgs()])
+            journal.close()
+
+    def testResetSeqNosKeepsHistory(self):
+        journal = Journaler()
+        session = journal.createSession("T1", "S1")
+        self.persist(journal, session, [1, 2])
+        # an in memory journal has no archive to keep the old sequence in
+        self.assertRaises(RuntimeError, journal.resetSeqNos, session)
+        self.assertEqual(2, len(journal.recoverMsgs(session, MessageDirection.INBOUND, 1, 10)))
+        self.assertEqual(3, journal.sessions()[0].nextExpectedMsgSeqNum)
+
+    def testIterArchivedMsgs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            clock = FakeClock()
+            journal = Journaler(os.path.join(directory, "journal.store"), clock=clock)
+            session = journal.createSession("T1", "S1")
+            self.persist(journal, session, range(1, 11))
+            journal.roll()
+            self.persist(journal, session, range(11, 21))
+            journal.roll()
+            self.persist(journal, session, range(21, 26))
+
+            # the archive is read as the messages are iterated over, and only up to the end of the range
+            entries = journal._archivedEntries
+            read = []
+            journal._archivedEntries = lambda session, direction: (read.append(entry[1]) or entry for entry in entries(session, direction))
+            msgs = journal.iterMsgs(session, MessageDirection.INBOUND, 5, 22)
+            self.assertEqual("5", next(msgs)[34])
+            self.assertEqual(list(range(1, 6)), read)
+            self.assertEqual([str(seqNo) for seqNo in range(6, 23)], [msg[34] for msg in msgs])
+            self.assertEqual(list(range(1, 21)), read)
+            del read[:]
+            self.assertEqual(["2", "3"], [msg[34] for msg in journal.recoverMsgs(session, MessageDirection.INBOUND, 2, 3)])
+            self.assertEqual([1, 2, 3, 4], read)
+            journal.close()
+
+    def testReadOnly(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "journal.store")
+            clock = FakeClock()
+            journal = Journaler(filename, clock=clock)
+            session = journal.createSession("T1", "S1")
+            self.persist(journal, session, [1, 2])
+            journal.close()
+            # a roll which didn't finish, its message is still in the database
+            msg = FIXMessage("0")
+            msg.setField(34, "1")
+            journalarchive.writeSegment(filename + '.archive', str(session.key), clock.wallTime, [(1, 1, 0, encodeRecord(msg))])
+            with open(filename, 'rb') as f:
+                contents = f.read()
+
+            journal = Journaler(filename, clock=clock, readOnly=True)
+            self.assertEqual(3, journal.sessions()[0].nextExpectedMsgSeqNum)
+            self.assertEqual([1, 1, 2], [seqNo for seqNo, msg, direction, key in journal.getAllMsgs()])
+            self.assertEqual([1, 2], [seqNo for seqNo, msg, direction, key in journal.queryMsgs({35: "0"}, archived=False)])
+            self.assertRaises(sqlite3.OperationalError, self.persist, journal, session, [3])
+            journal.close()
+            with open(filename, 'rb') as f:
+                self.assertEqual(contents, f.read())
+
+            # opening it to write finishes the roll
+            journal = Journaler(filename, clock=clock)
+            self.assertEqual([1, 2], [seqNo for seqNo, msg, direction, key in journal.getAllMsgs()])
+            journal.close()
+            self.assertRaises(ValueError, Journaler, readOnly=True)
+
+    def testEngineRollsDaily(self):
+        with tempfile.TemporaryDirectory() as directory:
+            engine = FIXEngine(os.path.join(directory, "journal.store"), journalRollTime=datetime.time(22, 0))
+            self.assertTrue(0 < engine.nextJournalRoll - time.time() <= 86400)
+            self.assertEqual(79200, engine.nextJournalRoll % 86400)
+            session = engine.createSession("T1", "S1")
+            self.persist(engine.journaller, session, [1])
+            engine.checkJournalRoll()
+            self.assertEqual(1, len(engine.journaller.recoverMsgs(session, MessageDirection.INBOUND, 1, 1)))
+            engine.nextJournalRoll = 0
+            engine.checkJournalRoll()
+            self.assertEqual(0, engine.journaller.cursor.execute("SELECT COUNT(*) FROM message").fetchone()[0])
+            self.assertEqual(1, len(engine.journaller.recoverMsgs(session, MessageDirection.INBOUND, 1, 1)))
+            self.assertEqual(1, len(engine.journaller.getAllMsgs()))
+            engine.close()
+
+            # a journal which can't be rolled can't be rolled daily
+            self.assertRaises(RuntimeError, FIXEngine, os.path.join(directory, "log"), journalClass=LogJournaler, journalRollTime=datetime.time(22, 0))
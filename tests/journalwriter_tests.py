@@ -0,0 +1,137 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pyfix.engine import FIXEngine
+from pyfix.journaler import Journaler, DurabilityPolicy, DuplicateSeqNoError
+from pyfix.journalwriter import JournalWriter, JournalWriterError
+from pyfix.message import FIXMessage, MessageDirection
+
+
+class FailingJournaler(Journaler):
+    def _persist(self, seqNo, record, session, direction):
+        raise RuntimeError("disk full")
+
+
+class BlockedJournaler(Journaler):
+    # fails once released
+    def __init__(self, filename, durability):
+        Journaler.__init__(self, filename, durability)
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def _persist(self, seqNo, record, session, direction, keys = ()):
+        self.started.set()
+        self.released.wait()
+        raise RuntimeError("disk full")
+
+
+class JournalWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "journal.store")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def persist(self, journal, session, seqNos, direction = MessageDirection.OUTBOUND):
+        for seqNo in seqNos:
+            msg = FIXMessage("0")
+            msg.setField(34, str(seqNo))
+            journal.persistMsg(msg, session, direction)
+
+    def storedCount(self):
+        conn = sqlite3.connect(self.filename)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM message").fetchone()[0]
+        finally:
+            conn.close()
+
+    def testWriter(self):
+        journal = JournalWriter(Journaler(self.filename, DurabilityPolicy.BATCHED, batchSize=10), queueSize=5)
+        session = journal.createSession("T1", "S1")
+        self.persist(journal, session, range(1, 101))
+        self.persist(journal, session, range(1, 4), MessageDirection.INBOUND)
+
+        # reads see everything queued before them
+        self.assertEqual([str(seqNo) for seqNo in range(95, 101)], [msg[34] for msg in journal.recoverMsgs(session, MessageDirection.OUTBOUND, 95, 200)])
+        self.assertEqual(103, len(list(journal.iterAllMsgs(chunkSize=7))))
+
+        # duplicates are logged by the writer rather than raised
+        with self.assertLogs(level='ERROR'):
+            self.persist(journal, session, [50])
+            journal.commit()
+        self.persist(journal, session, [101])
+        journal.close()
+
+        journal = Journaler(self.filename)
+        restored = journal.sessions()[0]
+        self.assertEqual(101, restored.sndSeqNum)
+        self.assertEqual(4, restored.nextExpectedMsgSeqNum)
+        self.assertEqual(104, len(journal.getAllMsgs()))
+        journal.close()
+
+    def testSendBarrier(self):
+        journal = JournalWriter(Journaler(self.filename, DurabilityPolicy.SYNC_BEFORE_SEND))
+        session = journal.createSession("T1", "S1")
+        self.persist(journal, session, range(1, 51))
+        journal.beforeSend()
+        self.assertEqual(50, self.storedCount())
+        journal.close()
+
+    def testWriterFailure(self):
+        journal = JournalWriter(FailingJournaler(self.filename, DurabilityPolicy.BATCHED))
+        session = journal.createSession("T1", "S1")
+        with self.assertLogs(level='ERROR'):
+            self.persist(journal, session, [1])
+            self.assertRaises(JournalWriterError, journal.commit)
+        self.assertRaises(JournalWriterError, self.persist, journal, session, [2])
+
+    def testSyncDuplicates(self):
+        journal = JournalWriter(Journaler(self.filename, DurabilityPolicy.SYNC_PER_MESSAGE))
+        session = journal.createSession("T1", "S1")
+        self.persist(journal, session, [1, 2])
+        self.assertRaises(DuplicateSeqNoError, self.persist, journal, session, [2])
+        self.persist(journal, session, [3])
+        journal.close()
+
+        # before sending, inbound duplicates are raised as the message comes in, outbound ones are logged as flush does
+        journal = JournalWriter(Journaler(self.filename, DurabilityPolicy.SYNC_BEFORE_SEND))
+        session = journal.sessions()[0]
+        self.persist(journal, session, [1], MessageDirection.INBOUND)
+        self.assertRaises(DuplicateSeqNoError, self.persist, journal, session, [1], MessageDirection.INBOUND)
+        with self.assertLogs(level='ERROR'):
+            self.persist(journal, session, [3])
+            journal.beforeSend()
+        self.persist(journal, session, [4])
+        journal.beforeSend()
+        journal.close()
+
+        self.assertEqual(5, self.storedCount())
+
+    def testWriterStoppedWithFullQueue(self):
+        backend = BlockedJournaler(self.filename, DurabilityPolicy.BATCHED)
+        journal = JournalWriter(backend, queueSize=1)
+        session = journal.createSession("T1", "S1")
+        self.persist(journal, session, [1])
+        backend.started.wait()
+        self.persist(journal, session, [2])
+        # the writer fails while we wait for room in the queue
+        threading.Timer(0.1, backend.released.set).start()
+        with self.assertLogs(level='ERROR'):
+            self.assertRaises(JournalWriterError, self.persist, journal, session, [3])
+        self.assertFalse(journal.thread.is_alive())
+        self.assertRaises(JournalWriterError, journal.close)
+
+    def testEngine(self):
+        engine = FIXEngine(self.filename, DurabilityPolicy.SYNC_PER_MESSAGE, journalQueueSize=100)
+        session = engine.createSession("T1", "S1")
+        self.persist(engine.journaller, session, range(1, 4))
+        self.assertEqual(3, self.storedCount())
+        engine.close()
+        self.assertEqual(3, FIXEngine(self.filename).sessions[session.key].sndSeqNum)
+
+
+if __name__ == '__main__':
+    unittest.main()
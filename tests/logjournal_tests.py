@@ -0,0 +1,118 @@
+import shutil
+import tempfile
+import unittest
+from pyfix.engine import FIXEngine
+from pyfix.journaler import DuplicateSeqNoError, DurabilityPolicy
+from pyfix.logjournal import LogJournaler
+from pyfix.message import FIXMessage, FIXContext, MessageDirection
+
+
+class LogJournalerTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def buildMsg(self, seqNo):
+        msg = FIXMessage("AB")
+        msg.setField("34", str(seqNo))
+        msg.setField("45", "dgd")
+        group = FIXContext()
+        group.setField("611", "aaa")
+        msg.addRepeatingGroup("444", group)
+        return msg
+
+    def testPersistRecover(self):
+        journal = LogJournaler(self.directory, segmentSize=200)
+        session = journal.createSession("T1", "S1")
+        other = journal.createSession("T2", "S2")
+        self.assertRaises(RuntimeError, journal.createSession, "T1", "S1")
+
+        for seqNo in range(1, 21):
+            journal.persistMsg(self.buildMsg(seqNo), session, MessageDirection.OUTBOUND)
+            journal.persistMsg(self.buildMsg(seqNo), other, MessageDirection.INBOUND)
+        journal.persistMsg(self.buildMsg(1), session, MessageDirection.INBOUND)
+        self.assertRaises(DuplicateSeqNoError, journal.persistMsg, self.buildMsg(5), session, MessageDirection.OUTBOUND)
+        self.assertGreater(len(journal._stream(session.key, MessageDirection.OUTBOUND).segments), 1)
+
+        msgs = journal.recoverMsgs(session, MessageDirection.OUTBOUND, 5, 15)
+        self.assertEqual([str(i) for i in range(5, 16)], [msg[34] for msg in msgs])
+        self.assertEqual(self.buildMsg(7), msgs[2])
+        self.assertEqual(self.buildMsg(20), journal.recoverMsg(session, MessageDirection.OUTBOUND, 20))
+        self.assertIsNone(journal.recoverMsg(session, MessageDirection.OUTBOUND, 21))
+        self.assertEqual(msgs, list(journal.iterMsgs(session, MessageDirection.OUTBOUND, 5, 15, chunkSize=2)))
+
+        allMsgs = journal.getAllMsgs()
+        self.assertEqual(41, len(allMsgs))
+        self.assertEqual((1, MessageDirection.OUTBOUND.value, session.key), (allMsgs[0][0], allMsgs[0][2], allMsgs[0][3]))
+        self.assertEqual((1, MessageDirection.INBOUND.value, other.key), (allMsgs[1][0], allMsgs[1][2], allMsgs[1][3]))
+        self.assertEqual(20, len(journal.getAllMsgs([str(other.key)], MessageDirection.INBOUND)))
+        journal.close()
+
+        # everything is there after a restart
+        journal = LogJournaler(self.directory, segmentSize=200)
+        sessions = {s.key: s for s in journal.sessions()}
+        self.assertEqual(20, sessions[session.key].sndSeqNum)
+        self.assertEqual(2, sessions[session.key].nextExpectedMsgSeqNum)
+        self.assertEqual(21, sessions[other.key].nextExpectedMsgSeqNum)
+        self.assertEqual(self.buildMsg(3), journal.recoverMsg(session, MessageDirection.OUTBOUND, 3))
+        journal.persistMsg(self.buildMsg(21), session, MessageDirection.OUTBOUND)
+        allMsgs = journal.getAllMsgs()
+        self.assertEqual(42, len(allMsgs))
+        self.assertEqual("21", allMsgs[-1][1][34])
+        journal.close()
+
+    def testTruncatedIndex(self):
+        journal = LogJournaler(self.directory)
+        session = journal.createSession("T1", "S1")
+        for seqNo in range(1, 4):
+            journal.persistMsg(self.buildMsg(seqNo), session, MessageDirection.OUTBOUND)
+        journal.close()
+
+        segment = journal._stream(session.key, MessageDirection.OUTBOUND).segments[0]
+        with open(segment.indexPath, 'ab') as f:
+            f.write(b'\x01\x02\x03')
+        with open(segment.logPath, 'r+b') as f:
+            f.truncate(segment.offsets[2] + 1)
+
+        journal = LogJournaler(self.directory)
+        self.assertEqual(2, journal.sessions()[0].sndSeqNum)
+        journal.persistMsg(self.buildMsg(3), session, MessageDirection.OUTBOUND)
+        self.assertEqual(["1", "2", "3"], [msg[34] for msg in journal.recoverMsgs(session, MessageDirection.OUTBOUND, 0, 10)])
+        journal.close()
+
+    def testResetSeqNos(self):
+        journal = LogJournaler(self.directory, segmentSize=200)
+        session = journal.createSession("T1", "S1")
+        for seqNo in range(1, 4):
+            journal.persistMsg(self.buildMsg(seqNo), session, MessageDirection.OUTBOUND)
+        journal.persistMsg(self.buildMsg(1), session, MessageDirection.INBOUND)
+        journal.resetSeqNos(session)
+        self.assertEqual((0, 1), (journal.sessions()[0].sndSeqNum, journal.sessions()[0].nextExpectedMsgSeqNum))
+
+        # the new sequence starts again from 1, the old one is no longer recovered but is kept
+        journal.persistMsg(self.buildMsg(1), session, MessageDirection.OUTBOUND)
+        self.assertEqual([self.buildMsg(1)], journal.recoverMsgs(session, MessageDirection.OUTBOUND, 1, 10))
+        self.assertEqual([], journal.recoverMsgs(session, MessageDirection.INBOUND, 1, 10))
+        self.assertEqual([1, 2, 3, 1, 1], [seqNo for seqNo, msg, direction, key in journal.getAllMsgs()])
+        journal.close()
+
+        journal = LogJournaler(self.directory, segmentSize=200)
+        self.assertEqual((1, 1), (journal.sessions()[0].sndSeqNum, journal.sessions()[0].nextExpectedMsgSeqNum))
+        self.assertRaises(DuplicateSeqNoError, journal.persistMsg, self.buildMsg(1), session, MessageDirection.OUTBOUND)
+        journal.persistMsg(self.buildMsg(2), session, MessageDirection.OUTBOUND)
+        self.assertEqual(["1", "2"], [msg[34] for msg in journal.recoverMsgs(session, MessageDirection.OUTBOUND, 1, 10)])
+        self.assertEqual([1, 2, 3, 1, 1, 2], [seqNo for seqNo, msg, direction, key in journal.getAllMsgs()])
+        journal.close()
+
+    def testEngine(self):
+        engine = FIXEngine(self.directory, DurabilityPolicy.BATCHED, journalClass=LogJournaler)
+        session = engine.createSession("T1", "S1")
+        engine.journaller.persistMsg(self.buildMsg(1), session, MessageDirection.OUTBOUND)
+        engine.journaller.close()
+        self.assertEqual(1, FIXEngine(self.directory, journalClass=LogJournaler).sessions[session.key].sndSeqNum)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
 import pickle
+from datetime import datetime
+from decimal import Decimal
 from pyfix.message import FIXMessage, FIXContext
 
 __author__ = 'tom'
@@ -61,5 +63,145 @@ class FIXMessageTests(unittest.TestCase):
         msg2 = pickle.loads(str)
         self.assertEqual(msg, msg2)
 
+    def testEquality(self):
+        def build(side):
+            msg = FIXMessage("D")
+            msg.setField(11, "abc")
+            msg.setField(54, side)
+            group = FIXContext()
+            group.setField(448, "P1")
+            msg.addRepeatingGroup(453, group)
+            return msg
+
+        self.assertEqual(build("1"), build("1"))
+        self.assertEqual(build(1), build("1"))
+        self.assertEqual(hash(build(1)), hash(build("1")))
+        self.assertNotEqual(build("1"), build("2"))
+        self.assertNotEqual(build("1"), FIXMessage("D"))
+
+        other = build("1")
+        other.getRepeatingGroupByIndex(453, 0).setField(448, "P2")
+        self.assertNotEqual(build("1"), other)
+        other.setMsgType("G")
+        other.getRepeatingGroupByIndex(453, 0).setField(448, "P1")
+        self.assertNotEqual(build("1"), other)
+
+        self.assertFalse(hasattr(build("1"), '__dict__'))
+
+    def testManyFields(self):
+        msg = FIXMessage("D")
+        for tag in range(100, 200):
+            msg.setField(tag, str(tag))
+        msg.removeField(150)
+        msg.setField(120, "x")
+        self.assertEqual("x", msg[120])
+        self.assertEqual("199", msg[199])
+        self.assertNotIn(150, msg)
+        self.assertEqual([tag for tag in range(100, 200) if tag != 150], list(msg.tags))
+        self.assertEqual(msg, pickle.loads(pickle.dumps(msg)))
+
+    def testRepeatingGroupLookup(self):
+        msg = FIXMessage("J")
+        for i in range(200):
+            group = FIXContext()
+            group.setField(448, "P%d" % (i, ))
+            group.setField(452, str(i % 3))
+            msg.addRepeatingGroup(453, group)
+
+        self.assertEqual("P150", msg.getRepeatingGroupByTag(453, 448, "P150")[448])
+        self.assertEqual("P1", msg.getRepeatingGroupByTag(453, 452, "1")[448])
+        self.assertIsNone(msg.getRepeatingGroupByTag(453, 448, "P200"))
+        self.assertIsNone(msg.getRepeatingGroupByTag(453, 11, "x"))
+
+        # misses on an index which is still current don't rebuild it
+        container = msg.tags.privateContainer(453)
+        indexes = container.indexes
+        for i in range(10):
+            self.assertIsNone(msg.getRepeatingGroupByTag(453, 448, "P%d" % (200 + i, )))
+        self.assertIs(indexes, container.indexes)
+
+        # changes to the groups are picked up
+        msg.getRepeatingGroupByTag(453, 448, "P150").setField(448, "X")
+        self.assertIsNone(msg.getRepeatingGroupByTag(453, 448, "P150"))
+        self.assertEqual("0", msg.getRepeatingGroupByTag(453, 448, "X")[452])
+
+        msg.removeRepeatingGroupByIndex(453, 0)
+        self.assertIsNone(msg.getRepeatingGroupByTag(453, 448, "P0"))
+        self.assertEqual("P1", msg.getRepeatingGroupByTag(453, 452, "1")[448])
+
+        group = FIXContext()
+        group.setField(448, "P200")
+        group.setField(452, "1")
+        msg.addRepeatingGroup(453, group, 0)
+        self.assertIs(group, msg.getRepeatingGroupByTag(453, 448, "P200"))
+        self.assertIs(group, msg.getRepeatingGroupByTag(453, 452, "1"))
+
+        msg.getRepeatingGroup(453)[1].append(FIXContext())
+        msg.getRepeatingGroup(453)[1][-1].setField(448, "P201")
+        self.assertEqual("P201", msg.getRepeatingGroupByTag(453, 448, "P201")[448])
+
+        copy = pickle.loads(pickle.dumps(msg))
+        self.assertEqual(msg, copy)
+        copy.getRepeatingGroupByTag(453, 448, "P201").setField(448, "P202")
+        self.assertEqual("P202", copy.getRepeatingGroupByTag(453, 448, "P202")[448])
+
+    def testClone(self):
+        msg = FIXMessage("D")
+        msg.setField(11, "abc")
+        msg.setField(55, "VOD.L")
+        for party in ("P1", "P2"):
+            group = FIXContext()
+            group.setField(448, party)
+            msg.addRepeatingGroup(453, group)
+        original = str(msg)
+
+        copy = msg.clone()
+        self.assertEqual(msg, copy)
+        self.assertIs(msg.tags.valueList, copy.tags.valueList)
+
+        copy.removeField(55)
+        copy.setField(43, "Y")
+        copy.getRepeatingGroupByIndex(453, 1).setField(448, "P3")
+        copy.addRepeatingGroup(453, FIXContext())
+        self.assertEqual(original, str(msg))
+        self.assertEqual("11=abc|453=3=>[448=P1, 448=P3, ]|43=Y", str(copy))
+        # the groups which weren't changed are still shared
+        self.assertIs(msg.getRepeatingGroupByIndex(453, 0).tags.valueList, copy.getRepeatingGroupByIndex(453, 0).tags.valueList)
+
+        # and the other way around
+        copy = msg.clone()
+        msg.getRepeatingGroupByIndex(453, 0).setField(448, "X")
+        msg.setField(11, "def")
+        self.assertEqual(original, str(copy))
+
+    def testTypedAccessors(self):
+        from pyfix.FIX44 import dictionary, fixtags
+
+        msg = FIXMessage("D")
+        msg.setField(fixtags.MsgSeqNum, "42")
+        msg.setField(fixtags.Price, "123.45")
+        msg.setField(fixtags.SendingTime, "20150619-11:08:54.123")
+        msg.setField(fixtags.PossDupFlag, "Y")
+        msg.setField(fixtags.Side, "1")
+
+        self.assertEqual(42, msg.getInt(fixtags.MsgSeqNum))
+        self.assertEqual(Decimal("123.45"), msg.getDecimal(fixtags.Price))
+        self.assertEqual(123.45, msg.getFloat(fixtags.Price))
+        self.assertEqual(datetime(2015, 6, 19, 11, 8, 54, 123000), msg.getTimestamp(fixtags.SendingTime))
+        self.assertTrue(msg.getBool(fixtags.PossDupFlag))
+
+        self.assertEqual(42, msg.getTypedField(fixtags.MsgSeqNum, dictionary))
+        self.assertEqual(Decimal("123.45"), msg.getTypedField(fixtags.Price, dictionary))
+        self.assertEqual(datetime(2015, 6, 19, 11, 8, 54, 123000), msg.getTypedField(fixtags.SendingTime, dictionary))
+        self.assertEqual("1", msg.getTypedField(fixtags.Side, dictionary))
+
+        # converted values are cached until the field changes
+        self.assertIs(msg.getDecimal(fixtags.Price), msg.getDecimal(fixtags.Price))
+        msg.setField(fixtags.Price, "99")
+        self.assertEqual(Decimal("99"), msg.getDecimal(fixtags.Price))
+        msg.removeField(fixtags.Price)
+        self.assertRaises(KeyError, msg.getDecimal, fixtags.Price)
+
+
 if __name__ == '__main__':
     unittest.main()
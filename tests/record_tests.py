@@ -0,0 +1,147 @@
+import importlib
+import pickle
+import unittest
+from pyfix.codec import Codec
+from pyfix.journaler import Journaler, DuplicateSeqNoError
+from pyfix.message import FIXMessage, FIXContext, FIXMessageView, MessageDirection
+from pyfix.record import encodeRecord, decodeRecord, RecordError, encodeRawRecord, VERSION, RAW_VERSION
+from pyfix.session import FIXSession
+
+
+class RecordTests(unittest.TestCase):
+    def buildMsg(self):
+        msg = FIXMessage("AB")
+        msg.setField(34, "7")
+        msg.setField(58, "café " * 100)
+        msg.setField(44, 123)
+        for party in ("P1", "P2"):
+            group = FIXContext()
+            group.setField(448, party)
+            subGroup = FIXContext()
+            subGroup.setField(523, "sub" + party)
+            group.addRepeatingGroup(802, subGroup)
+            msg.addRepeatingGroup(453, group)
+        return msg
+
+    def testRoundTrip(self):
+        msg = self.buildMsg()
+        record = encodeRecord(msg)
+        decoded = decodeRecord(record)
+        self.assertEqual("AB", decoded.msgType)
+        self.assertIsNotNone(decoded.tags.data)
+        self.assertEqual(msg, decoded)
+        self.assertEqual(str(msg), str(decoded))
+        self.assertEqual("subP2", decoded.getRepeatingGroupByIndex(453, 1).getRepeatingGroupByIndex(802, 0)[523])
+        self.assertLess(len(record), len(pickle.dumps(msg)))
+
+        decoded = decodeRecord(record)
+        decoded.setField(43, "Y")
+        self.assertEqual(str(msg) + "|43=Y", str(decoded))
+        self.assertEqual(decoded, pickle.loads(pickle.dumps(decodeRecord(encodeRecord(decoded)))))
+
+    def testCorrupt(self):
+        record = encodeRecord(self.buildMsg())
+        self.assertRaises(RecordError, decodeRecord, b'\x80' + record[1:])
+        self.assertRaises(RecordError, str, decodeRecord(record[:40]))
+
+    def testLegacyJournal(self):
+        journal = Journaler()
+        session = FIXSession(1, "S1", "T1")
+        msg = self.buildMsg()
+        journal.cursor.execute("INSERT INTO message VALUES(?, ?, ?, ?)", (7, session.key, MessageDirection.OUTBOUND.value, pickle.dumps(msg)))
+        msg.setField(34, "8")
+        journal.persistMsg(msg, session, MessageDirection.OUTBOUND)
+
+        msgs = journal.recoverMsgs(session, MessageDirection.OUTBOUND, 7, 8)
+        self.assertEqual(["7", "8"], [m[34] for m in msgs])
+        self.assertEqual(msg, msgs[1])
+
+    def testRawRecord(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        codec = Codec(protocol)
+        session = FIXSession(1, "T1", "S1")
+        msg = FIXMessage(protocol.msgtype.NewOrderSingle)
+        msg.setField(protocol.fixtags.ClOrdID, "abc")
+        for party in ("P1", "P2"):
+            group = FIXContext()
+            group.setField(protocol.fixtags.PartyID, party)
+            msg.addRepeatingGroup(protocol.fixtags.NoPartyIDs, group)
+        data, frames = codec.encode_frames([msg], session)
+        seqNo, msgType, frame = frames[0]
+
+        journal = Journaler()
+        journal.persistFrame(seqNo, msgType, frame, session, MessageDirection.OUTBOUND)
+        self.assertRaises(DuplicateSeqNoError, journal.persistFrame, seqNo, msgType, frame, session, MessageDirection.OUTBOUND)
+        decoded = codec.decodeFrame(frame)
+
+        recovered = journal.recoverMsg(session, MessageDirection.OUTBOUND, 1)
+        self.assertEqual("D", recovered.msgType)
+        self.assertEqual("1", recovered[protocol.fixtags.MsgSeqNum])
+        self.assertEqual(str(decoded), str(recovered))
+        self.assertEqual(decoded, recovered)
+        self.assertEqual("P2", recovered.getRepeatingGroupByIndex(protocol.fixtags.NoPartyIDs, 1)[protocol.fixtags.PartyID])
+        self.assertEqual(decoded, pickle.loads(pickle.dumps(recovered)))
+
+        self.assertRaises(RecordError, decodeRecord, encodeRawRecord("D", b'8=FIX.4.4\x019=5'))
+        self.assertRaises(RecordError, decodeRecord, encodeRawRecord("D", b'8=FIX.0.0\x019=5\x0135=D\x0110=000\x01'))
+
+
+    def testInboundViewsStoredRaw(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        codec = Codec(protocol)
+        session = FIXSession(1, "T1", "S1")
+        msgs = []
+        for clOrdID in ("a", "b"):
+            msg = FIXMessage(protocol.msgtype.NewOrderSingle)
+            msg.setField(protocol.fixtags.ClOrdID, clOrdID)
+            group = FIXContext()
+            group.setField(protocol.fixtags.PartyID, "P1")
+            msg.addRepeatingGroup(protocol.fixtags.NoPartyIDs, group)
+            msgs.append(msg)
+        data, frames = codec.encode_frames(msgs, session)
+
+        journal = Journaler()
+        received = codec.decodeFrame(frames[0][2])
+        journal.persistMsg(received, session, MessageDirection.INBOUND)
+        # nothing but the seqNo and the indexed fields were decoded to journal it
+        self.assertEqual(bytes(frames[0][2]), bytes(received.frame()))
+        self.assertEqual({34, 11, 35, 52}, set(received.tags.values))
+
+        # once modified, or once a group it could be modified through was built, it is stored field by field
+        modified = codec.decodeFrame(frames[1][2])
+        modified.getRepeatingGroupByIndex(protocol.fixtags.NoPartyIDs, 0).setField(protocol.fixtags.PartyID, "P2")
+        self.assertIsNone(modified.frame())
+        journal.persistMsg(modified, session, MessageDirection.INBOUND)
+
+        records = [row[0] for row in journal.conn.execute("SELECT msg FROM message ORDER BY seqNo")]
+        self.assertEqual([RAW_VERSION, VERSION], [record[0] for record in records])
+        recovered = journal.recoverMsgs(session, MessageDirection.INBOUND, 1, 2)
+        self.assertEqual("a", recovered[0][protocol.fixtags.ClOrdID])
+        self.assertEqual("P2", recovered[1].getRepeatingGroupByIndex(protocol.fixtags.NoPartyIDs, 0)[protocol.fixtags.PartyID])
+        self.assertEqual([("a",)], journal.conn.execute("SELECT value FROM message_key WHERE tag = 11 ORDER BY message LIMIT 1").fetchall())
+
+        # a copy of a modified view is a plain message, and is stored field by field too
+        copy = modified.clone()
+        self.assertNotIsInstance(copy, FIXMessageView)
+        copy.setField(protocol.fixtags.MsgSeqNum, "3")
+        journal.persistMsg(copy, session, MessageDirection.INBOUND)
+        self.assertEqual("P2", journal.recoverMsg(session, MessageDirection.INBOUND, 3).getRepeatingGroupByIndex(protocol.fixtags.NoPartyIDs, 0)[protocol.fixtags.PartyID])
+        materialized = codec.decodeFrame(frames[0][2])
+        materialized.setField(protocol.fixtags.MsgSeqNum, "4")
+        journal.persistMsg(materialized.clone(), session, MessageDirection.INBOUND)
+        self.assertEqual("a", journal.recoverMsg(session, MessageDirection.INBOUND, 4)[protocol.fixtags.ClOrdID])
+
+    def testRecoveredGroups(self):
+        journal = Journaler()
+        session = FIXSession(1, "T1", "S1")
+        journal.persistMsg(self.buildMsg(), session, MessageDirection.OUTBOUND)
+        recovered = journal.recoverMsg(session, MessageDirection.OUTBOUND, 7)
+        group = recovered.getRepeatingGroupByTag(453, 448, "P1")
+        self.assertIs(group, recovered.getRepeatingGroupByIndex(453, 0))
+        # the index of the groups sees changes to them
+        group.setField(448, "P3")
+        self.assertIsNone(recovered.getRepeatingGroupByTag(453, 448, "P1"))
+        self.assertIs(group, recovered.getRepeatingGroupByTag(453, 448, "P3"))
+
+if __name__ == '__main__':
+    unittest.main()
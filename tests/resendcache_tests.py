@@ -0,0 +1,103 @@
+import importlib
+import os
+import socket
+import tempfile
+import unittest
+from pyfix.connection import FIXConnectionHandler
+from pyfix.engine import FIXEngine
+from pyfix.message import FIXMessage, MessageDirection
+from pyfix.resendcache import ResendCache
+
+
+class ResendCacheTests(unittest.TestCase):
+    def testCache(self):
+        cache = ResendCache(maxMessages=3)
+        self.assertEqual([], cache.lookup(1, 10))
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+        for seqNo in range(1, 6):
+            cache.add(seqNo, memoryview(b'msg%d' % (seqNo, )))
+        # resent and gap filled messages aren't added again
+        cache.add(4, b'resent')
+        self.assertEqual(3, cache.firstSeqNo())
+        self.assertEqual(12, cache.size)
+
+        self.assertEqual([(4, b'msg4'), (5, b'msg5')], cache.lookup(4, 100))
+        self.assertEqual([(3, b'msg3')], cache.lookup(1, 3))
+        self.assertEqual((1, 2), (cache.hits, cache.misses))
+
+        cache = ResendCache(maxMessages=100, maxBytes=10)
+        for seqNo in range(1, 6):
+            cache.add(seqNo, b'msg%d' % (seqNo, ))
+        self.assertEqual([4, 5], [seqNo for seqNo, frame in cache.lookup(1, 10)])
+        cache.clear()
+        self.assertIsNone(cache.firstSeqNo())
+        cache.add(1, b'msg1')
+        self.assertEqual([(1, b'msg1')], cache.lookup(1, 1))
+
+    def testResendFromCache(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        engine = FIXEngine(resendCacheSize=5)
+        session = engine.createSession("T1", "S1")
+        sock, peer = socket.socketpair()
+        try:
+            handler = FIXConnectionHandler(engine, protocol, sock)
+            handler.session = session
+            for clOrdID in range(1, 9):
+                msg = FIXMessage(protocol.msgtype.NewOrderSingle)
+                msg.setField(protocol.fixtags.ClOrdID, str(clOrdID))
+                handler.sendMsg(msg)
+            cache = engine.resendCache(session)
+            self.assertEqual(4, cache.firstSeqNo())
+
+            replayed = list(handler._replayMsgs(6, 8))
+            self.assertEqual(["6", "7", "8"], [msg[protocol.fixtags.ClOrdID] for msg in replayed])
+            self.assertEqual((1, 0), (cache.hits, cache.misses))
+
+            # older messages come from the journal
+            replayed = list(handler._replayMsgs(2, 100))
+            self.assertEqual([str(seqNo) for seqNo in range(2, 9)], [msg[protocol.fixtags.MsgSeqNum] for msg in replayed])
+            self.assertEqual(engine.journaller.recoverMsgs(session, MessageDirection.OUTBOUND, 2, 8), replayed)
+            self.assertEqual((1, 1), (cache.hits, cache.misses))
+        finally:
+            engine.eventManager.unregisterHandler(handler.socketEvent)
+            sock.close()
+            peer.close()
+
+
+    def testResetSeqNos(self):
+        protocol = importlib.import_module("pyfix.FIX44")
+        directory = tempfile.TemporaryDirectory()
+        # the journal needs an archive to keep the old sequence in
+        engine = FIXEngine(os.path.join(directory.name, "journal.store"), resendCacheSize=5)
+        session = engine.createSession("T1", "S1")
+        sock, peer = socket.socketpair()
+        try:
+            handler = FIXConnectionHandler(engine, protocol, sock)
+            handler.session = session
+
+            def send(clOrdIDs):
+                for clOrdID in clOrdIDs:
+                    msg = FIXMessage(protocol.msgtype.NewOrderSingle)
+                    msg.setField(protocol.fixtags.ClOrdID, clOrdID)
+                    handler.sendMsg(msg)
+
+            send(["a", "b", "c"])
+            engine.resetSeqNos(session)
+            self.assertEqual((0, 1), (session.sndSeqNum, session.nextExpectedMsgSeqNum))
+            self.assertIsNone(engine.resendCache(session).firstSeqNo())
+
+            # the new seq nos are cached, nothing from before the reset is replayed
+            send(["d", "e"])
+            replayed = list(handler._replayMsgs(1, 10))
+            self.assertEqual([("1", "d"), ("2", "e")], [(msg[protocol.fixtags.MsgSeqNum], msg[protocol.fixtags.ClOrdID]) for msg in replayed])
+            self.assertEqual(["d", "e"], [msg[protocol.fixtags.ClOrdID] for msg in engine.journaller.recoverMsgs(session, MessageDirection.OUTBOUND, 1, 10)])
+        finally:
+            engine.eventManager.unregisterHandler(handler.socketEvent)
+            engine.close()
+            sock.close()
+            peer.close()
+            directory.cleanup()
+
+if __name__ == '__main__':
+    unittest.main()
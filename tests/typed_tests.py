@@ -0,0 +1,128 @@
+import calendar
+import importlib
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+import mock
+from pyfix.clock import Clock
+from pyfix.codec import Codec
+from pyfix.generator import Generator
+from pyfix.message import FIXMessage, FIXContext
+from pyfix.FIX44 import generated
+
+
+class FakeClock(Clock):
+    def time(self):
+        return calendar.timegm((2015, 6, 19, 11, 8, 54))
+
+
+class TypedMessageTests(unittest.TestCase):
+    def setUp(self):
+        self.protocol = importlib.import_module("pyfix.FIX44")
+        self.codec = Codec(self.protocol, FakeClock())
+        self.session = mock.Mock()
+        self.session.senderCompId = "sender"
+        self.session.targetCompId = "target"
+        self.session.allocateSndSeqNo.return_value = 1
+
+    def newOrder(self):
+        order = generated.NewOrderSingle()
+        order.ClOrdID = "abc"
+        order.Side = "1"
+        order.TransactTime = datetime(2015, 6, 19, 11, 8, 54, 123000)
+        order.OrderQty = Decimal("100")
+        order.Price = Decimal("123.45")
+        party = generated.Parties()
+        party.PartyID = "P1"
+        party.PartyRole = 3
+        order.NoPartyIDs = [party]
+        return order
+
+    def testEncode(self):
+        fixtags = self.protocol.fixtags
+        msg = FIXMessage(self.protocol.msgtype.NewOrderSingle)
+        msg.setField(fixtags.ClOrdID, "abc")
+        party = FIXContext()
+        party.setField(fixtags.PartyID, "P1")
+        party.setField(fixtags.PartyRole, "3")
+        msg.addRepeatingGroup(fixtags.NoPartyIDs, party)
+        msg.setField(fixtags.Side, "1")
+        msg.setField(fixtags.TransactTime, "20150619-11:08:54.123")
+        msg.setField(fixtags.OrderQty, "100")
+        msg.setField(fixtags.Price, "123.45")
+
+        # the declared fields are written in the order of the repository
+        self.assertEqual(self.codec.encode(msg, self.session), self.codec.encode(self.newOrder(), self.session))
+
+    def testDecode(self):
+        msg, length = self.codec.decode(self.codec.encode(self.newOrder(), self.session))
+        order = generated.fromMessage(msg)
+        self.assertIsInstance(order, generated.NewOrderSingle)
+        self.assertEqual(Decimal("123.45"), order.Price)
+        self.assertEqual(datetime(2015, 6, 19, 11, 8, 54, 123000), order.TransactTime)
+        self.assertEqual(3, order.NoPartyIDs[0].PartyRole)
+        self.assertIsNone(order.Account)
+
+        # undeclared fields, like the header, are still there
+        self.assertEqual("1", order[self.protocol.fixtags.MsgSeqNum])
+        self.assertIn(self.protocol.fixtags.SenderCompID, order)
+        self.assertIn(self.protocol.fixtags.ClOrdID, order)
+        self.assertNotIn(self.protocol.fixtags.Account, order)
+
+        order.setField(self.protocol.fixtags.Account, "ACC")
+        self.assertEqual("ACC", order.Account)
+        order.removeField(self.protocol.fixtags.Account)
+        self.assertRaises(KeyError, order.getField, self.protocol.fixtags.Account)
+
+        heartbeat = FIXMessage("0")
+        self.assertIsInstance(generated.fromMessage(heartbeat), generated.Heartbeat)
+        unknown = FIXMessage("B")
+        self.assertIs(unknown, generated.fromMessage(unknown))
+
+    def testPickle(self):
+        order = self.newOrder()
+        self.assertFalse(hasattr(order, '__dict__'))
+        copy = pickle.loads(pickle.dumps(order))
+        self.assertIs(FIXMessage, type(copy))
+        self.assertEqual(order, copy)
+
+    def testTypedGapFill(self):
+        gapFill = generated.SequenceReset()
+        gapFill.GapFillFlag = True
+        gapFill.NewSeqNo = 99
+        gapFill.setField(self.protocol.fixtags.MsgSeqNum, 5)
+        encoded = self.codec.encode(gapFill, self.session).replace(b'\x01', b'|')
+        # keeps the seq no it was given, rather than being allocated one
+        self.assertIn(b'|34=5|', encoded)
+        self.assertIn(b'|123=Y|36=99|', encoded)
+        self.session.allocateSndSeqNo.assert_not_called()
+
+    def testImportFromElsewhere(self):
+        # the generated module can be imported whatever the working directory is
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as directory:
+            env = dict(os.environ, PYTHONPATH=root)
+            result = subprocess.run([sys.executable, '-c', 'import pyfix.FIX44.generated'], cwd=directory, env=env, stderr=subprocess.PIPE)
+            self.assertEqual(0, result.returncode, result.stderr)
+
+    def testGenerated(self):
+        # the checked in module is what the generator produces
+        with open(generated.__file__) as f:
+            source = f.read()
+        msgTypes = source.splitlines()[0].split('(msg types ')[1].split(')')[0].split()
+        self.assertEqual(source, Generator(self.protocol.dictionary).generate('fix_repository_4_4.xml', msgTypes))
+        # and imports only what it uses
+        imports = [line for line in source.splitlines() if line.startswith('from ')]
+        body = source.split('\n\n\n', 1)[1]
+        for line in imports:
+            for name in line.split(' import ')[1].split(', '):
+                self.assertRegex(body, r'\b%s\b' % (name, ))
+
+
+if __name__ == '__main__':
+    unittest.main()